@@ -1,33 +1,94 @@
 # ruff: noqa
 
-from .base import BaseClient
-from .configuration import configure, get_client
-from .enums.enumeration_order_enum import EnumerationOrder_Enum
-from .enums.operator_enum import Opertator_Enum
-from .models.edge import EdgeModel
-from .models.edge_between import EdgeBetweenModel
-from .models.existence_request import ExistenceRequestModel
-from .models.existence_result import ExistenceResultModel
-from .models.expression import ExprModel
-from .models.hnsw_lite_vector_index import HnswLiteVectorIndexModel
-from .models.node import NodeModel
-from .models.route_detail import RouteDetailModel
-from .models.route_request import RouteRequestModel
-from .models.route_response import RouteResultModel
-from .models.search_graphs import SearchRequestGraph, SearchResultGraph
-from .models.search_node_edge import SearchRequest, SearchResult, SearchResultEdge
-from .resources.admin import Admin
-from .resources.authentication import Authentication
-from .resources.credentials import Credential
-from .resources.edges import Edge
-from .resources.graphs import Graph, GraphModel
-from .resources.labels import Label
-from .resources.nodes import Node
-from .resources.route_traversal import RouteNodes
-from .resources.routes import Routes
-from .resources.routes_between import RouteEdges
-from .resources.tags import Tag
-from .resources.tenants import Tenant
-from .resources.users import User
-from .resources.vector_index import VectorIndex
-from .resources.vectors import Vector
+# Public names are resolved lazily (PEP 562) so that `import litegraph` stays cheap:
+# resource modules and pydantic models are only imported on first attribute access.
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+_LAZY_ATTRIBUTES = {
+    "BaseClient": ".base",
+    "configure": ".configuration",
+    "get_client": ".configuration",
+    "EnumerationOrder_Enum": ".enums.enumeration_order_enum",
+    "Opertator_Enum": ".enums.operator_enum",
+    "EdgeModel": ".models.edge",
+    "EdgeBetweenModel": ".models.edge_between",
+    "ExistenceRequestModel": ".models.existence_request",
+    "ExistenceResultModel": ".models.existence_result",
+    "ExprModel": ".models.expression",
+    "HnswLiteVectorIndexModel": ".models.hnsw_lite_vector_index",
+    "NodeModel": ".models.node",
+    "RouteDetailModel": ".models.route_detail",
+    "RouteRequestModel": ".models.route_request",
+    "RouteResultModel": ".models.route_response",
+    "SearchRequestGraph": ".models.search_graphs",
+    "SearchResultGraph": ".models.search_graphs",
+    "SearchRequest": ".models.search_node_edge",
+    "SearchResult": ".models.search_node_edge",
+    "SearchResultEdge": ".models.search_node_edge",
+    "Admin": ".resources.admin",
+    "Authentication": ".resources.authentication",
+    "Credential": ".resources.credentials",
+    "Edge": ".resources.edges",
+    "Graph": ".resources.graphs",
+    "GraphModel": ".resources.graphs",
+    "Label": ".resources.labels",
+    "Node": ".resources.nodes",
+    "RouteNodes": ".resources.route_traversal",
+    "Routes": ".resources.routes",
+    "RouteEdges": ".resources.routes_between",
+    "Tag": ".resources.tags",
+    "Tenant": ".resources.tenants",
+    "User": ".resources.users",
+    "VectorIndex": ".resources.vector_index",
+    "Vector": ".resources.vectors",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .base import BaseClient
+    from .configuration import configure, get_client
+    from .enums.enumeration_order_enum import EnumerationOrder_Enum
+    from .enums.operator_enum import Opertator_Enum
+    from .models.edge import EdgeModel
+    from .models.edge_between import EdgeBetweenModel
+    from .models.existence_request import ExistenceRequestModel
+    from .models.existence_result import ExistenceResultModel
+    from .models.expression import ExprModel
+    from .models.hnsw_lite_vector_index import HnswLiteVectorIndexModel
+    from .models.node import NodeModel
+    from .models.route_detail import RouteDetailModel
+    from .models.route_request import RouteRequestModel
+    from .models.route_response import RouteResultModel
+    from .models.search_graphs import SearchRequestGraph, SearchResultGraph
+    from .models.search_node_edge import SearchRequest, SearchResult, SearchResultEdge
+    from .resources.admin import Admin
+    from .resources.authentication import Authentication
+    from .resources.credentials import Credential
+    from .resources.edges import Edge
+    from .resources.graphs import Graph, GraphModel
+    from .resources.labels import Label
+    from .resources.nodes import Node
+    from .resources.route_traversal import RouteNodes
+    from .resources.routes import Routes
+    from .resources.routes_between import RouteEdges
+    from .resources.tags import Tag
+    from .resources.tenants import Tenant
+    from .resources.users import User
+    from .resources.vector_index import VectorIndex
+    from .resources.vectors import Vector
@@ -0,0 +1,8 @@
+"""
+Graph analytics computed client-side on a GraphAdjacency snapshot.
+
+Load a snapshot with ``Graph.load_adjacency`` (pass ``include_isolated=True`` so
+nodes without edges are scored too). Results are NumPy arrays parallel to
+``adjacency.guids``. The modules in this package require the optional ``numpy``
+dependency (``pip install litegraph[numpy]``).
+"""
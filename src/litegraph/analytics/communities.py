@@ -0,0 +1,201 @@
+"""
+Connected components and label-propagation communities.
+
+Weakly connected components and label propagation are computed with whole-array
+NumPy operations over the edge list, so they scale to millions of edges. Strongly
+connected components use an iterative Tarjan's algorithm over the CSR arrays.
+Every function returns an int32 array of component or community IDs parallel to
+``adjacency.guids``, numbered from 0 in order of first appearance.
+"""
+
+from typing import Optional
+
+from ..utils.numpy_helper import _require_numpy
+
+
+def _renumber(np, labels):
+    """Renumber labels to 0..k-1 in order of first appearance."""
+    _, first, inverse = np.unique(labels, return_index=True, return_inverse=True)
+    rank = np.empty(len(first), dtype=np.int32)
+    rank[np.argsort(first, kind="stable")] = np.arange(len(first), dtype=np.int32)
+    return rank[inverse.reshape(-1)]
+
+
+def weakly_connected_components(adjacency):
+    """
+    Find the weakly connected components, ignoring edge direction.
+
+    Uses a vectorized union-find: every edge hooks the larger root onto the
+    smaller one, and pointer jumping then flattens the trees, until no edge joins
+    two different roots.
+
+    Args:
+        adjacency: The GraphAdjacency snapshot.
+
+    Returns:
+        numpy.ndarray: The component ID of every node.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    np = _require_numpy()
+    parent = np.arange(len(adjacency), dtype=np.int64)
+    sources = adjacency.out_sources().astype(np.int64)
+    targets = adjacency.out_targets.astype(np.int64)
+    while True:
+        source_roots, target_roots = parent[sources], parent[targets]
+        joined = source_roots != target_roots
+        if not joined.any():
+            break
+        high = np.maximum(source_roots[joined], target_roots[joined])
+        low = np.minimum(source_roots[joined], target_roots[joined])
+        np.minimum.at(parent, high, low)
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+    return _renumber(np, parent)
+
+
+def strongly_connected_components(adjacency):
+    """
+    Find the strongly connected components with an iterative Tarjan's algorithm.
+
+    Args:
+        adjacency: The GraphAdjacency snapshot.
+
+    Returns:
+        numpy.ndarray: The component ID of every node.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    np = _require_numpy()
+    count = len(adjacency)
+    # Plain lists index faster than NumPy arrays one element at a time.
+    offsets = adjacency.out_offsets.tolist()
+    targets = adjacency.out_targets.tolist()
+
+    index = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    labels = [-1] * count
+    stack = []
+    counter = component = 0
+    for root in range(count):
+        if index[root] >= 0:
+            continue
+        # Each frame is (node, position of the next edge to visit).
+        frames = [(root, offsets[root])]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        while frames:
+            node, position = frames[-1]
+            if position < offsets[node + 1]:
+                frames[-1] = (node, position + 1)
+                following = targets[position]
+                if index[following] < 0:
+                    index[following] = low[following] = counter
+                    counter += 1
+                    stack.append(following)
+                    on_stack[following] = True
+                    frames.append((following, offsets[following]))
+                elif on_stack[following]:
+                    low[node] = min(low[node], index[following])
+                continue
+            frames.pop()
+            if frames:
+                parent = frames[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    labels[member] = component
+                    if member == node:
+                        break
+                component += 1
+    return _renumber(np, np.asarray(labels, dtype=np.int64))
+
+
+def label_propagation(
+    adjacency,
+    weighted: bool = False,
+    max_iter: int = 100,
+    seed: Optional[int] = None,
+):
+    """
+    Detect communities by label propagation, ignoring edge direction.
+
+    Every node starts in its own community and repeatedly adopts the label most
+    common among its neighbours (weighted by edge cost with ``weighted``), ties
+    broken at random. Each round updates a random half of the nodes, which avoids
+    the oscillation of fully synchronous updates. Stops when every node holds one
+    of the most common labels of its neighbours.
+
+    Args:
+        adjacency: The GraphAdjacency snapshot.
+        weighted: Count neighbour labels by edge cost instead of edge count.
+        max_iter: Maximum number of rounds.
+        seed: Seed for tie-breaking and the choice of nodes to update.
+
+    Returns:
+        numpy.ndarray: The community ID of every node.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    np = _require_numpy()
+    count = len(adjacency)
+    rng = np.random.default_rng(seed)
+    sources = adjacency.out_sources().astype(np.int64)
+    targets = adjacency.out_targets.astype(np.int64)
+    # Both directions of every edge, self-loops dropped.
+    keep = sources != targets
+    nodes = np.concatenate([sources[keep], targets[keep]])
+    neighbours = np.concatenate([targets[keep], sources[keep]])
+    weights = (
+        np.tile(adjacency.out_costs[keep].astype(np.float64), 2)
+        if weighted
+        else np.ones(len(nodes))
+    )
+    labels = np.arange(count, dtype=np.int64)
+    if len(nodes) == 0:
+        return _renumber(np, labels)
+
+    for _ in range(max_iter):
+        # Total weight of every (node, neighbour label) pair.
+        keys, inverse = np.unique(
+            nodes * count + labels[neighbours], return_inverse=True
+        )
+        totals = np.bincount(inverse.reshape(-1), weights=weights)
+        pair_nodes, pair_labels = keys // count, keys % count
+        best = np.full(count, -np.inf)
+        np.maximum.at(best, pair_nodes, totals)
+        winners = totals >= best[pair_nodes] * (1 - 1e-12)
+
+        # Nodes whose current label is not among the most common ones.
+        holds_best = np.zeros(count, dtype=bool)
+        holds_best[pair_nodes[winners & (pair_labels == labels[pair_nodes])]] = True
+        has_neighbours = np.isfinite(best)
+        unstable = np.flatnonzero(has_neighbours & ~holds_best)
+        if len(unstable) == 0:
+            break
+
+        # Pick one winning label per node at random.
+        candidates = np.flatnonzero(winners)
+        order = np.lexsort((rng.random(len(candidates)), pair_nodes[candidates]))
+        candidates = candidates[order]
+        first = np.ones(len(candidates), dtype=bool)
+        first[1:] = pair_nodes[candidates][1:] != pair_nodes[candidates][:-1]
+        choice = np.full(count, -1, dtype=np.int64)
+        choice[pair_nodes[candidates[first]]] = pair_labels[candidates[first]]
+
+        # Ties may move stable nodes too, which lets equal plateaus merge.
+        update = np.flatnonzero(has_neighbours & (rng.random(count) < 0.5))
+        labels[update] = choice[update]
+        labels[unstable[:1]] = choice[unstable[:1]]
+    return _renumber(np, labels)
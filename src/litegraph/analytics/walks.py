@@ -0,0 +1,235 @@
+"""
+Random walks and node2vec-style biased walks for graph embedding training.
+
+Walks are sampled over a GraphAdjacency snapshot, with every walk in a batch
+advancing one step at a time as whole-array NumPy operations. Walks are returned
+as an int32 array of node indices, one row per walk, and ``write_guid_mapping``
+writes the index-to-GUID mapping needed to interpret them.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Sequence
+
+from ..utils.numpy_helper import _require_numpy
+
+# Index marking the end of a walk that reached a node without edges.
+PAD = -1
+
+# Per-process copy of the walk graph, set once by the pool initializer.
+_worker_graph = None
+
+
+class _WalkGraph:
+    """The CSR arrays walks are sampled from."""
+
+    def __init__(self, adjacency, directed: bool, weighted: bool):
+        np = _require_numpy()
+        count = len(adjacency)
+        sources = adjacency.out_sources().astype(np.int64)
+        targets = adjacency.out_targets.astype(np.int64)
+        costs = adjacency.out_costs.astype(np.float64)
+        if not directed:
+            sources, targets = (
+                np.concatenate([sources, targets]),
+                np.concatenate([targets, sources]),
+            )
+            costs = np.concatenate([costs, costs])
+        # Sorting by (source, target) groups the edges of every node and lets
+        # has_edge binary search them.
+        order = np.lexsort((targets, sources))
+        sources, targets, costs = sources[order], targets[order], costs[order]
+
+        self.count = count
+        self.offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=count), out=self.offsets[1:])
+        self.targets = targets
+        self.keys = sources * count + targets
+        self.cumulative = None
+        if weighted:
+            self.cumulative = np.concatenate([[0.0], np.cumsum(costs)])
+
+    def step(self, rng, current):
+        """Sample one first-order step from every node; PAD where there is none."""
+        np = _require_numpy()
+        following = np.full(len(current), PAD, dtype=np.int64)
+        live = current >= 0
+        nodes = current[live]
+        starts, ends = self.offsets[nodes], self.offsets[nodes + 1]
+        if self.cumulative is None:
+            can_move = ends > starts
+            positions = starts + (rng.random(len(nodes)) * (ends - starts)).astype(
+                np.int64
+            )
+        else:
+            low, high = self.cumulative[starts], self.cumulative[ends]
+            can_move = high > low
+            draws = low + rng.random(len(nodes)) * (high - low)
+            positions = np.searchsorted(self.cumulative, draws, side="right") - 1
+            positions = np.clip(positions, starts, np.maximum(ends - 1, starts))
+        picked = np.full(len(nodes), PAD, dtype=np.int64)
+        picked[can_move] = self.targets[positions[can_move]]
+        following[live] = picked
+        return following
+
+    def has_edge(self, sources, targets):
+        np = _require_numpy()
+        keys = sources * self.count + targets
+        found = np.searchsorted(self.keys, keys)
+        found = np.minimum(found, len(self.keys) - 1)
+        return (len(self.keys) > 0) & (self.keys[found] == keys)
+
+
+def _walk_batch(graph, starts, walk_length: int, p: float, q: float, seed):
+    """Sample one walk from every start node."""
+    np = _require_numpy()
+    rng = np.random.default_rng(seed)
+    walks = np.full((len(starts), walk_length), PAD, dtype=np.int32)
+    if walk_length == 0 or len(starts) == 0:
+        return walks
+    current = np.asarray(starts, dtype=np.int64)
+    previous = np.full(len(starts), PAD, dtype=np.int64)
+    walks[:, 0] = current
+    biased = p != 1 or q != 1
+    highest = max(1 / p, 1.0, 1 / q)
+    for column in range(1, walk_length):
+        following = graph.step(rng, current)
+        if biased and column > 1:
+            # Rejection sampling: resample steps until accepted with probability
+            # proportional to the node2vec return / in-out bias.
+            pending = np.flatnonzero(following >= 0)
+            while len(pending):
+                candidates = following[pending]
+                bias = np.where(
+                    candidates == previous[pending],
+                    1 / p,
+                    np.where(graph.has_edge(previous[pending], candidates), 1.0, 1 / q),
+                )
+                rejected = rng.random(len(pending)) * highest >= bias
+                pending = pending[rejected]
+                following[pending] = graph.step(rng, current[pending])
+        walks[:, column] = following
+        previous, current = current, following
+    return walks
+
+
+def _init_worker(graph) -> None:
+    global _worker_graph
+    _worker_graph = graph
+
+
+def _walk_worker(arguments):
+    return _walk_batch(_worker_graph, *arguments)
+
+
+def random_walks(
+    adjacency,
+    walk_length: int = 80,
+    walks_per_node: int = 10,
+    p: float = 1.0,
+    q: float = 1.0,
+    weighted: bool = False,
+    directed: bool = True,
+    start_guids: Optional[Sequence[str]] = None,
+    seed: Optional[int] = None,
+    processes: int = 1,
+    batch_size: int = 100_000,
+    out: Optional[str] = None,
+):
+    """
+    Sample random walks over a snapshot.
+
+    With ``p == q == 1`` walks are first-order: each step picks an edge of the
+    current node uniformly, or in proportion to its cost with ``weighted``. Other
+    values give node2vec walks: returning to the previous node is weighted by
+    ``1 / p``, moving to a neighbour of the previous node by 1 and moving further
+    away by ``1 / q``.
+
+    The walks are split into batches of ``batch_size``, each with its own seed
+    derived from ``seed``, so the result does not depend on ``processes``.
+
+    Args:
+        adjacency: The GraphAdjacency snapshot.
+        walk_length: Number of nodes per walk, including the start node.
+        walks_per_node: Number of walks starting at every start node.
+        p: Return parameter.
+        q: In-out parameter.
+        weighted: Pick edges in proportion to their cost.
+        directed: Follow edges from ``From`` to ``To`` only. When False, edges
+            are followed in both directions.
+        start_guids: The nodes to start walks from. All nodes if not given.
+        seed: Seed for the walks.
+        processes: Number of worker processes. 1 samples in this process.
+        batch_size: Number of walks per batch.
+        out: Path of a ``.npy`` file to write the walks to, as a memory-mapped
+            array, instead of keeping them in memory.
+
+    Returns:
+        numpy.ndarray: int32 array of shape ``(walks, walk_length)`` holding node
+        indices into ``adjacency.guids``. Walks reaching a node without edges are
+        padded with -1.
+
+    Raises:
+        ImportError: If numpy is not installed.
+        ValueError: If a parameter is out of range.
+    """
+    np = _require_numpy()
+    if p <= 0 or q <= 0:
+        raise ValueError("p and q must be positive.")
+    if walk_length < 1 or walks_per_node < 1:
+        raise ValueError("walk_length and walks_per_node must be at least 1.")
+    if processes < 1 or batch_size < 1:
+        raise ValueError("processes and batch_size must be at least 1.")
+
+    if start_guids is None:
+        starts = np.arange(len(adjacency), dtype=np.int64)
+    else:
+        starts = np.asarray(
+            [adjacency.index_of(guid) for guid in start_guids], dtype=np.int64
+        )
+    starts = np.tile(starts, walks_per_node)
+    shape = (len(starts), walk_length)
+    if out is None:
+        walks = np.empty(shape, dtype=np.int32)
+    else:
+        walks = np.lib.format.open_memmap(out, mode="w+", dtype=np.int32, shape=shape)
+
+    graph = _WalkGraph(adjacency, directed=directed, weighted=weighted)
+    offsets = list(range(0, len(starts), batch_size))
+    seeds = np.random.SeedSequence(seed).spawn(len(offsets))
+    tasks = [
+        (starts[offset : offset + batch_size], walk_length, p, q, batch_seed)
+        for offset, batch_seed in zip(offsets, seeds)
+    ]
+    if processes == 1 or len(tasks) == 1:
+        batches = (_walk_batch(graph, *task) for task in tasks)
+        for offset, batch in zip(offsets, batches):
+            walks[offset : offset + len(batch)] = batch
+    else:
+        with ProcessPoolExecutor(
+            max_workers=processes, initializer=_init_worker, initargs=(graph,)
+        ) as executor:
+            for offset, batch in zip(offsets, executor.map(_walk_worker, tasks)):
+                walks[offset : offset + len(batch)] = batch
+    if out is not None:
+        walks.flush()
+    return walks
+
+
+def write_guid_mapping(adjacency, path) -> int:
+    """
+    Write the node GUIDs to a text file, one per line, in index order.
+
+    Line ``i`` holds the GUID of node index ``i``, as used in walk arrays. The
+    file is written line by line without building it in memory.
+
+    Args:
+        adjacency: The GraphAdjacency the walks were sampled from.
+        path: The file to write.
+
+    Returns:
+        int: The number of GUIDs written.
+    """
+    with open(os.fspath(path), "w", encoding="utf-8") as handle:
+        handle.writelines(f"{guid}\n" for guid in adjacency.guids)
+    return len(adjacency)
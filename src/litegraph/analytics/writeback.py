@@ -0,0 +1,129 @@
+"""
+Write per-node analytics results back to LiteGraph as node tags or labels.
+"""
+
+from typing import Optional
+
+from ..configuration import get_client
+from ..exceptions import GRAPH_REQUIRED_ERROR
+from ..models.label import LabelModel
+from ..models.tag import TagModel
+
+
+def write_node_tags(
+    adjacency,
+    values,
+    key: str,
+    graph_guid: Optional[str] = None,
+    batch_size: int = 1000,
+    precision: int = 6,
+) -> int:
+    """
+    Store one value per node as a tag, with ``Tag.create_multiple``.
+
+    Existing tags with the same key are left in place, so delete them first (e.g.
+    with ``Tag.delete_multiple``) when re-running an analysis.
+
+    Args:
+        adjacency: The GraphAdjacency the values were computed on.
+        values: One value per node, parallel to ``adjacency.guids``. Nodes whose
+            value is None are skipped.
+        key: The tag key, e.g. ``"pagerank"``.
+        graph_guid: The graph GUID. If not provided, uses client.graph_guid.
+        batch_size: Number of tags per request.
+        precision: Significant digits of float values.
+
+    Returns:
+        int: The number of tags created.
+
+    Raises:
+        ValueError: If graph GUID is missing or the values do not match the nodes.
+    """
+    from ..resources.tags import Tag
+
+    return _write(
+        Tag,
+        adjacency,
+        values,
+        graph_guid,
+        batch_size,
+        lambda fields, value: TagModel(
+            **fields, Key=key, Value=_format(value, precision)
+        ),
+    )
+
+
+def write_node_labels(
+    adjacency,
+    values,
+    prefix: str = "",
+    graph_guid: Optional[str] = None,
+    batch_size: int = 1000,
+) -> int:
+    """
+    Store one value per node as a label, with ``Label.create_multiple``.
+
+    Suited to categorical results such as component or community IDs, so that
+    nodes can then be filtered by label on the server.
+
+    Args:
+        adjacency: The GraphAdjacency the values were computed on.
+        values: One value per node, parallel to ``adjacency.guids``. Nodes whose
+            value is None are skipped.
+        prefix: Prepended to every value, e.g. ``"component-"``.
+        graph_guid: The graph GUID. If not provided, uses client.graph_guid.
+        batch_size: Number of labels per request.
+
+    Returns:
+        int: The number of labels created.
+
+    Raises:
+        ValueError: If graph GUID is missing or the values do not match the nodes.
+    """
+    from ..resources.labels import Label
+
+    return _write(
+        Label,
+        adjacency,
+        values,
+        graph_guid,
+        batch_size,
+        lambda fields, value: LabelModel(**fields, Label=f"{prefix}{value}"),
+    )
+
+
+def _write(resource, adjacency, values, graph_guid, batch_size, build) -> int:
+    client = get_client()
+    graph_guid = graph_guid or client.graph_guid
+    if not graph_guid:
+        raise ValueError(GRAPH_REQUIRED_ERROR)
+    if len(values) != len(adjacency):
+        raise ValueError("values must have one entry per node.")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+
+    records = [
+        build(
+            {
+                "TenantGUID": client.tenant_guid,
+                "GraphGUID": graph_guid,
+                "NodeGUID": guid,
+            },
+            value,
+        )
+        for guid, value in zip(adjacency.guids.tolist(), _as_list(values))
+        if value is not None
+    ]
+    for start in range(0, len(records), batch_size):
+        resource.create_multiple(records[start : start + batch_size])
+    return len(records)
+
+
+def _as_list(values) -> list:
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def _format(value, precision: int) -> str:
+    if isinstance(value, float):
+        return f"{value:.{precision}g}"
+    return str(value)
@@ -1,3 +1,4 @@
+import importlib.util
 import json
 from typing import Optional, TypeVar
 
@@ -10,6 +11,11 @@ from .sdk_logging import log_error, log_info, log_warning
 
 T = TypeVar("T", bound="BaseClient")
 
+MODEL_BACKENDS = ("pydantic", "msgspec")
+
+# HTTP methods LiteGraph uses for writes; listeners are notified after each one.
+MUTATING_METHODS = frozenset({"PUT", "DELETE", "PATCH"})
+
 
 class BaseClient:
     """
@@ -24,14 +30,26 @@ class BaseClient:
         timeout: int = 10,
         retries: int = 3,
         access_key: str = None,
+        model_backend: str = "pydantic",
     ):
+        if model_backend not in MODEL_BACKENDS:
+            raise ValueError(
+                f"Unknown model backend '{model_backend}', expected one of {MODEL_BACKENDS}"
+            )
+        if model_backend == "msgspec" and importlib.util.find_spec("msgspec") is None:
+            raise ImportError(
+                "The msgspec model backend requires msgspec. "
+                "Install it with 'pip install litegraph[msgspec]'."
+            )
         self.base_url = base_url
         self.tenant_guid = tenant_guid
         self.graph_guid = graph_guid
         self.timeout = timeout
         self.retries = retries
         self.access_key = access_key
+        self.model_backend = model_backend
         self.client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
+        self._mutation_listeners = []
 
         log_info(
             Severity_Enum.Info.value,
@@ -39,7 +57,8 @@ class BaseClient:
             f"tenant_guid: {self.tenant_guid}, "
             f"graph_guid: {self.graph_guid}, "
             f"timeout: {self.timeout}, "
-            f"retries: {self.retries}",
+            f"retries: {self.retries}, "
+            f"model_backend: {self.model_backend}",
         )
 
     def _get_headers(self):
@@ -51,12 +70,14 @@ class BaseClient:
             headers["Authorization"] = f"Bearer {self.access_key}"
         return headers
 
-    def _handle_response(self, response):
+    def _handle_response(self, response, raw: bool = False):
         """Handle successful API response."""
         response.raise_for_status()
         log_info(
             Severity_Enum.Info.value, f"Request successful: {response.status_code}"
         )
+        if raw:
+            return response.content
         try:
             return response.json() if response.content else None
         except json.JSONDecodeError:
@@ -77,19 +98,25 @@ class BaseClient:
         )
         raise SdkException("Server responded with non-JSON content")
 
-    def request(self, method: str, url: str, **kwargs):
+    def request(
+        self, method: str, url: str, raw: bool = False, retry: bool = True, **kwargs
+    ):
         """
         Make an HTTP request to the API with automatic retries and error handling.
 
         Args:
             method (str): The HTTP method to use (GET, POST, PUT, DELETE, etc.).
             url (str): The URL to send the request to.
+            raw (bool): Return the undecoded response bytes instead of parsed JSON.
+            retry (bool): Retry on connection errors and timeouts. Disable for requests
+                that must not be sent twice.
             **kwargs: Additional arguments to pass to the underlying httpx request.
                 - headers (dict, optional): Additional headers for the request.
                 - data (dict, optional): The data to be sent in the request body.
 
         Returns:
             dict: The JSON response from the API if the response has content, None otherwise.
+                The raw response bytes are returned instead when ``raw`` is True.
 
         Raises:
             SdkException: If the request fails after all retries.
@@ -105,10 +132,14 @@ class BaseClient:
             f"Making {method} request to {url} with headers: {headers}",
         )
 
-        for attempt in range(self.retries):
+        attempts = self.retries if retry else 1
+        for attempt in range(attempts):
             try:
                 response = self.client.request(method, url, **kwargs)
-                return self._handle_response(response)
+                result = self._handle_response(response, raw=raw)
+                if method.upper() in MUTATING_METHODS:
+                    self.notify_mutation(method, url)
+                return result
 
             except httpx.HTTPStatusError as e:
                 try:
@@ -121,19 +152,50 @@ class BaseClient:
                     raise SdkException(f"Unexpected error: {e}")
 
             except httpx.RequestError as e:
-                if attempt == self.retries - 1:
+                if attempt == attempts - 1:
                     log_error(
                         Severity_Enum.Error.value,
                         "Max retries reached. Failing request.",
                     )
-                    raise SdkException(
-                        f"Request failed after {self.retries} attempts: {e}"
-                    )
+                    raise SdkException(f"Request failed after {attempts} attempts: {e}")
                 log_warning(
                     Severity_Enum.Warn.value,
                     f"Request attempt {attempt + 1} failed: {e}",
                 )
 
+    def add_mutation_listener(self, listener) -> None:
+        """
+        Register a callable notified after every successful write request.
+
+        Args:
+            listener: Called as ``listener(method, url)``, e.g. to invalidate caches.
+        """
+        if listener not in self._mutation_listeners:
+            self._mutation_listeners.append(listener)
+
+    def remove_mutation_listener(self, listener) -> None:
+        """
+        Unregister a listener added with ``add_mutation_listener``.
+        """
+        if listener in self._mutation_listeners:
+            self._mutation_listeners.remove(listener)
+
+    def notify_mutation(self, method: str, url: str) -> None:
+        """
+        Notify the mutation listeners of a successful write request.
+
+        Called after every PUT/DELETE/PATCH request, and by resources whose other
+        requests change data, e.g. ``VectorIndex.rebuild``.
+        """
+        for listener in list(self._mutation_listeners):
+            try:
+                listener(method, url)
+            except Exception as e:
+                log_warning(
+                    Severity_Enum.Warn.value,
+                    f"Mutation listener failed for {method} {url}: {e}",
+                )
+
     def close(self):
         """
         Close the HTTP client.
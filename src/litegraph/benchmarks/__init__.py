@@ -0,0 +1,6 @@
+"""
+Tools for measuring LiteGraph deployments from the client.
+
+The modules in this package require the optional ``numpy`` dependency
+(``pip install litegraph[numpy]``).
+"""
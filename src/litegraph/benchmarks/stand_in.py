@@ -0,0 +1,292 @@
+"""
+In-process stand-in for the LiteGraph endpoints used by the vector index benchmark.
+
+The stand-in answers requests through an ``httpx.MockTransport``, so the SDK's
+real request path is exercised without a server. Vector indexes are built with
+``LocalVectorIndex``; ``HnswRam`` and ``HnswSqlite`` indexes behave the same, and
+the reported memory is an estimate from the index's arrays.
+"""
+
+import json
+import re
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Optional
+
+import httpx
+
+from .. import configuration
+from ..base import BaseClient
+from ..enums.vector_search_type_enum import VectorSearchTypeEnum
+from ..local.ann_index import LocalVectorIndex
+from ..local.similarity import HIGHER_IS_BETTER, score, top_k
+from ..models.hnsw_lite_vector_index import HnswLiteVectorIndexModel
+from ..utils.numpy_helper import _require_numpy
+
+BASE_URL = "http://litegraph-stand-in"
+
+# Results returned by a search without TopK.
+DEFAULT_TOP_K = 100
+
+ROUTES = [
+    ("PUT", r"v1\.0/tenants/(?P<tenant>[^/]+)/graphs", "_create_graph"),
+    (
+        "DELETE",
+        r"v1\.0/tenants/(?P<tenant>[^/]+)/graphs/(?P<graph>[^/]+)",
+        "_delete_graph",
+    ),
+    (
+        "PUT",
+        r"v1\.0/tenants/(?P<tenant>[^/]+)/graphs/(?P<graph>[^/]+)/nodes/bulk",
+        "_create_nodes",
+    ),
+    ("PUT", r"v1\.0/tenants/(?P<tenant>[^/]+)/vectors/bulk", "_create_vectors"),
+    ("POST", r"v1\.0/tenants/(?P<tenant>[^/]+)/vectors", "_search"),
+    (
+        "PUT",
+        r"v2\.0/tenants/(?P<tenant>[^/]+)/graphs/(?P<graph>[^/]+)/vectorindex/enable",
+        "_enable_index",
+    ),
+    (
+        "POST",
+        r"v2\.0/tenants/(?P<tenant>[^/]+)/graphs/(?P<graph>[^/]+)/vectorindex/rebuild",
+        "_rebuild_index",
+    ),
+    (
+        "DELETE",
+        r"v2\.0/tenants/(?P<tenant>[^/]+)/graphs/(?P<graph>[^/]+)/vectorindex",
+        "_delete_index",
+    ),
+    (
+        "GET",
+        r"v1\.0/tenants/(?P<tenant>[^/]+)/graphs/(?P<graph>[^/]+)/vectorindex/config",
+        "_index_config",
+    ),
+    (
+        "GET",
+        r"v1\.0/tenants/(?P<tenant>[^/]+)/graphs/(?P<graph>[^/]+)/vectorindex/stats",
+        "_index_stats",
+    ),
+]
+
+
+class _Graph:
+    """State of one graph on the stand-in server."""
+
+    def __init__(self, guid: str, tenant_guid: str):
+        self.guid = guid
+        self.tenant_guid = tenant_guid
+        self.nodes = set()
+        self.vector_guids = []
+        self.node_guids = []
+        self.embeddings = []
+        self.config: Optional[HnswLiteVectorIndexModel] = None
+        self.index: Optional[LocalVectorIndex] = None
+        self.last_rebuild: Optional[datetime] = None
+
+
+class StandInServer:
+    """
+    Minimal in-memory LiteGraph server for benchmarks and CI.
+
+    Supports creating and deleting graphs, bulk-creating nodes and vectors, node
+    vector search, and enabling, rebuilding, reading and deleting vector indexes.
+    Other requests get a 404 response.
+    """
+
+    def __init__(self, seed: int = 0):
+        """
+        Create an empty server.
+
+        Args:
+            seed: Seed for the layer assignment of the HNSW indexes.
+        """
+        _require_numpy()
+        self.seed = seed
+        self.graphs = {}
+        self._routes = [
+            (method, re.compile(pattern + "$"), getattr(self, handler))
+            for method, pattern, handler in ROUTES
+        ]
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """
+        Answer a request, as the handler of an ``httpx.MockTransport``.
+        """
+        path = request.url.path.lstrip("/")
+        for method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if match and request.method == method:
+                body = json.loads(request.content) if request.content else None
+                try:
+                    result = handler(body, **match.groupdict())
+                except KeyError:
+                    break
+                if result is None:
+                    return httpx.Response(204)
+                return httpx.Response(200, json=result)
+        return httpx.Response(404, json={"Error": "NotFound", "Description": path})
+
+    def client(self, tenant_guid: Optional[str] = None, **kwargs) -> BaseClient:
+        """
+        Create a client whose requests are answered by this server.
+
+        Args:
+            tenant_guid: The tenant GUID. A random one is used if not given.
+            **kwargs: Additional arguments for BaseClient, e.g. ``graph_guid``.
+        """
+        client = BaseClient(
+            base_url=BASE_URL, tenant_guid=tenant_guid or str(uuid.uuid4()), **kwargs
+        )
+        client.client.close()
+        client.client = httpx.Client(
+            base_url=BASE_URL,
+            timeout=client.timeout,
+            transport=httpx.MockTransport(self.handle),
+        )
+        return client
+
+    @contextmanager
+    def configured(self, tenant_guid: Optional[str] = None, **kwargs):
+        """
+        Point the SDK's shared client at this server for the duration of a block.
+
+        Yields:
+            BaseClient: The client in use.
+        """
+        previous = configuration._client
+        client = self.client(tenant_guid, **kwargs)
+        configuration._client = client
+        try:
+            yield client
+        finally:
+            configuration._client = previous
+            client.close()
+
+    def _create_graph(self, body, tenant):
+        guid = (body or {}).get("GUID") or str(uuid.uuid4())
+        self.graphs[guid] = _Graph(guid, tenant)
+        return {**(body or {}), "GUID": guid, "TenantGUID": tenant}
+
+    def _delete_graph(self, body, tenant, graph):
+        del self.graphs[graph]
+
+    def _create_nodes(self, body, tenant, graph):
+        nodes = []
+        for record in body:
+            guid = record.get("GUID") or str(uuid.uuid4())
+            self.graphs[graph].nodes.add(guid)
+            nodes.append(
+                {**record, "GUID": guid, "TenantGUID": tenant, "GraphGUID": graph}
+            )
+        return nodes
+
+    def _create_vectors(self, body, tenant):
+        created = []
+        for record in body:
+            graph = self.graphs[record["GraphGUID"]]
+            guid = record.get("GUID") or str(uuid.uuid4())
+            graph.vector_guids.append(guid)
+            graph.node_guids.append(record.get("NodeGUID"))
+            graph.embeddings.append(record["Vectors"])
+            created.append({"GUID": guid, "TenantGUID": tenant})
+        return created
+
+    def _search(self, body, tenant):
+        np = _require_numpy()
+        graph = self.graphs[body["GraphGUID"]]
+        k = body.get("TopK") or DEFAULT_TOP_K
+        if not graph.embeddings:
+            return []
+
+        if graph.index is not None:
+            guids, distances = graph.index.query(body["Embeddings"], k=k)
+            positions = [graph.index._positions[guid] for guid in guids]
+            metric = graph.index.distance_metric
+            if metric == "Cosine":
+                scores = [1 - distance for distance in distances]
+            elif metric == "Euclidean":
+                scores = [1 / (1 + distance) for distance in distances]
+            else:
+                scores = [-distance for distance in distances]
+        else:
+            search_type = VectorSearchTypeEnum(
+                body.get("SearchType") or VectorSearchTypeEnum.CosineSimilarity
+            )
+            embeddings = np.asarray(graph.embeddings, dtype=np.float32)
+            indices, values = top_k(
+                score(body["Embeddings"], embeddings, search_type), k, search_type
+            )
+            positions = indices.tolist()
+            distances = [None] * len(positions)
+            scores = values.tolist() if search_type in HIGHER_IS_BETTER else distances
+        return [
+            {
+                "Score": value,
+                "Distance": distance,
+                "Node": {
+                    "GUID": graph.node_guids[position],
+                    "TenantGUID": tenant,
+                    "GraphGUID": graph.guid,
+                },
+            }
+            for position, value, distance in zip(positions, scores, distances)
+        ]
+
+    def _enable_index(self, body, tenant, graph):
+        config = HnswLiteVectorIndexModel.model_validate(body)
+        config.graph_guid = graph
+        self.graphs[graph].config = config
+        self.graphs[graph].index = None
+        return config.model_dump(mode="json", by_alias=True)
+
+    def _rebuild_index(self, body, tenant, graph):
+        state = self.graphs[graph]
+        if state.config is None:
+            raise KeyError(graph)
+        index = LocalVectorIndex.from_config(state.config, seed=self.seed)
+        index.add(state.vector_guids, state.embeddings, node_guids=state.node_guids)
+        state.index = index
+        state.config.vector_count = len(index)
+        state.config.estimated_memory_bytes = _estimated_memory(index)
+        state.config.is_loaded = True
+        state.last_rebuild = datetime.now(timezone.utc)
+
+    def _delete_index(self, body, tenant, graph):
+        self.graphs[graph].config = None
+        self.graphs[graph].index = None
+
+    def _index_config(self, body, tenant, graph):
+        config = self.graphs[graph].config
+        if config is None:
+            raise KeyError(graph)
+        return config.model_dump(mode="json", by_alias=True)
+
+    def _index_stats(self, body, tenant, graph):
+        state = self.graphs[graph]
+        if state.config is None:
+            raise KeyError(graph)
+        config = state.config
+        return {
+            "VectorCount": len(state.index) if state.index else 0,
+            "Dimensions": config.vector_dimensionality,
+            "IndexType": config.vector_index_type.value,
+            "M": config.m,
+            "EfConstruction": config.ef_construction,
+            "DefaultEf": config.default_ef,
+            "EstimatedMemoryBytes": _estimated_memory(state.index),
+            "IsLoaded": state.index is not None,
+            "LastRebuildUtc": state.last_rebuild.isoformat()
+            if state.last_rebuild
+            else None,
+            "DistanceMetric": config.distance_metric,
+        }
+
+
+def _estimated_memory(index: Optional[LocalVectorIndex]) -> int:
+    """Bytes held by an index's vectors plus 4 bytes per neighbour link."""
+    if index is None:
+        return 0
+    links = sum(len(layer) for node in index._links for layer in node)
+    return int(index._vectors.nbytes) + 4 * links
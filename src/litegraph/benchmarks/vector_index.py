@@ -0,0 +1,343 @@
+"""
+Recall and latency benchmark for vector index configurations.
+
+``run_index_benchmark`` loads an embedding set into a scratch graph, then for each
+index configuration enables and rebuilds the graph's vector index and measures:
+
+- recall@k of node vector searches against exact NumPy brute force;
+- p50/p99 latency of sequential searches and QPS of concurrent searches;
+- rebuild time and ``EstimatedMemoryBytes`` from the index statistics.
+
+Run ``python -m litegraph.benchmarks.vector_index --stand-in`` to benchmark the
+in-process stand-in server, e.g. in CI, or pass ``--endpoint`` and ``--tenant``
+to benchmark a LiteGraph server.
+"""
+
+import argparse
+import itertools
+import time
+import uuid
+from dataclasses import dataclass, fields
+from typing import Iterable, List, Optional, Sequence
+
+from ..configuration import get_client
+from ..enums.vector_index_type_enum import Vector_Index_Type_Enum
+from ..enums.vector_search_domain_enum import VectorSearchDomainEnum
+from ..enums.vector_search_type_enum import VectorSearchTypeEnum
+from ..local.similarity import score, top_k
+from ..models.hnsw_lite_vector_index import HnswLiteVectorIndexModel
+from ..utils.concurrency import DEFAULT_MAX_CONCURRENCY
+from ..utils.numpy_helper import _require_numpy
+
+# Search type giving the exact ranking of each index distance metric.
+SEARCH_TYPES = {
+    "Cosine": VectorSearchTypeEnum.CosineSimilarity,
+    "Euclidean": VectorSearchTypeEnum.EuclidianDistance,
+    "DotProduct": VectorSearchTypeEnum.DotProduct,
+}
+
+
+@dataclass
+class IndexBenchmarkResult:
+    """
+    Measurements of one vector index configuration.
+
+    Attributes:
+        config: The benchmarked configuration.
+        recall: Mean recall@k against exact search.
+        latency_p50_ms: Median latency of sequential searches, in milliseconds.
+        latency_p99_ms: 99th percentile latency of sequential searches, in milliseconds.
+        qps: Searches per second with concurrent requests.
+        rebuild_seconds: Time until ``VectorIndex.rebuild_async`` reported the
+            rebuild as complete, including polling delay.
+        estimated_memory_bytes: ``EstimatedMemoryBytes`` reported after the rebuild.
+    """
+
+    config: HnswLiteVectorIndexModel
+    recall: float
+    latency_p50_ms: float
+    latency_p99_ms: float
+    qps: float
+    rebuild_seconds: float
+    estimated_memory_bytes: int
+
+    def as_dict(self) -> dict:
+        """
+        Return the measurements and index parameters as a flat dictionary.
+        """
+        result = {
+            field.name: getattr(self, field.name)
+            for field in fields(self)
+            if field.name != "config"
+        }
+        return {
+            "vector_index_type": self.config.vector_index_type.value,
+            "m": self.config.m,
+            "ef_construction": self.config.ef_construction,
+            "default_ef": self.config.default_ef,
+            "distance_metric": self.config.distance_metric,
+            **result,
+        }
+
+
+def sweep_configs(
+    m: Iterable[int] = (16,),
+    ef_construction: Iterable[int] = (200,),
+    default_ef: Iterable[int] = (50,),
+    vector_index_types: Iterable[Vector_Index_Type_Enum] = (
+        Vector_Index_Type_Enum.HnswRam,
+    ),
+    distance_metric: str = "Cosine",
+) -> List[HnswLiteVectorIndexModel]:
+    """
+    Build the configurations of a parameter grid.
+
+    Returns:
+        List[HnswLiteVectorIndexModel]: One configuration per combination.
+    """
+    return [
+        HnswLiteVectorIndexModel(
+            vector_index_type=index_type,
+            m=links,
+            ef_construction=construction,
+            default_ef=ef,
+            distance_metric=distance_metric,
+        )
+        for index_type, links, construction, ef in itertools.product(
+            vector_index_types, m, ef_construction, default_ef
+        )
+    ]
+
+
+def _recall(found: Sequence, expected: Sequence) -> float:
+    expected = set(expected)
+    if not expected:
+        return 1.0
+    return len(expected.intersection(found)) / len(expected)
+
+
+def run_index_benchmark(
+    configs: Sequence[HnswLiteVectorIndexModel],
+    embeddings=None,
+    queries=None,
+    k: int = 10,
+    count: int = 2000,
+    dimensionality: int = 64,
+    query_count: int = 100,
+    seed: int = 0,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    keep_graph: bool = False,
+    rebuild_timeout: Optional[float] = None,
+    rebuild_poll_interval: float = 0.1,
+) -> List[IndexBenchmarkResult]:
+    """
+    Benchmark vector index configurations on a scratch graph.
+
+    The graph is created in the configured client's tenant and deleted afterwards
+    unless ``keep_graph`` is set. All configurations must use the same distance
+    metric, which defines the exact ranking recall is measured against.
+
+    Args:
+        configs: The configurations to compare, e.g. from ``sweep_configs``.
+        embeddings: Array-like ``(n, d)`` embedding set. Random if not given.
+        queries: Array-like ``(q, d)`` queries. Random if not given.
+        k: Number of neighbours per search.
+        count: Number of random embeddings when ``embeddings`` is not given.
+        dimensionality: Dimensionality of the random embeddings.
+        query_count: Number of random queries when ``queries`` is not given.
+        seed: Seed for the random embeddings and queries.
+        max_concurrency: Requests in flight while measuring QPS.
+        keep_graph: Keep the scratch graph instead of deleting it.
+        rebuild_timeout: Seconds to wait for each index rebuild, or None to wait
+            until it completes.
+        rebuild_poll_interval: Seconds before the first rebuild progress poll.
+
+    Returns:
+        List[IndexBenchmarkResult]: One result per configuration, in order.
+    """
+    np = _require_numpy()
+    from ..resources.graphs import Graph
+    from ..resources.nodes import Node
+    from ..resources.vector_index import VectorIndex
+    from ..resources.vectors import Vector
+
+    if not configs:
+        return []
+    metrics = {config.distance_metric for config in configs}
+    if len(metrics) != 1 or next(iter(metrics)) not in SEARCH_TYPES:
+        raise ValueError(
+            f"All configurations must use one distance metric of {tuple(SEARCH_TYPES)}."
+        )
+    search_type = SEARCH_TYPES[metrics.pop()]
+
+    rng = np.random.default_rng(seed)
+    if embeddings is None:
+        embeddings = rng.standard_normal((count, dimensionality))
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if queries is None:
+        queries = rng.standard_normal((query_count, embeddings.shape[1]))
+    queries = np.asarray(queries, dtype=np.float32)
+
+    tenant_guid = get_client().tenant_guid
+    graph_guid = Graph.create(name=f"index-benchmark-{uuid.uuid4()}").guid
+    try:
+        node_guids = [str(uuid.uuid4()) for _ in range(len(embeddings))]
+        Node.create_multiple(
+            [
+                {"GUID": guid, "GraphGUID": graph_guid, "Name": f"benchmark-{row}"}
+                for row, guid in enumerate(node_guids)
+            ],
+            validate=False,
+            graph_guid=graph_guid,
+        )
+        Vector.bulk_upload(embeddings, node_guids=node_guids, graph_guid=graph_guid)
+
+        exact, _ = top_k(score(queries, embeddings, search_type), k, search_type)
+        expected = [[node_guids[i] for i in row] for row in exact.tolist()]
+
+        def search(rows):
+            return Vector.search_vectors_batch(
+                VectorSearchDomainEnum.Node,
+                rows,
+                tenant_guid,
+                graph_guid=graph_guid,
+                search_type=search_type,
+                k=k,
+                max_concurrency=max_concurrency,
+            )
+
+        results = []
+        for config in configs:
+            config = config.model_copy(
+                update={
+                    "graph_guid": graph_guid,
+                    "vector_dimensionality": embeddings.shape[1],
+                }
+            )
+            VectorIndex.enable(graph_guid, config)
+            started = time.perf_counter()
+            stats = VectorIndex.rebuild_async(
+                graph_guid,
+                poll_interval=rebuild_poll_interval,
+                timeout=rebuild_timeout,
+            ).result()
+            rebuild_seconds = time.perf_counter() - started
+
+            latencies = []
+            recalls = []
+            for query, wanted in zip(queries, expected):
+                started = time.perf_counter()
+                found = search(query[None, :])
+                latencies.append(time.perf_counter() - started)
+                recalls.append(_recall(found.guids[0][: found.counts[0]], wanted))
+
+            started = time.perf_counter()
+            search(queries)
+            elapsed = time.perf_counter() - started
+
+            latencies = np.asarray(latencies) * 1000
+            results.append(
+                IndexBenchmarkResult(
+                    config=config,
+                    recall=float(np.mean(recalls)),
+                    latency_p50_ms=float(np.percentile(latencies, 50)),
+                    latency_p99_ms=float(np.percentile(latencies, 99)),
+                    qps=len(queries) / elapsed if elapsed else float("inf"),
+                    rebuild_seconds=rebuild_seconds,
+                    estimated_memory_bytes=stats.estimated_memory_bytes,
+                )
+            )
+        return results
+    finally:
+        if not keep_graph:
+            Graph.delete(graph_guid, force=True)
+
+
+def format_report(results: Sequence[IndexBenchmarkResult]) -> str:
+    """
+    Format benchmark results as a Markdown table, best recall first.
+    """
+    header = (
+        "| Type | M | EfConstruction | DefaultEf | Recall | p50 ms | p99 ms "
+        "| QPS | Rebuild s | Memory MB |"
+    )
+    lines = [header, "|---" * (header.count("|") - 1) + "|"]
+    for result in sorted(results, key=lambda result: -result.recall):
+        config = result.config
+        lines.append(
+            f"| {config.vector_index_type.value} | {config.m} "
+            f"| {config.ef_construction} | {config.default_ef} "
+            f"| {result.recall:.3f} | {result.latency_p50_ms:.2f} "
+            f"| {result.latency_p99_ms:.2f} | {result.qps:.0f} "
+            f"| {result.rebuild_seconds:.2f} "
+            f"| {result.estimated_memory_bytes / 1_000_000:.1f} |"
+        )
+    return "\n".join(lines)
+
+
+def _integers(value: str) -> List[int]:
+    return [int(item) for item in value.split(",")]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Command line entry point; prints the comparison report.
+    """
+    from ..configuration import configure
+    from ..sdk_logging import set_log_level
+    from .stand_in import StandInServer
+
+    parser = argparse.ArgumentParser(
+        prog="python -m litegraph.benchmarks.vector_index",
+        description="Compare LiteGraph vector index configurations.",
+    )
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
+        "--stand-in", action="store_true", help="Use a local stand-in server."
+    )
+    target.add_argument("--endpoint", help="LiteGraph server URL.")
+    parser.add_argument("--tenant", help="Tenant GUID (required with --endpoint).")
+    parser.add_argument("--access-key")
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--dimensionality", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--m", type=_integers, default=[16])
+    parser.add_argument("--ef-construction", type=_integers, default=[200])
+    parser.add_argument("--ef", type=_integers, default=[50])
+    parser.add_argument(
+        "--index-types",
+        type=lambda value: [Vector_Index_Type_Enum(item) for item in value.split(",")],
+        default=[Vector_Index_Type_Enum.HnswRam],
+    )
+    parser.add_argument("--metric", default="Cosine", choices=tuple(SEARCH_TYPES))
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+    set_log_level(args.log_level)
+
+    configs = sweep_configs(
+        m=args.m,
+        ef_construction=args.ef_construction,
+        default_ef=args.ef,
+        vector_index_types=args.index_types,
+        distance_metric=args.metric,
+    )
+    options = dict(
+        k=args.k,
+        count=args.count,
+        dimensionality=args.dimensionality,
+        query_count=args.queries,
+    )
+    if args.stand_in:
+        with StandInServer().configured():
+            results = run_index_benchmark(configs, **options)
+    else:
+        if not args.tenant:
+            parser.error("--tenant is required with --endpoint")
+        configure(args.endpoint, args.tenant, access_key=args.access_key)
+        results = run_index_benchmark(configs, **options)
+    print(format_report(results))
+
+
+if __name__ == "__main__":
+    main()
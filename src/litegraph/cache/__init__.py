@@ -0,0 +1,6 @@
+"""
+Opt-in client-side caches in front of LiteGraph API calls.
+
+Caches register a mutation listener on the configured client, so writes made
+through the same client invalidate the affected entries.
+"""
@@ -0,0 +1,287 @@
+"""
+Memoization of route results.
+
+``RouteCache`` answers repeated ``Routes.routes``, ``RouteEdges.between`` and
+``RouteNodes.between`` calls for the same graph, nodes and filters from memory.
+Node and edge writes made through the same client invalidate the graph's entries,
+and writes made by other clients are detected by periodically comparing the
+graph's node and edge counts from ``Graph.retrieve_statistics``.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from ..configuration import get_client
+
+GRAPH_IN_URL = re.compile(r"/graphs/([^/?]+)")
+
+# Writes to vectors and vector indexes cannot change routes, whether or not their
+# URL names a graph.
+UNRELATED_IN_URL = re.compile(r"/(vectors|vectorindex)(/|\?|$)")
+
+
+class RouteCache:
+    """
+    LRU and TTL bounded cache of route results keyed on graph, node pair and filters.
+
+    Writes made through the client (PUT/DELETE requests) to a graph's nodes, edges,
+    labels or tags, or to the graph itself, invalidate that graph's entries; other
+    writes whose URL has no graph invalidate the whole cache, and vector writes
+    invalidate nothing. Every ``check_interval`` seconds the node and edge counts
+    of a graph are compared with those seen when its entries were cached, catching
+    writes made by other clients that add or remove nodes or edges.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl: Optional[float] = None,
+        check_interval: Optional[float] = 60.0,
+    ):
+        """
+        Create an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results; least recently used go first.
+            ttl: Seconds an entry stays valid, or None to keep entries until evicted.
+            check_interval: Seconds between statistics checks of a graph, or None
+                to rely on invalidation by this client only.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        # graph GUID -> ((nodes, edges), time of the last check)
+        self._counts: Dict[str, Tuple[Tuple[int, int], float]] = {}
+        # Invalidation counters, whole-cache and per graph. Lookups snapshot them
+        # to detect writes made while a route was being fetched.
+        self._cleared = 0
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._client = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _attach(self) -> None:
+        """Listen for writes on the currently configured client."""
+        client = get_client()
+        if client is self._client:
+            return
+        if self._client is not None:
+            self._client.remove_mutation_listener(self._on_mutation)
+        client.add_mutation_listener(self._on_mutation)
+        self._client = client
+
+    def detach(self) -> None:
+        """
+        Stop listening for writes on the client.
+        """
+        if self._client is not None:
+            self._client.remove_mutation_listener(self._on_mutation)
+            self._client = None
+
+    def _on_mutation(self, method: str, url: str) -> None:
+        url = "/" + url.lstrip("/")
+        if UNRELATED_IN_URL.search(url):
+            return
+        match = GRAPH_IN_URL.search(url)
+        self.invalidate(match.group(1) if match else None)
+
+    @staticmethod
+    def _filter_hash(edge_filter, node_filter) -> Optional[str]:
+        if edge_filter is None and node_filter is None:
+            return None
+        filters = [
+            value.model_dump(mode="json", by_alias=True)
+            if hasattr(value, "model_dump")
+            else value
+            for value in (edge_filter, node_filter)
+        ]
+        encoded = json.dumps(filters, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _graph_counts(self, graph_guid: str) -> Tuple[int, int]:
+        from ..resources.graphs import Graph
+
+        stats = Graph.retrieve_statistics(graph_guid)
+        if hasattr(stats, "model_dump"):
+            stats = stats.model_dump(by_alias=True)
+        stats = stats or {}
+        return int(stats.get("Nodes") or 0), int(stats.get("Edges") or 0)
+
+    def _check(self, graph_guid: str) -> None:
+        """Invalidate a graph whose node or edge count changed since the last check."""
+        if self.check_interval is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            seen = self._counts.get(graph_guid)
+            if seen is not None and now - seen[1] < self.check_interval:
+                return
+            # Claim the check so concurrent lookups do not repeat it.
+            self._counts[graph_guid] = (seen[0] if seen else None, now)
+        counts = self._graph_counts(graph_guid)
+        with self._lock:
+            if seen is not None and seen[0] != counts:
+                self.invalidate(graph_guid)
+            self._counts[graph_guid] = (counts, now)
+
+    def _generation(self, graph_guid: str) -> Tuple[int, int]:
+        """Snapshot of the invalidations that would drop entries of ``graph_guid``."""
+        with self._lock:
+            return self._cleared, self._generations.get(graph_guid, 0)
+
+    def get(self, key: tuple):
+        """
+        Return the cached result for a key, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                self.ttl is None or time.monotonic() - entry[1] <= self.ttl
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple, result) -> None:
+        """
+        Cache a result under a key.
+        """
+        with self._lock:
+            self._entries[key] = (result, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _lookup(self, key: tuple, fetch):
+        self._attach()
+        self._check(key[1])
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        generation = self._generation(key[1])
+        result = fetch()
+        with self._lock:
+            # Skip caching a route that a write invalidated while it was fetched.
+            if self._generation(key[1]) == generation:
+                self.put(key, result)
+        return result
+
+    def routes(self, graph_guid: str, **kwargs):
+        """
+        ``Routes.routes`` answered from the cache when the same route was requested.
+
+        Takes the same arguments as ``Routes.routes``. The result model is shared
+        with the cache and should not be modified.
+        """
+        from ..resources.routes import Routes
+
+        client = get_client()
+        graph_guid = client.graph_guid or graph_guid
+        key = (
+            "routes",
+            str(graph_guid),
+            kwargs.get("tenant_guid") or client.tenant_guid,
+            kwargs.get("from_guid"),
+            kwargs.get("to_guid"),
+            self._filter_hash(kwargs.get("edge_filter"), kwargs.get("node_filter")),
+        )
+        return self._lookup(key, lambda: Routes.routes(graph_guid, **kwargs))
+
+    def between(self, graph_guid: str, from_node_guid: str, to_node_guid: str):
+        """
+        ``RouteEdges.between`` answered from the cache when the same pair was requested.
+
+        The returned list is a copy, but the edge models are shared with the cache.
+        """
+        from ..resources.routes_between import RouteEdges
+
+        client = get_client()
+        graph_guid = client.graph_guid or graph_guid
+        key = (
+            "between",
+            str(graph_guid),
+            client.tenant_guid,
+            from_node_guid,
+            to_node_guid,
+            None,
+        )
+        return list(
+            self._lookup(
+                key,
+                lambda: RouteEdges.between(graph_guid, from_node_guid, to_node_guid),
+            )
+        )
+
+    def nodes_between(self, graph_guid: str, node_guid: str):
+        """
+        ``RouteNodes.between`` answered from the cache when the same node was requested.
+
+        The returned list is a copy, but the node models are shared with the cache.
+        """
+        from ..resources.route_traversal import RouteNodes
+
+        client = get_client()
+        graph_guid = client.graph_guid or graph_guid
+        key = (
+            "nodes_between",
+            str(graph_guid),
+            client.tenant_guid,
+            node_guid,
+            None,
+            None,
+        )
+        return list(
+            self._lookup(key, lambda: RouteNodes.between(graph_guid, node_guid))
+        )
+
+    def invalidate(self, graph_guid: Optional[str] = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            graph_guid: Only drop entries for this graph. Drops everything if not given.
+
+        Returns:
+            int: The number of entries dropped.
+        """
+        with self._lock:
+            if graph_guid is None:
+                self._cleared += 1
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._counts.clear()
+                return dropped
+            graph_guid = str(graph_guid)
+            self._generations[graph_guid] = self._generations.get(graph_guid, 0) + 1
+            # The next lookup takes a new statistics baseline for the graph.
+            self._counts.pop(graph_guid, None)
+            stale = [key for key in self._entries if key[1] == graph_guid]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the hit and miss counters.
+        """
+        with self._lock:
+            self.invalidate()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,305 @@
+"""
+Semantic cache for vector search results.
+
+Near-duplicate query embeddings (the same prompt embedded slightly differently)
+are answered from the cache instead of a new ``Vector.search_vectors`` round-trip.
+Queries are bucketed with random-hyperplane LSH, and a cached query is reused when
+its cosine similarity to the new one reaches ``threshold`` and the domain, graph,
+labels, tags and filter expression are the same.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from ..configuration import get_client
+from ..enums.vector_search_domain_enum import VectorSearchDomainEnum
+from ..utils.numpy_helper import _require_numpy
+
+GRAPH_IN_URL = re.compile(r"/graphs/([^/?]+)")
+
+
+class VectorSearchCache:
+    """
+    LRU and TTL bounded cache of vector search results keyed on query embeddings.
+
+    Writes made through the client (PUT/DELETE requests and index rebuilds) in a
+    graph invalidate that graph's entries; writes whose URL has no graph, such as
+    vector creation, invalidate the whole cache.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.98,
+        max_entries: int = 1024,
+        ttl: Optional[float] = 300.0,
+        bits: int = 16,
+        seed: int = 0,
+    ):
+        """
+        Create an empty cache.
+
+        Args:
+            threshold: Minimum cosine similarity between queries for a hit.
+            max_entries: Maximum number of cached queries; least recently used go first.
+            ttl: Seconds an entry stays valid, or None to keep entries until evicted.
+            bits: Number of LSH hyperplanes. More bits mean smaller buckets.
+            seed: Seed for the LSH hyperplanes.
+        """
+        _require_numpy()
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1].")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        if not 1 <= bits <= 62:
+            raise ValueError("bits must be between 1 and 62.")
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.bits = bits
+        self.seed = seed
+        self.hits = 0
+        self.misses = 0
+
+        self._planes = {}
+        self._entries = OrderedDict()
+        self._buckets = {}
+        self._next_id = 0
+        # Invalidation counters: of every invalidation, of whole-cache ones, and
+        # per graph. Searches snapshot them to detect writes made while in flight.
+        self._epoch = 0
+        self._cleared = 0
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._client = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _attach(self) -> None:
+        """Listen for writes on the currently configured client."""
+        client = get_client()
+        if client is self._client:
+            return
+        if self._client is not None:
+            self._client.remove_mutation_listener(self._on_mutation)
+        client.add_mutation_listener(self._on_mutation)
+        self._client = client
+
+    def detach(self) -> None:
+        """
+        Stop listening for writes on the client.
+        """
+        if self._client is not None:
+            self._client.remove_mutation_listener(self._on_mutation)
+            self._client = None
+
+    def _on_mutation(self, method: str, url: str) -> None:
+        match = GRAPH_IN_URL.search("/" + url.lstrip("/"))
+        self.invalidate(match.group(1) if match else None)
+
+    def _hash(self, query) -> int:
+        np = _require_numpy()
+        planes = self._planes.get(len(query))
+        if planes is None:
+            rng = np.random.default_rng(self.seed)
+            planes = rng.standard_normal((self.bits, len(query))).astype(np.float32)
+            self._planes[len(query)] = planes
+        signs = (planes @ query) >= 0
+        return int(signs.astype(np.int64) @ (1 << np.arange(self.bits, dtype=np.int64)))
+
+    def _probes(self, code: int):
+        """The bucket of a query and its neighbours at Hamming distance one."""
+        yield code
+        for bit in range(self.bits):
+            yield code ^ (1 << bit)
+
+    @staticmethod
+    def _key(domain, tenant_guid, graph_guid, labels, tags, filter_expr) -> tuple:
+        if hasattr(filter_expr, "model_dump"):
+            filter_expr = filter_expr.model_dump(mode="json", by_alias=True)
+        return (
+            VectorSearchDomainEnum(domain).value,
+            str(tenant_guid) if tenant_guid else None,
+            str(graph_guid) if graph_guid else None,
+            tuple(sorted(labels or [])),
+            tuple(sorted((tags or {}).items())),
+            json.dumps(filter_expr, sort_keys=True, default=str)
+            if filter_expr
+            else None,
+        )
+
+    def _generation(self, graph_guid) -> tuple:
+        """Snapshot of the invalidations that would drop a search of ``graph_guid``."""
+        with self._lock:
+            if graph_guid is None:
+                return (self._epoch,)
+            return self._cleared, self._generations.get(str(graph_guid), 0)
+
+    def _remove(self, entry_id: int) -> None:
+        key, code, _, _, _ = self._entries.pop(entry_id)
+        bucket = self._buckets.get((key, code))
+        if bucket is not None:
+            bucket.discard(entry_id)
+            if not bucket:
+                del self._buckets[(key, code)]
+
+    def get(
+        self,
+        domain: VectorSearchDomainEnum,
+        embeddings: List[float],
+        tenant_guid=None,
+        graph_guid=None,
+        labels: List[str] = None,
+        tags: dict = None,
+        filter_expr: dict = None,
+    ):
+        """
+        Return the cached results of a similar query, or None on a miss.
+        """
+        np = _require_numpy()
+        query = np.asarray(embeddings, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return None
+        query = query / norm
+        key = self._key(domain, tenant_guid, graph_guid, labels, tags, filter_expr)
+        code = self._hash(query)
+        now = time.monotonic()
+
+        with self._lock:
+            best, best_similarity = None, self.threshold
+            for probe in self._probes(code):
+                for entry_id in list(self._buckets.get((key, probe), ())):
+                    _, _, cached, _, created = self._entries[entry_id]
+                    if self.ttl is not None and now - created > self.ttl:
+                        self._remove(entry_id)
+                        continue
+                    if len(cached) != len(query):
+                        continue
+                    similarity = float(cached @ query)
+                    if similarity >= best_similarity:
+                        best, best_similarity = entry_id, similarity
+            if best is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(best)
+            self.hits += 1
+            return list(self._entries[best][3])
+
+    def put(
+        self,
+        results: list,
+        domain: VectorSearchDomainEnum,
+        embeddings: List[float],
+        tenant_guid=None,
+        graph_guid=None,
+        labels: List[str] = None,
+        tags: dict = None,
+        filter_expr: dict = None,
+    ) -> None:
+        """
+        Cache the results of a query.
+        """
+        np = _require_numpy()
+        query = np.asarray(embeddings, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return
+        query = query / norm
+        key = self._key(domain, tenant_guid, graph_guid, labels, tags, filter_expr)
+        code = self._hash(query)
+
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (
+                key,
+                code,
+                query,
+                list(results),
+                time.monotonic(),
+            )
+            self._buckets.setdefault((key, code), set()).add(entry_id)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def search_vectors(
+        self,
+        domain: VectorSearchDomainEnum,
+        embeddings: List[float],
+        tenant_guid=None,
+        graph_guid=None,
+        labels: List[str] = None,
+        tags: dict = None,
+        filter_expr: dict = None,
+    ):
+        """
+        ``Vector.search_vectors`` answered from the cache when a similar query was seen.
+
+        Takes the same arguments as ``Vector.search_vectors``. The returned list is a
+        copy, but the result models are shared with the cache.
+        """
+        from ..resources.vectors import Vector
+
+        self._attach()
+        arguments = dict(
+            domain=domain,
+            embeddings=embeddings,
+            tenant_guid=tenant_guid,
+            graph_guid=graph_guid,
+            labels=labels,
+            tags=tags,
+            filter_expr=filter_expr,
+        )
+        cached = self.get(**arguments)
+        if cached is not None:
+            return cached
+        generation = self._generation(graph_guid)
+        results = Vector.search_vectors(**arguments)
+        with self._lock:
+            # Skip caching results that a write invalidated while they were fetched.
+            if self._generation(graph_guid) == generation:
+                self.put(results, **arguments)
+        return results
+
+    def invalidate(self, graph_guid: Optional[str] = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            graph_guid: Only drop entries for this graph (and tenant-wide searches).
+                Drops everything if not given.
+
+        Returns:
+            int: The number of entries dropped.
+        """
+        with self._lock:
+            self._epoch += 1
+            if graph_guid is None:
+                self._cleared += 1
+                dropped = len(self._entries)
+                self._entries.clear()
+                self._buckets.clear()
+                return dropped
+            graph_guid = str(graph_guid)
+            self._generations[graph_guid] = self._generations.get(graph_guid, 0) + 1
+            stale = [
+                entry_id
+                for entry_id, (key, _, _, _, _) in self._entries.items()
+                if key[2] in (graph_guid, None)
+            ]
+            for entry_id in stale:
+                self._remove(entry_id)
+            return len(stale)
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the hit and miss counters.
+        """
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
@@ -9,8 +9,14 @@ def configure(
     tenant_guid: str | None,
     graph_guid: str | None = None,
     access_key: str | None = None,
+    model_backend: str = "pydantic",
 ):
-    """Configure the SDK with access credentials, endpoint, and graph GUID."""
+    """
+    Configure the SDK with access credentials, endpoint, and graph GUID.
+
+    ``model_backend`` selects how responses of the hot resources (nodes, edges
+    and vectors) are decoded: ``"pydantic"`` (default) or ``"msgspec"``.
+    """
     global _client
     if tenant_guid is None:
         raise ValueError("Tenant GUID is required")
@@ -19,6 +25,7 @@ def configure(
         tenant_guid=tenant_guid,
         graph_guid=graph_guid,
         access_key=access_key,
+        model_backend=model_backend,
     )
 
 
@@ -0,0 +1,6 @@
+"""
+Client-side computation on data downloaded from LiteGraph.
+
+The modules in this package require the optional ``numpy`` dependency
+(``pip install litegraph[numpy]``).
+"""
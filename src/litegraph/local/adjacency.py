@@ -0,0 +1,218 @@
+"""
+Compressed sparse row (CSR) snapshot of a graph's edges for in-process traversal.
+"""
+
+from typing import List, Optional, Sequence
+
+from ..utils.numpy_helper import _require_numpy
+
+
+class GraphAdjacency:
+    """
+    Read-only adjacency of a graph in CSR form.
+
+    Nodes are numbered ``0..n-1`` in ``guids`` order. Outgoing edges of node ``i``
+    are ``out_targets[out_offsets[i]:out_offsets[i + 1]]``, with the parallel
+    ``out_costs`` and ``out_edges`` (indices into ``edge_guids``); incoming edges are
+    stored the same way in the ``in_*`` arrays. Index arrays are int32.
+
+    The methods taking GUIDs return GUID lists; the ``*_indices`` methods return
+    array views without copying, for use in tight loops.
+    """
+
+    def __init__(
+        self,
+        guids,
+        edge_guids,
+        out_offsets,
+        out_targets,
+        out_costs,
+        out_edges,
+        in_offsets,
+        in_sources,
+        in_costs,
+        in_edges,
+    ):
+        self.guids = guids
+        self.edge_guids = edge_guids
+        self.out_offsets = out_offsets
+        self.out_targets = out_targets
+        self.out_costs = out_costs
+        self.out_edges = out_edges
+        self.in_offsets = in_offsets
+        self.in_sources = in_sources
+        self.in_costs = in_costs
+        self.in_edges = in_edges
+        self._index = {guid: index for index, guid in enumerate(guids.tolist())}
+
+    @classmethod
+    def from_edges(
+        cls,
+        sources: Sequence[str],
+        targets: Sequence[str],
+        costs: Optional[Sequence[float]] = None,
+        edge_guids: Optional[Sequence[str]] = None,
+        node_guids: Optional[Sequence[str]] = None,
+    ) -> "GraphAdjacency":
+        """
+        Build the adjacency from parallel edge lists.
+
+        Args:
+            sources: The ``From`` node GUID of every edge.
+            targets: The ``To`` node GUID of every edge.
+            costs: The cost of every edge. Defaults to 0.
+            edge_guids: The GUID of every edge.
+            node_guids: Additional node GUIDs, e.g. to include nodes without edges.
+
+        Returns:
+            GraphAdjacency: The snapshot.
+        """
+        np = _require_numpy()
+        count = len(sources)
+        if len(targets) != count:
+            raise ValueError("sources and targets must have the same length.")
+        for name, values in (("costs", costs), ("edge_guids", edge_guids)):
+            if values is not None and len(values) != count:
+                raise ValueError(f"{name} must have one entry per edge.")
+
+        endpoints = np.asarray(list(sources) + list(targets), dtype=object)
+        extra = np.asarray(list(node_guids or []), dtype=object)
+        guids, inverse = np.unique(
+            np.concatenate([endpoints, extra]).astype(str), return_inverse=True
+        )
+        inverse = inverse.astype(np.int32)
+        source_index, target_index = inverse[:count], inverse[count : 2 * count]
+        costs = np.asarray(
+            costs if costs is not None else np.zeros(count), dtype=np.float32
+        )
+        edge_ids = np.arange(count, dtype=np.int32)
+        node_count = len(guids)
+
+        def compress(keys, values):
+            order = np.argsort(keys, kind="stable")
+            offsets = np.zeros(node_count + 1, dtype=np.int32)
+            np.cumsum(np.bincount(keys, minlength=node_count), out=offsets[1:])
+            return offsets, values[order], costs[order], edge_ids[order]
+
+        out_offsets, out_targets, out_costs, out_edges = compress(
+            source_index, target_index
+        )
+        in_offsets, in_sources, in_costs, in_edges = compress(
+            target_index, source_index
+        )
+        return cls(
+            guids.astype(object),
+            np.asarray(
+                list(edge_guids) if edge_guids is not None else [None] * count,
+                dtype=object,
+            ),
+            out_offsets,
+            out_targets,
+            out_costs,
+            out_edges,
+            in_offsets,
+            in_sources,
+            in_costs,
+            in_edges,
+        )
+
+    def __len__(self) -> int:
+        return len(self.guids)
+
+    def __contains__(self, guid: str) -> bool:
+        return guid in self._index
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edges in the snapshot."""
+        return len(self.out_targets)
+
+    def index_of(self, guid: str) -> int:
+        """
+        Return the index of a node GUID.
+
+        Raises:
+            KeyError: If the node is not in the snapshot.
+        """
+        return self._index[guid]
+
+    def successor_indices(self, index: int):
+        """Target indices of the outgoing edges of node ``index``."""
+        return self.out_targets[self.out_offsets[index] : self.out_offsets[index + 1]]
+
+    def predecessor_indices(self, index: int):
+        """Source indices of the incoming edges of node ``index``."""
+        return self.in_sources[self.in_offsets[index] : self.in_offsets[index + 1]]
+
+    def out_degree(self, guid: str) -> int:
+        """
+        Return the number of edges from a node.
+        """
+        index = self._index[guid]
+        return int(self.out_offsets[index + 1] - self.out_offsets[index])
+
+    def in_degree(self, guid: str) -> int:
+        """
+        Return the number of edges to a node.
+        """
+        index = self._index[guid]
+        return int(self.in_offsets[index + 1] - self.in_offsets[index])
+
+    def out_degrees(self):
+        """Out-degree of every node, as an array parallel to ``guids``."""
+        _require_numpy()
+        return self.out_offsets[1:] - self.out_offsets[:-1]
+
+    def in_degrees(self):
+        """In-degree of every node, as an array parallel to ``guids``."""
+        _require_numpy()
+        return self.in_offsets[1:] - self.in_offsets[:-1]
+
+    def out_sources(self):
+        """Source index of every edge, as an array parallel to ``out_targets``."""
+        np = _require_numpy()
+        return np.repeat(np.arange(len(self.guids), dtype=np.int32), self.out_degrees())
+
+    def children(self, guid: str) -> List[str]:
+        """
+        Return the GUIDs of the nodes this node has edges to, without duplicates.
+        """
+        return self._guids_of(self.successor_indices(self._index[guid]))
+
+    def parents(self, guid: str) -> List[str]:
+        """
+        Return the GUIDs of the nodes with edges to this node, without duplicates.
+        """
+        return self._guids_of(self.predecessor_indices(self._index[guid]))
+
+    def neighbors(self, guid: str) -> List[str]:
+        """
+        Return the GUIDs of the nodes connected to this node in either direction.
+        """
+        np = _require_numpy()
+        index = self._index[guid]
+        return self._guids_of(
+            np.concatenate(
+                [self.successor_indices(index), self.predecessor_indices(index)]
+            )
+        )
+
+    def edges_from(self, guid: str) -> List[str]:
+        """
+        Return the GUIDs of the edges from a node.
+        """
+        index = self._index[guid]
+        edges = self.out_edges[self.out_offsets[index] : self.out_offsets[index + 1]]
+        return self.edge_guids[edges].tolist()
+
+    def edges_to(self, guid: str) -> List[str]:
+        """
+        Return the GUIDs of the edges to a node.
+        """
+        index = self._index[guid]
+        edges = self.in_edges[self.in_offsets[index] : self.in_offsets[index + 1]]
+        return self.edge_guids[edges].tolist()
+
+    def _guids_of(self, indices) -> List[str]:
+        seen = dict.fromkeys(indices.tolist())
+        return [self.guids[index] for index in seen]
@@ -0,0 +1,539 @@
+"""
+In-process approximate nearest neighbour index over a graph's vectors.
+
+``LocalVectorIndex`` is an HNSW graph built with NumPy. It takes the same
+parameters as the server's ``HnswLiteVectorIndexModel`` (``m``,
+``ef_construction``, ``default_ef`` and ``distance_metric``) and answers
+``Vector.search_vectors``-style queries locally, falling back to the server when
+the local copy is stale.
+"""
+
+import heapq
+import math
+import random
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from ..enums.vector_search_domain_enum import VectorSearchDomainEnum
+from ..utils.numpy_helper import _require_numpy
+
+DISTANCE_METRICS = ("Cosine", "Euclidean", "DotProduct")
+
+# The graph is rebuilt without deleted vectors once they exceed this fraction of
+# the indexed vectors.
+COMPACT_FRACTION = 0.25
+
+
+class LocalVectorIndex:
+    """
+    HNSW index of a graph's vectors, kept in memory.
+
+    Vectors can be added incrementally with ``add`` or refreshed from the server
+    with ``sync``. Vectors removed or replaced are marked deleted and skipped in
+    results; they still take part in graph traversal until they exceed
+    ``COMPACT_FRACTION`` of the index, when ``compact`` rebuilds the graph
+    without them.
+    """
+
+    def __init__(
+        self,
+        dimensionality: Optional[int] = None,
+        m: int = 16,
+        ef_construction: int = 200,
+        default_ef: int = 50,
+        distance_metric: str = "Cosine",
+        graph_guid: Optional[str] = None,
+        tenant_guid: Optional[str] = None,
+        stale_after: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Create an empty index.
+
+        Args:
+            dimensionality: The embedding dimensionality. Inferred from the first add.
+            m: Maximum number of links per node on upper layers (``2 * m`` on layer 0).
+            ef_construction: Size of the candidate list while inserting.
+            default_ef: Size of the candidate list while searching.
+            distance_metric: ``Cosine``, ``Euclidean`` or ``DotProduct``.
+            graph_guid: The graph the vectors belong to, used by ``sync`` and fallback.
+            tenant_guid: The tenant of the graph. Defaults to client.tenant_guid.
+            stale_after: Seconds after the last sync at which the index is stale.
+            seed: Seed for the random layer assignment.
+        """
+        np = _require_numpy()
+        metric = {name.lower(): name for name in DISTANCE_METRICS}.get(
+            str(distance_metric).lower()
+        )
+        if metric is None:
+            raise ValueError(
+                f"Unknown distance metric '{distance_metric}', "
+                f"expected one of {DISTANCE_METRICS}"
+            )
+        if m < 2:
+            raise ValueError("m must be at least 2.")
+
+        self.dimensionality = dimensionality
+        self.m = m
+        self.ef_construction = ef_construction
+        self.default_ef = default_ef
+        self.distance_metric = metric
+        self.graph_guid = graph_guid
+        self.tenant_guid = tenant_guid
+        self.stale_after = stale_after
+
+        self.guids: List[str] = []
+        self.node_guids: List[Optional[str]] = []
+        self.edge_guids: List[Optional[str]] = []
+        self._positions = {}
+        self._deleted = set()
+        self._vectors = np.empty((0, dimensionality or 0), dtype=np.float32)
+        self._links: List[List[List[int]]] = []
+        self._entry: Optional[int] = None
+        self._max_level = -1
+        self._level_factor = 1 / math.log(m)
+        self._random = random.Random(seed)
+        self._synced_at: Optional[float] = None
+        self._stale = False
+
+    @classmethod
+    def from_config(cls, config, **kwargs) -> "LocalVectorIndex":
+        """
+        Create an empty index with the parameters of a HnswLiteVectorIndexModel.
+        """
+        return cls(
+            dimensionality=config.vector_dimensionality or None,
+            m=config.m,
+            ef_construction=config.ef_construction,
+            default_ef=config.default_ef,
+            distance_metric=config.distance_metric,
+            graph_guid=kwargs.pop("graph_guid", None) or config.graph_guid,
+            **kwargs,
+        )
+
+    @classmethod
+    def build(
+        cls,
+        graph_guid: str,
+        config=None,
+        tenant_guid: Optional[str] = None,
+        **kwargs,
+    ) -> "LocalVectorIndex":
+        """
+        Build an index from the vectors of a graph.
+
+        Args:
+            graph_guid: The graph to mirror.
+            config: The HnswLiteVectorIndexModel to copy parameters from. Read from
+                the server with ``VectorIndex.get_config`` if not given.
+            tenant_guid: The tenant GUID. If not provided, uses client.tenant_guid.
+            **kwargs: Additional arguments for the constructor, e.g. ``stale_after``.
+
+        Returns:
+            LocalVectorIndex: The populated index.
+        """
+        if config is None:
+            from ..resources.vector_index import VectorIndex
+
+            config = VectorIndex.get_config(graph_guid)
+        index = cls.from_config(
+            config, graph_guid=graph_guid, tenant_guid=tenant_guid, **kwargs
+        )
+        index.sync()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, guid: str) -> bool:
+        return guid in self._positions
+
+    def _prepare(self, embeddings):
+        np = _require_numpy()
+        embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        if self.distance_metric == "Cosine":
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.where(norms == 0, 1, norms)
+        return embeddings
+
+    def _distances(self, query, ids):
+        """Distances (smaller is closer) from a prepared query to the given nodes."""
+        vectors = self._vectors[ids]
+        if self.distance_metric == "Euclidean":
+            difference = vectors - query
+            return (difference * difference).sum(axis=1)
+        products = vectors @ query
+        return 1 - products if self.distance_metric == "Cosine" else -products
+
+    def _search_layer(self, query, entries: List[int], ef: int, level: int):
+        """Best-first search of one layer, returning up to ``ef`` (distance, id) pairs."""
+        np = _require_numpy()
+        distances = self._distances(query, np.array(entries)).tolist()
+        visited = set(entries)
+        candidates = list(zip(distances, entries))
+        heapq.heapify(candidates)
+        results = [(-distance, node) for distance, node in candidates]
+        heapq.heapify(results)
+        while len(results) > ef:
+            heapq.heappop(results)
+
+        while candidates:
+            distance, node = heapq.heappop(candidates)
+            if distance > -results[0][0] and len(results) >= ef:
+                break
+            neighbors = [
+                neighbor
+                for neighbor in self._links[node][level]
+                if neighbor not in visited
+            ]
+            if not neighbors:
+                continue
+            visited.update(neighbors)
+            neighbor_distances = self._distances(query, np.array(neighbors)).tolist()
+            for neighbor, neighbor_distance in zip(neighbors, neighbor_distances):
+                if len(results) < ef or neighbor_distance < -results[0][0]:
+                    heapq.heappush(candidates, (neighbor_distance, neighbor))
+                    heapq.heappush(results, (-neighbor_distance, neighbor))
+                    if len(results) > ef:
+                        heapq.heappop(results)
+        return sorted((-distance, node) for distance, node in results)
+
+    def _pairwise(self, ids):
+        """Distances between every pair of the given nodes."""
+        vectors = self._vectors[ids]
+        if self.distance_metric == "Euclidean":
+            squared = (vectors * vectors).sum(axis=1)
+            return squared[:, None] + squared[None, :] - 2 * vectors @ vectors.T
+        products = vectors @ vectors.T
+        return 1 - products if self.distance_metric == "Cosine" else -products
+
+    def _select_neighbors(self, candidates: List[Tuple[float, int]], count: int):
+        """
+        HNSW neighbour selection heuristic, keeping diverse neighbours and topping up
+        with the closest pruned candidates.
+        """
+        np = _require_numpy()
+        if len(candidates) <= count:
+            return [node for _, node in candidates]
+        nodes = [node for _, node in candidates]
+        pairwise = self._pairwise(np.array(nodes)).tolist()
+        selected = []
+        pruned = []
+        for position, (distance, node) in enumerate(candidates):
+            if len(selected) >= count:
+                break
+            row = pairwise[position]
+            if any(row[other] < distance for other in selected):
+                pruned.append(position)
+            else:
+                selected.append(position)
+        selected.extend(pruned[: count - len(selected)])
+        return [nodes[position] for position in selected]
+
+    def _insert(self, node: int) -> None:
+        np = _require_numpy()
+        level = int(-math.log(1 - self._random.random()) * self._level_factor)
+        self._links.append([[] for _ in range(level + 1)])
+        if self._entry is None:
+            self._entry = node
+            self._max_level = level
+            return
+
+        query = self._vectors[node]
+        entries = [self._entry]
+        for current in range(self._max_level, level, -1):
+            entries = [self._search_layer(query, entries, 1, current)[0][1]]
+        for current in range(min(level, self._max_level), -1, -1):
+            found = self._search_layer(query, entries, self.ef_construction, current)
+            limit = 2 * self.m if current == 0 else self.m
+            neighbors = self._select_neighbors(found, self.m)
+            self._links[node][current] = neighbors
+            for neighbor in neighbors:
+                links = self._links[neighbor][current]
+                links.append(node)
+                if len(links) > limit:
+                    distances = self._distances(
+                        self._vectors[neighbor], np.array(links)
+                    ).tolist()
+                    self._links[neighbor][current] = self._select_neighbors(
+                        sorted(zip(distances, links)), limit
+                    )
+            entries = [candidate for _, candidate in found]
+        if level > self._max_level:
+            self._entry = node
+            self._max_level = level
+
+    def add(
+        self,
+        guids: Sequence[str],
+        embeddings,
+        node_guids: Optional[Sequence[Optional[str]]] = None,
+        edge_guids: Optional[Sequence[Optional[str]]] = None,
+    ) -> int:
+        """
+        Insert vectors into the index. Vectors already present are replaced.
+
+        Args:
+            guids: The vector GUIDs, one per row.
+            embeddings: Array of shape ``(len(guids), d)``.
+            node_guids: Optional node GUIDs, one per row.
+            edge_guids: Optional edge GUIDs, one per row.
+
+        Returns:
+            int: The number of vectors inserted.
+        """
+        np = _require_numpy()
+        embeddings = self._prepare(embeddings)
+        if len(embeddings) != len(guids):
+            raise ValueError("Embeddings must have one row per GUID.")
+        if not len(guids):
+            return 0
+        if self.dimensionality is None:
+            self.dimensionality = embeddings.shape[1]
+        if embeddings.shape[1] != self.dimensionality:
+            raise ValueError(
+                f"Expected embeddings of dimensionality {self.dimensionality}."
+            )
+
+        start = len(self.guids)
+        self._vectors = np.concatenate(
+            [self._vectors.reshape(-1, self.dimensionality), embeddings]
+        )
+        for offset, guid in enumerate(guids):
+            previous = self._positions.get(guid)
+            if previous is not None:
+                self._deleted.add(previous)
+            self._positions[guid] = start + offset
+        self.guids.extend(guids)
+        self.node_guids.extend(
+            node_guids if node_guids is not None else [None] * len(guids)
+        )
+        self.edge_guids.extend(
+            edge_guids if edge_guids is not None else [None] * len(guids)
+        )
+        for node in range(start, start + len(guids)):
+            self._insert(node)
+        self._maybe_compact()
+        return len(guids)
+
+    def remove(self, guids: Sequence[str]) -> int:
+        """
+        Mark vectors as deleted so they are no longer returned.
+
+        Returns:
+            int: The number of vectors removed.
+        """
+        removed = 0
+        for guid in guids:
+            position = self._positions.pop(guid, None)
+            if position is not None:
+                self._deleted.add(position)
+                removed += 1
+        self._maybe_compact()
+        return removed
+
+    def _maybe_compact(self) -> None:
+        if len(self._deleted) > COMPACT_FRACTION * len(self.guids):
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Rebuild the graph from the live vectors, dropping the deleted ones.
+        """
+        np = _require_numpy()
+        live = sorted(self._positions.values())
+        self._vectors = np.ascontiguousarray(
+            self._vectors.reshape(-1, self.dimensionality or 0)[live]
+        )
+        self.guids = [self.guids[position] for position in live]
+        self.node_guids = [self.node_guids[position] for position in live]
+        self.edge_guids = [self.edge_guids[position] for position in live]
+        self._positions = {guid: node for node, guid in enumerate(self.guids)}
+        self._deleted = set()
+        self._links = []
+        self._entry = None
+        self._max_level = -1
+        for node in range(len(live)):
+            self._insert(node)
+
+    def sync(self) -> int:
+        """
+        Bring the index up to date with the graph's vectors on the server.
+
+        New and changed vectors are inserted and vectors no longer on the server
+        are removed.
+
+        Returns:
+            int: The number of vectors inserted.
+        """
+        from ..resources.vectors import Vector
+
+        np = _require_numpy()
+        matrix = Vector.download_matrix(self.graph_guid, self.tenant_guid)
+        guids = matrix.guids.tolist()
+        positions = np.array(
+            [self._positions.get(guid, -1) for guid in guids], dtype=np.int64
+        )
+        insert = positions < 0
+        existing = ~insert
+        if existing.any():
+            current = self._prepare(matrix.embeddings[existing])
+            changed = ~np.isclose(current, self._vectors[positions[existing]]).all(
+                axis=1
+            )
+            insert[np.flatnonzero(existing)[changed]] = True
+
+        self.remove(set(self._positions) - set(guids))
+        rows = np.flatnonzero(insert)
+        inserted = self.add(
+            [guids[row] for row in rows],
+            matrix.embeddings[rows],
+            node_guids=matrix.node_guids[rows].tolist(),
+            edge_guids=matrix.edge_guids[rows].tolist(),
+        )
+        self._synced_at = time.monotonic()
+        self._stale = False
+        return inserted
+
+    def mark_stale(self) -> None:
+        """
+        Mark the index stale, so ``search_vectors`` falls back to the server.
+        """
+        self._stale = True
+
+    def is_stale(self) -> bool:
+        """
+        Return True if the index was marked stale or is older than ``stale_after``.
+        """
+        if self._stale:
+            return True
+        if self.stale_after is None or self._synced_at is None:
+            return False
+        return time.monotonic() - self._synced_at > self.stale_after
+
+    def query(self, embeddings, k: int = 10, ef: Optional[int] = None):
+        """
+        Find the approximate nearest neighbours of a query.
+
+        Args:
+            embeddings: The query embedding.
+            k: Number of neighbours to return.
+            ef: Size of the candidate list. Defaults to ``default_ef``.
+
+        Returns:
+            Tuple[List[str], List[float]]: The vector GUIDs and their distances
+            (cosine distance, Euclidean distance or negative inner product),
+            closest first.
+        """
+        if self._entry is None or not self._positions:
+            return [], []
+        query = self._prepare(embeddings)[0]
+        if len(query) != self.dimensionality:
+            raise ValueError(
+                f"Expected a query of dimensionality {self.dimensionality}."
+            )
+        ef = max(ef or self.default_ef, k)
+        entries = [self._entry]
+        for level in range(self._max_level, 0, -1):
+            entries = [self._search_layer(query, entries, 1, level)[0][1]]
+        # Widen the search to make up for deleted nodes, at most to twice ``ef``;
+        # compaction keeps them to a fraction of the index.
+        found = self._search_layer(query, entries, ef + min(len(self._deleted), ef), 0)
+        found = [
+            (distance, node) for distance, node in found if node not in self._deleted
+        ][:k]
+        distances = [distance for distance, _ in found]
+        if self.distance_metric == "Euclidean":
+            distances = [math.sqrt(max(distance, 0.0)) for distance in distances]
+        return [self.guids[node] for _, node in found], distances
+
+    def search_vectors(
+        self,
+        domain: VectorSearchDomainEnum,
+        embeddings: List[float],
+        k: int = 10,
+        ef: Optional[int] = None,
+        labels: List[str] = None,
+        tags: dict = None,
+        filter_expr: dict = None,
+    ):
+        """
+        Answer a ``Vector.search_vectors`` query locally.
+
+        The query is sent to the server instead when the index is stale, when
+        labels, tags or a filter expression are given (they are not mirrored
+        locally), or for the Graph domain.
+
+        Args:
+            domain: Vector search domain (Node or Edge)
+            embeddings: Vector embeddings to search with
+            k: Number of results to return
+            ef: Size of the candidate list. Defaults to ``default_ef``.
+            labels: Optional list of labels to filter by
+            tags: Optional dictionary of tags to filter by
+            filter_expr: Optional filter expression
+
+        Returns:
+            List of VectorSearchResultModel, best first.
+        """
+        from ..configuration import get_client
+        from ..models.vector_search_response import VectorSearchResultModel
+        from ..resources.vectors import Vector
+
+        domain = VectorSearchDomainEnum(domain)
+        if (
+            self.is_stale()
+            or labels
+            or tags
+            or filter_expr
+            or domain == VectorSearchDomainEnum.Graph
+        ):
+            results = Vector.search_vectors(
+                domain=domain,
+                embeddings=embeddings,
+                tenant_guid=self.tenant_guid or get_client().tenant_guid,
+                graph_guid=self.graph_guid,
+                labels=labels,
+                tags=tags,
+                filter_expr=filter_expr,
+            )
+            return results[:k]
+
+        owners = (
+            self.node_guids
+            if domain == VectorSearchDomainEnum.Node
+            else self.edge_guids
+        )
+        # Vectors of the other domain are skipped, so widen the search until
+        # enough results of this domain are found.
+        wanted = k
+        while True:
+            guids, distances = self.query(embeddings, k=wanted, ef=ef)
+            hits = [
+                (owners[self._positions[guid]], distance)
+                for guid, distance in zip(guids, distances)
+                if owners[self._positions[guid]] is not None
+            ]
+            if len(hits) >= k or len(guids) < wanted:
+                break
+            wanted *= 2
+
+        owner_fields = {"GraphGUID": self.graph_guid, "TenantGUID": self.tenant_guid}
+        owner_fields = {key: value for key, value in owner_fields.items() if value}
+        results = []
+        for owner, distance in hits[:k]:
+            if self.distance_metric == "Cosine":
+                scores = {"Score": 1 - distance, "Distance": distance}
+            elif self.distance_metric == "Euclidean":
+                scores = {"Score": 1 / (1 + distance), "Distance": distance}
+            else:
+                scores = {"Score": -distance, "InnerProduct": -distance}
+            results.append(
+                VectorSearchResultModel.model_validate(
+                    {
+                        **scores,
+                        domain.value: {"GUID": owner, **owner_fields},
+                    }
+                )
+            )
+        return results
@@ -0,0 +1,121 @@
+from typing import Iterable, Optional, Sequence, Tuple
+
+from ..utils.numpy_helper import _require_numpy
+
+
+class EmbeddingCache:
+    """
+    In-memory cache of embeddings keyed by GUID.
+
+    Embeddings are kept in one contiguous float32 matrix, so looking up a set of
+    GUIDs is a single fancy-indexing operation.
+    """
+
+    def __init__(self, dimensionality: Optional[int] = None):
+        np = _require_numpy()
+        # GUID -> row of ``_embeddings``.
+        self._index = {}
+        self._embeddings = np.empty((0, dimensionality or 0), dtype=np.float32)
+        self.dimensionality = dimensionality
+
+    @classmethod
+    def from_matrix(cls, matrix, key: str = "node_guids", **kwargs) -> "EmbeddingCache":
+        """
+        Build a cache from a VectorMatrix returned by ``Vector.download_matrix``.
+
+        Args:
+            matrix: The VectorMatrix to cache.
+            key: The GUID array to key rows by: ``node_guids``, ``edge_guids`` or
+                ``guids`` (vector GUIDs). Rows without a GUID are skipped; if
+                several rows share a GUID the last one wins.
+            **kwargs: Further arguments of the constructor.
+
+        Returns:
+            EmbeddingCache: The populated cache.
+        """
+        np = _require_numpy()
+        guids = getattr(matrix, key)
+        keep = np.array([guid is not None for guid in guids], dtype=bool)
+        cache = cls(
+            dimensionality=matrix.embeddings.shape[1]
+            if matrix.embeddings.size
+            else None,
+            **kwargs,
+        )
+        cache.add(list(np.asarray(guids)[keep]), matrix.embeddings[keep])
+        return cache
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, guid: str) -> bool:
+        return guid in self._index
+
+    def _check(self, embeddings, count: int):
+        """Convert embeddings to float32 rows, checking their shape."""
+        np = _require_numpy()
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if embeddings.ndim != 2 or len(embeddings) != count:
+            raise ValueError("Embeddings must have one row per GUID.")
+        if count and self.dimensionality is None:
+            self.dimensionality = embeddings.shape[1]
+        if count and embeddings.shape[1] != self.dimensionality:
+            raise ValueError(
+                f"Expected embeddings of dimensionality {self.dimensionality}."
+            )
+        return embeddings
+
+    def add(self, guids: Sequence[str], embeddings) -> None:
+        """
+        Add or replace the embeddings of the given GUIDs.
+
+        Args:
+            guids: The GUIDs, one per row.
+            embeddings: Array of shape ``(len(guids), d)``.
+        """
+        np = _require_numpy()
+        embeddings = self._check(embeddings, len(guids))
+        if not len(guids):
+            return
+        if not len(self._embeddings):
+            self._embeddings = self._embeddings.reshape(0, self.dimensionality)
+
+        new_rows = []
+        pending = {}
+        for row, guid in enumerate(guids):
+            if guid in pending:
+                new_rows[pending[guid]] = row
+                continue
+            position = self._index.get(guid)
+            if position is None:
+                pending[guid] = len(new_rows)
+                self._index[guid] = len(self._embeddings) + len(new_rows)
+                new_rows.append(row)
+            else:
+                self._embeddings[position] = embeddings[row]
+        if new_rows:
+            self._embeddings = np.concatenate([self._embeddings, embeddings[new_rows]])
+
+    def lookup(self, guids: Iterable[str]) -> Tuple:
+        """
+        Look up the embeddings of the given GUIDs.
+
+        Args:
+            guids: The GUIDs to look up.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The embeddings of the GUIDs that
+            were found, and a boolean mask over ``guids`` of which were found.
+        """
+        return _lookup_rows(self._index, self._embeddings, guids)
+
+
+def _lookup_rows(rows: dict, embeddings, guids: Iterable[str]) -> Tuple:
+    """Gather the embedding rows of the GUIDs found in ``rows``."""
+    np = _require_numpy()
+    guids = list(guids)
+    positions = np.fromiter(
+        (rows.get(guid, -1) for guid in guids), dtype=np.int64, count=len(guids)
+    )
+    found = positions >= 0
+    return embeddings[positions[found]], found
@@ -0,0 +1,494 @@
+"""
+Memory-mapped float32 embedding store.
+
+A store is a directory holding:
+
+- ``embeddings.<n>.f32``: the embeddings as raw float32 rows, memory-mapped.
+- ``index.<n>.npy``: a structured array with the vector, node and edge GUID and
+  the ``LastUpdateUtc`` (microseconds since the epoch) of every row.
+- ``meta.json``: the dimensionality and the names of the current embedding and
+  index files.
+
+Rows are copy-on-write: a new or updated vector is always written to a fresh row
+past the end of the last flushed index, and ``flush`` publishes the new index by
+atomically replacing ``meta.json``. Readers therefore only ever see rows that
+were completely written before the index they loaded. Superseded and removed
+rows are reclaimed by ``compact``, which writes a new embedding file.
+
+Worker processes can open the same directory read-only; the embeddings are then
+shared zero-copy through the operating system's page cache.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from typing import Iterable, Optional, Sequence, Tuple, TypeVar
+
+from ..utils.numpy_helper import _require_numpy
+from .embedding_cache import EmbeddingCache, _lookup_rows
+
+EMBEDDINGS_FILE = "embeddings.{}.f32"
+INDEX_FILE = "index.{}.npy"
+META_FILE = "meta.json"
+
+GUID_WIDTH = 36
+KEYS = ("vector", "node", "edge")
+
+# Initial number of rows reserved when a store file is first created.
+INITIAL_CAPACITY = 1024
+
+# Number of rows copied at a time by ``compact``.
+COMPACT_CHUNK = 65536
+
+_Store = TypeVar("_Store", bound="EmbeddingStore")
+
+
+def _index_dtype():
+    np = _require_numpy()
+    return np.dtype(
+        [
+            ("guid", f"U{GUID_WIDTH}"),
+            ("node_guid", f"U{GUID_WIDTH}"),
+            ("edge_guid", f"U{GUID_WIDTH}"),
+            ("last_update", "<i8"),
+        ]
+    )
+
+
+def _timestamp(value) -> int:
+    """Convert a LastUpdateUtc value into microseconds since the epoch."""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1_000_000)
+
+
+class EmbeddingStore(EmbeddingCache):
+    """
+    Local embedding store keyed by vector GUID, node GUID and edge GUID.
+
+    An EmbeddingCache whose rows live in a memory-mapped file. ``lookup`` and
+    ``in`` match vector GUIDs; ``lookup(..., key="node")`` and ``keyed`` match
+    node or edge GUIDs.
+
+    Rows are only rewritten when the incoming vector has a newer ``LastUpdateUtc``
+    than the stored one, so a store can be refreshed incrementally with ``sync``.
+    Changes are published to readers by ``flush``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        dimensionality: Optional[int] = None,
+        readonly: bool = False,
+    ):
+        """
+        Open a store, creating it if it does not exist.
+
+        Args:
+            path: The directory of the store.
+            dimensionality: The embedding dimensionality. Inferred from the first
+                vectors added if not given.
+            readonly: Open an existing store without write access.
+
+        Raises:
+            FileNotFoundError: If ``readonly`` is set and the store does not exist.
+            ValueError: If ``dimensionality`` does not match the existing store.
+        """
+        np = _require_numpy()
+        super().__init__(dimensionality)
+        self.path = os.fspath(path)
+        self.readonly = readonly
+        self._embeddings = None
+
+        meta_path = os.path.join(self.path, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path) as meta_file:
+                meta = json.load(meta_file)
+            if dimensionality and meta["dimensionality"] not in (None, dimensionality):
+                raise ValueError(
+                    f"Store has dimensionality {meta['dimensionality']}, "
+                    f"not {dimensionality}."
+                )
+            self.dimensionality = meta["dimensionality"]
+            self._generation = meta["generation"]
+            self._files = (meta["embeddings"], meta["index"])
+            records = np.load(
+                os.path.join(self.path, self._files[1]),
+                mmap_mode="r" if readonly else None,
+            )
+            self._count = meta["count"]
+            self._records = records
+        elif readonly:
+            raise FileNotFoundError(f"No embedding store at {self.path}")
+        else:
+            os.makedirs(self.path, exist_ok=True)
+            self._generation = 0
+            self._files = (EMBEDDINGS_FILE.format(0), None)
+            self._count = 0
+            self._records = np.zeros(0, dtype=_index_dtype())
+        # Files named by the metadata on disk, and by the metadata before it.
+        # The latter are kept until the next flush for readers still loading them.
+        self._published = self._previous = self._files
+
+        self._open_embeddings()
+        self._rows = {"vector": self._index, "node": {}, "edge": {}}
+        columns = zip(
+            self._records["guid"][: self._count].tolist(),
+            self._records["node_guid"][: self._count].tolist(),
+            self._records["edge_guid"][: self._count].tolist(),
+        )
+        for row, guids in enumerate(columns):
+            for key, guid in zip(KEYS, guids):
+                if guid:
+                    self._rows[key][guid] = row
+
+    @classmethod
+    def open(cls, path: str) -> "EmbeddingStore":
+        """
+        Open an existing store read-only, e.g. from a worker process.
+        """
+        return cls(path, readonly=True)
+
+    def _open_embeddings(self) -> None:
+        np = _require_numpy()
+        file_path = os.path.join(self.path, self._files[0])
+        if not self.dimensionality or not os.path.exists(file_path):
+            return
+        capacity = os.path.getsize(file_path) // (4 * self.dimensionality)
+        if capacity:
+            self._embeddings = np.memmap(
+                file_path,
+                dtype=np.float32,
+                mode="r" if self.readonly else "r+",
+                shape=(capacity, self.dimensionality),
+            )
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the embedding file and index so ``rows`` more rows fit."""
+        np = _require_numpy()
+        if not rows:
+            return
+        needed = self._count + rows
+        capacity = 0 if self._embeddings is None else len(self._embeddings)
+        if needed > capacity:
+            capacity = max(needed, 2 * capacity, INITIAL_CAPACITY)
+            if self._embeddings is not None:
+                self._embeddings.flush()
+                self._embeddings = None
+            file_path = os.path.join(self.path, self._files[0])
+            with open(file_path, "ab") as embeddings_file:
+                embeddings_file.truncate(capacity * 4 * self.dimensionality)
+            self._open_embeddings()
+        if needed > len(self._records):
+            grown = np.zeros(len(self._embeddings), dtype=self._records.dtype)
+            grown[: self._count] = self._records[: self._count]
+            self._records = grown
+
+    @property
+    def embeddings(self):
+        """
+        The stored embeddings as an ``(n, d)`` float32 memory-mapped view.
+
+        Rows of superseded or removed vectors are kept, with empty GUIDs in
+        ``index``, until ``compact`` is called.
+        """
+        np = _require_numpy()
+        if self._embeddings is None:
+            return np.empty((0, self.dimensionality or 0), dtype=np.float32)
+        return self._embeddings[: self._count]
+
+    @property
+    def index(self):
+        """The structured array of GUIDs and update times, parallel to ``embeddings``."""
+        return self._records[: self._count]
+
+    @property
+    def stale_rows(self) -> int:
+        """Number of rows held by superseded or removed vectors."""
+        return self._count - len(self._index)
+
+    def _write(self, entries: dict) -> int:
+        """Append one fresh row per ``guid: (entry, embeddings)`` entry."""
+        self._reserve(len(entries))
+        for guid, (entry, embeddings) in entries.items():
+            old = self._index.get(guid)
+            if old is not None:
+                self._clear(old)
+            row = self._count
+            self._count += 1
+            self._records[row] = entry
+            self._embeddings[row] = embeddings
+            for key, key_guid in zip(KEYS, entry[:3]):
+                if key_guid:
+                    self._rows[key][key_guid] = row
+        return len(entries)
+
+    def _clear(self, row: int) -> None:
+        """Drop a row from the GUID maps and blank its index entry."""
+        for key, stored in zip(KEYS, self._records[row].tolist()[:3]):
+            if stored and self._rows[key].get(stored) == row:
+                del self._rows[key][stored]
+        self._records[row] = ("", "", "", 0)
+
+    def add(self, guids: Sequence[str], embeddings) -> None:
+        """
+        Add or replace embeddings keyed by vector GUID only.
+
+        Args:
+            guids: The vector GUIDs, one per row.
+            embeddings: Array of shape ``(len(guids), d)``.
+
+        Raises:
+            ValueError: If the store is read-only or the shapes do not match.
+        """
+        if self.readonly:
+            raise ValueError("Embedding store is read-only.")
+        embeddings = self._check(embeddings, len(guids))
+        self._write(
+            {
+                guid: ((guid, "", "", 0), row)
+                for guid, row in zip(guids, embeddings.tolist())
+            }
+        )
+
+    def upsert(self, vectors: Iterable) -> int:
+        """
+        Add new vectors and rewrite those whose ``LastUpdateUtc`` is newer.
+
+        Args:
+            vectors: VectorMetadataModel instances (or structs / dicts with the same
+                fields), e.g. from ``Vector.retrieve_all_graph_vectors`` or the
+                objects of an enumeration page.
+
+        Returns:
+            int: The number of rows written.
+
+        Raises:
+            ValueError: If the store is read-only or dimensionalities do not match.
+        """
+        if self.readonly:
+            raise ValueError("Embedding store is read-only.")
+
+        entries = {}
+        for vector in vectors:
+            record = vector if isinstance(vector, dict) else None
+            guid = record.get("GUID") if record else vector.guid
+            embeddings = (
+                record.get("Vectors") or record.get("Embeddings")
+                if record
+                else vector.vectors or vector.embeddings
+            )
+            if not guid or not embeddings:
+                continue
+            if self.dimensionality is None:
+                self.dimensionality = len(embeddings)
+            if len(embeddings) != self.dimensionality:
+                raise ValueError(
+                    f"Expected embeddings of dimensionality {self.dimensionality}."
+                )
+            updated = _timestamp(
+                record.get("LastUpdateUtc") if record else vector.last_update_utc
+            )
+            row = self._index.get(guid)
+            if row is not None and self._records["last_update"][row] >= updated:
+                continue
+            entry = (
+                guid,
+                (record.get("NodeGUID") if record else vector.node_guid) or "",
+                (record.get("EdgeGUID") if record else vector.edge_guid) or "",
+                updated,
+            )
+            entries[guid] = (entry, embeddings)
+        return self._write(entries)
+
+    def remove(self, guids: Iterable[str]) -> int:
+        """
+        Stop indexing the given vector GUIDs. Their rows are reclaimed by
+        ``compact``.
+
+        Returns:
+            int: The number of vectors removed.
+        """
+        if self.readonly:
+            raise ValueError("Embedding store is read-only.")
+        removed = 0
+        for guid in guids:
+            row = self._index.get(guid)
+            if row is not None:
+                self._clear(row)
+                removed += 1
+        return removed
+
+    def compact(self) -> int:
+        """
+        Copy the live rows into a new embedding file and flush the store.
+
+        Readers that opened the store earlier keep reading the previous file,
+        which is deleted by the next flush after this one.
+
+        Returns:
+            int: The number of rows reclaimed.
+
+        Raises:
+            ValueError: If the store is read-only.
+        """
+        np = _require_numpy()
+        if self.readonly:
+            raise ValueError("Embedding store is read-only.")
+        reclaimed = self.stale_rows
+        if not reclaimed:
+            return 0
+
+        live = np.flatnonzero(self._records["guid"][: self._count] != "")
+        self._generation += 1
+        self._files = (EMBEDDINGS_FILE.format(self._generation), self._files[1])
+        source, self._embeddings = self._embeddings, None
+        file_path = os.path.join(self.path, self._files[0])
+        with open(file_path, "wb") as embeddings_file:
+            embeddings_file.truncate(max(len(live), 1) * 4 * (self.dimensionality or 1))
+        self._open_embeddings()
+        for start in range(0, len(live), COMPACT_CHUNK):
+            rows = live[start : start + COMPACT_CHUNK]
+            self._embeddings[start : start + len(rows)] = source[rows]
+
+        self._records = self._records[live]
+        self._count = len(live)
+        for rows in self._rows.values():
+            rows.clear()
+        columns = zip(
+            self._records["guid"].tolist(),
+            self._records["node_guid"].tolist(),
+            self._records["edge_guid"].tolist(),
+        )
+        for row, guids in enumerate(columns):
+            for key, guid in zip(KEYS, guids):
+                if guid:
+                    self._rows[key][guid] = row
+        self.flush()
+        return reclaimed
+
+    def sync(
+        self,
+        graph_guid: Optional[str] = None,
+        tenant_guid: Optional[str] = None,
+        prune: bool = False,
+    ) -> int:
+        """
+        Refresh the store from the vectors of a graph and flush it to disk.
+
+        Only vectors that are new or have a newer ``LastUpdateUtc`` are rewritten.
+        The store is compacted once stale rows outnumber live ones.
+
+        Args:
+            graph_guid: The graph GUID. If not provided, uses client.graph_guid.
+            tenant_guid: The tenant GUID. If not provided, uses client.tenant_guid.
+            prune: Also remove stored vectors that no longer exist in the graph.
+
+        Returns:
+            int: The number of rows written.
+        """
+        from ..resources.vectors import Vector
+
+        vectors = Vector.retrieve_all_graph_vectors(tenant_guid, graph_guid)
+        written = self.upsert(vectors)
+        if prune:
+            current = {vector.guid for vector in vectors}
+            self.remove([guid for guid in self._index if guid not in current])
+        if self.stale_rows > len(self):
+            self.compact()
+        else:
+            self.flush()
+        return written
+
+    def lookup(self, guids: Iterable[str], key: str = "vector") -> Tuple:
+        """
+        Look up embeddings by vector, node or edge GUID.
+
+        Args:
+            guids: The GUIDs to look up.
+            key: Which GUID to match: ``vector``, ``node`` or ``edge``.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The embeddings of the GUIDs that
+            were found, and a boolean mask over ``guids`` of which were found.
+        """
+        if key not in self._rows:
+            raise ValueError(f"Unknown key '{key}', expected one of {KEYS}")
+        return _lookup_rows(self._rows[key], self.embeddings, guids)
+
+    def keyed(self, key: str) -> "_KeyedStore":
+        """
+        Return a view whose ``lookup`` matches ``key`` GUIDs.
+
+        This lets the store be used where a cache keyed by node or edge GUID is
+        expected, such as ``Vector.search_vectors_reranked(cache=store.keyed("node"))``.
+        """
+        if key not in self._rows:
+            raise ValueError(f"Unknown key '{key}', expected one of {KEYS}")
+        return _KeyedStore(self, key)
+
+    def flush(self) -> None:
+        """
+        Write the embeddings and a new index to disk, then publish them by
+        atomically replacing the metadata file.
+        """
+        np = _require_numpy()
+        if self.readonly:
+            return
+        if self._embeddings is not None:
+            self._embeddings.flush()
+        self._generation += 1
+        self._files = (self._files[0], INDEX_FILE.format(self._generation))
+        with open(os.path.join(self.path, self._files[1]), "wb") as index_file:
+            np.save(index_file, self._records[: self._count])
+
+        meta_path = os.path.join(self.path, META_FILE)
+        with open(meta_path + ".tmp", "w") as meta_file:
+            json.dump(
+                {
+                    "dimensionality": self.dimensionality,
+                    "count": self._count,
+                    "generation": self._generation,
+                    "embeddings": self._files[0],
+                    "index": self._files[1],
+                },
+                meta_file,
+            )
+        os.replace(meta_path + ".tmp", meta_path)
+
+        previous, self._published = self._published, self._files
+        for name in {*self._previous} - {*self._files, *previous}:
+            if name:
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except FileNotFoundError:
+                    pass
+        self._previous = previous
+
+    def close(self) -> None:
+        """
+        Flush the store and release the memory map.
+        """
+        self.flush()
+        self._embeddings = None
+
+    def __enter__(self: _Store) -> _Store:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _KeyedStore:
+    """View of an EmbeddingStore that looks up embeddings by one kind of GUID."""
+
+    def __init__(self, store: EmbeddingStore, key: str):
+        self.store = store
+        self.key = key
+
+    def lookup(self, guids: Iterable[str]) -> Tuple:
+        return self.store.lookup(guids, key=self.key)
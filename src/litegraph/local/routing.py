@@ -0,0 +1,421 @@
+"""
+Client-side weighted routing over a GraphAdjacency snapshot.
+
+``LocalRouter`` answers ``Routes.routes``-style queries in-process with
+Dijkstra, bidirectional Dijkstra, A* or Yen's k-shortest paths, using edge costs
+as weights, and returns the same ``RouteResultModel`` the server does. Queries go
+to the server instead when the snapshot is stale.
+"""
+
+import heapq
+import itertools
+import math
+import time
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple
+
+ALGORITHMS = ("dijkstra", "bidirectional", "astar")
+
+# (total cost, node indices, edge ids) of a path.
+Path = Tuple[float, List[int], List[int]]
+
+
+class LocalRouter:
+    """
+    Shortest-path router over an in-memory copy of a graph's edges.
+
+    Edges are directed from ``From`` to ``To`` and weighted by their cost, as on
+    the server. Paths are compared by their edges, so parallel edges give
+    distinct routes.
+    """
+
+    def __init__(
+        self,
+        adjacency,
+        graph_guid: Optional[str] = None,
+        tenant_guid: Optional[str] = None,
+        stale_after: Optional[float] = None,
+    ):
+        """
+        Create a router over a snapshot.
+
+        Args:
+            adjacency: The GraphAdjacency to route over.
+            graph_guid: The graph of the snapshot, used by ``refresh`` and fallback.
+            tenant_guid: The tenant of the graph. Defaults to client.tenant_guid.
+            stale_after: Seconds after the last load at which the snapshot is stale.
+        """
+        self.graph_guid = graph_guid
+        self.tenant_guid = tenant_guid
+        self.stale_after = stale_after
+        self._load(adjacency)
+
+    @classmethod
+    def build(
+        cls,
+        graph_guid: str,
+        tenant_guid: Optional[str] = None,
+        stale_after: Optional[float] = None,
+    ) -> "LocalRouter":
+        """
+        Build a router from the edges of a graph with ``Graph.load_adjacency``.
+
+        Args:
+            graph_guid: The graph to route over.
+            tenant_guid: The tenant GUID. If not provided, uses client.tenant_guid.
+            stale_after: Seconds after the last load at which the snapshot is stale.
+
+        Returns:
+            LocalRouter: The router.
+        """
+        from ..configuration import get_client
+        from ..resources.graphs import Graph
+
+        tenant_guid = tenant_guid or get_client().tenant_guid
+        return cls(
+            Graph.load_adjacency(graph_guid, tenant_guid),
+            graph_guid=graph_guid,
+            tenant_guid=tenant_guid,
+            stale_after=stale_after,
+        )
+
+    def _load(self, adjacency) -> None:
+        # Plain lists index faster than NumPy arrays one element at a time.
+        self.adjacency = adjacency
+        self._guids = adjacency.guids.tolist()
+        self._out = (
+            adjacency.out_offsets.tolist(),
+            adjacency.out_targets.tolist(),
+            adjacency.out_costs.tolist(),
+            adjacency.out_edges.tolist(),
+        )
+        self._in = (
+            adjacency.in_offsets.tolist(),
+            adjacency.in_sources.tolist(),
+            adjacency.in_costs.tolist(),
+            adjacency.in_edges.tolist(),
+        )
+        edge_count = adjacency.edge_count
+        self._edge_sources = [0] * edge_count
+        self._edge_targets = [0] * edge_count
+        self._edge_costs = [0.0] * edge_count
+        offsets, targets, costs, edges = self._out
+        for node in range(len(self._guids)):
+            for position in range(offsets[node], offsets[node + 1]):
+                edge = edges[position]
+                self._edge_sources[edge] = node
+                self._edge_targets[edge] = targets[position]
+                self._edge_costs[edge] = costs[position]
+        self._synced_at = time.monotonic()
+        self._stale = False
+
+    def refresh(self) -> None:
+        """
+        Reload the snapshot from the server.
+        """
+        from ..resources.graphs import Graph
+
+        self._load(Graph.load_adjacency(self.graph_guid, self.tenant_guid))
+
+    def mark_stale(self) -> None:
+        """
+        Mark the snapshot stale, so ``routes`` falls back to the server.
+        """
+        self._stale = True
+
+    def is_stale(self) -> bool:
+        """
+        Return True if the snapshot was marked stale or is older than ``stale_after``.
+        """
+        if self._stale:
+            return True
+        if self.stale_after is None:
+            return False
+        return time.monotonic() - self._synced_at > self.stale_after
+
+    def shortest_path(
+        self,
+        from_guid: str,
+        to_guid: str,
+        algorithm: str = "dijkstra",
+        heuristic: Optional[Callable[[str, str], float]] = None,
+    ) -> Optional[Path]:
+        """
+        Find the cheapest path between two nodes of the snapshot.
+
+        Args:
+            from_guid: The start node GUID.
+            to_guid: The end node GUID.
+            algorithm: ``dijkstra``, ``bidirectional`` or ``astar``.
+            heuristic: For A*, called as ``heuristic(node_guid, to_guid)``; it must
+                never overestimate the remaining cost.
+
+        Returns:
+            Optional[Tuple[float, List[int], List[int]]]: The total cost, node
+            indices and edge ids of the path, or None if there is none.
+
+        Raises:
+            KeyError: If a node is not in the snapshot.
+            ValueError: If the algorithm is unknown or A* has no heuristic.
+        """
+        _check_algorithm(algorithm, heuristic)
+        source = self.adjacency.index_of(from_guid)
+        target = self.adjacency.index_of(to_guid)
+        if algorithm == "bidirectional":
+            return self._bidirectional(source, target)
+        return self._search(source, target, self._estimate(heuristic, to_guid))
+
+    def k_shortest_paths(
+        self,
+        from_guid: str,
+        to_guid: str,
+        k: int,
+        heuristic: Optional[Callable[[str, str], float]] = None,
+    ) -> List[Path]:
+        """
+        Find the ``k`` cheapest loopless paths between two nodes with Yen's algorithm.
+
+        Args:
+            from_guid: The start node GUID.
+            to_guid: The end node GUID.
+            k: Number of paths to return.
+            heuristic: Optional A* heuristic used for every spur search.
+
+        Returns:
+            List[Tuple[float, List[int], List[int]]]: Up to ``k`` paths, cheapest first.
+
+        Raises:
+            KeyError: If a node is not in the snapshot.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        target = self.adjacency.index_of(to_guid)
+        estimate = self._estimate(heuristic, to_guid)
+        first = self._search(self.adjacency.index_of(from_guid), target, estimate)
+        if first is None:
+            return []
+        found = [first]
+        seen = {tuple(first[2])}
+        candidates = []
+        counter = itertools.count()
+        while len(found) < k:
+            _, nodes, edges = found[-1]
+            for i in range(len(edges)):
+                root_nodes, root_edges = nodes[: i + 1], edges[:i]
+                banned_edges = {
+                    path[2][i] for path in found if path[1][: i + 1] == root_nodes
+                }
+                spur = self._search(
+                    nodes[i],
+                    target,
+                    estimate,
+                    banned_edges=banned_edges,
+                    banned_nodes=set(root_nodes[:-1]),
+                )
+                if spur is None:
+                    continue
+                path_edges = root_edges + spur[2]
+                if tuple(path_edges) in seen:
+                    continue
+                seen.add(tuple(path_edges))
+                cost = sum(self._edge_costs[edge] for edge in root_edges) + spur[0]
+                heapq.heappush(
+                    candidates,
+                    (cost, next(counter), root_nodes[:-1] + spur[1], path_edges),
+                )
+            if not candidates:
+                break
+            cost, _, path_nodes, path_edges = heapq.heappop(candidates)
+            found.append((cost, path_nodes, path_edges))
+        return found
+
+    def routes(
+        self,
+        from_guid: str,
+        to_guid: str,
+        k: int = 1,
+        algorithm: str = "dijkstra",
+        heuristic: Optional[Callable[[str, str], float]] = None,
+        edge_filter=None,
+        node_filter=None,
+    ):
+        """
+        Answer a ``Routes.routes`` query locally.
+
+        The query is sent to the server instead when the snapshot is stale, when
+        an edge or node filter is given (labels, tags and data are not mirrored
+        locally), or when a node is not in the snapshot.
+
+        Args:
+            from_guid: The start node GUID.
+            to_guid: The end node GUID.
+            k: Number of routes to return; more than one uses Yen's algorithm.
+            algorithm: ``dijkstra``, ``bidirectional`` or ``astar``.
+            heuristic: For A*, called as ``heuristic(node_guid, to_guid)``.
+            edge_filter: Optional SearchRequest for edges, sent to the server.
+            node_filter: Optional SearchRequest for nodes, sent to the server.
+
+        Returns:
+            RouteResultModel: The routes, cheapest first. ``TotalCost`` is the
+            exact sum of the snapshot's edge costs, while ``Edges[].Cost`` is an
+            integer as on the server, so fractional snapshot costs are truncated
+            there and may not add up to ``TotalCost``.
+        """
+        from ..configuration import get_client
+        from ..models.route_detail import RouteDetailModel
+        from ..models.route_response import RouteResultModel, Timestamp
+        from ..resources.routes import Routes
+
+        _check_algorithm(algorithm, heuristic)
+        if (
+            self.is_stale()
+            or edge_filter is not None
+            or node_filter is not None
+            or from_guid not in self.adjacency
+            or to_guid not in self.adjacency
+        ):
+            filters = {}
+            if edge_filter is not None:
+                filters["edge_filter"] = edge_filter
+            if node_filter is not None:
+                filters["node_filter"] = node_filter
+            result = Routes.routes(
+                self.graph_guid,
+                from_guid=from_guid,
+                to_guid=to_guid,
+                tenant_guid=self.tenant_guid or get_client().tenant_guid,
+                **filters,
+            )
+            result.Routes = result.Routes[:k]
+            return result
+
+        start = datetime.now(timezone.utc)
+        began = time.perf_counter()
+        if k > 1:
+            paths = self.k_shortest_paths(from_guid, to_guid, k, heuristic)
+        else:
+            path = self.shortest_path(from_guid, to_guid, algorithm, heuristic)
+            paths = [path] if path is not None else []
+        routes = [
+            RouteDetailModel(
+                TotalCost=cost, Edges=[self._edge_model(edge) for edge in edges]
+            )
+            for cost, _, edges in paths
+        ]
+        return RouteResultModel(
+            Timestamp=Timestamp(
+                Start=start,
+                End=datetime.now(timezone.utc),
+                TotalMs=(time.perf_counter() - began) * 1000,
+            ),
+            Routes=routes,
+        )
+
+    def _estimate(self, heuristic, to_guid: str):
+        if heuristic is None:
+            return None
+        guids = self._guids
+        return lambda node: heuristic(guids[node], to_guid)
+
+    def _search(
+        self,
+        source: int,
+        target: int,
+        estimate=None,
+        banned_edges=frozenset(),
+        banned_nodes=frozenset(),
+    ) -> Optional[Path]:
+        """Dijkstra's algorithm, or A* when an estimate is given."""
+        offsets, targets, costs, edges = self._out
+        distances = {source: 0.0}
+        previous = {}
+        heap = [(estimate(source) if estimate else 0.0, 0.0, source)]
+        while heap:
+            _, cost, node = heapq.heappop(heap)
+            if node == target:
+                return cost, *self._unwind(previous, source, target)
+            if cost > distances[node]:
+                continue
+            for position in range(offsets[node], offsets[node + 1]):
+                edge, following = edges[position], targets[position]
+                if edge in banned_edges or following in banned_nodes:
+                    continue
+                total = cost + costs[position]
+                if total < distances.get(following, math.inf):
+                    distances[following] = total
+                    previous[following] = (node, edge)
+                    priority = total + estimate(following) if estimate else total
+                    heapq.heappush(heap, (priority, total, following))
+        return None
+
+    def _bidirectional(self, source: int, target: int) -> Optional[Path]:
+        """Dijkstra's algorithm run from both ends until the searches meet."""
+        if source == target:
+            return 0.0, [source], []
+        sides = (self._out, self._in)
+        distances = ({source: 0.0}, {target: 0.0})
+        previous = ({}, {})
+        heaps = ([(0.0, source)], [(0.0, target)])
+        best, meeting = math.inf, None
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+            cost, node = heapq.heappop(heaps[side])
+            if cost > distances[side][node]:
+                continue
+            offsets, neighbours, costs, edges = sides[side]
+            other = distances[1 - side]
+            for position in range(offsets[node], offsets[node + 1]):
+                following = neighbours[position]
+                total = cost + costs[position]
+                if total < distances[side].get(following, math.inf):
+                    distances[side][following] = total
+                    previous[side][following] = (node, edges[position])
+                    heapq.heappush(heaps[side], (total, following))
+                if following in other and total + other[following] < best:
+                    best, meeting = total + other[following], following
+        if meeting is None:
+            return None
+        nodes, edges = self._unwind(previous[0], source, meeting)
+        backward_nodes, backward_edges = self._unwind(previous[1], target, meeting)
+        return (
+            best,
+            nodes + backward_nodes[::-1][1:],
+            edges + backward_edges[::-1],
+        )
+
+    @staticmethod
+    def _unwind(previous, source: int, node: int) -> Tuple[List[int], List[int]]:
+        nodes, edges = [node], []
+        while node != source:
+            node, edge = previous[node]
+            nodes.append(node)
+            edges.append(edge)
+        return nodes[::-1], edges[::-1]
+
+    def _edge_model(self, edge: int):
+        """Build the EdgeModel of an edge; its integer Cost truncates fractional costs."""
+        from ..models.edge import EdgeModel
+
+        fields = {
+            "From": self._guids[self._edge_sources[edge]],
+            "To": self._guids[self._edge_targets[edge]],
+            "Cost": int(self._edge_costs[edge]),
+        }
+        identifiers = (
+            ("GUID", self.adjacency.edge_guids[edge]),
+            ("GraphGUID", self.graph_guid),
+            ("TenantGUID", self.tenant_guid),
+        )
+        fields.update({name: value for name, value in identifiers if value})
+        return EdgeModel(**fields)
+
+
+def _check_algorithm(algorithm: str, heuristic) -> None:
+    if algorithm not in ALGORITHMS:
+        raise ValueError(
+            f"Unknown routing algorithm '{algorithm}', expected one of {ALGORITHMS}"
+        )
+    if algorithm == "astar" and heuristic is None:
+        raise ValueError("The astar algorithm requires a heuristic.")
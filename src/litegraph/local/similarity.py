@@ -0,0 +1,97 @@
+"""
+Exact, vectorized scoring of embeddings for the LiteGraph vector search types.
+"""
+
+from typing import Tuple
+
+from ..enums.vector_search_type_enum import VectorSearchTypeEnum
+from ..utils.numpy_helper import _require_numpy
+
+# Search types for which a larger value is a better match.
+HIGHER_IS_BETTER = frozenset(
+    {
+        VectorSearchTypeEnum.CosineSimilarity,
+        VectorSearchTypeEnum.EuclidianSimilarity,
+        VectorSearchTypeEnum.DotProduct,
+    }
+)
+
+
+def _normalize(matrix):
+    np = _require_numpy()
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def _euclidean(queries, candidates):
+    np = _require_numpy()
+    squared = (
+        np.einsum("ij,ij->i", queries, queries)[:, None]
+        + np.einsum("ij,ij->i", candidates, candidates)[None, :]
+        - 2 * queries @ candidates.T
+    )
+    return np.sqrt(np.maximum(squared, 0))
+
+
+def score(queries, candidates, search_type: VectorSearchTypeEnum):
+    """
+    Score every query against every candidate.
+
+    Args:
+        queries: Array of shape ``(d,)`` or ``(n, d)``.
+        candidates: Array of shape ``(m, d)``.
+        search_type: The metric to compute.
+
+    Returns:
+        numpy.ndarray: ``(n, m)`` scores (``(m,)`` for a single query).
+    """
+    np = _require_numpy()
+    search_type = VectorSearchTypeEnum(search_type)
+    single = np.ndim(queries) == 1
+    queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+    candidates = np.asarray(candidates, dtype=np.float32).reshape(-1, queries.shape[1])
+
+    if search_type == VectorSearchTypeEnum.DotProduct:
+        scores = queries @ candidates.T
+    elif search_type in (
+        VectorSearchTypeEnum.CosineSimilarity,
+        VectorSearchTypeEnum.CosineDistance,
+    ):
+        scores = _normalize(queries) @ _normalize(candidates).T
+        if search_type == VectorSearchTypeEnum.CosineDistance:
+            scores = 1 - scores
+    else:
+        scores = _euclidean(queries, candidates)
+        if search_type == VectorSearchTypeEnum.EuclidianSimilarity:
+            scores = 1 / (1 + scores)
+    return scores[0] if single else scores
+
+
+def top_k(scores, k: int, search_type: VectorSearchTypeEnum) -> Tuple:
+    """
+    Select the best ``k`` scores of each row, best first.
+
+    Args:
+        scores: Array of shape ``(m,)`` or ``(n, m)``.
+        k: Number of results to keep.
+        search_type: The metric the scores were computed with.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The selected column indices and scores.
+    """
+    np = _require_numpy()
+    scores = np.asarray(scores)
+    single = scores.ndim == 1
+    scores = np.atleast_2d(scores)
+    k = min(k, scores.shape[1])
+    keys = -scores if VectorSearchTypeEnum(search_type) in HIGHER_IS_BETTER else scores
+    if k < scores.shape[1]:
+        candidates = np.argpartition(keys, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    order = np.take_along_axis(keys, candidates, axis=1).argsort(axis=1, kind="stable")
+    indices = np.take_along_axis(candidates, order, axis=1)
+    selected = np.take_along_axis(scores, indices, axis=1)
+    if single:
+        return indices[0], selected[0]
+    return indices, selected
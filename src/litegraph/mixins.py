@@ -1,20 +1,159 @@
 import json
 import uuid
-from typing import Any, Dict, List, Optional, Type
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Type, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from .configuration import get_client
 from .enums.severity_enum import Severity_Enum
 from .exceptions import GRAPH_REQUIRED_ERROR, TENANT_REQUIRED_ERROR, SdkException
 from .models.enumeration_query import EnumerationQueryModel
 from .models.enumeration_result import EnumerationResultModel
+from .models.tracked import ChangeTrackedModel
 from .sdk_logging import log_error
+from .utils.projection import _project_records, _resolve_projection
 from .utils.url_helper import _get_url_base, _get_url_v1, _get_url_v2
 
 JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
 
 
+def _get_struct(cls, client):
+    """Return the msgspec struct of a resource when the msgspec backend is enabled."""
+    struct_name = getattr(cls, "STRUCT", None)
+    if not struct_name or getattr(client, "model_backend", None) != "msgspec":
+        return None
+    from .models import structs
+
+    return getattr(structs, struct_name)
+
+
+def _request_models(
+    cls, client, method, url, many=False, enumeration=False, projection=None, **kwargs
+):
+    """
+    Make a request and decode the response into the resource's models.
+
+    With the msgspec backend the raw response bytes are decoded straight into the
+    resource's STRUCT; otherwise the records are validated against MODEL.
+    """
+    struct = _get_struct(cls, client)
+    if struct is not None:
+        from .models.structs import decode
+
+        payload = client.request(method, url, raw=True, **kwargs)
+        return decode(
+            payload, struct, many=many, enumeration=enumeration, projection=projection
+        )
+
+    response = client.request(method, url, **kwargs)
+    model = getattr(cls, "MODEL", None)
+    if enumeration:
+        response = _project_objects(response, projection)
+        if not model:
+            return response
+        result = EnumerationResultModel[model].model_validate(response)
+        if isinstance(response, dict) and result.objects:
+            for item, raw in zip(result.objects, response.get("Objects") or []):
+                if isinstance(item, ChangeTrackedModel):
+                    item._attach_source(raw)
+            if projection:
+                _mark_projected(result.objects)
+        return result
+    if many:
+        response = _project_records(response, projection)
+        if not model:
+            return response
+        models = [_validate_model(model, item) for item in response]
+        if projection:
+            _mark_projected(models)
+        return models
+    return _validate_model(model, response) if model else response
+
+
+def _validate_model(model, data):
+    """Validate a response record, keeping the raw record for change tracking."""
+    if issubclass(model, ChangeTrackedModel):
+        return model.from_response(data)
+    return model.model_validate(data)
+
+
+def _mark_projected(items) -> None:
+    """Mark models built from projected records, so they are not sent back whole."""
+    for item in items or []:
+        if isinstance(item, ChangeTrackedModel):
+            item._mark_projected()
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model):
+    """Return a cached TypeAdapter serializing a list of ``model`` instances."""
+    return TypeAdapter(List[model])
+
+
+def _is_struct(value) -> bool:
+    """Return True if the value is a msgspec struct, without importing msgspec."""
+    return hasattr(type(value), "__struct_fields__")
+
+
+def _dump_create_item(model, item, validate: bool, exclude_unset: bool):
+    """Serialize a single record of a create request."""
+    if isinstance(item, BaseModel):
+        # Already validated when it was constructed.
+        return item.model_dump(mode="json", by_alias=True, exclude_unset=exclude_unset)
+    if model is None or not validate:
+        return item
+    return model(**item).model_dump(
+        mode="json", by_alias=True, exclude_unset=exclude_unset
+    )
+
+
+def _encode_create_payload(
+    cls, data, validate: bool = True, many: bool = False, exclude_unset: bool = False
+) -> dict:
+    """
+    Serialize the body of a create request once.
+
+    Pre-encoded bytes are sent as-is, model instances and msgspec structs are
+    serialized without being validated again, and dicts are validated against
+    MODEL unless ``validate`` is False.
+
+    Returns:
+        dict: The request keyword arguments carrying the body (``json`` or ``content``).
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return {"content": bytes(data)}
+
+    model = getattr(cls, "MODEL", None)
+    items = data if many else [data]
+    if all(_is_struct(item) for item in items):
+        import msgspec
+
+        return {"content": msgspec.json.encode(data)}
+    if (
+        many
+        and model is not None
+        and not exclude_unset
+        and all(type(item) is model for item in items)
+    ):
+        return {"content": _list_adapter(model).dump_json(items, by_alias=True)}
+
+    encoded = [
+        _dump_create_item(model, item, validate, exclude_unset) for item in items
+    ]
+    return {"json": encoded if many else encoded[0]}
+
+
+def _project_objects(response, projection):
+    """Apply a field projection to the objects of an enumeration response."""
+    if projection and isinstance(response, dict) and "Objects" in response:
+        response = {
+            **response,
+            "Objects": _project_records(response["Objects"], projection),
+        }
+    return response
+
+
 class ExistsAPIResource:
     """
     Mixin class for checking if a resource exists.
@@ -57,23 +196,32 @@ class CreateableAPIResource:
     CREATE_METHOD: str = "PUT"
 
     @classmethod
-    def create(cls, **kwargs) -> "BaseModel":
+    def create(
+        cls, _data: Union[dict, BaseModel, bytes, None] = None, **kwargs
+    ) -> "BaseModel":
         """
         Creates a new resource.
 
         Args:
+            _data (dict | BaseModel | bytes, optional): The data to be sent in the
+                request body. Model instances are serialized without being validated
+                again and pre-encoded JSON bytes are sent as-is. Defaults to kwargs.
             **kwargs: Keyword arguments for the request, including the resource data.
                 - headers (dict, optional): Additional headers for the request.
-                - _data (dict, optional): The data to be sent in the request body.
+                - validate (bool, optional): Validate dict data against MODEL before
+                  sending it. Defaults to True; when False, dicts must already use
+                  the API field names.
 
         Returns:
-            BaseModel: The created resource, validated against the MODEL if defined.
+            BaseModel: The created resource, validated against the MODEL if defined,
+                or decoded into the STRUCT with the msgspec backend.
 
         Raises:
             ValueError: If tenant GUID or graph GUID is required but not provided.
         """
         client = get_client()
         headers = kwargs.pop("headers", {})
+        validate = kwargs.pop("validate", True)
 
         if cls.REQUIRE_TENANT and client.tenant_guid is None:
             raise ValueError(TENANT_REQUIRED_ERROR)
@@ -83,7 +231,8 @@ class CreateableAPIResource:
             raise ValueError(GRAPH_REQUIRED_ERROR)
 
         # Extract data from kwargs
-        _data = kwargs.pop("_data", kwargs.copy())
+        if _data is None:
+            _data = kwargs.copy()
 
         # Build URL based on requirements
         tenant = client.tenant_guid if cls.REQUIRE_TENANT else None
@@ -92,16 +241,12 @@ class CreateableAPIResource:
             if graph_id and cls.REQUIRE_GRAPH_GUID
             else _get_url_v1(cls, tenant)
         )
-        if cls.MODEL is not None:
-            data = cls.MODEL(**_data).model_dump(
-                mode="json", by_alias=True, exclude_unset=True
-            )
-        else:
-            data = _data
+        body = _encode_create_payload(cls, _data, validate=validate, exclude_unset=True)
 
         # Make request and validate response
-        instance = client.request(cls.CREATE_METHOD, url, json=data, headers=headers)
-        return cls.MODEL.model_validate(instance) if cls.MODEL else instance
+        return _request_models(
+            cls, client, cls.CREATE_METHOD, url, headers=headers, **body
+        )
 
 
 class CreateableMultipleAPIResource:
@@ -116,9 +261,25 @@ class CreateableMultipleAPIResource:
     REQUIRE_TENANT: bool = True
 
     @classmethod
-    def create_multiple(cls, data: List[dict]) -> List[BaseModel]:
+    def create_multiple(
+        cls,
+        data: Union[List[Union[dict, BaseModel]], bytes],
+        validate: bool = True,
+        graph_guid: str | None = None,
+    ) -> List[BaseModel]:
         """
         Creates multiple nodes or edges in a single request.
+
+        Args:
+            data: The records to create. Model instances are serialized in one pass
+                without being validated again, and pre-encoded JSON bytes (a JSON
+                array) are sent as-is.
+            validate: Validate dict records against MODEL before sending them.
+                When False, dicts must already use the API field names.
+            graph_guid: The graph GUID. If not provided, uses client.graph_guid.
+
+        Returns:
+            List[BaseModel]: The created resources.
         """
         if data is None:
             raise TypeError("Nodes parameter cannot be None")
@@ -129,16 +290,10 @@ class CreateableMultipleAPIResource:
         client = get_client()
         if cls.REQUIRE_TENANT and client.tenant_guid is None:
             raise ValueError(TENANT_REQUIRED_ERROR)
-        graph_id = client.graph_guid
+        graph_id = graph_guid or client.graph_guid
 
-        # Validate and serialize each node if MODEL is provided
-        if cls.MODEL is not None:
-            validated_nodes = [
-                cls.MODEL(**node).model_dump(mode="json", by_alias=True)
-                for node in data
-            ]
-        else:
-            validated_nodes = data
+        # Validate (if needed) and serialize the records once
+        body = _encode_create_payload(cls, data, validate=validate, many=True)
 
         # Construct URL for multiple creation
         tenant = client.tenant_guid if cls.REQUIRE_TENANT else None
@@ -149,12 +304,8 @@ class CreateableMultipleAPIResource:
         )
 
         # Make the request
-        instances = client.request("PUT", url, json=validated_nodes)
-
-        # Validate response data if MODEL is provided
-        if cls.MODEL is not None:
-            return [cls.MODEL.model_validate(instance) for instance in instances]
-        return instances
+        # Make the request and validate response data if MODEL is provided
+        return _request_models(cls, client, "PUT", url, many=True, **body)
 
 
 class RetrievableAPIResource:
@@ -192,9 +343,7 @@ class RetrievableAPIResource:
             if graph_id and cls.REQUIRE_GRAPH_GUID
             else _get_url_v1(cls, tenant, guid, **include)
         )
-        instance = client.request("GET", url)
-
-        return cls.MODEL.model_validate(instance) if cls.MODEL else instance
+        return _request_models(cls, client, "GET", url)
 
 
 class UpdatableAPIResource:
@@ -232,9 +381,46 @@ class UpdatableAPIResource:
             )
         else:
             data = kwargs
-        instance = client.request("PUT", url, json=data)
+        return _request_models(cls, client, "PUT", url, json=data)
 
-        return cls.MODEL.model_validate(instance) if cls.MODEL else instance
+    @classmethod
+    def update_changed(cls, instance: ChangeTrackedModel, partial: bool = False):
+        """
+        Update a resource, serializing only what changed since it was retrieved.
+
+        Args:
+            instance: A model previously returned by the SDK and modified locally.
+            partial: If True, only the changed fields (and the GUID) are sent.
+                Otherwise the full object is sent, but unchanged fields reuse the
+                raw response values instead of being re-serialized.
+
+        Returns:
+            BaseModel: The updated resource, or the instance itself if nothing changed.
+
+        Raises:
+            TypeError: If the instance does not track changes.
+            ValueError: If tenant GUID or graph GUID is required but not provided.
+        """
+        if not isinstance(instance, ChangeTrackedModel):
+            raise TypeError("Instance must be a model returned by the SDK")
+        if not instance.is_changed():
+            return instance
+
+        client = get_client()
+        if cls.REQUIRE_TENANT and client.tenant_guid is None:
+            raise ValueError(TENANT_REQUIRED_ERROR)
+        graph_id = client.graph_guid or getattr(instance, "graph_guid", None)
+        if cls.REQUIRE_GRAPH_GUID and not graph_id:
+            raise ValueError(GRAPH_REQUIRED_ERROR)
+        tenant = client.tenant_guid if cls.REQUIRE_TENANT else None
+        url = (
+            _get_url_v1(cls, tenant, graph_id, instance.guid)
+            if graph_id and cls.REQUIRE_GRAPH_GUID
+            else _get_url_v1(cls, tenant, instance.guid)
+        )
+
+        data = instance.changed_payload(partial=partial)
+        return _request_models(cls, client, "PUT", url, json=data)
 
 
 class DeletableAPIResource:
@@ -360,6 +546,13 @@ class AllRetrievableAPIResource:
     def retrieve_all(cls, **kwargs) -> list["BaseModel"]:
         """
         Retrieve all instances of the resource.
+
+        Args:
+            **kwargs: Optional request parameters.
+                - graph_guid (str, optional): The graph GUID, defaults to client.graph_guid.
+                - include_data (bool, optional): Whether to include data.
+                - include_subordinates (bool, optional): Whether to include subordinates.
+                - fields (list[str], optional): Fields to keep in each returned record.
         """
         client = get_client()
         if cls.REQUIRE_TENANT and client.tenant_guid is None:
@@ -371,6 +564,15 @@ class AllRetrievableAPIResource:
         if cls.REQUIRE_GRAPH_GUID and not graph_id:
             raise ValueError(GRAPH_REQUIRED_ERROR)
         tenant = client.tenant_guid if cls.REQUIRE_TENANT else None
+        projection = _resolve_projection(
+            cls.MODEL,
+            kwargs.pop("fields", None),
+            kwargs.get("include_data"),
+            kwargs.get("include_subordinates"),
+        )
+        if projection:
+            kwargs["include_data"] = projection.include_data
+            kwargs["include_subordinates"] = projection.include_subordinates
         include = {}
         if kwargs.get("include_data"):
             include["incldata"] = None
@@ -382,12 +584,8 @@ class AllRetrievableAPIResource:
             if graph_id and cls.REQUIRE_GRAPH_GUID
             else _get_url_v1(cls, tenant, **include)
         )
-        instances = client.request("GET", url)
-
-        return (
-            [cls.MODEL.model_validate(instance) for instance in instances]
-            if cls.MODEL
-            else instances
+        return _request_models(
+            cls, client, "GET", url, many=True, projection=projection
         )
 
 
@@ -408,11 +606,25 @@ class SearchableAPIResource:
     def search(cls, graph_id: str | None = None, **data) -> BaseModel:
         """
         Search for resources based on the provided criteria.
+
+        A ``fields`` list may be supplied to keep only those fields of each
+        returned record; unwanted keys are dropped before model construction.
         """
         client = get_client()
         if cls.REQUIRE_TENANT and client.tenant_guid is None:
             raise ValueError(TENANT_REQUIRED_ERROR)
         tenant = client.tenant_guid if cls.REQUIRE_TENANT else None
+        projection = _resolve_projection(
+            getattr(cls, "MODEL", None),
+            data.pop("fields", None),
+            data.get("include_data"),
+            data.get("include_subordinates"),
+        )
+        if projection:
+            data["include_data"] = projection.include_data
+            data["include_subordinates"] = projection.include_subordinates
+            data["IncludeData"] = projection.include_data
+            data["IncludeSubordinates"] = projection.include_subordinates
         if data.get("include_data"):
             data["IncludeData"] = True
         if data.get("include_subordinates"):
@@ -428,7 +640,18 @@ class SearchableAPIResource:
         instance = client.request(
             "POST", url, data=json.dumps(data).encode(), headers=JSON_CONTENT_TYPE
         )
-        return result_model(**instance)
+        if projection and isinstance(instance, dict):
+            instance = {
+                key: _project_records(value, projection)
+                for key, value in instance.items()
+            }
+        result = result_model(**instance)
+        if projection:
+            for name in type(result).model_fields:
+                value = getattr(result, name)
+                if isinstance(value, list):
+                    _mark_projected(value)
+        return result
 
 
 class ExportGexfMixin:
@@ -465,6 +688,11 @@ class EnumerableAPIResource:
         """
         Enumerates resources of a given type.
 
+        Args:
+            **kwargs: Optional query parameters.
+                - fields (list[str], optional): Fields to keep in each enumerated
+                  object. Data and subordinates are only requested when needed.
+
         Returns:
             EnumerationResultModel: The enumeration results containing the list of resources
                 and any pagination metadata.
@@ -480,6 +708,16 @@ class EnumerableAPIResource:
         if cls.REQUIRE_GRAPH_GUID and not graph_id:
             raise ValueError(GRAPH_REQUIRED_ERROR)
 
+        projection = _resolve_projection(
+            getattr(cls, "MODEL", None),
+            kwargs.pop("fields", None),
+            kwargs.get("include_data"),
+            kwargs.get("include_subordinates"),
+        )
+        if projection:
+            kwargs["include_data"] = projection.include_data
+            kwargs["include_subordinates"] = projection.include_subordinates
+
         if kwargs.pop("include_data", False):
             kwargs["incldata"] = None
         if kwargs.pop("include_subordinates", False):
@@ -493,11 +731,8 @@ class EnumerableAPIResource:
         else:
             url = _get_url_v2(cls, **kwargs)
 
-        response = client.request("GET", url)
-        return (
-            EnumerationResultModel[cls.MODEL].model_validate(response)
-            if cls.MODEL
-            else response
+        return _request_models(
+            cls, client, "GET", url, enumeration=True, projection=projection
         )
 
 
@@ -518,6 +753,8 @@ class EnumerableAPIResourceWithData:
         Args:
             **kwargs: Query parameters that conform to the ENUMERABLE_REQUEST_MODEL schema.
                 These parameters will be validated against the model before making the request.
+                A ``fields`` list may be supplied to keep only those fields of each
+                enumerated object; IncludeData/IncludeSubordinates follow the projection.
 
         Returns:
             EnumerationResultModel: The enumeration results containing the list of resources
@@ -541,6 +778,16 @@ class EnumerableAPIResourceWithData:
         if cls.REQUIRE_GRAPH_GUID and not graph_id:
             raise ValueError(GRAPH_REQUIRED_ERROR)
 
+        projection = _resolve_projection(
+            getattr(cls, "MODEL", None),
+            data_dict.pop("fields", None),
+            data_dict.get("include_data"),
+            data_dict.get("include_subordinates"),
+        )
+        if projection:
+            data_dict["include_data"] = projection.include_data
+            data_dict["include_subordinates"] = projection.include_subordinates
+
         if data_dict.pop("include_data", False):
             data_dict["IncludeData"] = True
         if data_dict.pop("include_subordinates", False):
@@ -558,11 +805,8 @@ class EnumerableAPIResourceWithData:
             mode="json", by_alias=True, exclude_unset=True
         )
 
-        response = client.request("POST", url, json=data)
-        return (
-            EnumerationResultModel[cls.MODEL].model_validate(response)
-            if cls.MODEL
-            else response
+        return _request_models(
+            cls, client, "POST", url, enumeration=True, projection=projection, json=data
         )
 
 
@@ -652,11 +896,20 @@ class RetrievableManyMixin:
 
     @classmethod
     def retrieve_many(
-        cls, guids: list[str], graph_guid: str | None = None
+        cls,
+        guids: list[str],
+        graph_guid: str | None = None,
+        fields: list[str] | None = None,
     ) -> "BaseModel":
         """
         Retrieves many resources of a given type.
+
+        Args:
+            guids: The GUIDs of the resources to retrieve.
+            graph_guid: The graph GUID.
+            fields: Optional fields to keep in each returned record.
         """
+        projection = _resolve_projection(getattr(cls, "MODEL", None), fields)
         client = get_client()
         if cls.REQUIRE_TENANT and client.tenant_guid is None:
             raise ValueError(TENANT_REQUIRED_ERROR)
@@ -666,16 +919,15 @@ class RetrievableManyMixin:
             if graph_guid and cls.REQUIRE_GRAPH_GUID
             else _get_url_v1(cls, tenant, guids=",".join(guids))
         )
-        instance = client.request(
+        return _request_models(
+            cls,
+            client,
             "GET",
             url,
+            many=True,
+            projection=projection,
             headers=JSON_CONTENT_TYPE,
         )
-        return (
-            [cls.MODEL.model_validate(item) for item in instance]
-            if cls.MODEL
-            else instance
-        )
 
 
 class RetrievableAllEndpointMixin:
@@ -715,13 +967,7 @@ class RetrievableAllEndpointMixin:
         # Manually construct URL to avoid graph_guid being inserted when REQUIRE_GRAPH_GUID is True
         url = f"v1.0/tenants/{tenant_guid}/{cls.RESOURCE_NAME}/all"
 
-        instance = client.request("GET", url)
-
-        return (
-            [cls.MODEL.model_validate(item) for item in instance]
-            if getattr(cls, "MODEL", None)
-            else instance
-        )
+        return _request_models(cls, client, "GET", url, many=True)
 
     @classmethod
     def retrieve_all_graph(
@@ -760,13 +1006,7 @@ class RetrievableAllEndpointMixin:
             # (can't use _get_url_v1 as it would place graph after resource name)
             url = f"v1.0/tenants/{tenant_guid}/graphs/{graph_guid}/{cls.RESOURCE_NAME}/all"
 
-        instance = client.request("GET", url)
-
-        return (
-            [cls.MODEL.model_validate(item) for item in instance]
-            if getattr(cls, "MODEL", None)
-            else instance
-        )
+        return _request_models(cls, client, "GET", url, many=True)
 
     @classmethod
     def retrieve_for_graph(
@@ -817,13 +1057,7 @@ class RetrievableAllEndpointMixin:
 
         url = _get_url_v1(_TempGraphClass, tenant_guid, graph_guid, **include)
 
-        instance = client.request("GET", url)
-
-        return (
-            [cls.MODEL.model_validate(item) for item in instance]
-            if getattr(cls, "MODEL", None)
-            else instance
-        )
+        return _request_models(cls, client, "GET", url, many=True)
 
 
 class DeletableAllEndpointMixin:
@@ -995,13 +1229,7 @@ class RetrievableNodeResourceMixin:
         # Append the actual resource name
         url = f"v1.0/{base_path}/{cls.RESOURCE_NAME}"
 
-        instance = client.request("GET", url)
-
-        return (
-            [cls.MODEL.model_validate(item) for item in instance]
-            if getattr(cls, "MODEL", None)
-            else instance
-        )
+        return _request_models(cls, client, "GET", url, many=True)
 
 
 class RetrievableEdgeResourceMixin:
@@ -1066,13 +1294,7 @@ class RetrievableEdgeResourceMixin:
         # Append the actual resource name
         url = f"v1.0/{base_path}/{cls.RESOURCE_NAME}"
 
-        instance = client.request("GET", url)
-
-        return (
-            [cls.MODEL.model_validate(item) for item in instance]
-            if getattr(cls, "MODEL", None)
-            else instance
-        )
+        return _request_models(cls, client, "GET", url, many=True)
 
 
 class DeletableGraphResourceMixin:
@@ -13,4 +13,4 @@ class ApiErrorResponseModel(BaseModel):
     error: ApiError_Enum = Field(alias="Error")
     context: Optional[str] = Field(default=None, alias="Context")
     description: Optional[str] = Field(default=None, alias="Description")
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
@@ -17,7 +17,7 @@ class AuthenticationTokenModel(BaseModel):
     token: Optional[str] = Field(default=None, alias="Token")
     valid: bool = Field(default=True, alias="Valid")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     @computed_field
     def is_expired(self) -> bool:
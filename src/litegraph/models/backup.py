@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BackupModel(BaseModel):
@@ -16,3 +16,4 @@ class BackupModel(BaseModel):
     created_utc: datetime = Field(alias="CreatedUtc")
     last_update_utc: datetime = Field(alias="LastUpdateUtc")
     last_access_utc: datetime = Field(alias="LastAccessUtc")
+    model_config = ConfigDict(defer_build=True)
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from .vector_search_response import VectorSearchResultModel
+
+
+@dataclass
+class CrossGraphSearchResult:
+    """
+    Merged results of ``Vector.search_across_graphs``.
+
+    Attributes:
+        results: The global top-k results, best first.
+        graph_guids: The graph each result came from, parallel to ``results``.
+        timings: Seconds each searched graph took to answer, by graph GUID.
+        errors: The exception raised by each graph that failed, by graph GUID.
+        skipped: Graphs whose results were not waited for because the early
+            cut-off was reached.
+    """
+
+    results: List[VectorSearchResultModel] = field(default_factory=list)
+    graph_guids: List[str] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def slowest(self, count: int = 5) -> List[tuple]:
+        """
+        Return the ``(graph_guid, seconds)`` of the slowest graphs, slowest first.
+        """
+        return sorted(self.timings.items(), key=lambda item: -item[1])[:count]
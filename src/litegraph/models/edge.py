@@ -2,12 +2,13 @@ import uuid
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ConfigDict, Field
 
 from ..models.vector_metadata import VectorMetadataModel
+from .tracked import ChangeTrackedModel
 
 
-class EdgeModel(BaseModel):
+class EdgeModel(ChangeTrackedModel):
     """
     Edge in a graph.
     """
@@ -40,4 +41,6 @@ class EdgeModel(BaseModel):
         default_factory=list, alias="Vectors"
     )
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+    TRACKED_CHILDREN = ("vectors",)
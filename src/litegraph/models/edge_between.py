@@ -14,4 +14,4 @@ class EdgeBetweenModel(BaseModel):
     to_node_guid: str = Field(
         default_factory=lambda: str(uuid.uuid4()), alias="To", strict=True
     )
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
@@ -18,6 +18,6 @@ class EnumerationQueryModel(BaseModel):
     continuation_token: Optional[str] = Field(None, alias="ContinuationToken")
     labels: List[str] = Field(default_factory=list, alias="Labels")
     tags: Dict[str, str] = Field(default_factory=dict, alias="Tags")
-    expr: ExprModel = Field(default_factory=ExprModel, alias="Expr")
+    expr: Optional[ExprModel] = Field(default=None, alias="Expr")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
@@ -60,7 +60,7 @@ class EnumerationResultModel(BaseModel, Generic[T]):
         default_factory=list, alias="Objects", description="List of enumerated objects"
     )
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     @field_validator("objects", mode="before")
     def validate_objects(cls, v: Optional[List[T]]) -> List[T]:
@@ -15,7 +15,7 @@ class ExistenceRequestModel(BaseModel):
     edges_between: Optional[List[EdgeBetweenModel]] = Field(
         default=None, alias="EdgesBetween"
     )
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     def contains_existence_request(self) -> bool:
         """
@@ -20,4 +20,4 @@ class ExistenceResultModel(BaseModel):
     missing_edges_between: Optional[List[EdgeBetweenModel]] = Field(
         default=None, alias="MissingEdgesBetween"
     )
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from ..enums.operator_enum import Opertator_Enum
 
@@ -11,3 +11,4 @@ class ExprModel(BaseModel):
     Left: str
     Operator: Opertator_Enum
     Right: str
+    model_config = ConfigDict(defer_build=True)
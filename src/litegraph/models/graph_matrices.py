@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from ..utils.numpy_helper import _require_numpy
+
+
+@dataclass
+class GraphMatrices:
+    """
+    A graph as NumPy arrays, ready for machine-learning pipelines.
+
+    Node indices are row positions in ``node_guids``; edge indices are positions
+    in ``edge_guids``, so predictions can be mapped back to GUIDs.
+
+    Attributes:
+        node_guids: Array of the ``n`` node GUIDs.
+        edge_guids: Array of the ``m`` edge GUIDs.
+        sources: int32 array of the ``From`` node index of every edge (COO rows).
+        targets: int32 array of the ``To`` node index of every edge (COO columns).
+        costs: float32 array of the cost of every edge.
+        features: ``(n, d)`` float32 array of node embeddings, or None if no node
+            has a vector. Rows of nodes without one are zero.
+        has_features: Boolean array marking the nodes that have a feature row.
+        label_names: The label of every column of ``labels``.
+        labels: ``(n, len(label_names))`` uint8 one-hot array of node labels.
+        tag_names: The ``key=value`` pair of every column of ``tags``.
+        tags: ``(n, len(tag_names))`` uint8 one-hot array of node tags.
+    """
+
+    node_guids: Any
+    edge_guids: Any
+    sources: Any
+    targets: Any
+    costs: Any
+    features: Optional[Any]
+    has_features: Any
+    label_names: List[str]
+    labels: Any
+    tag_names: List[str]
+    tags: Any
+
+    def __len__(self) -> int:
+        return len(self.node_guids)
+
+    def csr(self, weighted: bool = True):
+        """
+        Return the adjacency as plain CSR arrays, rows being ``From`` nodes.
+
+        Args:
+            weighted: Use edge costs as values instead of ones.
+
+        Returns:
+            tuple: The ``(indptr, indices, data)`` arrays. ``indices`` holds the
+            ``To`` node of every edge and ``data`` its value.
+        """
+        np = _require_numpy()
+
+        order = np.argsort(self.sources, kind="stable")
+        indptr = np.zeros(len(self.node_guids) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(self.sources, minlength=len(self.node_guids)), out=indptr[1:]
+        )
+        data = self.costs if weighted else np.ones(len(self.costs), dtype=np.float32)
+        return indptr, self.targets[order], data[order]
+
+    def to_scipy(self, weighted: bool = True):
+        """
+        Return the adjacency as a ``scipy.sparse.csr_matrix``.
+
+        Parallel edges are kept as separate entries; call ``sum_duplicates`` on
+        the result to merge them.
+
+        Args:
+            weighted: Use edge costs as values instead of ones.
+
+        Returns:
+            scipy.sparse.csr_matrix: The ``(n, n)`` adjacency matrix.
+
+        Raises:
+            ImportError: If scipy is not installed.
+        """
+        try:
+            from scipy.sparse import csr_matrix
+        except ImportError as exc:
+            raise ImportError(
+                "to_scipy requires scipy. Install it with `pip install litegraph[scipy]`."
+            ) from exc
+
+        count = len(self.node_guids)
+        indptr, indices, data = self.csr(weighted)
+        return csr_matrix((data, indices, indptr), shape=(count, count))
@@ -2,12 +2,13 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ConfigDict, Field
 
 from ..models.vector_metadata import VectorMetadataModel
+from .tracked import ChangeTrackedModel
 
 
-class GraphModel(BaseModel):
+class GraphModel(ChangeTrackedModel):
     """
     Represents a graph.
     """
@@ -27,4 +28,6 @@ class GraphModel(BaseModel):
         default_factory=list, alias="Vectors"
     )
     data: Optional[Dict] = Field(default=None, alias="Data")
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+    TRACKED_CHILDREN = ("vectors",)
@@ -42,4 +42,6 @@ class HnswLiteVectorIndexModel(BaseModel):
     last_search_utc: Optional[datetime] = Field(default=None, alias="LastSearchUtc")
     is_loaded: bool = Field(default=False, alias="IsLoaded")
 
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+    model_config = ConfigDict(
+        populate_by_name=True, from_attributes=True, defer_build=True
+    )
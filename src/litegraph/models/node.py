@@ -2,12 +2,13 @@ import uuid
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ConfigDict, Field
 
 from ..models.vector_metadata import VectorMetadataModel
+from .tracked import ChangeTrackedModel
 
 
-class NodeModel(BaseModel):
+class NodeModel(ChangeTrackedModel):
     """
     Node in a graph.
     """
@@ -37,4 +38,6 @@ class NodeModel(BaseModel):
     vectors: Optional[List[VectorMetadataModel]] = Field(
         default_factory=list, alias="Vectors"
     )
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
+
+    TRACKED_CHILDREN = ("vectors",)
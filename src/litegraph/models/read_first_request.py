@@ -1,6 +1,6 @@
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ReadFirstRequest(BaseModel):
@@ -8,3 +8,4 @@ class ReadFirstRequest(BaseModel):
     labels: Optional[List[str]] = Field(alias="Labels")
     tags: Optional[Dict[str, str]] = Field(alias="Tags")
     expr: Optional[Dict[str, str]] = Field(alias="Expr")
+    model_config = ConfigDict(defer_build=True)
@@ -1,6 +1,6 @@
 from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .edge import EdgeModel
 
@@ -12,3 +12,4 @@ class RouteDetailModel(BaseModel):
 
     TotalCost: float
     Edges: List[EdgeModel]
+    model_config = ConfigDict(defer_build=True)
@@ -17,5 +17,5 @@ class RouteRequestModel(BaseModel):
     edge_filter: Optional[SearchRequest] = Field(default=None, alias="EdgeFilter")
     node_filter: Optional[SearchRequest] = Field(default=None, alias="NodeFilter")
     model_config = ConfigDict(
-        populate_by_name=True
+        populate_by_name=True, defer_build=True
     )  # class Config: populate_by_name = True
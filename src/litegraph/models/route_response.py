@@ -16,7 +16,7 @@ class Timestamp(BaseModel):
     TotalMs: float
     Messages: dict = Field(default_factory=dict)
     model_config = ConfigDict(
-        populate_by_name=True
+        populate_by_name=True, defer_build=True
     )  # class Config: populate_by_name = True
 
 
@@ -27,3 +27,4 @@ class RouteResultModel(BaseModel):
 
     Timestamp: Timestamp
     Routes: List[RouteDetailModel]
+    model_config = ConfigDict(defer_build=True)
@@ -18,6 +18,7 @@ class SearchRequestGraph(BaseModel):
     expr: Optional[ExprModel] = Field(None, alias="Expr")  # Optional Expression
     labels: Optional[List] = Field(None, alias="Labels")  # Optional Labels
     tags: Optional[dict] = Field(None, alias="Tags")  # Optional Tags
+    model_config = ConfigDict(defer_build=True)
 
 
 class SearchResultGraph(BaseModel):
@@ -30,4 +31,5 @@ class SearchResultGraph(BaseModel):
         from_attributes=True,
         json_encoders={Optional[List]: lambda v: v or None},
         exclude_none=True,
+        defer_build=True,
     )
@@ -28,7 +28,9 @@ class SearchRequest(BaseModel):
     name: Optional[str] = Field(None, alias="Name")
     labels: Optional[List] = Field(None, alias="Labels")
     tags: Optional[Dict[str, str]] = Field(default_factory=dict, alias="Tags")
-    model_config = ConfigDict(populate_by_name=True, populate_by_alias=True)
+    model_config = ConfigDict(
+        populate_by_name=True, populate_by_alias=True, defer_build=True
+    )
 
 
 class SearchResult(BaseModel):
@@ -37,7 +39,7 @@ class SearchResult(BaseModel):
     """
 
     nodes: Optional[List[NodeModel]] = Field(None, alias="Nodes")
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
 
 class SearchResultEdge(BaseModel):
@@ -48,4 +50,4 @@ class SearchResultEdge(BaseModel):
     edges: Optional[List[EdgeModel]] = Field(None, alias="Edges")
     graphs: Optional[List[GraphModel]] = Field(None, alias="Graphs")
     nodes: Optional[List[NodeModel]] = Field(None, alias="Nodes")
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
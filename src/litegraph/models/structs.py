@@ -0,0 +1,221 @@
+"""
+msgspec struct equivalents of the hot resource models.
+
+These structs are used instead of the pydantic models when the client is
+configured with ``model_backend="msgspec"``. Responses are decoded straight
+from bytes into structs, skipping pydantic validation entirely. Requires the
+optional ``msgspec`` dependency (``pip install litegraph[msgspec]``).
+"""
+
+from datetime import datetime
+from typing import Any, Generic, List, Optional, TypeVar
+
+import msgspec
+from pydantic import BaseModel
+
+from ..utils.projection import _project_records
+from .edge import EdgeModel
+from .enumeration_result import EnumerationResultModel
+from .node import NodeModel
+from .vector_metadata import VectorMetadataModel
+
+T = TypeVar("T")
+
+
+class VectorMetadataStruct(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """
+    Vector metadata.
+    """
+
+    guid: Optional[str] = msgspec.field(default=None, name="GUID")
+    tenant_guid: Optional[str] = msgspec.field(default=None, name="TenantGUID")
+    graph_guid: Optional[str] = msgspec.field(default=None, name="GraphGUID")
+    node_guid: Optional[str] = msgspec.field(default=None, name="NodeGUID")
+    edge_guid: Optional[str] = msgspec.field(default=None, name="EdgeGUID")
+    model: Optional[str] = msgspec.field(default=None, name="Model")
+    dimensionality: int = msgspec.field(default=0, name="Dimensionality")
+    content: Optional[str] = msgspec.field(default="", name="Content")
+    vectors: Optional[List[float]] = msgspec.field(default=None, name="Vectors")
+    embeddings: Optional[List[float]] = msgspec.field(default=None, name="Embeddings")
+    created_utc: Optional[datetime] = msgspec.field(default=None, name="CreatedUtc")
+    last_update_utc: Optional[datetime] = msgspec.field(
+        default=None, name="LastUpdateUtc"
+    )
+
+
+class NodeStruct(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """
+    Node in a graph.
+    """
+
+    guid: str = msgspec.field(name="GUID")
+    tenant_guid: Optional[str] = msgspec.field(default=None, name="TenantGUID")
+    graph_guid: Optional[str] = msgspec.field(default=None, name="GraphGUID")
+    name: Optional[str] = msgspec.field(default=None, name="Name")
+    data: Optional[Any] = msgspec.field(default=None, name="Data")
+    edges_in: Optional[int] = msgspec.field(default=None, name="EdgesIn")
+    edges_out: Optional[int] = msgspec.field(default=None, name="EdgesOut")
+    edges_total: Optional[int] = msgspec.field(default=None, name="EdgesTotal")
+    created_utc: Optional[datetime] = msgspec.field(default=None, name="CreatedUtc")
+    last_update_utc: Optional[datetime] = msgspec.field(
+        default=None, name="LastUpdateUtc"
+    )
+    labels: Optional[list] = msgspec.field(default_factory=list, name="Labels")
+    tags: Optional[dict] = msgspec.field(default_factory=dict, name="Tags")
+    vectors: Optional[List[VectorMetadataStruct]] = msgspec.field(
+        default_factory=list, name="Vectors"
+    )
+
+
+class EdgeStruct(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """
+    Edge in a graph.
+    """
+
+    guid: str = msgspec.field(name="GUID")
+    tenant_guid: Optional[str] = msgspec.field(default=None, name="TenantGUID")
+    graph_guid: Optional[str] = msgspec.field(default=None, name="GraphGUID")
+    name: Optional[str] = msgspec.field(default=None, name="Name")
+    from_node_guid: Optional[str] = msgspec.field(default=None, name="From")
+    from_node: Optional[dict] = msgspec.field(default=None, name="FromNode")
+    to_node_guid: Optional[str] = msgspec.field(default=None, name="To")
+    to_node: Optional[dict] = msgspec.field(default=None, name="ToNode")
+    cost: int = msgspec.field(default=0, name="Cost")
+    created_utc: Optional[datetime] = msgspec.field(default=None, name="CreatedUtc")
+    last_update_utc: Optional[datetime] = msgspec.field(
+        default=None, name="LastUpdateUtc"
+    )
+    labels: Optional[list] = msgspec.field(default_factory=list, name="Labels")
+    tags: Optional[dict] = msgspec.field(default_factory=dict, name="Tags")
+    data: Optional[Any] = msgspec.field(default=None, name="Data")
+    vectors: Optional[List[VectorMetadataStruct]] = msgspec.field(
+        default_factory=list, name="Vectors"
+    )
+
+
+class VectorRowStruct(msgspec.Struct, kw_only=True):
+    """
+    Identifiers and embeddings of a vector, used when downloading embedding matrices.
+    """
+
+    guid: Optional[str] = msgspec.field(default=None, name="GUID")
+    node_guid: Optional[str] = msgspec.field(default=None, name="NodeGUID")
+    edge_guid: Optional[str] = msgspec.field(default=None, name="EdgeGUID")
+    vectors: Optional[List[float]] = msgspec.field(default=None, name="Vectors")
+    embeddings: Optional[List[float]] = msgspec.field(default=None, name="Embeddings")
+
+
+class EdgeRowStruct(msgspec.Struct, kw_only=True):
+    """
+    Identifiers, endpoints and cost of an edge, used when building adjacency snapshots.
+    """
+
+    guid: Optional[str] = msgspec.field(default=None, name="GUID")
+    from_node_guid: Optional[str] = msgspec.field(default=None, name="From")
+    to_node_guid: Optional[str] = msgspec.field(default=None, name="To")
+    cost: int = msgspec.field(default=0, name="Cost")
+
+
+class EnumerationResultStruct(
+    msgspec.Struct, Generic[T], kw_only=True, omit_defaults=True
+):
+    """Object returned as the result of an enumeration."""
+
+    success: bool = msgspec.field(default=True, name="Success")
+    timestamp: Optional[dict] = msgspec.field(default=None, name="Timestamp")
+    max_results: int = msgspec.field(default=1000, name="MaxResults")
+    iterations_required: int = msgspec.field(default=0, name="IterationsRequired")
+    continuation_token: Optional[str] = msgspec.field(
+        default=None, name="ContinuationToken"
+    )
+    end_of_results: bool = msgspec.field(default=True, name="EndOfResults")
+    total_records: int = msgspec.field(default=0, name="TotalRecords")
+    records_remaining: int = msgspec.field(default=0, name="RecordsRemaining")
+    objects: Optional[List[T]] = msgspec.field(default_factory=list, name="Objects")
+
+    def __post_init__(self):
+        if self.objects is None:
+            self.objects = []
+
+
+STRUCT_MODELS = {
+    VectorMetadataStruct: VectorMetadataModel,
+    NodeStruct: NodeModel,
+    EdgeStruct: EdgeModel,
+}
+MODEL_STRUCTS = {model: struct for struct, model in STRUCT_MODELS.items()}
+
+
+def decode(
+    payload: Any,
+    struct: type,
+    many: bool = False,
+    enumeration: bool = False,
+    projection=None,
+) -> Any:
+    """
+    Decode a response payload into structs.
+
+    Args:
+        payload: Raw response bytes, or an already decoded JSON value.
+        struct: The struct type of a single record.
+        many: Whether the payload is a list of records.
+        enumeration: Whether the payload is an enumeration result.
+        projection: Optional field projection applied before conversion.
+
+    Returns:
+        The decoded struct, list of structs or EnumerationResultStruct.
+    """
+    if enumeration:
+        target = EnumerationResultStruct[struct]
+    elif many:
+        target = List[struct]
+    else:
+        target = struct
+
+    if payload is None or payload == b"":
+        return None
+
+    if projection is None and isinstance(payload, (bytes, bytearray, str)):
+        return msgspec.json.decode(payload, type=target)
+
+    if isinstance(payload, (bytes, bytearray, str)):
+        payload = msgspec.json.decode(payload)
+    if projection is not None:
+        if enumeration and isinstance(payload, dict) and "Objects" in payload:
+            payload = {
+                **payload,
+                "Objects": _project_records(payload["Objects"], projection),
+            }
+        elif many:
+            payload = _project_records(payload, projection)
+    return msgspec.convert(payload, type=target)
+
+
+def to_model(struct: Any) -> Any:
+    """
+    Convert a struct (or list of structs) into the equivalent pydantic model.
+
+    Enumeration results are converted into ``EnumerationResultModel``.
+    """
+    if isinstance(struct, list):
+        return [to_model(item) for item in struct]
+    if isinstance(struct, EnumerationResultStruct):
+        result = msgspec.to_builtins(struct)
+        result["Objects"] = [to_model(item) for item in struct.objects]
+        return EnumerationResultModel.model_validate(result)
+    model = STRUCT_MODELS.get(type(struct))
+    if model is None:
+        raise TypeError(f"No pydantic model registered for {type(struct).__name__}")
+    return model.model_validate(msgspec.to_builtins(struct))
+
+
+def from_model(model: Any) -> Any:
+    """
+    Convert a pydantic model (or list of models) into the equivalent struct.
+    """
+    if isinstance(model, list):
+        return [from_model(item) for item in model]
+    if not isinstance(model, BaseModel) or type(model) not in MODEL_STRUCTS:
+        raise TypeError(f"No struct registered for {type(model).__name__}")
+    return msgspec.convert(model, type=MODEL_STRUCTS[type(model)], from_attributes=True)
@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class SubgraphBatch:
+    """
+    The subgraphs around many seed nodes, storing shared nodes and edges once.
+
+    Every distinct node and edge found in any subgraph has one entry in
+    ``node_guids`` and ``edge_guids``; each seed's subgraph is a list of indices
+    into them.
+
+    Attributes:
+        node_guids: GUIDs of the distinct nodes.
+        edge_guids: GUIDs of the distinct edges.
+        nodes: NodeModel (NodeStruct with the msgspec backend) of every entry of
+            ``node_guids``, or None when the subgraphs were read from a local
+            snapshot.
+        edges: EdgeModel (EdgeStruct with the msgspec backend) of every entry of
+            ``edge_guids``, or None when the subgraphs were read from a local
+            snapshot.
+        node_members: For every seed, the indices of its subgraph's nodes.
+        edge_members: For every seed, the indices of its subgraph's edges.
+    """
+
+    node_guids: List[str]
+    edge_guids: List[str]
+    nodes: Optional[List[Any]]
+    edges: Optional[List[Any]]
+    node_members: Dict[str, List[int]]
+    edge_members: Dict[str, List[int]]
+
+    def __len__(self) -> int:
+        return len(self.node_members)
+
+    def __contains__(self, seed: str) -> bool:
+        return seed in self.node_members
+
+    @property
+    def seeds(self) -> List[str]:
+        """The seed node GUIDs, in request order."""
+        return list(self.node_members)
+
+    def subgraph(self, seed: str) -> Tuple[List[Any], List[Any]]:
+        """
+        Return the nodes and edges of one seed's subgraph.
+
+        Args:
+            seed: The seed node GUID.
+
+        Returns:
+            tuple: The node and edge models, or their GUIDs when the subgraphs
+            were read from a local snapshot.
+
+        Raises:
+            KeyError: If ``seed`` was not part of the batch.
+        """
+        nodes = self.node_guids if self.nodes is None else self.nodes
+        edges = self.edge_guids if self.edges is None else self.edges
+        return (
+            [nodes[index] for index in self.node_members[seed]],
+            [edges[index] for index in self.edge_members[seed]],
+        )
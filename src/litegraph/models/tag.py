@@ -26,4 +26,6 @@ class TagModel(BaseModel):
         default_factory=lambda: datetime.now(timezone.utc), alias="LastUpdateUtc"
     )
 
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+    model_config = ConfigDict(
+        populate_by_name=True, from_attributes=True, defer_build=True
+    )
@@ -13,4 +13,4 @@ class TenantStatisticsModel(BaseModel):
     tags: NonNegativeInt = Field(default=0, alias="Tags")
     vectors: NonNegativeInt = Field(default=0, alias="Vectors")
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
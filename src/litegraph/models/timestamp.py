@@ -25,4 +25,6 @@ class TimestampModel(BaseModel):
             raise ValueError("Message cannot be empty.")
         self.messages[datetime.now(timezone.utc)] = msg
 
-    model_config = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
+    model_config = ConfigDict(
+        populate_by_name=True, arbitrary_types_allowed=True, defer_build=True
+    )
@@ -0,0 +1,174 @@
+from typing import Any, ClassVar, Set, Tuple
+
+from pydantic import BaseModel
+
+
+class ChangeTrackedModel(BaseModel):
+    """
+    Base model that tracks which fields were modified after it was retrieved.
+
+    Models decoded by the SDK keep a reference to the raw response they were
+    validated from, so unchanged fields can be sent back without re-serializing
+    them. Assignments are tracked directly; in-place changes to containers such
+    as ``Data``, ``Labels`` and ``Tags`` are detected by comparing against the
+    raw response, and nested tracked models (``Vectors``) report their own changes.
+    """
+
+    # Tracking state lives in slots rather than private attributes, so that
+    # plain validation pays nothing for it.
+    __slots__ = ("_lg_source", "_lg_changed", "_lg_projected")
+
+    # List fields holding nested tracked models that share the raw response.
+    TRACKED_CHILDREN: ClassVar[Tuple[str, ...]] = ()
+
+    @classmethod
+    def from_response(cls, data: Any):
+        """
+        Validate an API response record and remember it for change tracking.
+        """
+        model = cls.model_validate(data)
+        model._attach_source(data)
+        return model
+
+    def _attach_source(self, data: Any) -> None:
+        if not isinstance(data, dict):
+            return
+        object.__setattr__(self, "_lg_source", data)
+        for name in self.TRACKED_CHILDREN:
+            children = getattr(self, name)
+            raw_children = self._raw_value(name)
+            if isinstance(children, list) and isinstance(raw_children, list):
+                for child, raw_child in zip(children, raw_children):
+                    if isinstance(child, ChangeTrackedModel):
+                        child._attach_source(raw_child)
+
+    def _mark_projected(self) -> None:
+        """Record that the model was built from a field projection."""
+        object.__setattr__(self, "_lg_projected", frozenset(self.model_fields_set))
+
+    def is_projected(self) -> bool:
+        """
+        Return True if the model was built from a field projection.
+
+        Fields left out of the projection hold defaults rather than server
+        values, so such models can only be updated with ``partial=True``.
+        """
+        return getattr(self, "_lg_projected", None) is not None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._changed().add(name)
+
+    def _changed(self) -> Set[str]:
+        try:
+            return self._lg_changed
+        except AttributeError:
+            changed = set()
+            object.__setattr__(self, "_lg_changed", changed)
+            return changed
+
+    def _raw_value(self, name: str) -> Any:
+        """Return the raw response value of a field, or a sentinel if unknown."""
+        source = getattr(self, "_lg_source", None)
+        if source is None:
+            return _MISSING
+        alias = type(self).model_fields[name].alias
+        if alias and alias in source:
+            return source[alias]
+        return source.get(name, _MISSING)
+
+    def _field_changed(self, name: str) -> bool:
+        if name in self._changed():
+            return True
+        value = getattr(self, name)
+        if not isinstance(value, (dict, list)):
+            # Scalars can only change through assignment.
+            return False
+        raw = self._raw_value(name)
+        if raw is _MISSING:
+            return False
+        if value and isinstance(value, list) and _is_tracked_list(value):
+            return (
+                not isinstance(raw, list)
+                or len(raw) != len(value)
+                or any(
+                    getattr(item, "_lg_source", None) is not raw_item
+                    or item.is_changed()
+                    for item, raw_item in zip(value, raw)
+                )
+            )
+        return value != raw
+
+    def changed_fields(self) -> Set[str]:
+        """
+        Return the names of the fields modified since the model was retrieved.
+        """
+        return {name for name in type(self).model_fields if self._field_changed(name)}
+
+    def is_changed(self) -> bool:
+        """
+        Return True if any field was modified since the model was retrieved.
+        """
+        return any(self._field_changed(name) for name in type(self).model_fields)
+
+    def mark_changed(self, *names: str) -> None:
+        """
+        Explicitly mark fields as modified.
+        """
+        for name in names:
+            if name not in type(self).model_fields:
+                raise ValueError(f"Unknown field: {name}")
+            self._changed().add(name)
+
+    def changed_payload(self, partial: bool = False) -> dict:
+        """
+        Build the JSON payload for updating this object.
+
+        Args:
+            partial: If True, only the changed fields (and the GUID) are included.
+                Otherwise the full object is returned, reusing the raw response
+                values of unchanged fields instead of re-serializing them.
+
+        Returns:
+            dict: The JSON-compatible payload keyed by API aliases.
+
+        Raises:
+            ValueError: If a full payload is requested for a projected model.
+        """
+        fields = type(self).model_fields
+        changed = self.changed_fields()
+        if partial:
+            include = changed | ({"guid"} & fields.keys())
+            return self.model_dump(mode="json", by_alias=True, include=include)
+
+        if self.is_projected():
+            raise ValueError(
+                "This model was built from a field projection and only holds "
+                f"{sorted(self._lg_projected)}; update it with partial=True."
+            )
+        reused = {}
+        dump = set()
+        for name, info in fields.items():
+            if info.exclude:
+                continue
+            raw = _MISSING if name in changed else self._raw_value(name)
+            if raw is _MISSING:
+                dump.add(name)
+            else:
+                reused[info.alias or name] = raw
+        payload = self.model_dump(mode="json", by_alias=True, include=dump)
+        payload.update(reused)
+        return payload
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+def _is_tracked_list(value: list) -> bool:
+    return all(isinstance(item, ChangeTrackedModel) for item in value)
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from .edge import EdgeModel
+
+
+@dataclass
+class TraversalStep:
+    """
+    A node reached during a traversal.
+
+    Attributes:
+        depth: Number of hops from the start nodes.
+        node_guid: The node reached.
+        edge: The edge it was reached through, or None for start nodes.
+        parent_guid: The node the edge was followed from, or None for start nodes.
+        new: True the first time the node is reached; False for further edges to a
+            node already visited.
+    """
+
+    depth: int
+    node_guid: str
+    edge: Optional[EdgeModel] = None
+    parent_guid: Optional[str] = None
+    new: bool = True
@@ -20,4 +20,4 @@ class UserMasterModel(BaseModel):
         default_factory=lambda: datetime.now(timezone.utc), alias="LastUpdateUtc"
     )
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
@@ -20,4 +20,6 @@ class VectorIndexManagerModel(BaseModel):
     # Whether manager has been disposed
     disposed: bool = Field(default=False, alias="Disposed")
 
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+    model_config = ConfigDict(
+        populate_by_name=True, from_attributes=True, defer_build=True
+    )
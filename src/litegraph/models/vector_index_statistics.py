@@ -33,4 +33,6 @@ class VectorIndexStatisticsModel(BaseModel):
     is_loaded: bool = Field(default=False, alias="IsLoaded")
     distance_metric: str = Field(default="Cosine", alias="DistanceMetric")
 
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+    model_config = ConfigDict(
+        populate_by_name=True, from_attributes=True, defer_build=True
+    )
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+
+@dataclass
+class VectorMatrix:
+    """
+    Embeddings of many vectors as a single NumPy matrix.
+
+    Attributes:
+        embeddings: Contiguous ``(n, d)`` float32 array, one row per vector.
+        guids: Array of the ``n`` vector GUIDs, parallel to the rows.
+        node_guids: Array of the node GUIDs the vectors belong to (None if unset).
+        edge_guids: Array of the edge GUIDs the vectors belong to (None if unset).
+    """
+
+    embeddings: Any
+    guids: Any
+    node_guids: Any
+    edge_guids: Any
+
+    def __len__(self) -> int:
+        return len(self.guids)
+
+    @property
+    def dimensionality(self) -> int:
+        """Number of columns of the embedding matrix."""
+        return self.embeddings.shape[1]
+
+
+@dataclass
+class VectorSearchBatchResult:
+    """
+    Results of a batch of vector searches in matrix form.
+
+    Rows are padded when a query returns fewer than ``k`` results: scores with
+    NaN and GUIDs with None.
+
+    Attributes:
+        scores: ``(n_queries, k)`` float32 array of result scores.
+        guids: ``(n_queries, k)`` array of the GUIDs of the matched graphs, nodes or edges.
+        counts: ``(n_queries,)`` array with the number of results of each query.
+        results: The hydrated ``VectorSearchResultModel`` lists per query, if requested.
+    """
+
+    scores: Any
+    guids: Any
+    counts: Any
+    results: Optional[List[List[Any]]] = None
+
+    def __len__(self) -> int:
+        return len(self.scores)
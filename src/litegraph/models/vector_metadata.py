@@ -1,10 +1,12 @@
 from datetime import datetime, timezone
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ConfigDict, Field
 
+from .tracked import ChangeTrackedModel
 
-class VectorMetadataModel(BaseModel):
+
+class VectorMetadataModel(ChangeTrackedModel):
     """
     Vector metadata.
     """
@@ -30,4 +32,6 @@ class VectorMetadataModel(BaseModel):
         exclude=True,
     )
 
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+    model_config = ConfigDict(
+        populate_by_name=True, from_attributes=True, defer_build=True
+    )
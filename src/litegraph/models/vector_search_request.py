@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_serializer
 
 from ..enums.vector_search_domain_enum import VectorSearchDomainEnum
 from ..enums.vector_search_type_enum import VectorSearchTypeEnum
@@ -25,5 +25,17 @@ class VectorSearchRequestModel(BaseModel):
     tags: Dict[str, str] = Field(default_factory=dict, alias="Tags")
     expr: Optional[ExprModel] = Field(default=None, alias="Expr")
     embeddings: Optional[List[float]] = Field(default=None, alias="Embeddings")
+    top_k: Optional[int] = Field(default=None, ge=1, alias="TopK")
 
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+    model_config = ConfigDict(
+        populate_by_name=True, from_attributes=True, defer_build=True
+    )
+
+    @model_serializer(mode="wrap")
+    def _omit_unset_top_k(self, handler):
+        # Searches without TopK keep sending the payload the server always got.
+        data = handler(self)
+        if self.top_k is None:
+            data.pop("TopK", None)
+            data.pop("top_k", None)
+        return data
@@ -19,4 +19,6 @@ class VectorSearchResultModel(BaseModel):
     node: Optional[NodeModel] = Field(default=None, alias="Node")
     edge: Optional[EdgeModel] = Field(default=None, alias="Edge")
 
-    model_config = ConfigDict(populate_by_name=True, from_attributes=True)
+    model_config = ConfigDict(
+        populate_by_name=True, from_attributes=True, defer_build=True
+    )
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class VectorSyncResult:
+    """
+    Outcome of ``Vector.sync_vectors``.
+
+    Attributes:
+        created: Vectors uploaded without replacing a previously uploaded one.
+        replaced: Vectors re-uploaded because their model or content changed.
+        deleted: Vectors deleted, both replaced ones and those whose source is gone.
+        unchanged: Vectors skipped because their content hash matched.
+    """
+
+    created: int = 0
+    replaced: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+
+    @property
+    def uploaded(self) -> int:
+        """Number of vectors sent to the server."""
+        return self.created + self.replaced
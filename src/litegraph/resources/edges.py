@@ -44,6 +44,7 @@ class Edge(
 
     RESOURCE_NAME: str = "edges"
     MODEL = EdgeModel
+    STRUCT = "EdgeStruct"
     SEARCH_MODELS = SearchRequest, SearchResultEdge
 
     @classmethod
@@ -1,8 +1,10 @@
-from typing import Type
+from importlib.util import find_spec
+from typing import List, Optional, Sequence, Type
 
 from pydantic import BaseModel
 
 from ..configuration import get_client
+from ..exceptions import GRAPH_REQUIRED_ERROR, TENANT_REQUIRED_ERROR
 from ..mixins import (
     AllRetrievableAPIResource,
     CreateableAPIResource,
@@ -19,12 +21,16 @@ from ..mixins import (
     RetrievableStatisticsMixin,
     SearchableAPIResource,
     UpdatableAPIResource,
+    _get_struct,
+    _validate_model,
 )
 from ..models.existence_request import ExistenceRequestModel
 from ..models.existence_result import ExistenceResultModel
 from ..models.graph_statistics import GraphStatisticsModel
 from ..models.graphs import GraphModel
 from ..models.search_graphs import SearchRequestGraph, SearchResultGraph
+from ..utils.concurrency import DEFAULT_MAX_CONCURRENCY, _iter_concurrent
+from ..utils.numpy_helper import _json_loads, _require_numpy
 from ..utils.url_helper import _get_url_v1
 
 
@@ -207,16 +213,9 @@ class Graph(
             GraphModel: The subgraph.
         """
         client = get_client()
-        query_params = {
-            "maxDepth": max_depth,
-            "maxNodes": max_nodes,
-            "maxEdges": max_edges,
-        }
-        if include_data:
-            query_params["incldata"] = None
-        if include_sub:
-            query_params["inclsub"] = None
-
+        query_params = _subgraph_params(
+            max_depth, max_nodes, max_edges, include_data, include_sub
+        )
         url = _get_url_v1(
             cls,
             client.tenant_guid,
@@ -229,6 +228,292 @@ class Graph(
         response = client.request("GET", url)
         return GraphModel.model_validate(response)
 
+    @classmethod
+    def retrieve_subgraphs(
+        cls,
+        graph_guid: str | None,
+        seeds: Sequence[str],
+        max_depth: int | None = 2,
+        max_nodes: int | None = None,
+        max_edges: int | None = None,
+        include_data: bool = False,
+        include_sub: bool = False,
+        adjacency=None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """
+        Retrieve the subgraphs (ego networks) around many seed nodes.
+
+        Subgraphs are requested concurrently, with at most ``max_concurrency``
+        requests in flight. Nodes and edges shared between subgraphs are decoded
+        and stored only once, through an identity map keyed by GUID.
+
+        With ``adjacency``, the subgraphs are instead expanded breadth-first over
+        the local snapshot, following edges in both directions, without any
+        request. Only GUIDs are available then.
+
+        Endpoint:
+            /v1.0/tenants/{tenant}/graphs/{graph}/nodes/{node}/subgraph
+
+        Args:
+            graph_guid: The graph GUID. If not provided, uses client.graph_guid.
+            seeds: The seed node GUIDs. Duplicates are retrieved once.
+            max_depth: Maximum number of hops from the seed. None for no limit.
+            max_nodes: Maximum number of nodes per subgraph, including the seed.
+            max_edges: Maximum number of edges per subgraph.
+            include_data: Whether to include data in the response.
+            include_sub: Whether to include subordinates in the response.
+            adjacency: A GraphAdjacency snapshot to read the subgraphs from.
+            max_concurrency: Maximum number of concurrent requests.
+
+        Returns:
+            SubgraphBatch: The distinct nodes and edges and each seed's members.
+
+        Raises:
+            KeyError: If a seed is not in ``adjacency``.
+            ValueError: If tenant GUID or graph GUID is missing.
+        """
+        from ..models.edge import EdgeModel
+        from ..models.node import NodeModel
+        from ..models.subgraph_batch import SubgraphBatch
+        from .edges import Edge
+        from .nodes import Node
+
+        unique = list(dict.fromkeys(seeds))
+        if adjacency is not None:
+            return _local_subgraphs(adjacency, unique, max_depth, max_nodes, max_edges)
+
+        client = get_client()
+        graph_guid = graph_guid or client.graph_guid
+        if client.tenant_guid is None:
+            raise ValueError(TENANT_REQUIRED_ERROR)
+        if not graph_guid:
+            raise ValueError(GRAPH_REQUIRED_ERROR)
+        query_params = _subgraph_params(
+            max_depth, max_nodes, max_edges, include_data, include_sub
+        )
+
+        def fetch(seed):
+            url = _get_url_v1(
+                cls,
+                client.tenant_guid,
+                graph_guid,
+                "nodes",
+                seed,
+                "subgraph",
+                **query_params,
+            )
+            return client.request("GET", url)
+
+        node_struct = _get_struct(Node, client)
+        edge_struct = _get_struct(Edge, client)
+        node_index, edge_index = {}, {}
+        nodes, edges = [], []
+        node_members, edge_members = {}, {}
+        responses = _iter_concurrent(fetch, unique, max_concurrency)
+        try:
+            for seed, response, error in responses:
+                if error is not None:
+                    raise error
+                response = response or {}
+                node_members[seed] = _intern(
+                    response.get("Nodes"), node_index, nodes, NodeModel, node_struct
+                )
+                edge_members[seed] = _intern(
+                    response.get("Edges"), edge_index, edges, EdgeModel, edge_struct
+                )
+        finally:
+            responses.close()
+        return SubgraphBatch(
+            node_guids=list(node_index),
+            edge_guids=list(edge_index),
+            nodes=nodes,
+            edges=edges,
+            node_members={seed: node_members[seed] for seed in unique},
+            edge_members={seed: edge_members[seed] for seed in unique},
+        )
+
+    @classmethod
+    def load_adjacency(
+        cls,
+        graph_guid: str | None = None,
+        tenant_guid: str | None = None,
+        include_isolated: bool = False,
+    ):
+        """
+        Download the edges of a graph into a local CSR adjacency snapshot.
+
+        Only the GUID, endpoints and cost of each edge are decoded (without
+        building EdgeModel instances when msgspec is installed), so neighbour and
+        degree queries can then be answered in-process.
+
+        Endpoint:
+            /v1.0/tenants/{tenant}/graphs/{graph}/edges/all
+
+        Args:
+            graph_guid: The graph GUID. If not provided, uses client.graph_guid.
+            tenant_guid: The tenant GUID. If not provided, uses client.tenant_guid.
+            include_isolated: Also download the node GUIDs so that nodes without
+                edges are part of the snapshot (one extra request).
+
+        Returns:
+            GraphAdjacency: The snapshot.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If tenant GUID or graph GUID is missing.
+        """
+        from ..local.adjacency import GraphAdjacency
+
+        client = get_client()
+        tenant_guid = tenant_guid or client.tenant_guid
+        graph_guid = graph_guid or client.graph_guid
+        if tenant_guid is None:
+            raise ValueError(TENANT_REQUIRED_ERROR)
+        if not graph_guid:
+            raise ValueError(GRAPH_REQUIRED_ERROR)
+        base = f"v1.0/tenants/{tenant_guid}/graphs/{graph_guid}"
+
+        guids, sources, targets, costs = _decode_edge_rows(
+            client.request("GET", f"{base}/edges/all", raw=True)
+        )
+        node_guids = None
+        if include_isolated:
+            node_guids = _decode_guids(
+                client.request("GET", f"{base}/nodes/all", raw=True)
+            )
+        return GraphAdjacency.from_edges(
+            sources, targets, costs=costs, edge_guids=guids, node_guids=node_guids
+        )
+
+    @classmethod
+    def to_matrices(
+        cls,
+        graph_guid: str | None = None,
+        page_size: int = 1000,
+        include_features: bool = True,
+        vector_model: str | None = None,
+        tag_keys: Sequence[str] | None = None,
+    ):
+        """
+        Export a graph as sparse adjacency, feature and one-hot matrices.
+
+        Nodes and then edges are read page by page through the v2.0 enumeration
+        endpoints, requesting only the fields needed. Every page is folded into
+        compact index lists and arrays before the next one is requested, so no
+        node or edge models are kept beyond a single page.
+
+        Endpoints:
+            /v2.0/tenants/{tenant}/graphs/{graph}/nodes
+            /v2.0/tenants/{tenant}/graphs/{graph}/edges
+
+        Args:
+            graph_guid: The graph GUID. If not provided, uses client.graph_guid.
+            page_size: Number of nodes or edges per request (at most 1000).
+            include_features: Build the feature matrix from node vectors.
+            vector_model: Use the vector of this embedding model when nodes have
+                several. By default the first vector with embeddings is used.
+            tag_keys: Only one-hot encode tags with these keys. All tags if not
+                given.
+
+        Returns:
+            GraphMatrices: The arrays, with node and edge GUIDs in index order.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If tenant GUID or graph GUID is missing, or node vectors
+                do not share the same dimensionality.
+        """
+        from ..models.graph_matrices import GraphMatrices
+        from .edges import Edge
+        from .nodes import Node
+
+        np = _require_numpy()
+        client = get_client()
+        graph_guid = graph_guid or client.graph_guid
+        if client.tenant_guid is None:
+            raise ValueError(TENANT_REQUIRED_ERROR)
+        if not graph_guid:
+            raise ValueError(GRAPH_REQUIRED_ERROR)
+        if not 1 <= page_size <= 1000:
+            raise ValueError("page_size must be between 1 and 1000.")
+        tag_keys = None if tag_keys is None else set(tag_keys)
+
+        node_guids, index = [], {}
+        label_columns, label_rows, label_cells = {}, [], []
+        tag_columns, tag_rows, tag_cells = {}, [], []
+        feature_rows, feature_blocks = [], []
+        fields = ["guid", "labels", "tags"] + (["vectors"] if include_features else [])
+        for page in _enumerate_pages(Node, graph_guid, page_size, fields):
+            rows, embeddings = [], []
+            for node in page:
+                row = index[node.guid] = len(node_guids)
+                node_guids.append(node.guid)
+                for label in node.labels or []:
+                    label_rows.append(row)
+                    label_cells.append(
+                        label_columns.setdefault(label, len(label_columns))
+                    )
+                for key, value in (node.tags or {}).items():
+                    if tag_keys is None or key in tag_keys:
+                        name = f"{key}={value}"
+                        tag_rows.append(row)
+                        tag_cells.append(tag_columns.setdefault(name, len(tag_columns)))
+                embedding = include_features and _node_embedding(node, vector_model)
+                if embedding:
+                    rows.append(row)
+                    embeddings.append(embedding)
+            if embeddings:
+                feature_rows.append(np.asarray(rows, dtype=np.int64))
+                feature_blocks.append(_feature_block(np, embeddings, feature_blocks))
+
+        edge_guids, source_blocks, target_blocks, cost_blocks = [], [], [], []
+        fields = ["guid", "from_node_guid", "to_node_guid", "cost"]
+        for page in _enumerate_pages(Edge, graph_guid, page_size, fields):
+            sources, targets, costs = [], [], []
+            for edge in page:
+                # Endpoints missing from the node pages (e.g. nodes created while
+                # enumerating) get a row without features, labels or tags.
+                for guid, found in (
+                    (edge.from_node_guid, sources),
+                    (edge.to_node_guid, targets),
+                ):
+                    if guid not in index:
+                        index[guid] = len(node_guids)
+                        node_guids.append(guid)
+                    found.append(index[guid])
+                edge_guids.append(edge.guid)
+                costs.append(edge.cost or 0)
+            source_blocks.append(np.asarray(sources, dtype=np.int32))
+            target_blocks.append(np.asarray(targets, dtype=np.int32))
+            cost_blocks.append(np.asarray(costs, dtype=np.float32))
+
+        count = len(node_guids)
+        has_features = np.zeros(count, dtype=bool)
+        features = None
+        if feature_blocks:
+            rows = np.concatenate(feature_rows)
+            features = np.zeros((count, feature_blocks[0].shape[1]), dtype=np.float32)
+            features[rows] = np.concatenate(feature_blocks)
+            has_features[rows] = True
+        labels = np.zeros((count, len(label_columns)), dtype=np.uint8)
+        labels[label_rows, label_cells] = 1
+        tags = np.zeros((count, len(tag_columns)), dtype=np.uint8)
+        tags[tag_rows, tag_cells] = 1
+        return GraphMatrices(
+            node_guids=np.array(node_guids, dtype=object),
+            edge_guids=np.array(edge_guids, dtype=object),
+            sources=_concatenate(np, source_blocks, np.int32),
+            targets=_concatenate(np, target_blocks, np.int32),
+            costs=_concatenate(np, cost_blocks, np.float32),
+            features=features,
+            has_features=has_features,
+            label_names=list(label_columns),
+            labels=labels,
+            tag_names=list(tag_columns),
+            tags=tags,
+        )
+
     @classmethod
     def retrieve_all_tenant_graphs(
         cls, tenant_guid: str | None = None
@@ -250,3 +535,166 @@ class Graph(
         Delete all graphs for a tenant.
         """
         return super().delete_all_tenant(tenant_guid)
+
+
+def _decode_edge_rows(payload):
+    """
+    Decode a list of edges into parallel GUID, From, To and Cost lists.
+
+    With msgspec installed, only those fields are decoded and every other field
+    is skipped.
+    """
+    if isinstance(payload, (bytes, bytearray, str)) and find_spec("msgspec"):
+        import msgspec
+
+        from ..models.structs import EdgeRowStruct
+
+        records = msgspec.json.decode(payload or b"[]", type=List[EdgeRowStruct])
+        return (
+            [record.guid for record in records],
+            [record.from_node_guid for record in records],
+            [record.to_node_guid for record in records],
+            [record.cost for record in records],
+        )
+
+    records = _json_loads(payload) or []
+    return (
+        [record.get("GUID") for record in records],
+        [record.get("From") for record in records],
+        [record.get("To") for record in records],
+        [record.get("Cost") or 0 for record in records],
+    )
+
+
+def _decode_guids(payload) -> List[str]:
+    """Decode the GUIDs of a list of objects."""
+    return [record.get("GUID") for record in _json_loads(payload) or []]
+
+
+def _enumerate_pages(resource, graph_guid: str, page_size: int, fields: List[str]):
+    """Yield the objects of every enumeration page, following continuation tokens."""
+    token = None
+    while True:
+        query = {"graph_guid": graph_guid, "max_results": page_size, "fields": fields}
+        if token:
+            query["continuation_token"] = token
+        result = resource.enumerate_with_query(**query)
+        yield result.objects or []
+        token = result.continuation_token
+        if result.end_of_results or not token:
+            return
+
+
+def _node_embedding(node, vector_model: Optional[str]):
+    """Return the embeddings of the first matching vector of a node, if any."""
+    for vector in node.vectors or []:
+        if vector_model is not None and vector.model != vector_model:
+            continue
+        values = vector.vectors if vector.vectors is not None else vector.embeddings
+        if values:
+            return values
+    return None
+
+
+def _feature_block(np, embeddings, blocks):
+    """Convert one page of embeddings, checking they match earlier pages."""
+    try:
+        block = np.array(embeddings, dtype=np.float32)
+    except ValueError as exc:
+        raise ValueError("Node vectors do not share the same dimensionality.") from exc
+    if block.ndim != 2 or (blocks and block.shape[1] != blocks[0].shape[1]):
+        raise ValueError("Node vectors do not share the same dimensionality.")
+    return block
+
+
+def _concatenate(np, blocks, dtype):
+    return np.concatenate(blocks) if blocks else np.zeros(0, dtype=dtype)
+
+
+def _subgraph_params(max_depth, max_nodes, max_edges, include_data, include_sub):
+    """Build the query parameters of a subgraph request."""
+    query_params = {
+        "maxDepth": max_depth,
+        "maxNodes": max_nodes,
+        "maxEdges": max_edges,
+    }
+    if include_data:
+        query_params["incldata"] = None
+    if include_sub:
+        query_params["inclsub"] = None
+    return query_params
+
+
+def _intern(records, index, models, model, struct=None) -> List[int]:
+    """
+    Return the identity-map indices of records, decoding only new ones.
+
+    New records become ``struct`` instances when the msgspec backend is enabled,
+    and validated ``model`` instances otherwise.
+    """
+    members = []
+    for record in records or []:
+        guid = record.get("GUID")
+        if guid not in index:
+            index[guid] = len(models)
+            if struct is not None:
+                from ..models.structs import decode
+
+                models.append(decode(record, struct))
+            else:
+                models.append(_validate_model(model, record))
+        members.append(index[guid])
+    return members
+
+
+def _local_subgraphs(adjacency, seeds, max_depth, max_nodes, max_edges):
+    """Expand the subgraph of every seed breadth-first over a snapshot."""
+    from ..models.subgraph_batch import SubgraphBatch
+
+    # Outgoing and incoming edges as (offsets, other endpoints, edge indices).
+    directions = (
+        (
+            adjacency.out_offsets.tolist(),
+            adjacency.out_targets.tolist(),
+            adjacency.out_edges.tolist(),
+        ),
+        (
+            adjacency.in_offsets.tolist(),
+            adjacency.in_sources.tolist(),
+            adjacency.in_edges.tolist(),
+        ),
+    )
+    node_index, edge_index = {}, {}
+    node_members, edge_members = {}, {}
+    for seed in seeds:
+        found = {adjacency.index_of(seed): None}
+        followed = {}
+        frontier, depth = list(found), 0
+        while frontier and (max_depth is None or depth < max_depth):
+            following = []
+            for node in frontier:
+                for offsets, others, edges in directions:
+                    for position in range(offsets[node], offsets[node + 1]):
+                        other = others[position]
+                        if other not in found:
+                            if max_nodes is not None and len(found) >= max_nodes:
+                                continue
+                            found[other] = None
+                            following.append(other)
+                        if max_edges is None or len(followed) < max_edges:
+                            followed[edges[position]] = None
+            frontier, depth = following, depth + 1
+        node_members[seed] = [
+            node_index.setdefault(node, len(node_index)) for node in found
+        ]
+        edge_members[seed] = [
+            edge_index.setdefault(edge, len(edge_index)) for edge in followed
+        ]
+    return SubgraphBatch(
+        node_guids=[adjacency.guids[node] for node in node_index],
+        edge_guids=[adjacency.edge_guids[edge] for edge in edge_index],
+        nodes=None,
+        edges=None,
+        node_members=node_members,
+        edge_members=edge_members,
+    )
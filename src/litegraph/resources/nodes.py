@@ -47,6 +47,7 @@ class Node(
 
     RESOURCE_NAME: str = "nodes"
     MODEL = NodeModel
+    STRUCT = "NodeStruct"
     SEARCH_MODELS = SearchRequest, SearchResult
 
     @classmethod
@@ -1,9 +1,23 @@
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
 from ..configuration import get_client
+from ..exceptions import GRAPH_REQUIRED_ERROR, TENANT_REQUIRED_ERROR
 from ..models.edge import EdgeModel
+from ..models.expression import ExprModel
 from ..models.node import NodeModel
 from ..models.route_request import RouteRequestModel
+from ..models.traversal_step import TraversalStep
+from ..utils.concurrency import DEFAULT_MAX_CONCURRENCY
+from ..utils.traversal import _edge_matches, _traverse
 from ..utils.url_helper import _get_url_v1
 
+# Edge endpoints followed for each traversal direction.
+TRAVERSAL_DIRECTIONS = {
+    "out": ("edges/from",),
+    "in": ("edges/to",),
+    "both": ("edges/from", "edges/to"),
+}
+
 
 class RouteNodes:
     """
@@ -141,10 +155,14 @@ class RouteNodes:
         )
 
     @classmethod
-    def between(cls, graph_guid: str, node_guid: str):
+    def between(cls, graph_guid: str, node_guid: str, cache=None):
         """
         Get the nodes between two nodes in a graph.
+
+        Pass a RouteCache as ``cache`` to answer repeated requests from memory.
         """
+        if cache is not None:
+            return cache.nodes_between(graph_guid, node_guid)
         client = get_client()
         graph_id = client.graph_guid if cls.REQUIRE_GRAPH_GUID else None
         url = (
@@ -158,3 +176,88 @@ class RouteNodes:
             if cls.MODEL
             else instance
         )
+
+    @classmethod
+    def traverse(
+        cls,
+        start_guids: Union[str, Sequence[str]],
+        graph_guid: Optional[str] = None,
+        direction: str = "out",
+        max_depth: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+        max_edges: Optional[int] = None,
+        labels: Optional[List[str]] = None,
+        tags: Optional[Dict[str, str]] = None,
+        expr: Union[ExprModel, dict, None] = None,
+        strategy: str = "bfs",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Iterator[TraversalStep]:
+        """
+        Traverse a graph from one or more nodes, streaming the nodes and edges found.
+
+        Breadth-first traversals fetch the edges of every node in a frontier
+        concurrently, with at most ``max_concurrency`` requests in flight, so the
+        latency grows with the number of hops rather than the number of nodes.
+        Each node is expanded once and each edge is yielded once. Stopping the
+        iteration early cancels the requests that have not been sent yet.
+
+        Args:
+            start_guids: The node GUID, or GUIDs, to start from.
+            graph_guid: The graph GUID. If not provided, uses client.graph_guid.
+            direction: Follow edges ``out`` (children), ``in`` (parents) or ``both``
+                (neighbors).
+            max_depth: Maximum number of hops from the start nodes.
+            max_nodes: Maximum number of nodes visited, including the start nodes.
+            max_edges: Maximum number of edges yielded.
+            labels: Only follow edges that have all of these labels.
+            tags: Only follow edges that have all of these tag values.
+            expr: Only follow edges whose ``Data`` matches this expression; ``Left``
+                is a dotted path into the data.
+            strategy: ``bfs`` (breadth-first, concurrent) or ``dfs`` (depth-first,
+                one request at a time).
+            max_concurrency: Maximum number of concurrent requests.
+
+        Yields:
+            TraversalStep: The start nodes first, then one step per edge followed.
+
+        Raises:
+            ValueError: If tenant GUID or graph GUID is missing, or an argument is
+                invalid.
+        """
+        client = get_client()
+        graph_guid = graph_guid or client.graph_guid
+        if client.tenant_guid is None:
+            raise ValueError(TENANT_REQUIRED_ERROR)
+        if not graph_guid:
+            raise ValueError(GRAPH_REQUIRED_ERROR)
+        if direction not in TRAVERSAL_DIRECTIONS:
+            raise ValueError(
+                f"Unknown direction '{direction}', "
+                f"expected one of {tuple(TRAVERSAL_DIRECTIONS)}"
+            )
+        if isinstance(start_guids, str):
+            start_guids = [start_guids]
+        if isinstance(expr, dict):
+            expr = ExprModel.model_validate(expr)
+        suffixes = TRAVERSAL_DIRECTIONS[direction]
+        tenant_guid = client.tenant_guid
+
+        def expand(node_guid: str) -> List[EdgeModel]:
+            edges = []
+            for suffix in suffixes:
+                url = _get_url_v1(cls, tenant_guid, graph_guid, node_guid, suffix)
+                edges.extend(
+                    cls.RESPONSE_MODEL.model_validate(item)
+                    for item in client.request("GET", url) or []
+                )
+            return [edge for edge in edges if _edge_matches(edge, labels, tags, expr)]
+
+        return _traverse(
+            expand,
+            start_guids,
+            max_depth=max_depth,
+            max_nodes=max_nodes,
+            max_edges=max_edges,
+            strategy=strategy,
+            max_concurrency=max_concurrency,
+        )
@@ -1,6 +1,12 @@
+from typing import Iterable, Iterator, Optional, Tuple
+
 from ..configuration import get_client
+from ..exceptions import GRAPH_REQUIRED_ERROR, TENANT_REQUIRED_ERROR
 from ..models.route_request import RouteRequestModel
 from ..models.route_response import RouteResultModel
+from ..models.search_node_edge import SearchRequest
+from ..utils.concurrency import DEFAULT_MAX_CONCURRENCY, _iter_concurrent
+from ..utils.numpy_helper import _json_dumps
 from ..utils.url_helper import _get_url_v1
 
 
@@ -16,10 +22,14 @@ class Routes:
     REQUIRE_TENANT = True
 
     @classmethod
-    def routes(cls, graph_guid: str, **kwargs):
+    def routes(cls, graph_guid: str, cache=None, **kwargs):
         """
         Routes
+
+        Pass a RouteCache as ``cache`` to answer repeated requests from memory.
         """
+        if cache is not None:
+            return cache.routes(graph_guid, **kwargs)
         headers = {"Content-Type": "application/json"}
         client = get_client()
         tenant = client.tenant_guid if cls.REQUIRE_TENANT else None
@@ -49,3 +59,72 @@ class Routes:
         )
         instance = client.request("POST", url, json=request_data, headers=headers)
         return cls.RESPONSE_MODEL.model_validate(instance) if cls.MODEL else instance
+
+    @classmethod
+    def routes_many(
+        cls,
+        graph_guid: Optional[str],
+        pairs: Iterable[Tuple[str, str]],
+        edge_filter: Optional[SearchRequest] = None,
+        node_filter: Optional[SearchRequest] = None,
+        tenant_guid: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> Iterator[Tuple[Tuple[str, str], RouteResultModel]]:
+        """
+        Find the routes between many pairs of nodes concurrently.
+
+        Each distinct pair is requested once, with at most ``max_concurrency``
+        requests in flight. The filters are serialized once and the same body is
+        reused for every pair. Results are yielded as they arrive, not in input
+        order. Closing the generator early cancels the requests not yet sent.
+
+        Endpoint:
+            /v1.0/tenants/{tenant}/graphs/{graph}/routes
+
+        Args:
+            graph_guid: The graph GUID. If not provided, uses client.graph_guid.
+            pairs: The ``(from_guid, to_guid)`` pairs to route.
+            edge_filter: Optional SearchRequest edges must match.
+            node_filter: Optional SearchRequest nodes must match.
+            tenant_guid: The tenant GUID. If not provided, uses client.tenant_guid.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Yields:
+            Tuple[Tuple[str, str], RouteResultModel]: Each distinct pair and its routes.
+
+        Raises:
+            ValueError: If tenant GUID or graph GUID is missing.
+        """
+        client = get_client()
+        tenant_guid = tenant_guid or client.tenant_guid
+        graph_guid = graph_guid or client.graph_guid
+        if tenant_guid is None:
+            raise ValueError(TENANT_REQUIRED_ERROR)
+        if not graph_guid:
+            raise ValueError(GRAPH_REQUIRED_ERROR)
+        url = f"v1.0/tenants/{tenant_guid}/graphs/{graph_guid}/{cls.RESOURCE_NAME}"
+        headers = {"Content-Type": "application/json"}
+
+        template = cls.MODEL(
+            graph=graph_guid, edge_filter=edge_filter, node_filter=node_filter
+        ).model_dump(mode="json", by_alias=True, exclude={"from_node", "to_node"})
+        # Splice each pair into the pre-encoded body: '{"From":..,"To":..,' + rest.
+        rest = _json_dumps(template)[1:]
+
+        def route(pair):
+            body = b'{"From":%s,"To":%s,%s' % (
+                _json_dumps(pair[0]),
+                _json_dumps(pair[1]),
+                rest,
+            )
+            return client.request("POST", url, content=body, headers=headers)
+
+        unique = list(dict.fromkeys((str(pair[0]), str(pair[1])) for pair in pairs))
+        responses = _iter_concurrent(route, unique, max_concurrency)
+        try:
+            for pair, response, error in responses:
+                if error is not None:
+                    raise error
+                yield pair, cls.RESPONSE_MODEL.model_validate(response)
+        finally:
+            responses.close()
@@ -16,10 +16,21 @@ class RouteEdges:
     REQUIRE_TENANT = True
 
     @classmethod
-    def between(cls, graph_guid: str, from_node_guid: str, to_node_guid: str, **kwargs):
+    def between(
+        cls,
+        graph_guid: str,
+        from_node_guid: str,
+        to_node_guid: str,
+        cache=None,
+        **kwargs,
+    ):
         """
         Get the routes between two nodes in a graph.
+
+        Pass a RouteCache as ``cache`` to answer repeated requests from memory.
         """
+        if cache is not None:
+            return cache.between(graph_guid, from_node_guid, to_node_guid)
         # Define query parameters
         query_params = {"from": from_node_guid, "to": to_node_guid}
         client = get_client()
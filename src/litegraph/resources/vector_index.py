@@ -1,3 +1,7 @@
+from typing import Optional
+
+from httpx import USE_CLIENT_DEFAULT
+
 from ..configuration import get_client
 from ..mixins import (
     CreateableAPIResource,
@@ -7,6 +11,7 @@ from ..mixins import (
 )
 from ..models.hnsw_lite_vector_index import HnswLiteVectorIndexModel
 from ..models.vector_index_statistics import VectorIndexStatisticsModel
+from ..utils.rebuild import RebuildOperation, RebuildPolicy
 from ..utils.url_helper import _get_url_v1, _get_url_v2
 
 
@@ -125,12 +130,17 @@ class VectorIndex(
         return cls.MODEL(**response)
 
     @classmethod
-    def rebuild(cls, graph_guid: str) -> None:
+    def rebuild(cls, graph_guid: str, timeout=USE_CLIENT_DEFAULT) -> None:
         """
         Rebuild vector index for a specific graph.
 
+        The request blocks until the server finished rebuilding; use
+        ``rebuild_async`` for large graphs.
+
         Args:
             graph_guid: The GUID of the graph to rebuild vector index for
+            timeout: Request timeout in seconds, or None to wait indefinitely.
+                Defaults to the client's timeout.
 
         Raises:
             ValueError: If tenant GUID or graph GUID is not provided
@@ -145,7 +155,62 @@ class VectorIndex(
 
         url = _get_url_v2(cls, client.tenant_guid, graph_guid, "rebuild")
 
-        client.request("POST", url)
+        # A retried rebuild would start another rebuild on the server.
+        if timeout is USE_CLIENT_DEFAULT:
+            client.request("POST", url, retry=False)
+        else:
+            client.request("POST", url, retry=False, timeout=timeout)
+        # Rebuilding changes search results even though it is not a PUT/DELETE.
+        client.notify_mutation("POST", url)
+
+    @classmethod
+    def rebuild_async(
+        cls,
+        graph_guid: str,
+        policy: Optional[RebuildPolicy] = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+        request_timeout: float = 60.0,
+    ) -> RebuildOperation:
+        """
+        Start rebuilding the vector index of a graph without blocking.
+
+        Args:
+            graph_guid: The GUID of the graph to rebuild vector index for
+            policy: Decides from the current statistics whether to rebuild, e.g.
+                ChangeThresholdPolicy. Defaults to always rebuilding.
+            poll_interval: Seconds before the first progress poll; doubles after
+                each poll up to ``max_poll_interval``.
+            max_poll_interval: Upper bound of the poll interval.
+            timeout: Seconds after which the operation fails with TimeoutError.
+            request_timeout: Seconds to wait for the rebuild request itself. A
+                timed out request does not fail the operation, which keeps
+                polling until the index reports the rebuild.
+
+        Returns:
+            RebuildOperation: The running operation. Its result is the
+            VectorIndexStatisticsModel read after the rebuild completed.
+
+        Raises:
+            ValueError: If tenant GUID or graph GUID is not provided
+        """
+        client = get_client()
+
+        if client.tenant_guid is None:
+            raise ValueError("Tenant GUID is required for this resource.")
+
+        if not graph_guid:
+            raise ValueError("Graph GUID is required for this resource.")
+
+        return RebuildOperation(
+            graph_guid,
+            policy=policy,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            timeout=timeout,
+            request_timeout=request_timeout,
+        ).start()
 
     @classmethod
     def delete(cls, graph_guid: str) -> None:
@@ -1,7 +1,14 @@
+import heapq
+import itertools
+import time
+from importlib.util import find_spec
+from typing import Iterable, List, Optional, Sequence
 from uuid import UUID
 
 from ..configuration import get_client
 from ..enums.vector_search_domain_enum import VectorSearchDomainEnum
+from ..enums.vector_search_type_enum import VectorSearchTypeEnum
+from ..exceptions import GRAPH_REQUIRED_ERROR, TENANT_REQUIRED_ERROR
 from ..mixins import (
     AllRetrievableAPIResource,
     CreateableAPIResource,
@@ -21,11 +28,28 @@ from ..mixins import (
     RetrievableNodeResourceMixin,
     UpdatableAPIResource,
 )
+from ..models.cross_graph_search import CrossGraphSearchResult
 from ..models.enumeration_result import EnumerationResultModel
+from ..models.vector_matrix import VectorMatrix, VectorSearchBatchResult
 from ..models.vector_metadata import VectorMetadataModel
 from ..models.vector_search_request import VectorSearchRequestModel
 from ..models.vector_search_response import VectorSearchResultModel
+from ..models.vector_sync_result import VectorSyncResult
+from ..utils.concurrency import (
+    DEFAULT_MAX_CONCURRENCY,
+    _iter_concurrent,
+    _map_concurrent,
+)
+from ..utils.numpy_helper import _json_dumps, _json_loads, _require_numpy
 from ..utils.url_helper import _get_url_v1
+from ..utils.vector_manifest import VectorManifest
+
+# Result field holding the exact value of each search metric after re-ranking.
+_EXACT_SCORE_FIELDS = {
+    VectorSearchTypeEnum.CosineDistance: "distance",
+    VectorSearchTypeEnum.EuclidianDistance: "distance",
+    VectorSearchTypeEnum.DotProduct: "inner_product",
+}
 
 
 class Vector(
@@ -52,6 +76,7 @@ class Vector(
     REQUIRE_GRAPH_GUID = False
     RESOURCE_NAME = "vectors"
     MODEL = VectorMetadataModel
+    STRUCT = "VectorMetadataStruct"
     SEARCH_MODELS = (VectorSearchRequestModel, VectorSearchResultModel)
 
     @classmethod
@@ -64,6 +89,7 @@ class Vector(
         labels: list[str] = None,
         tags: dict = None,
         filter_expr: dict = None,
+        cache=None,
     ) -> VectorSearchResultModel:
         """
         Search vectors based on the provided criteria.
@@ -76,10 +102,23 @@ class Vector(
             labels: Optional list of labels to filter by
             tags: Optional dictionary of tags to filter by
             filter_expr: Optional filter expression
+            cache: Optional VectorSearchCache answering near-duplicate queries
+                without a request.
 
         Returns:
             VectorSearchResultModel containing search results
         """
+        if cache is not None:
+            return cache.search_vectors(
+                domain,
+                embeddings,
+                tenant_guid,
+                graph_guid=graph_guid,
+                labels=labels,
+                tags=tags,
+                filter_expr=filter_expr,
+            )
+
         if not embeddings:
             raise ValueError(
                 "The supplied vector list must include at least one value."
@@ -119,6 +158,588 @@ class Vector(
 
         return [cls.SEARCH_MODELS[1].model_validate(response) for response in responses]
 
+    @classmethod
+    def search_vectors_batch(
+        cls,
+        domain: VectorSearchDomainEnum,
+        queries,
+        tenant_guid: UUID,
+        graph_guid: UUID = None,
+        labels: list[str] = None,
+        tags: dict = None,
+        filter_expr: dict = None,
+        search_type: VectorSearchTypeEnum = VectorSearchTypeEnum.CosineSimilarity,
+        k: Optional[int] = None,
+        hydrate: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> VectorSearchBatchResult:
+        """
+        Run many vector searches concurrently and return the results as matrices.
+
+        The request is validated once and reused for every query; the searches are
+        issued over the client's connection pool with at most ``max_concurrency``
+        requests in flight, so the batch takes roughly as long as its slowest query.
+
+        Args:
+            domain: Vector search domain (Graph, Node, Edge)
+            queries: Array-like of shape ``(n_queries, d)``, one query per row
+            tenant_guid: Tenant GUID
+            graph_guid: Optional Graph GUID
+            labels: Optional list of labels to filter by
+            tags: Optional dictionary of tags to filter by
+            filter_expr: Optional filter expression
+            search_type: Vector search type
+            k: Number of results kept per query. Defaults to the largest result count.
+            hydrate: Also validate every result into a VectorSearchResultModel
+            max_concurrency: Maximum number of concurrent search requests
+
+        Returns:
+            VectorSearchBatchResult with ``(n_queries, k)`` score and GUID arrays.
+            Scores hold the value of the search metric: ``Score`` for
+            similarities, ``Distance`` or ``InnerProduct`` otherwise.
+        """
+        np = _require_numpy()
+        matrix = np.asarray(queries)
+        if matrix.ndim != 2:
+            raise ValueError("Queries must be a 2-dimensional array.")
+        if matrix.shape[1] == 0:
+            raise ValueError(
+                "The supplied vector list must include at least one value."
+            )
+        if (
+            domain in [VectorSearchDomainEnum.Node, VectorSearchDomainEnum.Edge]
+            and not graph_guid
+        ):
+            raise ValueError(
+                "Graph GUID must be supplied when performing a node/edge vector search."
+            )
+
+        search_request = cls.SEARCH_MODELS[0](
+            Domain=domain,
+            SearchType=search_type,
+            TenantGUID=tenant_guid,
+            GraphGUID=graph_guid,
+            Labels=labels or [],
+            Tags=tags or {},
+            Expr=filter_expr,
+        )
+        base = search_request.model_dump(mode="json", by_alias=True)
+
+        client = get_client()
+        url = _get_url_v1(cls, graph_guid)
+        headers = {"Content-Type": "application/json"}
+
+        def search(embeddings):
+            return (
+                client.request(
+                    method="POST",
+                    url=url,
+                    json={**base, "Embeddings": embeddings},
+                    headers=headers,
+                )
+                or []
+            )
+
+        responses = _map_concurrent(search, matrix.tolist(), max_concurrency)
+
+        counts = np.array([len(response) for response in responses], dtype=np.int64)
+        if k is None:
+            k = int(counts.max()) if len(counts) else 0
+        counts = np.minimum(counts, k)
+        scores = np.full((len(responses), k), np.nan, dtype=np.float32)
+        guids = np.full((len(responses), k), None, dtype=object)
+        key = VectorSearchDomainEnum(domain).value
+        field = _EXACT_SCORE_FIELDS.get(VectorSearchTypeEnum(search_type), "score")
+        alias = cls.SEARCH_MODELS[1].model_fields[field].alias
+        for row, response in enumerate(responses):
+            hits = response[:k]
+            if not hits:
+                continue
+            scores[row, : len(hits)] = [
+                np.nan if hit.get(alias) is None else hit[alias] for hit in hits
+            ]
+            guids[row, : len(hits)] = [(hit.get(key) or {}).get("GUID") for hit in hits]
+
+        results = None
+        if hydrate:
+            results = [
+                [cls.SEARCH_MODELS[1].model_validate(hit) for hit in response[:k]]
+                for response in responses
+            ]
+        return VectorSearchBatchResult(
+            scores=scores, guids=guids, counts=counts, results=results
+        )
+
+    @classmethod
+    def search_across_graphs(
+        cls,
+        graph_guids: Sequence[str],
+        embeddings: list[float],
+        k: int = 10,
+        domain: VectorSearchDomainEnum = VectorSearchDomainEnum.Node,
+        tenant_guid: UUID = None,
+        labels: list[str] = None,
+        tags: dict = None,
+        filter_expr: dict = None,
+        search_type: VectorSearchTypeEnum = VectorSearchTypeEnum.CosineSimilarity,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        stop_at: Optional[float] = None,
+        raise_errors: bool = True,
+    ) -> CrossGraphSearchResult:
+        """
+        Search many graphs concurrently and merge the results into a global top-k.
+
+        Each graph is searched for its own top ``k`` with at most ``max_concurrency``
+        requests in flight. Results are merged with a bounded heap on the value of
+        ``search_type``: ``Distance`` for distance types (lower is better),
+        ``InnerProduct`` for DotProduct and ``Score`` otherwise (higher is better).
+
+        Args:
+            graph_guids: The graphs to search.
+            embeddings: Vector embeddings to search with
+            k: Number of results to return
+            domain: Vector search domain (Node or Edge)
+            tenant_guid: Tenant GUID. If not provided, uses client.tenant_guid.
+            labels: Optional list of labels to filter by
+            tags: Optional dictionary of tags to filter by
+            filter_expr: Optional filter expression
+            search_type: Vector search type
+            max_concurrency: Maximum number of concurrent search requests
+            stop_at: Early cut-off. Once ``k`` results at least this good (a score
+                at or above it, or a distance at or below it) have arrived, graphs
+                not yet searched are skipped.
+            raise_errors: Raise the first failed search. If False, failures are
+                recorded in ``errors`` and the other graphs are still merged.
+
+        Returns:
+            CrossGraphSearchResult with the merged results and per-graph timings.
+        """
+        from ..local.similarity import HIGHER_IS_BETTER
+
+        if not embeddings:
+            raise ValueError(
+                "The supplied vector list must include at least one value."
+            )
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        if VectorSearchDomainEnum(domain) == VectorSearchDomainEnum.Graph:
+            raise ValueError("Cross-graph searches require the Node or Edge domain.")
+
+        client = get_client()
+        tenant_guid = tenant_guid or client.tenant_guid
+        if tenant_guid is None:
+            raise ValueError(TENANT_REQUIRED_ERROR)
+
+        search_request = cls.SEARCH_MODELS[0](
+            Domain=domain,
+            SearchType=search_type,
+            Embeddings=embeddings,
+            TenantGUID=tenant_guid,
+            Labels=labels or [],
+            Tags=tags or {},
+            Expr=filter_expr,
+            TopK=k,
+        )
+        base = search_request.model_dump(mode="json", by_alias=True)
+        headers = {"Content-Type": "application/json"}
+
+        def search(graph_guid):
+            started = time.perf_counter()
+            hits = client.request(
+                method="POST",
+                url=_get_url_v1(cls, graph_guid),
+                json={**base, "GraphGUID": str(graph_guid)},
+                headers=headers,
+            )
+            return hits or [], time.perf_counter() - started
+
+        search_type = VectorSearchTypeEnum(search_type)
+        field = _EXACT_SCORE_FIELDS.get(search_type, "score")
+        alias = cls.SEARCH_MODELS[1].model_fields[field].alias
+        # The heap keeps the k best hits with the worst at the top; values are
+        # negated for distances so that larger is always better.
+        sign = 1 if search_type in HIGHER_IS_BETTER else -1
+        heap = []
+        sequence = itertools.count()
+        result = CrossGraphSearchResult()
+        pending = list(dict.fromkeys(str(guid) for guid in graph_guids))
+
+        searches = _iter_concurrent(search, pending, max_concurrency)
+        try:
+            for graph_guid, response, error in searches:
+                pending.remove(graph_guid)
+                if error is not None:
+                    if raise_errors:
+                        raise error
+                    result.errors[graph_guid] = error
+                    continue
+                hits, result.timings[graph_guid] = response
+                for hit in hits:
+                    value = hit.get(alias, hit.get("Score"))
+                    if value is None:
+                        continue
+                    entry = (sign * value, next(sequence), graph_guid, hit)
+                    if len(heap) < k:
+                        heapq.heappush(heap, entry)
+                    elif entry[0] > heap[0][0]:
+                        heapq.heapreplace(heap, entry)
+                if (
+                    stop_at is not None
+                    and len(heap) == k
+                    and heap[0][0] >= sign * stop_at
+                ):
+                    break
+        finally:
+            searches.close()
+
+        result.skipped = pending if stop_at is not None else []
+        for _, _, graph_guid, hit in sorted(
+            heap, key=lambda entry: (-entry[0], entry[1])
+        ):
+            result.results.append(cls.SEARCH_MODELS[1].model_validate(hit))
+            result.graph_guids.append(graph_guid)
+        return result
+
+    @classmethod
+    def search_vectors_reranked(
+        cls,
+        domain: VectorSearchDomainEnum,
+        embeddings: list[float],
+        tenant_guid: UUID,
+        cache,
+        k: int = 10,
+        oversample: int = 4,
+        graph_guid: UUID = None,
+        labels: list[str] = None,
+        tags: dict = None,
+        filter_expr: dict = None,
+        search_type: VectorSearchTypeEnum = VectorSearchTypeEnum.CosineSimilarity,
+    ) -> list[VectorSearchResultModel]:
+        """
+        Search vectors and re-rank the candidates exactly on the client.
+
+        ``k * oversample`` candidates are fetched from the server's approximate index,
+        their embeddings are read from ``cache`` and scored exactly with the metric of
+        ``search_type``, and the true top ``k`` are returned. Candidates whose
+        embeddings are not cached cannot be re-scored and are left out.
+
+        Args:
+            domain: Vector search domain (Graph, Node, Edge)
+            embeddings: Vector embeddings to search with
+            tenant_guid: Tenant GUID
+            cache: An EmbeddingCache (or any object with a compatible ``lookup``)
+                keyed by the GUIDs of the searched domain
+            k: Number of results to return
+            oversample: How many more candidates than ``k`` to fetch
+            graph_guid: Optional Graph GUID
+            labels: Optional list of labels to filter by
+            tags: Optional dictionary of tags to filter by
+            filter_expr: Optional filter expression
+            search_type: Vector search type
+
+        Returns:
+            List of VectorSearchResultModel, best first. The exact value is stored in
+            ``distance`` for distance metrics, ``inner_product`` for DotProduct and
+            ``score`` otherwise.
+        """
+        from ..local.similarity import score, top_k
+
+        if not embeddings:
+            raise ValueError(
+                "The supplied vector list must include at least one value."
+            )
+        if k < 1 or oversample < 1:
+            raise ValueError("k and oversample must be at least 1.")
+        if (
+            domain in [VectorSearchDomainEnum.Node, VectorSearchDomainEnum.Edge]
+            and not graph_guid
+        ):
+            raise ValueError(
+                "Graph GUID must be supplied when performing a node/edge vector search."
+            )
+
+        search_request = cls.SEARCH_MODELS[0](
+            Domain=domain,
+            SearchType=search_type,
+            Embeddings=embeddings,
+            TenantGUID=tenant_guid,
+            GraphGUID=graph_guid,
+            Labels=labels or [],
+            Tags=tags or {},
+            Expr=filter_expr,
+            TopK=k * oversample,
+        )
+
+        client = get_client()
+        url = _get_url_v1(cls, graph_guid)
+        data = search_request.model_dump(mode="json", by_alias=True)
+        headers = {"Content-Type": "application/json"}
+        hits = client.request(method="POST", url=url, json=data, headers=headers) or []
+
+        key = VectorSearchDomainEnum(domain).value
+        candidates, found = cache.lookup(
+            [(hit.get(key) or {}).get("GUID") for hit in hits]
+        )
+        hits = [hit for hit, cached in zip(hits, found) if cached]
+        if not hits:
+            return []
+
+        indices, scores = top_k(
+            score(embeddings, candidates, search_type), k, search_type
+        )
+        field = _EXACT_SCORE_FIELDS.get(VectorSearchTypeEnum(search_type), "score")
+        results = []
+        for index, value in zip(indices.tolist(), scores.tolist()):
+            result = cls.SEARCH_MODELS[1].model_validate(hits[index])
+            setattr(result, field, value)
+            results.append(result)
+        return results
+
+    @classmethod
+    def bulk_upload(
+        cls,
+        embeddings,
+        node_guids: Optional[Sequence[str]] = None,
+        model: Optional[str] = None,
+        graph_guid: Optional[str] = None,
+        tenant_guid: Optional[str] = None,
+        edge_guids: Optional[Sequence[str]] = None,
+        contents: Optional[Sequence[str]] = None,
+        batch_size: int = 1000,
+    ):
+        """
+        Upload a matrix of embeddings, one vector per row.
+
+        The matrix is converted to JSON a batch at a time without building
+        VectorMetadataModel instances, and each batch is sent to the bulk endpoint.
+
+        Args:
+            embeddings: Array-like of shape ``(n, d)``.
+            node_guids: Optional node GUIDs, one per row.
+            model: Optional embedding model name stored with every vector.
+            graph_guid: The graph GUID. If not provided, uses client.graph_guid.
+            tenant_guid: The tenant GUID. If not provided, uses client.tenant_guid.
+            edge_guids: Optional edge GUIDs, one per row.
+            contents: Optional source content, one per row.
+            batch_size: Number of vectors sent per request.
+
+        Returns:
+            numpy.ndarray: The GUIDs of the created vectors, in row order.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If the inputs have mismatched lengths, or tenant GUID or
+                graph GUID is missing.
+        """
+        np = _require_numpy()
+        matrix = np.asarray(embeddings)
+        if matrix.ndim != 2:
+            raise ValueError("Embeddings must be a 2-dimensional array.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        count, dimensionality = matrix.shape
+        for name, values in (
+            ("node_guids", node_guids),
+            ("edge_guids", edge_guids),
+            ("contents", contents),
+        ):
+            if values is not None and len(values) != count:
+                raise ValueError(f"{name} must have one entry per embedding row.")
+
+        client = get_client()
+        tenant_guid = tenant_guid or client.tenant_guid
+        graph_guid = graph_guid or client.graph_guid
+        if tenant_guid is None:
+            raise ValueError(TENANT_REQUIRED_ERROR)
+        if not graph_guid:
+            raise ValueError(GRAPH_REQUIRED_ERROR)
+        url = _get_url_v1(cls, tenant_guid, "bulk")
+
+        base = {"GraphGUID": graph_guid, "Dimensionality": dimensionality}
+        if model is not None:
+            base["Model"] = model
+        guids = []
+        for start in range(0, count, batch_size):
+            stop = min(start + batch_size, count)
+            records = [{**base, "Vectors": row} for row in matrix[start:stop].tolist()]
+            for key, values in (
+                ("NodeGUID", node_guids),
+                ("EdgeGUID", edge_guids),
+                ("Content", contents),
+            ):
+                if values is not None:
+                    for record, value in zip(records, values[start:stop]):
+                        record[key] = value
+            response = _json_loads(
+                client.request("PUT", url, raw=True, content=_json_dumps(records))
+            )
+            guids.extend(item.get("GUID") for item in response or [])
+        return np.asarray(guids, dtype=object)
+
+    @classmethod
+    def download_matrix(
+        cls,
+        graph_guid: Optional[str] = None,
+        tenant_guid: Optional[str] = None,
+        dtype=None,
+    ) -> VectorMatrix:
+        """
+        Download every vector of a graph as a single embedding matrix.
+
+        The response is decoded once and converted to a contiguous array in one
+        step, without building VectorMetadataModel instances.
+
+        Endpoint:
+            /v1.0/tenants/{tenant}/graphs/{graph}/vectors/all
+
+        Args:
+            graph_guid: The graph GUID. If not provided, uses client.graph_guid.
+            tenant_guid: The tenant GUID. If not provided, uses client.tenant_guid.
+            dtype: The dtype of the matrix. Defaults to float32.
+
+        Returns:
+            VectorMatrix: The ``(n, d)`` matrix and the parallel GUID arrays.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If the vectors do not share the same dimensionality.
+        """
+        np = _require_numpy()
+        client = get_client()
+        tenant_guid = tenant_guid or client.tenant_guid
+        graph_guid = graph_guid or client.graph_guid
+        if tenant_guid is None:
+            raise ValueError(TENANT_REQUIRED_ERROR)
+        if not graph_guid:
+            raise ValueError(GRAPH_REQUIRED_ERROR)
+        url = f"v1.0/tenants/{tenant_guid}/graphs/{graph_guid}/{cls.RESOURCE_NAME}/all"
+
+        guids, node_guids, edge_guids, rows = _decode_vector_rows(
+            client.request("GET", url, raw=True)
+        )
+        if any(row is None for row in rows):
+            raise ValueError("Every vector must have embeddings to build a matrix.")
+        try:
+            embeddings = np.array(rows, dtype=dtype or np.float32, order="C")
+        except ValueError as exc:
+            raise ValueError("Vectors do not share the same dimensionality.") from exc
+        if not rows:
+            embeddings = embeddings.reshape(0, 0)
+        return VectorMatrix(
+            embeddings=embeddings,
+            guids=np.array(guids, dtype=object),
+            node_guids=np.array(node_guids, dtype=object),
+            edge_guids=np.array(edge_guids, dtype=object),
+        )
+
+    @classmethod
+    def sync_vectors(
+        cls,
+        vectors: Iterable[VectorMetadataModel],
+        manifest: VectorManifest,
+        graph_guid: Optional[str] = None,
+        prune: bool = True,
+        batch_size: int = 1000,
+    ) -> VectorSyncResult:
+        """
+        Upload only the vectors whose model or content changed since the last sync.
+
+        Every vector is keyed by its node, edge or graph and model, and the hash of
+        its model and content is compared with the hashes recorded for that key in
+        ``manifest``, so a source can have several vectors, such as text chunks.
+        New and changed vectors are created in batches; recorded vectors of a key
+        whose content is no longer given are deleted afterwards. With ``prune``,
+        the vectors of sources missing from ``vectors`` are deleted too, so
+        ``vectors`` should be the full set for the graph. Vectors with the same
+        key and content are uploaded once. Deletes that fail are kept in the
+        manifest and retried next time.
+
+        Args:
+            vectors: VectorMetadataModel instances (or dicts) for the graph.
+            manifest: The VectorManifest of previously uploaded vectors; saved
+                after every batch.
+            graph_guid: The graph GUID. If not provided, uses client.graph_guid.
+            prune: Delete vectors whose node, edge or model is no longer present.
+            batch_size: Number of vectors created or deleted per request.
+
+        Returns:
+            VectorSyncResult: Counts of created, replaced, deleted and unchanged vectors.
+
+        Raises:
+            ValueError: If tenant GUID or graph GUID is missing, or a vector belongs
+                to another graph.
+        """
+        client = get_client()
+        graph_guid = graph_guid or client.graph_guid
+        if client.tenant_guid is None:
+            raise ValueError(TENANT_REQUIRED_ERROR)
+        if not graph_guid:
+            raise ValueError(GRAPH_REQUIRED_ERROR)
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        result = VectorSyncResult()
+        # Manifest key -> content hashes of the vectors given for it.
+        seen = {}
+        uploads = {}
+        for vector in vectors:
+            if isinstance(vector, dict):
+                vector = cls.MODEL.model_validate(vector)
+            if vector.graph_guid is None:
+                vector = vector.model_copy(update={"graph_guid": graph_guid})
+            elif str(vector.graph_guid) != str(graph_guid):
+                raise ValueError(
+                    f"Vector of graph {vector.graph_guid} cannot be synced to {graph_guid}."
+                )
+            key = manifest.key(
+                graph_guid, vector.model, vector.node_guid, vector.edge_guid
+            )
+            content_hash = manifest.content_hash(vector.model, vector.content)
+            if content_hash in seen.setdefault(key, set()):
+                continue
+            seen[key].add(content_hash)
+            if content_hash in manifest.get(key):
+                result.unchanged += 1
+            else:
+                uploads[(key, content_hash)] = vector
+
+        pending = list(uploads.items())
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+            created = cls.create_multiple([vector for _, vector in batch])
+            for ((key, content_hash), _), vector in zip(batch, created):
+                # A vector whose content is no longer given is replaced by this one.
+                stale = [
+                    recorded
+                    for recorded in manifest.get(key)
+                    if recorded not in seen[key]
+                ]
+                if stale:
+                    manifest.pending_deletes.extend(manifest.discard(key, stale[0]))
+                    result.replaced += 1
+                else:
+                    result.created += 1
+                manifest.record(key, content_hash, vector.guid)
+            manifest.save()
+
+        for key, hashes in seen.items():
+            for recorded in manifest.get(key):
+                if recorded not in hashes:
+                    manifest.pending_deletes.extend(manifest.discard(key, recorded))
+        if prune:
+            for key in manifest.keys(graph_guid):
+                if key not in seen:
+                    manifest.pending_deletes.extend(manifest.discard(key))
+
+        while manifest.pending_deletes:
+            batch = manifest.pending_deletes[:batch_size]
+            cls.delete_multiple(batch)
+            del manifest.pending_deletes[: len(batch)]
+            result.deleted += len(batch)
+            manifest.save()
+        manifest.save()
+        return result
+
     @classmethod
     def enumerate_with_query(cls, **kwargs) -> EnumerationResultModel:
         """
@@ -293,3 +914,35 @@ class Vector(
         Delete vectors for a specific edge.
         """
         return super().delete_for_edge(edge_guid, tenant_guid, graph_guid)
+
+
+def _decode_vector_rows(payload):
+    """
+    Decode a list of vectors into parallel GUID lists and embedding rows.
+
+    With msgspec installed, only the identifiers and embeddings are decoded and
+    every other field is skipped.
+    """
+    if isinstance(payload, (bytes, bytearray, str)) and find_spec("msgspec"):
+        import msgspec
+
+        from ..models.structs import VectorRowStruct
+
+        records = msgspec.json.decode(payload or b"[]", type=List[VectorRowStruct])
+        return (
+            [record.guid for record in records],
+            [record.node_guid for record in records],
+            [record.edge_guid for record in records],
+            [
+                record.vectors if record.vectors is not None else record.embeddings
+                for record in records
+            ],
+        )
+
+    records = _json_loads(payload) or []
+    return (
+        [record.get("GUID") for record in records],
+        [record.get("NodeGUID") for record in records],
+        [record.get("EdgeGUID") for record in records],
+        [record.get("Vectors") or record.get("Embeddings") for record in records],
+    )
@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+def _map_concurrent(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[R]:
+    """
+    Apply ``func`` to every item using at most ``max_concurrency`` threads.
+
+    Requests made through the shared client reuse its connection pool. Results are
+    returned in input order; the first exception raised is propagated and pending
+    calls are cancelled.
+
+    Args:
+        func: The function to call for each item.
+        items: The items to process.
+        max_concurrency: Maximum number of calls in flight at once.
+
+    Returns:
+        List: The results, in the same order as ``items``.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+    items = list(items)
+    if max_concurrency == 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(items)))
+    try:
+        return list(executor.map(func, items))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _iter_concurrent(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Iterator[Tuple[T, Optional[R], Optional[BaseException]]]:
+    """
+    Apply ``func`` to every item using at most ``max_concurrency`` threads and
+    yield ``(item, result, error)`` as each call completes.
+
+    Closing the generator early cancels the calls that have not started yet;
+    calls already running are left to finish in the background.
+
+    Args:
+        func: The function to call for each item.
+        items: The items to process.
+        max_concurrency: Maximum number of calls in flight at once.
+
+    Yields:
+        Tuple: The item, its result (None on error) and the exception raised, if any.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+    items = list(items)
+    if not items:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(items)))
+    try:
+        futures = {executor.submit(func, item): item for item in items}
+        for future in as_completed(futures):
+            error = future.exception()
+            yield futures[future], None if error else future.result(), error
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
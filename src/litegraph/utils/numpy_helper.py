@@ -0,0 +1,45 @@
+import importlib
+
+
+def _require_numpy():
+    """
+    Import numpy, raising a helpful error if the optional dependency is missing.
+
+    Returns:
+        module: The numpy module.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    try:
+        return importlib.import_module("numpy")
+    except ImportError as exc:
+        raise ImportError(
+            "This feature requires numpy. Install it with `pip install litegraph[numpy]`."
+        ) from exc
+
+
+def _json_dumps(value) -> bytes:
+    """Encode a JSON payload, using msgspec when it is installed."""
+    try:
+        import msgspec
+    except ImportError:
+        import json
+
+        return json.dumps(value, separators=(",", ":")).encode()
+    return msgspec.json.encode(value)
+
+
+def _json_loads(payload):
+    """Decode a JSON payload, using msgspec when it is installed."""
+    if payload is None or payload == b"":
+        return None
+    if not isinstance(payload, (bytes, bytearray, str)):
+        return payload
+    try:
+        import msgspec
+    except ImportError:
+        import json
+
+        return json.loads(payload)
+    return msgspec.json.decode(payload)
@@ -0,0 +1,127 @@
+from typing import Any, Iterable, NamedTuple, Optional
+
+# Response keys (lower-cased) that are only populated when the server is asked for them.
+DATA_KEYS = frozenset({"data"})
+SUBORDINATE_KEYS = frozenset({"labels", "tags", "vectors"})
+
+# Identity keys that are always kept so projected records can still be resolved
+# and are never given placeholder owners.
+IDENTITY_KEYS = frozenset({"GUID", "TenantGUID", "GraphGUID"})
+
+
+class _Projection(NamedTuple):
+    """Resolved field projection for a resource model."""
+
+    keys: frozenset
+    tag_keys: Optional[frozenset]
+    include_data: bool
+    include_subordinates: bool
+
+
+def _resolve_projection(
+    model,
+    fields: Optional[Iterable[str]],
+    include_data: Optional[bool] = None,
+    include_subordinates: Optional[bool] = None,
+) -> Optional[_Projection]:
+    """
+    Resolve a list of requested fields into the response keys to keep.
+
+    Fields may be given either as model attribute names (``guid``, ``labels``)
+    or as API aliases (``GUID``, ``Labels``). A single tag can be selected with
+    ``tags.<key>``, in which case only that key is kept in the ``Tags`` object.
+    The identity keys (``GUID``, ``TenantGUID``, ``GraphGUID``) are always kept.
+
+    An explicit ``include_data=True`` or ``include_subordinates=True`` keeps the
+    corresponding keys as well, rather than being overridden by the projection.
+
+    Args:
+        model: The pydantic model the records will be validated against, if any.
+        fields: The requested fields, or None for no projection.
+        include_data: The caller's explicit include_data flag, if any.
+        include_subordinates: The caller's explicit include_subordinates flag,
+            if any.
+
+    Returns:
+        _Projection: The resolved projection, or None if no projection applies.
+
+    Raises:
+        ValueError: If a requested field is not part of the model, or the
+            projection needs data or subordinates that were explicitly excluded.
+    """
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = [fields]
+
+    aliases = {}
+    if model is not None:
+        for name, info in model.model_fields.items():
+            alias = info.alias or name
+            aliases[name] = alias
+            aliases[alias] = alias
+
+    keys = set(IDENTITY_KEYS)
+    selected_tags = set()
+    all_tags = False
+    for field in fields:
+        field, _, tag_key = field.partition(".")
+        if aliases and field not in aliases:
+            raise ValueError(f"Unknown field for projection: {field}")
+        alias = aliases.get(field, field)
+        keys.add(alias)
+        if alias == "Tags":
+            if tag_key:
+                selected_tags.add(tag_key)
+            else:
+                all_tags = True
+
+    # A bare "tags" request always wins over individual tag selections.
+    tag_keys = None if all_tags or not selected_tags else frozenset(selected_tags)
+
+    if include_data:
+        keys.add(aliases.get("data", "Data"))
+    if include_subordinates:
+        keys.update(
+            aliases.get(name, name.capitalize()) for name in sorted(SUBORDINATE_KEYS)
+        )
+
+    lowered = {key.lower() for key in keys}
+    needs_data = bool(lowered & DATA_KEYS)
+    needs_subordinates = bool(lowered & SUBORDINATE_KEYS)
+    if include_data is False and needs_data:
+        raise ValueError("fields requests Data but include_data is False.")
+    if include_subordinates is False and needs_subordinates:
+        raise ValueError(
+            "fields requests labels, tags or vectors but include_subordinates is False."
+        )
+    return _Projection(
+        keys=frozenset(keys),
+        tag_keys=tag_keys,
+        include_data=needs_data,
+        include_subordinates=needs_subordinates,
+    )
+
+
+def _project_record(record: Any, projection: Optional[_Projection]) -> Any:
+    """
+    Drop the keys of a single response record that are not part of the projection.
+    """
+    if projection is None or not isinstance(record, dict):
+        return record
+    projected = {key: value for key, value in record.items() if key in projection.keys}
+    tags = projected.get("Tags")
+    if projection.tag_keys is not None and isinstance(tags, dict):
+        projected["Tags"] = {
+            key: value for key, value in tags.items() if key in projection.tag_keys
+        }
+    return projected
+
+
+def _project_records(records: Any, projection: Optional[_Projection]) -> Any:
+    """
+    Project a list of response records.
+    """
+    if projection is None or not isinstance(records, list):
+        return records
+    return [_project_record(record, projection) for record in records]
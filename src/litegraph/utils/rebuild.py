@@ -0,0 +1,277 @@
+"""
+Non-blocking vector index rebuilds and the policies deciding when to rebuild.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from datetime import timezone
+from typing import Callable, List, Optional
+
+import httpx
+
+from ..enums.severity_enum import Severity_Enum
+from ..models.vector_index_statistics import VectorIndexStatisticsModel
+from ..sdk_logging import log_warning
+
+
+def _utc(value):
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _is_timeout(error: BaseException) -> bool:
+    """Return True if ``error`` was caused by an HTTP timeout."""
+    while error is not None:
+        if isinstance(error, httpx.TimeoutException):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _changed_since_rebuild(stats: VectorIndexStatisticsModel) -> bool:
+    rebuilt = _utc(stats.last_rebuild_utc)
+    if rebuilt is None:
+        return True
+    return any(
+        changed is not None and _utc(changed) > rebuilt
+        for changed in (stats.last_add_utc, stats.last_remove_utc)
+    )
+
+
+class RebuildPolicy:
+    """
+    Decides whether a rebuild is needed. The base policy always rebuilds.
+    """
+
+    def should_rebuild(
+        self, graph_guid: str, stats: VectorIndexStatisticsModel
+    ) -> bool:
+        """
+        Return True if the index of ``graph_guid`` should be rebuilt.
+        """
+        return True
+
+    def rebuilt(self, graph_guid: str, stats: VectorIndexStatisticsModel) -> None:
+        """
+        Called with the statistics after a rebuild completed.
+        """
+
+
+class ChangedSinceRebuildPolicy(RebuildPolicy):
+    """
+    Rebuild when vectors were added or removed after ``LastRebuildUtc``.
+    """
+
+    def should_rebuild(
+        self, graph_guid: str, stats: VectorIndexStatisticsModel
+    ) -> bool:
+        return _changed_since_rebuild(stats)
+
+
+class ChangeThresholdPolicy(RebuildPolicy):
+    """
+    Rebuild when the vector count moved by at least ``threshold`` since the last
+    rebuild made through this policy.
+
+    The count is compared with the one recorded after that rebuild, so adds and
+    removes that cancel out are not counted. Graphs without a recorded count fall
+    back to ``ChangedSinceRebuildPolicy``.
+    """
+
+    def __init__(self, threshold: int):
+        if threshold < 1:
+            raise ValueError("threshold must be at least 1.")
+        self.threshold = threshold
+        self.baselines = {}
+
+    def should_rebuild(
+        self, graph_guid: str, stats: VectorIndexStatisticsModel
+    ) -> bool:
+        baseline = self.baselines.get(graph_guid)
+        if baseline is None:
+            return _changed_since_rebuild(stats)
+        return abs(stats.vector_count - baseline) >= self.threshold
+
+    def rebuilt(self, graph_guid: str, stats: VectorIndexStatisticsModel) -> None:
+        self.baselines[graph_guid] = stats.vector_count
+
+
+class RebuildOperation:
+    """
+    A vector index rebuild running in the background.
+
+    The rebuild request is sent from a background thread while ``VectorIndex.get_stats``
+    is polled with exponential backoff. The operation completes once the index reports
+    ``IsLoaded`` and either ``LastRebuildUtc`` moved past its value before the rebuild
+    or the request returned. The request has its own finite timeout; when it times
+    out, completion is detected by polling alone. The result is the final
+    VectorIndexStatisticsModel. It can be waited on with ``result``, given callbacks,
+    or awaited from asyncio code.
+    """
+
+    def __init__(
+        self,
+        graph_guid: str,
+        policy: Optional[RebuildPolicy] = None,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        backoff: float = 2.0,
+        timeout: Optional[float] = None,
+        request_timeout: float = 60.0,
+    ):
+        """
+        Create a rebuild operation. Call ``start`` to run it.
+
+        Args:
+            graph_guid: The graph whose index to rebuild.
+            policy: Decides whether to rebuild at all. Defaults to always.
+            poll_interval: Seconds before the first statistics poll.
+            max_poll_interval: Upper bound of the poll interval.
+            backoff: Factor the poll interval grows by after each poll.
+            timeout: Seconds after which the operation fails with TimeoutError.
+            request_timeout: Seconds to wait for the rebuild request to return.
+        """
+        if poll_interval <= 0 or max_poll_interval < poll_interval or backoff < 1:
+            raise ValueError(
+                "Poll intervals must be positive, increasing and backoff at least 1."
+            )
+        self.graph_guid = graph_guid
+        self.policy = policy or RebuildPolicy()
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.request_timeout = request_timeout
+        self.stats: Optional[VectorIndexStatisticsModel] = None
+        self.skipped = False
+        self.started_at: Optional[float] = None
+
+        self._future = Future()
+        self._request_done = threading.Event()
+        self._request_succeeded = False
+        self._request_error: Optional[Exception] = None
+        self._progress_callbacks: List[Callable] = []
+
+    def start(self) -> "RebuildOperation":
+        """
+        Start the operation in a background thread and return immediately.
+        """
+        if self.started_at is not None:
+            raise RuntimeError("The rebuild operation was already started.")
+        self.started_at = time.monotonic()
+        threading.Thread(target=self._run, daemon=True).start()
+        return self
+
+    def _poll(self) -> VectorIndexStatisticsModel:
+        from ..resources.vector_index import VectorIndex
+
+        self.stats = VectorIndex.get_stats(self.graph_guid)
+        for callback in list(self._progress_callbacks):
+            try:
+                callback(self.stats)
+            except Exception as e:
+                log_warning(
+                    Severity_Enum.Warn.value, f"Rebuild progress callback failed: {e}"
+                )
+        return self.stats
+
+    def _send_rebuild(self) -> None:
+        from ..resources.vector_index import VectorIndex
+
+        try:
+            VectorIndex.rebuild(self.graph_guid, timeout=self.request_timeout)
+            self._request_succeeded = True
+        except Exception as e:
+            # The server keeps rebuilding after a timed out request; poll for it.
+            if not _is_timeout(e):
+                self._request_error = e
+        finally:
+            self._request_done.set()
+
+    def _run(self) -> None:
+        try:
+            stats = self._poll()
+            if not self.policy.should_rebuild(self.graph_guid, stats):
+                self.skipped = True
+                self._future.set_result(stats)
+                return
+
+            previous = _utc(stats.last_rebuild_utc)
+            threading.Thread(target=self._send_rebuild, daemon=True).start()
+            interval = self.poll_interval
+            while True:
+                remaining = None
+                if self.timeout is not None:
+                    remaining = self.timeout - (time.monotonic() - self.started_at)
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"Vector index rebuild of {self.graph_guid} did not "
+                            f"complete within {self.timeout} seconds."
+                        )
+                delay = interval if remaining is None else min(interval, remaining)
+                if self._request_done.is_set():
+                    time.sleep(delay)
+                else:
+                    self._request_done.wait(delay)
+                if self._request_error is not None:
+                    raise self._request_error
+                stats = self._poll()
+                rebuilt = _utc(stats.last_rebuild_utc)
+                advanced = rebuilt is not None and (
+                    previous is None or rebuilt > previous
+                )
+                if stats.is_loaded and (advanced or self._request_succeeded):
+                    break
+                interval = min(interval * self.backoff, self.max_poll_interval)
+
+            self.policy.rebuilt(self.graph_guid, stats)
+            self._future.set_result(stats)
+        except Exception as e:
+            self._future.set_exception(e)
+
+    def add_progress_callback(
+        self, callback: Callable[[VectorIndexStatisticsModel], None]
+    ) -> None:
+        """
+        Call ``callback`` with the statistics read by every poll.
+        """
+        self._progress_callbacks.append(callback)
+
+    def add_done_callback(self, callback: Callable[["RebuildOperation"], None]) -> None:
+        """
+        Call ``callback`` with this operation once it completes or fails.
+        """
+        self._future.add_done_callback(lambda _: callback(self))
+
+    def done(self) -> bool:
+        """
+        Return True if the operation completed or failed.
+        """
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> VectorIndexStatisticsModel:
+        """
+        Wait for the operation and return the final index statistics.
+
+        Raises:
+            TimeoutError: If the operation did not complete in time.
+            Exception: The error the rebuild failed with.
+        """
+        return self._future.result(timeout)
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """
+        Wait for the operation and return the error it failed with, if any.
+        """
+        return self._future.exception(timeout)
+
+    @property
+    def future(self) -> Future:
+        """The ``concurrent.futures.Future`` resolved with the final statistics."""
+        return self._future
+
+    def __await__(self):
+        return asyncio.wrap_future(self._future).__await__()
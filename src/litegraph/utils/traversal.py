@@ -0,0 +1,148 @@
+"""
+Breadth-first and depth-first traversal over a node expansion function.
+"""
+
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from ..enums.operator_enum import Opertator_Enum
+from ..models.traversal_step import TraversalStep
+from .concurrency import DEFAULT_MAX_CONCURRENCY, _iter_concurrent
+
+STRATEGIES = ("bfs", "dfs")
+
+_MISSING = object()
+
+
+def _resolve_path(data, path: str):
+    """Look up a dotted path such as ``address.city`` in nested dictionaries."""
+    value = data
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _expr_matches(data: Optional[dict], expr) -> bool:
+    """
+    Evaluate an ExprModel against an object's ``Data``.
+
+    ``Left`` is a dotted path into the data. Values are compared as numbers when
+    both sides are numeric, otherwise as strings.
+    """
+    value = _resolve_path(data or {}, expr.Left)
+    if value is _MISSING:
+        return False
+    left, right = value, expr.Right
+    try:
+        left, right = float(left), float(right)
+    except (TypeError, ValueError):
+        left, right = str(left), str(right)
+    operator = Opertator_Enum(expr.Operator)
+    if operator == Opertator_Enum.Equals:
+        return left == right
+    if operator == Opertator_Enum.GreaterThan:
+        return left > right
+    return left < right
+
+
+def _edge_matches(
+    edge,
+    labels: Optional[List[str]] = None,
+    tags: Optional[Dict[str, str]] = None,
+    expr=None,
+) -> bool:
+    """Return True if an edge has all ``labels`` and ``tags`` and matches ``expr``."""
+    if labels and not set(labels).issubset(edge.labels or ()):
+        return False
+    if tags and any((edge.tags or {}).get(key) != value for key, value in tags.items()):
+        return False
+    return expr is None or _expr_matches(edge.data, expr)
+
+
+def _traverse(
+    expand: Callable[[str], list],
+    start_guids: Iterable[str],
+    max_depth: Optional[int] = None,
+    max_nodes: Optional[int] = None,
+    max_edges: Optional[int] = None,
+    strategy: str = "bfs",
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Iterator[TraversalStep]:
+    """
+    Traverse from ``start_guids`` using ``expand(node_guid) -> edges``.
+
+    Breadth-first traversals expand each frontier concurrently and yield steps as
+    expansions complete; depth-first traversals expand one node at a time. Every
+    edge is yielded once, and each node is expanded once.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy '{strategy}', expected one of {STRATEGIES}")
+    visited = {}
+    for guid in start_guids:
+        if guid in visited:
+            continue
+        if max_nodes is not None and len(visited) >= max_nodes:
+            break
+        visited[guid] = None
+        yield TraversalStep(depth=0, node_guid=guid)
+    edges_seen = set()
+
+    def follow(node_guid: str, edges: list, depth: int):
+        """Yield the steps of an expansion; returns the newly reached nodes."""
+        for edge in edges:
+            if edge.guid in edges_seen:
+                continue
+            other = (
+                edge.to_node_guid
+                if edge.from_node_guid == node_guid
+                else edge.from_node_guid
+            )
+            new = other not in visited
+            if new and max_nodes is not None and len(visited) >= max_nodes:
+                continue
+            edges_seen.add(edge.guid)
+            if new:
+                visited[other] = None
+            yield TraversalStep(
+                depth=depth, node_guid=other, edge=edge, parent_guid=node_guid, new=new
+            )
+
+    def exhausted() -> bool:
+        return max_edges is not None and len(edges_seen) >= max_edges
+
+    if strategy == "bfs":
+        frontier = list(visited)
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            reached = []
+            expansions = _iter_concurrent(expand, frontier, max_concurrency)
+            try:
+                for node_guid, edges, error in expansions:
+                    if error is not None:
+                        raise error
+                    for step in follow(node_guid, edges, depth + 1):
+                        if step.new:
+                            reached.append(step.node_guid)
+                        yield step
+                        if exhausted():
+                            return
+            finally:
+                expansions.close()
+            frontier = reached
+            depth += 1
+        return
+
+    stack = [(guid, 0) for guid in reversed(list(visited))]
+    while stack:
+        node_guid, depth = stack.pop()
+        if max_depth is not None and depth >= max_depth:
+            continue
+        reached = []
+        for step in follow(node_guid, expand(node_guid), depth + 1):
+            if step.new:
+                reached.append(step.node_guid)
+            yield step
+            if exhausted():
+                return
+        stack.extend((guid, depth + 1) for guid in reversed(reached))
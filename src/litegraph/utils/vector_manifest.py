@@ -0,0 +1,144 @@
+"""
+Local manifest of the vectors already uploaded, used by ``Vector.sync_vectors``.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Iterator, List, Optional
+
+MANIFEST_VERSION = 1
+
+
+class VectorManifest:
+    """
+    Content hashes and GUIDs of the vectors uploaded per node, edge or graph.
+
+    Each entry is keyed by the graph, the owning node, edge or graph, and the
+    embedding model, and maps the hash of the model and content of every vector
+    uploaded for it (e.g. the chunks of a document) to the vector's GUID. The
+    manifest is kept in memory and written to ``path`` as JSON by ``save``.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Load a manifest, or start an empty one if ``path`` does not exist.
+
+        Args:
+            path: The JSON file the manifest is stored in. The manifest is only
+                kept in memory if not given.
+        """
+        self.path = os.fspath(path) if path is not None else None
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self.pending_deletes: List[str] = []
+        if self.path and os.path.exists(self.path):
+            with open(self.path) as manifest_file:
+                data = json.load(manifest_file)
+            if data.get("version") != MANIFEST_VERSION:
+                raise ValueError(f"Unsupported manifest version in {self.path}")
+            self._entries = data["entries"]
+            self.pending_deletes = data.get("pending_deletes", [])
+
+    @staticmethod
+    def content_hash(model: Optional[str], content: Optional[str]) -> str:
+        """
+        Hash the embedding model and source content of a vector.
+        """
+        digest = hashlib.sha256()
+        digest.update((model or "").encode())
+        digest.update(b"\0")
+        digest.update((content or "").encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(
+        graph_guid: str,
+        model: Optional[str],
+        node_guid: Optional[str] = None,
+        edge_guid: Optional[str] = None,
+    ) -> str:
+        """
+        Return the manifest key of the vectors of a node, edge or graph and model.
+        """
+        if node_guid:
+            owner = f"node/{node_guid}"
+        elif edge_guid:
+            owner = f"edge/{edge_guid}"
+        else:
+            owner = "graph"
+        return f"{graph_guid}/{owner}/{model or ''}"
+
+    def __len__(self) -> int:
+        return sum(len(vectors) for vectors in self._entries.values())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Dict[str, str]:
+        """
+        Return the content hashes recorded for ``key`` and their vector GUIDs.
+        """
+        return dict(self._entries.get(key, {}))
+
+    def is_current(
+        self,
+        graph_guid: str,
+        model: Optional[str],
+        content: Optional[str],
+        node_guid: Optional[str] = None,
+        edge_guid: Optional[str] = None,
+    ) -> bool:
+        """
+        Return True if this content was already uploaded for the node or edge.
+
+        Embedding jobs can use this to skip computing embeddings that would not
+        be uploaded.
+        """
+        vectors = self._entries.get(self.key(graph_guid, model, node_guid, edge_guid))
+        return vectors is not None and self.content_hash(model, content) in vectors
+
+    def record(self, key: str, content_hash: str, vector_guid: str) -> None:
+        """
+        Record the vector uploaded for ``key`` with this content hash.
+        """
+        self._entries.setdefault(key, {})[content_hash] = vector_guid
+
+    def discard(self, key: str, content_hash: Optional[str] = None) -> List[str]:
+        """
+        Forget one vector of ``key``, or all of them if ``content_hash`` is not
+        given, and return the GUIDs of the vectors forgotten.
+        """
+        vectors = self._entries.get(key)
+        if vectors is None:
+            return []
+        if content_hash is None:
+            del self._entries[key]
+            return list(vectors.values())
+        vector_guid = vectors.pop(content_hash, None)
+        if not vectors:
+            del self._entries[key]
+        return [vector_guid] if vector_guid else []
+
+    def keys(self, graph_guid: Optional[str] = None) -> Iterator[str]:
+        """
+        Iterate over the keys, optionally only those of one graph.
+        """
+        prefix = f"{graph_guid}/" if graph_guid else ""
+        return (key for key in list(self._entries) if key.startswith(prefix))
+
+    def save(self) -> None:
+        """
+        Write the manifest to ``path`` atomically. Does nothing without a path.
+        """
+        if not self.path:
+            return
+        with open(self.path + ".tmp", "w") as manifest_file:
+            json.dump(
+                {
+                    "version": MANIFEST_VERSION,
+                    "entries": self._entries,
+                    "pending_deletes": self.pending_deletes,
+                },
+                manifest_file,
+            )
+        os.replace(self.path + ".tmp", self.path)
@@ -0,0 +1,71 @@
+"""
+Benchmarks for bulk node creation.
+
+These are skipped by default; run them with ``LITEGRAPH_BENCHMARK=1 pytest tests/benchmarks -s``.
+The request itself is mocked, so only client-side validation and serialization are measured.
+"""
+
+import os
+import time
+from unittest.mock import Mock
+
+import pytest
+from litegraph.models.node import NodeModel
+from litegraph.resources.nodes import Node
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("LITEGRAPH_BENCHMARK"),
+    reason="set LITEGRAPH_BENCHMARK=1 to run benchmarks",
+)
+
+NODE_COUNT = int(os.environ.get("LITEGRAPH_BENCHMARK_NODES", "100000"))
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Client whose requests return nothing, so responses are not validated."""
+    client = Mock()
+    client.tenant_guid = "tenant1"
+    client.graph_guid = "graph1"
+    client.model_backend = "pydantic"
+    client.request.return_value = []
+    monkeypatch.setattr("litegraph.configuration._client", client)
+    return client
+
+
+def _records():
+    return [
+        {
+            "GUID": f"00000000-0000-0000-0000-{i:012d}",
+            "TenantGUID": "tenant1",
+            "GraphGUID": "graph1",
+            "Name": f"node-{i}",
+            "Data": {"index": i},
+            "Labels": ["bench"],
+            "Tags": {"batch": "1"},
+        }
+        for i in range(NODE_COUNT)
+    ]
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def test_create_multiple_benchmark(mock_client):
+    """Compare dict, model-instance and unvalidated bulk creates."""
+    records = _records()
+    models = [NodeModel.model_validate(record) for record in records]
+
+    timings = {
+        "dicts": _timed(lambda: Node.create_multiple(records)),
+        "models": _timed(lambda: Node.create_multiple(models)),
+        "validate=False": _timed(lambda: Node.create_multiple(records, validate=False)),
+    }
+    for name, elapsed in timings.items():
+        print(f"create_multiple[{name}] {NODE_COUNT} nodes: {elapsed:.3f}s")
+
+    assert timings["models"] < timings["dicts"]
+    assert timings["validate=False"] < timings["dicts"]
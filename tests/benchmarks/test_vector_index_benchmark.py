@@ -0,0 +1,173 @@
+from unittest.mock import Mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from litegraph import configuration
+from litegraph.benchmarks.stand_in import StandInServer
+from litegraph.benchmarks.vector_index import (
+    IndexBenchmarkResult,
+    format_report,
+    main,
+    run_index_benchmark,
+    sweep_configs,
+)
+from litegraph.enums.vector_index_type_enum import Vector_Index_Type_Enum
+from litegraph.enums.vector_search_domain_enum import VectorSearchDomainEnum
+from litegraph.resources.graphs import Graph
+from litegraph.resources.nodes import Node
+from litegraph.resources.vector_index import VectorIndex
+from litegraph.resources.vectors import Vector
+
+
+@pytest.fixture
+def server():
+    """Fixture providing a stand-in server configured as the SDK client."""
+    server = StandInServer()
+    with server.configured():
+        yield server
+
+
+def test_sweep_configs():
+    """Test that the sweep covers every combination."""
+    configs = sweep_configs(
+        m=(8, 16),
+        default_ef=(20, 40),
+        vector_index_types=(
+            Vector_Index_Type_Enum.HnswRam,
+            Vector_Index_Type_Enum.HnswSqlite,
+        ),
+        distance_metric="Euclidean",
+    )
+    assert len(configs) == 8
+    assert {(config.m, config.default_ef) for config in configs} == {
+        (8, 20),
+        (8, 40),
+        (16, 20),
+        (16, 40),
+    }
+    assert all(config.distance_metric == "Euclidean" for config in configs)
+
+
+def test_stand_in_search_and_index(server):
+    """Test the stand-in server through the regular resources."""
+    graph = Graph.create(name="scratch")
+    embeddings = np.eye(4, dtype=np.float32)
+    Vector.bulk_upload(embeddings, node_guids=list("abcd"), graph_guid=graph.guid)
+
+    exact = Vector.search_vectors_batch(
+        VectorSearchDomainEnum.Node,
+        [[0, 1, 0.1, 0]],
+        configuration._client.tenant_guid,
+        graph_guid=graph.guid,
+        k=2,
+    )
+    assert exact.guids[0].tolist() == ["b", "c"]
+
+    config = sweep_configs(m=(4,))[0]
+    config.vector_dimensionality = 4
+    VectorIndex.enable(graph.guid, config)
+    VectorIndex.rebuild(graph.guid)
+    stats = VectorIndex.get_stats(graph.guid)
+    assert stats.vector_count == 4
+    assert stats.estimated_memory_bytes > embeddings.nbytes
+
+    indexed = Vector.search_vectors_batch(
+        VectorSearchDomainEnum.Node,
+        [[0, 1, 0.1, 0]],
+        configuration._client.tenant_guid,
+        graph_guid=graph.guid,
+        k=1,
+    )
+    assert indexed.guids[0].tolist() == ["b"]
+    assert indexed.scores[0][0] == pytest.approx(1 / np.sqrt(1.01), abs=1e-5)
+
+    Graph.delete(graph.guid, force=True)
+    assert graph.guid not in server.graphs
+
+
+def test_run_index_benchmark(server):
+    """Test the benchmark against the stand-in server."""
+    configs = sweep_configs(m=(4, 8), default_ef=(10,), ef_construction=(40,))
+    results = run_index_benchmark(
+        configs, count=300, dimensionality=8, query_count=10, k=5
+    )
+
+    assert len(results) == 2
+    for result, config in zip(results, configs):
+        assert isinstance(result, IndexBenchmarkResult)
+        assert result.config.m == config.m
+        assert 0.5 <= result.recall <= 1
+        assert result.latency_p99_ms >= result.latency_p50_ms > 0
+        assert result.qps > 0
+        assert result.estimated_memory_bytes > 300 * 8 * 4
+        assert result.as_dict()["m"] == config.m
+    assert not server.graphs
+
+    report = format_report(results)
+    assert report.count("\n") == 3
+    assert "| HnswRam | 8 |" in report
+
+
+def test_run_index_benchmark_user_embeddings(server):
+    """Test that supplied embeddings and queries are used as-is."""
+    embeddings = np.random.default_rng(3).standard_normal((50, 6))
+    results = run_index_benchmark(
+        sweep_configs(),
+        embeddings=embeddings,
+        queries=embeddings[:5],
+        k=3,
+        keep_graph=True,
+    )
+    assert results[0].recall == 1.0
+    (graph,) = server.graphs.values()
+    assert len(graph.embeddings) == 50
+
+
+def test_run_index_benchmark_requires_one_metric(server):
+    """Test that mixed distance metrics are rejected."""
+    configs = sweep_configs() + sweep_configs(distance_metric="Euclidean")
+    with pytest.raises(ValueError):
+        run_index_benchmark(configs, count=10)
+    assert run_index_benchmark([]) == []
+
+
+def test_main_stand_in(capsys, monkeypatch):
+    """Test the command line entry point against the stand-in server."""
+    set_log_level = Mock()
+    monkeypatch.setattr("litegraph.sdk_logging.set_log_level", set_log_level)
+    main(["--stand-in", "--count", "100", "--dimensionality", "4", "--queries", "5"])
+    set_log_level.assert_called_once_with("WARNING")
+    output = capsys.readouterr().out
+    assert output.startswith("| Type | M |")
+    assert "| HnswRam | 16 | 200 | 50 |" in output
+
+
+def test_run_index_benchmark_leaves_client_graph(monkeypatch):
+    """Test that the benchmark passes its graph explicitly instead of switching the client's."""
+    server = StandInServer()
+    with server.configured(graph_guid="client-graph"):
+        client = configuration._client
+        seen = []
+        create_multiple = Node.create_multiple.__func__
+
+        def record(cls, data, validate=True, graph_guid=None):
+            seen.append(client.graph_guid)
+            raise RuntimeError("create failed")
+
+        monkeypatch.setattr(Node, "create_multiple", classmethod(record))
+        with pytest.raises(RuntimeError):
+            run_index_benchmark(sweep_configs(), count=10)
+        assert seen == ["client-graph"]
+        assert client.graph_guid == "client-graph"
+        assert not server.graphs
+
+        monkeypatch.setattr(Node, "create_multiple", classmethod(create_multiple))
+        rebuild_async = Mock(wraps=VectorIndex.rebuild_async)
+        monkeypatch.setattr(VectorIndex, "rebuild_async", rebuild_async)
+        (result,) = run_index_benchmark(
+            sweep_configs(), count=20, query_count=2, rebuild_timeout=30
+        )
+        assert rebuild_async.call_args.kwargs["timeout"] == 30
+        assert result.recall > 0
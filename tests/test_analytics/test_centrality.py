@@ -0,0 +1,184 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from litegraph.analytics.centrality import betweenness, hits, pagerank
+from litegraph.analytics.writeback import write_node_tags
+from litegraph.local.adjacency import GraphAdjacency
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Create a mock client and configure it."""
+    client = Mock()
+    client.tenant_guid = "tenant1"
+    client.graph_guid = "graph1"
+    client.model_backend = "pydantic"
+    client.request.return_value = []
+    monkeypatch.setattr("litegraph.configuration._client", client)
+    return client
+
+
+@pytest.fixture
+def adjacency():
+    """Fixture providing a small graph with a dangling node (d) and costs."""
+    return GraphAdjacency.from_edges(
+        ["a", "a", "b", "c", "c", "e"],
+        ["b", "c", "c", "a", "d", "c"],
+        costs=[1, 3, 1, 2, 1, 4],
+    )
+
+
+def dense_pagerank(adjacency, damping, teleport, weighted=False):
+    """Reference PageRank from the dense Google matrix's principal eigenvector."""
+    count = len(adjacency)
+    matrix = np.zeros((count, count))
+    weights = adjacency.out_costs if weighted else np.ones(adjacency.edge_count)
+    for source, target, weight in zip(
+        adjacency.out_sources(), adjacency.out_targets, weights
+    ):
+        matrix[target, source] += weight
+    totals = matrix.sum(axis=0)
+    for column in range(count):
+        if totals[column]:
+            matrix[:, column] /= totals[column]
+        else:
+            matrix[:, column] = teleport
+    google = damping * matrix + (1 - damping) * np.outer(teleport, np.ones(count))
+    values, vectors = np.linalg.eig(google)
+    vector = np.real(vectors[:, np.argmax(np.real(values))])
+    return vector / vector.sum()
+
+
+def test_pagerank(adjacency):
+    """Test PageRank against the dense reference."""
+    uniform = np.full(len(adjacency), 1 / len(adjacency))
+    ranks = pagerank(adjacency, tol=1e-12, max_iter=500)
+    assert ranks.sum() == pytest.approx(1.0)
+    assert ranks == pytest.approx(dense_pagerank(adjacency, 0.85, uniform), abs=1e-8)
+
+    weighted = pagerank(adjacency, weighted=True, tol=1e-12, max_iter=500)
+    assert weighted == pytest.approx(
+        dense_pagerank(adjacency, 0.85, uniform, weighted=True), abs=1e-8
+    )
+    assert not np.allclose(weighted, ranks)
+
+    # Cycles rank every node equally
+    cycle = GraphAdjacency.from_edges(["a", "b", "c"], ["b", "c", "a"])
+    assert pagerank(cycle) == pytest.approx([1 / 3] * 3)
+    assert pagerank(GraphAdjacency.from_edges([], [])).tolist() == []
+
+
+def test_personalized_pagerank(adjacency):
+    """Test that personalization teleports to the given nodes only."""
+    ranks = pagerank(adjacency, personalization={"e": 1}, tol=1e-12, max_iter=500)
+    teleport = np.zeros(len(adjacency))
+    teleport[adjacency.index_of("e")] = 1
+    assert ranks == pytest.approx(dense_pagerank(adjacency, 0.85, teleport), abs=1e-8)
+    assert ranks[adjacency.index_of("e")] == pytest.approx(
+        0.15 + 0.85 * ranks[adjacency.index_of("d")]
+    )
+
+    with pytest.raises(ValueError):
+        pagerank(adjacency, personalization={"a": 0})
+    with pytest.raises(KeyError):
+        pagerank(adjacency, personalization={"x": 1})
+    with pytest.raises(ValueError):
+        pagerank(adjacency, damping=1)
+
+
+def test_pagerank_not_converged(adjacency, monkeypatch):
+    """Test that running out of iterations logs a warning."""
+    warning = Mock()
+    monkeypatch.setattr("litegraph.analytics.centrality.log_warning", warning)
+    pagerank(adjacency, max_iter=1)
+    warning.assert_called_once()
+
+
+def test_hits():
+    """Test hub and authority scores on a bipartite graph."""
+    adjacency = GraphAdjacency.from_edges(
+        ["h1", "h1", "h2", "h2", "h3"], ["a1", "a2", "a1", "a2", "a1"]
+    )
+    hubs, authorities = hits(adjacency)
+    index = adjacency.index_of
+    assert hubs.sum() == pytest.approx(1.0)
+    assert authorities.sum() == pytest.approx(1.0)
+    assert hubs[index("h1")] == pytest.approx(hubs[index("h2")])
+    assert hubs[index("h1")] > hubs[index("h3")] > 0
+    assert authorities[index("a1")] > authorities[index("a2")]
+    assert hubs[index("a1")] == 0 and authorities[index("h1")] == 0
+
+    # Authorities are the principal eigenvector of A^T A
+    matrix = np.zeros((len(adjacency), len(adjacency)))
+    matrix[adjacency.out_sources(), adjacency.out_targets] = 1
+    _, vectors = np.linalg.eigh(matrix.T @ matrix)
+    expected = np.abs(vectors[:, -1])
+    assert authorities == pytest.approx(expected / expected.sum(), abs=1e-6)
+
+    empty = GraphAdjacency.from_edges([], [], node_guids=["a"])
+    assert [scores.tolist() for scores in hits(empty)] == [[0.0], [0.0]]
+
+
+def test_betweenness():
+    """Test betweenness on graphs with known values."""
+    path = GraphAdjacency.from_edges(["a", "b", "c"], ["b", "c", "d"])
+    scores = betweenness(path, normalized=False)
+    assert scores.tolist() == [0, 2, 2, 0]
+    assert betweenness(path).tolist() == [0, 2 / 6, 2 / 6, 0]
+
+    # Two equally short routes from s to t share the dependency
+    diamond = GraphAdjacency.from_edges(["s", "s", "x", "y"], ["x", "y", "t", "t"])
+    scores = betweenness(diamond, normalized=False)
+    assert scores[diamond.index_of("x")] == 0.5
+    assert scores[diamond.index_of("y")] == 0.5
+
+    # With costs, only the cheaper route counts
+    weighted = GraphAdjacency.from_edges(
+        ["s", "s", "x", "y"], ["x", "y", "t", "t"], costs=[1, 1, 1, 5]
+    )
+    scores = betweenness(weighted, weighted=True, normalized=False)
+    assert scores[weighted.index_of("x")] == 1
+    assert scores[weighted.index_of("y")] == 0
+
+
+def test_sampled_betweenness():
+    """Test that sampling sources approximates the exact scores."""
+    rng = np.random.default_rng(1)
+    nodes = [f"n{i}" for i in range(80)]
+    adjacency = GraphAdjacency.from_edges(
+        rng.choice(nodes, 400).tolist(), rng.choice(nodes, 400).tolist()
+    )
+    exact = betweenness(adjacency)
+    approximate = betweenness(adjacency, samples=len(adjacency) // 2, seed=0)
+    assert np.corrcoef(exact, approximate)[0, 1] > 0.8
+    assert betweenness(adjacency, samples=10_000).tolist() == exact.tolist()
+
+
+def test_write_node_tags(mock_client, adjacency):
+    """Test writing scores back as node tags in batches."""
+    scores = pagerank(adjacency)
+    assert write_node_tags(adjacency, scores, "pagerank", batch_size=3) == 5
+    assert mock_client.request.call_count == 2
+    method, url = mock_client.request.call_args_list[0][0]
+    assert method == "PUT"
+    assert url.endswith("tenants/tenant1/tags/bulk")
+
+    tags = []
+    for call in mock_client.request.call_args_list:
+        tags += json.loads(call[1]["content"])
+    assert [tag["NodeGUID"] for tag in tags] == adjacency.guids.tolist()
+    assert {tag["Key"] for tag in tags} == {"pagerank"}
+    assert {tag["GraphGUID"] for tag in tags} == {"graph1"}
+    assert float(tags[0]["Value"]) == pytest.approx(scores[0], rel=1e-5)
+
+    mock_client.request.reset_mock()
+    assert write_node_tags(adjacency, [1, None, 2, None, 3], "component") == 3
+    assert [
+        tag["Value"] for tag in json.loads(mock_client.request.call_args[1]["content"])
+    ] == ["1", "2", "3"]
+    with pytest.raises(ValueError):
+        write_node_tags(adjacency, [1], "x")
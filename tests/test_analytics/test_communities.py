@@ -0,0 +1,145 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from litegraph.analytics.communities import (
+    label_propagation,
+    strongly_connected_components,
+    weakly_connected_components,
+)
+from litegraph.analytics.writeback import write_node_labels
+from litegraph.local.adjacency import GraphAdjacency
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Create a mock client and configure it."""
+    client = Mock()
+    client.tenant_guid = "tenant1"
+    client.graph_guid = "graph1"
+    client.model_backend = "pydantic"
+    client.request.return_value = []
+    monkeypatch.setattr("litegraph.configuration._client", client)
+    return client
+
+
+@pytest.fixture
+def adjacency():
+    """Fixture providing a cycle a->b->c->a, a tail c->d->e, a pair f<->g and h."""
+    return GraphAdjacency.from_edges(
+        ["a", "b", "c", "c", "d", "f", "g"],
+        ["b", "c", "a", "d", "e", "g", "f"],
+        node_guids=["h"],
+    )
+
+
+def groups(adjacency, labels):
+    """The node GUID sets of every component."""
+    found = {}
+    for guid, label in zip(adjacency.guids.tolist(), labels.tolist()):
+        found.setdefault(label, set()).add(guid)
+    return sorted(found.values(), key=sorted)
+
+
+def reference_components(adjacency):
+    """Weakly connected components by depth-first search."""
+    neighbours = {guid: set(adjacency.neighbors(guid)) for guid in adjacency.guids}
+    seen, found = set(), []
+    for guid in adjacency.guids:
+        if guid in seen:
+            continue
+        component, stack = set(), [guid]
+        while stack:
+            node = stack.pop()
+            if node not in component:
+                component.add(node)
+                stack.extend(neighbours[node] - component)
+        seen |= component
+        found.append(component)
+    return sorted(found, key=sorted)
+
+
+def test_weakly_connected_components(adjacency):
+    """Test weak components on a small graph and a random one."""
+    labels = weakly_connected_components(adjacency)
+    assert labels.dtype == np.int32
+    assert labels.tolist() == [0, 0, 0, 0, 0, 1, 1, 2]
+    assert groups(adjacency, labels) == [
+        {"a", "b", "c", "d", "e"},
+        {"f", "g"},
+        {"h"},
+    ]
+
+    rng = np.random.default_rng(5)
+    nodes = [f"n{i}" for i in range(500)]
+    random = GraphAdjacency.from_edges(
+        rng.choice(nodes, 300).tolist(), rng.choice(nodes, 300).tolist()
+    )
+    assert groups(random, weakly_connected_components(random)) == (
+        reference_components(random)
+    )
+    assert weakly_connected_components(GraphAdjacency.from_edges([], [])).tolist() == []
+
+
+def test_strongly_connected_components(adjacency):
+    """Test strong components, including a long chain."""
+    labels = strongly_connected_components(adjacency)
+    assert labels.dtype == np.int32
+    assert groups(adjacency, labels) == [
+        {"a", "b", "c"},
+        {"d"},
+        {"e"},
+        {"f", "g"},
+        {"h"},
+    ]
+
+    # Deep graphs do not hit the recursion limit
+    count = 5000
+    chain = GraphAdjacency.from_edges(
+        [f"n{i:05d}" for i in range(count)],
+        [f"n{(i + 1) % count:05d}" for i in range(count)],
+    )
+    assert set(strongly_connected_components(chain).tolist()) == {0}
+
+
+def test_label_propagation():
+    """Test that two dense clusters joined by one edge are found."""
+    left = [f"l{i}" for i in range(6)]
+    right = [f"r{i}" for i in range(6)]
+    sources, targets = [], []
+    for cluster in (left, right):
+        for i, source in enumerate(cluster):
+            for target in cluster[i + 1 :]:
+                sources.append(source)
+                targets.append(target)
+    sources.append("l0")
+    targets.append("r0")
+    adjacency = GraphAdjacency.from_edges(sources, targets, node_guids=["alone"])
+
+    labels = label_propagation(adjacency, seed=0)
+    assert groups(adjacency, labels) == [{"alone"}, set(left), set(right)]
+    assert label_propagation(adjacency, seed=0).tolist() == labels.tolist()
+
+    costs = [5] * (len(sources) - 1) + [1]
+    adjacency = GraphAdjacency.from_edges(sources, targets, costs=costs)
+    weighted = label_propagation(adjacency, weighted=True, seed=1)
+    assert groups(adjacency, weighted) == [set(left), set(right)]
+    assert label_propagation(
+        GraphAdjacency.from_edges([], [], node_guids=["a"])
+    ).tolist() == [0]
+
+
+def test_write_node_labels(mock_client, adjacency):
+    """Test writing component IDs back as node labels."""
+    labels = weakly_connected_components(adjacency)
+    assert write_node_labels(adjacency, labels, prefix="component-") == 8
+    method, url = mock_client.request.call_args[0]
+    assert method == "PUT"
+    assert url.endswith("tenants/tenant1/labels/bulk")
+    records = json.loads(mock_client.request.call_args[1]["content"])
+    assert [record["Label"] for record in records[:2]] == ["component-0"] * 2
+    assert records[-1]["NodeGUID"] == "h"
+    assert records[-1]["GraphGUID"] == "graph1"
@@ -0,0 +1,136 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from litegraph.analytics.walks import random_walks, write_guid_mapping
+from litegraph.local.adjacency import GraphAdjacency
+
+
+@pytest.fixture
+def adjacency():
+    """Fixture providing a small graph; d has no outgoing edges."""
+    return GraphAdjacency.from_edges(
+        ["a", "a", "b", "b", "c", "c"],
+        ["b", "c", "a", "c", "a", "d"],
+        costs=[1, 9, 1, 1, 1, 0],
+    )
+
+
+def edges_of(adjacency, directed=True):
+    sources = adjacency.out_sources().tolist()
+    targets = adjacency.out_targets.tolist()
+    found = set(zip(sources, targets))
+    if not directed:
+        found |= set(zip(targets, sources))
+    return found
+
+
+def test_uniform_walks(adjacency):
+    """Test that walks follow edges and stop at nodes without edges."""
+    walks = random_walks(adjacency, walk_length=6, walks_per_node=20, seed=0)
+    assert walks.dtype == np.int32
+    assert walks.shape == (4 * 20, 6)
+    assert walks[:, 0].tolist() == list(range(4)) * 20
+
+    edges = edges_of(adjacency)
+    d = adjacency.index_of("d")
+    for walk in walks.tolist():
+        steps = [node for node in walk if node >= 0]
+        assert walk[len(steps) :] == [-1] * (6 - len(steps))
+        assert all(step in edges for step in zip(steps, steps[1:]))
+        if len(steps) < 6:
+            assert steps[-1] == d
+
+    assert (
+        walks.tolist()
+        == random_walks(adjacency, walk_length=6, walks_per_node=20, seed=0).tolist()
+    )
+
+    undirected = random_walks(adjacency, walk_length=6, directed=False, seed=0)
+    assert (undirected >= 0).all()
+    edges = edges_of(adjacency, directed=False)
+    for walk in undirected.tolist():
+        assert all(step in edges for step in zip(walk, walk[1:]))
+
+
+def test_weighted_walks(adjacency):
+    """Test that weighted steps follow edge costs."""
+    a, c = (adjacency.index_of(guid) for guid in "ac")
+    walks = random_walks(
+        adjacency, walk_length=2, walks_per_node=4000, start_guids=["a"], seed=0
+    )
+    assert np.mean(walks[:, 1] == c) == pytest.approx(0.5, abs=0.05)
+
+    walks = random_walks(
+        adjacency,
+        walk_length=2,
+        walks_per_node=4000,
+        start_guids=["a", "c"],
+        weighted=True,
+        seed=0,
+    )
+    from_a = walks[walks[:, 0] == a, 1]
+    assert np.mean(from_a == c) == pytest.approx(0.9, abs=0.03)
+    # The zero-cost edge c->d is never taken
+    assert set(walks[walks[:, 0] == c, 1].tolist()) == {a}
+
+
+def test_biased_walks():
+    """Test the node2vec return and in-out parameters on a path graph."""
+    path = GraphAdjacency.from_edges(list("abcd"), list("bcde"))
+
+    def returns(p, q):
+        walks = random_walks(
+            path,
+            walk_length=3,
+            walks_per_node=3000,
+            p=p,
+            q=q,
+            directed=False,
+            start_guids=["c"],
+            seed=1,
+        )
+        return np.mean(walks[:, 2] == walks[:, 0])
+
+    # From c, the second step either returns to c or moves further away
+    assert returns(1, 1) == pytest.approx(0.5, abs=0.04)
+    assert returns(0.25, 1) == pytest.approx(0.8, abs=0.04)
+    assert returns(1, 0.25) == pytest.approx(0.2, abs=0.04)
+
+    # Triangle: from a->b, stepping to c (a neighbour of a) is weighted 1
+    triangle = GraphAdjacency.from_edges(list("abc"), list("bca"))
+    walks = random_walks(
+        triangle,
+        walk_length=3,
+        walks_per_node=3000,
+        p=4,
+        q=1,
+        directed=False,
+        start_guids=["a"],
+        seed=2,
+    )
+    assert np.mean(walks[:, 2] == walks[:, 0]) == pytest.approx(0.2, abs=0.04)
+
+    with pytest.raises(ValueError):
+        random_walks(path, p=0)
+
+
+def test_batches_processes_and_files(adjacency, tmp_path):
+    """Test that batching, worker processes and memmap output agree."""
+    expected = random_walks(
+        adjacency, walk_length=5, walks_per_node=30, seed=3, batch_size=7
+    )
+    parallel = random_walks(
+        adjacency, walk_length=5, walks_per_node=30, seed=3, batch_size=7, processes=2
+    )
+    assert parallel.tolist() == expected.tolist()
+
+    out = tmp_path / "walks.npy"
+    random_walks(
+        adjacency, walk_length=5, walks_per_node=30, seed=3, batch_size=7, out=str(out)
+    )
+    assert np.load(out).tolist() == expected.tolist()
+
+    mapping = tmp_path / "guids.txt"
+    assert write_guid_mapping(adjacency, mapping) == 4
+    assert mapping.read_text().splitlines() == ["a", "b", "c", "d"]
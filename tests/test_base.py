@@ -417,3 +417,73 @@ def test_request_max_retries_exhausted(base_client, monkeypatch):
         with pytest.raises(SdkException) as exc_info:
             base_client.request("GET", "/test")
         assert f"Request failed after {base_client.retries} attempts" in str(exc_info.value)
+
+
+def test_raw_request_returns_bytes(base_client):
+    """Test that raw requests skip JSON decoding."""
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b'{"data": "test"}'
+    mock_response.raise_for_status.return_value = None
+
+    with patch.object(base_client.client, "request", return_value=mock_response):
+        response = base_client.request("GET", "/test", raw=True)
+        assert response == b'{"data": "test"}'
+        mock_response.json.assert_not_called()
+
+
+def test_model_backend_validation(base_url):
+    """Test model backend selection."""
+    with patch("httpx.Client"):
+        assert BaseClient(base_url, "tenant").model_backend == "pydantic"
+        assert (
+            BaseClient(base_url, "tenant", model_backend="msgspec").model_backend
+            == "msgspec"
+        )
+        with pytest.raises(ValueError):
+            BaseClient(base_url, "tenant", model_backend="unknown")
+        with patch("importlib.util.find_spec", return_value=None):
+            with pytest.raises(ImportError):
+                BaseClient(base_url, "tenant", model_backend="msgspec")
+
+
+def test_mutation_listeners(base_client):
+    """Test that listeners are notified after successful writes only."""
+    mock_response = Mock(spec=httpx.Response)
+    mock_response.status_code = 200
+    mock_response.content = b"{}"
+    mock_response.json.return_value = {}
+    mock_response.raise_for_status.return_value = None
+    listener = Mock()
+    failing = Mock(side_effect=RuntimeError("boom"))
+
+    base_client.add_mutation_listener(failing)
+    base_client.add_mutation_listener(listener)
+    base_client.add_mutation_listener(listener)
+    with patch.object(base_client.client, "request", return_value=mock_response):
+        base_client.request("GET", "/test")
+        base_client.request("POST", "/test")
+        base_client.request("PUT", "/graphs/g1/nodes")
+        base_client.request("DELETE", "/graphs/g1/nodes/n1")
+        base_client.remove_mutation_listener(listener)
+        base_client.request("PUT", "/graphs/g1/nodes")
+
+    assert listener.call_args_list == [
+        (("PUT", "/graphs/g1/nodes"),),
+        (("DELETE", "/graphs/g1/nodes/n1"),),
+    ]
+    assert failing.call_count == 3
+
+
+def test_request_without_retry(base_client):
+    """Test that requests sent with retry=False are attempted once."""
+    with patch.object(
+        base_client.client,
+        "request",
+        side_effect=httpx.ReadTimeout("Timed out"),
+    ) as mock_request:
+        with pytest.raises(SdkException, match="Request failed after 1 attempts"):
+            base_client.request("POST", "/test", retry=False, timeout=0.01)
+    mock_request.assert_called_once_with(
+        "POST", "/test", headers={"Content-Type": "application/json"}, timeout=0.01
+    )
@@ -0,0 +1,198 @@
+from unittest.mock import Mock
+
+import pytest
+
+from litegraph.base import BaseClient
+from litegraph.cache.route_cache import RouteCache
+from litegraph.models.route_response import RouteResultModel
+from litegraph.models.search_node_edge import SearchRequest
+from litegraph.resources.edges import Edge
+from litegraph.resources.route_traversal import RouteNodes
+from litegraph.resources.routes import Routes
+from litegraph.resources.routes_between import RouteEdges
+
+TENANT = "00000000-0000-0000-0000-000000000000"
+GRAPH = "00000000-0000-0000-0000-000000000001"
+OTHER_GRAPH = "00000000-0000-0000-0000-000000000002"
+
+ROUTE_RESPONSE = {
+    "Timestamp": {"TotalMs": 1.0},
+    "Routes": [{"TotalCost": 3, "Edges": []}],
+}
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Create a mock client that keeps real mutation listeners and graph counts."""
+    client = Mock()
+    client.tenant_guid = TENANT
+    client.graph_guid = None
+    client.counts = {"Nodes": 2, "Edges": 1}
+    client._mutation_listeners = []
+    client.add_mutation_listener = lambda listener: BaseClient.add_mutation_listener(
+        client, listener
+    )
+    client.remove_mutation_listener = lambda listener: (
+        BaseClient.remove_mutation_listener(client, listener)
+    )
+
+    def request(method, url, **kwargs):
+        if url.endswith("/stats"):
+            return dict(client.counts)
+        if method == "GET" and "/edges" in url:
+            return [{"GUID": "e1", "From": "a", "To": "b"}]
+        if url.endswith("/routes"):
+            return ROUTE_RESPONSE
+        if method == "GET" and url.endswith("/between"):
+            return [{"GUID": "n1"}]
+        BaseClient.notify_mutation(client, method, url)
+        return {"GUID": "e2", "From": "a", "To": "b"}
+
+    client.request.side_effect = request
+    monkeypatch.setattr("litegraph.configuration._client", client)
+    return client
+
+
+def route_calls(client):
+    return [call for call in client.request.call_args_list if "stats" not in call[0][1]]
+
+
+def test_routes_memoized(mock_client):
+    """Test that repeated routes are answered from the cache."""
+    cache = RouteCache()
+    first = Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="b")
+    second = Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="b")
+    assert isinstance(first, RouteResultModel)
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(route_calls(mock_client)) == 1
+
+    # Other pairs, graphs and filters are separate entries
+    Routes.routes(GRAPH, cache=cache, from_guid="b", to_guid="a")
+    Routes.routes(OTHER_GRAPH, cache=cache, from_guid="a", to_guid="b")
+    edge_filter = SearchRequest(GraphGUID=GRAPH, Labels=["road"])
+    Routes.routes(
+        GRAPH, cache=cache, from_guid="a", to_guid="b", edge_filter=edge_filter
+    )
+    Routes.routes(
+        GRAPH,
+        cache=cache,
+        from_guid="a",
+        to_guid="b",
+        edge_filter=SearchRequest(GraphGUID=GRAPH, Labels=["road"]),
+    )
+    assert len(route_calls(mock_client)) == 4
+    assert len(cache) == 4
+
+    edges = RouteEdges.between(GRAPH, "a", "b", cache=cache)
+    assert RouteEdges.between(GRAPH, "a", "b", cache=cache) == edges
+    assert edges[0].guid == "e1"
+    assert len(route_calls(mock_client)) == 5
+
+    nodes = RouteNodes.between(GRAPH, "a", cache=cache)
+    assert RouteNodes.between(GRAPH, "a", cache=cache) == nodes
+    assert nodes[0].guid == "n1"
+    assert len(route_calls(mock_client)) == 6
+    RouteNodes.between(GRAPH, "b", cache=cache)
+    assert len(route_calls(mock_client)) == 7
+
+    Edge.create(graph_guid=GRAPH, from_node_guid="a", to_node_guid="b")
+    RouteNodes.between(GRAPH, "a", cache=cache)
+    assert len(route_calls(mock_client)) == 9
+
+
+def test_invalidated_by_writes(mock_client):
+    """Test that node and edge writes through the client drop the graph's entries."""
+    cache = RouteCache()
+    Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="b")
+    Routes.routes(OTHER_GRAPH, cache=cache, from_guid="a", to_guid="b")
+
+    Edge.create(graph_guid=GRAPH, from_node_guid="a", to_node_guid="b")
+    assert len(cache) == 1
+    Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="b")
+    assert cache.misses == 3
+
+    BaseClient.notify_mutation(
+        mock_client, "PUT", f"v1.0/tenants/{TENANT}/graphs/{GRAPH}/vectors"
+    )
+    assert len(cache) == 2
+    for url in (
+        f"v1.0/tenants/{TENANT}/vectors",
+        f"v1.0/tenants/{TENANT}/vectors/bulk",
+        f"v1.0/tenants/{TENANT}/vectors/v1",
+    ):
+        BaseClient.notify_mutation(mock_client, "PUT", url)
+    assert len(cache) == 2
+    BaseClient.notify_mutation(mock_client, "DELETE", f"v1.0/tenants/{TENANT}")
+    assert len(cache) == 0
+
+    cache.detach()
+    assert mock_client._mutation_listeners == []
+
+
+def test_write_during_fetch_is_not_cached(mock_client):
+    """Test that a route fetched across an invalidating write is not cached."""
+    cache = RouteCache(check_interval=None)
+    fetch = mock_client.request.side_effect
+
+    def request(method, url, **kwargs):
+        if url.endswith("/routes"):
+            BaseClient.notify_mutation(
+                mock_client, "PUT", f"v1.0/tenants/{TENANT}/graphs/{GRAPH}/nodes"
+            )
+        return fetch(method, url, **kwargs)
+
+    mock_client.request.side_effect = request
+    Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="b")
+    assert len(cache) == 0
+
+    mock_client.request.side_effect = fetch
+    Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="b")
+    assert len(cache) == 1
+
+
+def test_statistics_check(mock_client, monkeypatch):
+    """Test that count changes from other writers invalidate after the interval."""
+    clock = [100.0]
+    monkeypatch.setattr("litegraph.cache.route_cache.time.monotonic", lambda: clock[0])
+    cache = RouteCache(check_interval=60)
+
+    Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="b")
+    mock_client.counts["Edges"] = 2
+    Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="b")
+    assert cache.hits == 1
+
+    clock[0] += 61
+    Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="b")
+    assert cache.misses == 2
+    stats = [
+        call for call in mock_client.request.call_args_list if "stats" in call[0][1]
+    ]
+    assert len(stats) == 2
+    assert stats[0][0][1].endswith(f"graphs/{GRAPH}/stats")
+
+    clock[0] += 61
+    Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="b")
+    assert cache.hits == 2
+
+
+def test_ttl_lru_and_clear(mock_client, monkeypatch):
+    """Test expiry, eviction and clearing."""
+    clock = [100.0]
+    monkeypatch.setattr("litegraph.cache.route_cache.time.monotonic", lambda: clock[0])
+    cache = RouteCache(max_entries=2, ttl=10, check_interval=None)
+
+    Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="b")
+    clock[0] += 11
+    Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="b")
+    assert cache.misses == 2
+
+    Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="c")
+    Routes.routes(GRAPH, cache=cache, from_guid="a", to_guid="d")
+    assert len(cache) == 2
+    assert not any("stats" in call[0][1] for call in mock_client.request.call_args_list)
+
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+    with pytest.raises(ValueError):
+        RouteCache(max_entries=0)
@@ -0,0 +1,182 @@
+from unittest.mock import Mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from litegraph.base import BaseClient
+from litegraph.cache.search_cache import VectorSearchCache
+from litegraph.enums.vector_search_domain_enum import VectorSearchDomainEnum
+from litegraph.resources.vectors import Vector
+
+TENANT = "00000000-0000-0000-0000-000000000000"
+GRAPH = "00000000-0000-0000-0000-000000000001"
+OTHER_GRAPH = "00000000-0000-0000-0000-000000000002"
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Create a mock client that keeps real mutation listeners."""
+    client = Mock()
+    client.tenant_guid = TENANT
+    client.graph_guid = GRAPH
+    client.model_backend = "pydantic"
+    client._mutation_listeners = []
+    client.add_mutation_listener = lambda listener: BaseClient.add_mutation_listener(
+        client, listener
+    )
+    client.remove_mutation_listener = lambda listener: (
+        BaseClient.remove_mutation_listener(client, listener)
+    )
+    client.notify_mutation = lambda method, url: BaseClient.notify_mutation(
+        client, method, url
+    )
+    client.request.return_value = [{"Score": 0.9, "Distance": 0.1}]
+    monkeypatch.setattr("litegraph.configuration._client", client)
+    return client
+
+
+@pytest.fixture
+def query():
+    """Fixture providing a random query embedding."""
+    return np.random.default_rng(0).standard_normal(32).tolist()
+
+
+def search(cache, embeddings, graph_guid=GRAPH, **kwargs):
+    return Vector.search_vectors(
+        VectorSearchDomainEnum.Node,
+        embeddings,
+        TENANT,
+        graph_guid=graph_guid,
+        cache=cache,
+        **kwargs,
+    )
+
+
+def test_near_duplicate_query_hits(mock_client, query):
+    """Test that a slightly perturbed query is answered from the cache."""
+    cache = VectorSearchCache(threshold=0.98)
+    first = search(cache, query)
+    nudged = (np.asarray(query) * 1.01 + 0.001).tolist()
+    second = search(cache, nudged)
+
+    assert mock_client.request.call_count == 1
+    assert second == first
+    assert first[0].score == 0.9
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_dissimilar_query_misses(mock_client, query):
+    """Test that an unrelated query goes to the server."""
+    cache = VectorSearchCache()
+    search(cache, query)
+    search(cache, np.random.default_rng(1).standard_normal(32).tolist())
+
+    assert mock_client.request.call_count == 2
+    assert len(cache) == 2
+
+
+def test_filters_are_part_of_the_key(mock_client, query):
+    """Test that labels, tags, expressions and graphs must match for a hit."""
+    cache = VectorSearchCache()
+    search(cache, query, labels=["a", "b"], tags={"k": "v"})
+    search(cache, query, labels=["b", "a"], tags={"k": "v"})
+    assert mock_client.request.call_count == 1
+
+    search(cache, query, labels=["a"], tags={"k": "v"})
+    search(cache, query, labels=["a", "b"], tags={"k": "other"})
+    search(
+        cache,
+        query,
+        labels=["a", "b"],
+        tags={"k": "v"},
+        filter_expr={"Left": "x", "Operator": "Equals", "Right": "1"},
+    )
+    search(cache, query, graph_guid=OTHER_GRAPH, labels=["a", "b"], tags={"k": "v"})
+    assert mock_client.request.call_count == 5
+
+
+def test_ttl_expiry(mock_client, query, monkeypatch):
+    """Test that entries older than the TTL are not used."""
+    now = [1000.0]
+    monkeypatch.setattr("litegraph.cache.search_cache.time.monotonic", lambda: now[0])
+    cache = VectorSearchCache(ttl=10)
+    search(cache, query)
+    now[0] += 5
+    search(cache, query)
+    assert mock_client.request.call_count == 1
+
+    now[0] += 20
+    search(cache, query)
+    assert mock_client.request.call_count == 2
+
+
+def test_lru_eviction(mock_client):
+    """Test that the least recently used entry is evicted first."""
+    rng = np.random.default_rng(2)
+    a, b, c = (rng.standard_normal(32).tolist() for _ in range(3))
+    cache = VectorSearchCache(max_entries=2)
+    search(cache, a)
+    search(cache, b)
+    search(cache, a)
+    search(cache, c)
+
+    assert len(cache) == 2
+    assert cache.get(VectorSearchDomainEnum.Node, a, TENANT, GRAPH) is not None
+    assert cache.get(VectorSearchDomainEnum.Node, b, TENANT, GRAPH) is None
+
+
+def test_invalidated_by_writes_to_the_graph(mock_client, query):
+    """Test that writes through the client invalidate the affected graph."""
+    cache = VectorSearchCache()
+    search(cache, query)
+    search(cache, query, graph_guid=OTHER_GRAPH)
+    assert len(cache) == 2
+
+    mock_client.notify_mutation("PUT", f"v1.0/tenants/{TENANT}/graphs/{GRAPH}/nodes")
+    assert len(cache) == 1
+    assert cache.get(VectorSearchDomainEnum.Node, query, TENANT, OTHER_GRAPH)
+
+    mock_client.notify_mutation("PUT", f"v1.0/tenants/{TENANT}/vectors")
+    assert len(cache) == 0
+
+
+def test_write_during_search_is_not_cached(mock_client, query):
+    """Test that results fetched across an invalidating write are not cached."""
+    cache = VectorSearchCache()
+
+    def request(*args, **kwargs):
+        mock_client.notify_mutation(
+            "PUT", f"v1.0/tenants/{TENANT}/graphs/{GRAPH}/nodes"
+        )
+        return [{"Score": 0.9, "Distance": 0.1}]
+
+    mock_client.request.side_effect = request
+    assert search(cache, query)[0].score == 0.9
+    assert len(cache) == 0
+
+    mock_client.request.side_effect = None
+    search(cache, query)
+    assert len(cache) == 1
+
+
+def test_detach(mock_client, query):
+    """Test that a detached cache no longer listens for writes."""
+    cache = VectorSearchCache()
+    search(cache, query)
+    assert mock_client._mutation_listeners
+
+    cache.detach()
+    assert not mock_client._mutation_listeners
+    mock_client.notify_mutation("DELETE", f"v1.0/tenants/{TENANT}/vectors/v1")
+    assert len(cache) == 1
+
+
+def test_invalid_arguments():
+    """Test argument validation."""
+    with pytest.raises(ValueError):
+        VectorSearchCache(threshold=0)
+    with pytest.raises(ValueError):
+        VectorSearchCache(max_entries=0)
+    with pytest.raises(ValueError):
+        VectorSearchCache(bits=0)
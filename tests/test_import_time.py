@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_PATH = str(Path(__file__).parent.parent / "src")
+
+# Generous budget for `import litegraph`; override with LITEGRAPH_IMPORT_BUDGET_MS.
+IMPORT_BUDGET_MS = float(os.environ.get("LITEGRAPH_IMPORT_BUDGET_MS", "150"))
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": SRC_PATH}
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def _cumulative_import_us(stderr: str, module: str) -> int:
+    """Parse the cumulative import time of a module from `-X importtime` output."""
+    for line in stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+@pytest.mark.skipif(
+    not os.environ.get("LITEGRAPH_BENCHMARK"),
+    reason="set LITEGRAPH_BENCHMARK=1 to check the import time budget",
+)
+def test_import_time_budget():
+    """Track the cold import time of the package with `python -X importtime`."""
+    result = _run("import litegraph", "-X", "importtime")
+    cumulative_ms = _cumulative_import_us(result.stderr, "litegraph") / 1000
+    print(f"import litegraph: {cumulative_ms:.2f} ms")
+    assert cumulative_ms < IMPORT_BUDGET_MS
+
+
+def test_import_is_lazy():
+    """Test that importing the package does not import resources or pydantic."""
+    result = _run(
+        "import sys, litegraph; "
+        "print(sorted(m for m in sys.modules "
+        "if m.startswith(('litegraph.', 'pydantic', 'httpx'))))"
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_attribute_only_imports_its_module():
+    """Test that accessing one resource does not import the others."""
+    result = _run(
+        "import sys; from litegraph import Node; "
+        "print('litegraph.resources.nodes' in sys.modules, "
+        "'litegraph.resources.graphs' in sys.modules)"
+    )
+    assert result.stdout.strip() == "True False"
+
+
+def test_lazy_attributes():
+    """Test lazy attribute resolution on the package."""
+    import litegraph
+    from litegraph.resources.nodes import Node
+
+    assert litegraph.Node is Node
+    assert "Vector" in dir(litegraph)
+    assert set(litegraph.__all__) <= set(dir(litegraph))
+    with pytest.raises(AttributeError):
+        getattr(litegraph, "DoesNotExist")
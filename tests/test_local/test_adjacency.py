@@ -0,0 +1,61 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from litegraph.local.adjacency import GraphAdjacency
+
+
+@pytest.fixture
+def adjacency():
+    """Fixture providing a small graph: a->b, a->c, b->c, c->a, a->b (parallel)."""
+    return GraphAdjacency.from_edges(
+        ["a", "a", "b", "c", "a"],
+        ["b", "c", "c", "a", "b"],
+        costs=[1, 2, 3, 4, 5],
+        edge_guids=["e1", "e2", "e3", "e4", "e5"],
+        node_guids=["d"],
+    )
+
+
+def test_structure(adjacency):
+    """Test the CSR arrays."""
+    assert len(adjacency) == 4
+    assert adjacency.edge_count == 5
+    assert adjacency.guids.tolist() == ["a", "b", "c", "d"]
+    assert adjacency.out_offsets.dtype == np.int32
+    assert adjacency.out_targets.dtype == np.int32
+    assert adjacency.out_offsets.tolist() == [0, 3, 4, 5, 5]
+    assert adjacency.in_offsets.tolist() == [0, 1, 3, 5, 5]
+    a = adjacency.index_of("a")
+    assert adjacency.successor_indices(a).tolist() == [1, 2, 1]
+    assert adjacency.out_costs[: adjacency.out_offsets[1]].tolist() == [1, 2, 5]
+    assert adjacency.out_sources().tolist() == [0, 0, 0, 1, 2]
+    assert "d" in adjacency and "x" not in adjacency
+    with pytest.raises(KeyError):
+        adjacency.index_of("x")
+
+
+def test_queries(adjacency):
+    """Test the GUID-level neighbour and degree queries."""
+    assert adjacency.children("a") == ["b", "c"]
+    assert adjacency.parents("c") == ["a", "b"]
+    assert adjacency.neighbors("a") == ["b", "c"]
+    assert adjacency.neighbors("d") == []
+    assert adjacency.out_degree("a") == 3
+    assert adjacency.in_degree("b") == 2
+    assert adjacency.out_degrees().tolist() == [3, 1, 1, 0]
+    assert adjacency.in_degrees().tolist() == [1, 2, 2, 0]
+    assert adjacency.edges_from("a") == ["e1", "e2", "e5"]
+    assert adjacency.edges_to("a") == ["e4"]
+
+
+def test_from_edges_validation():
+    """Test that mismatched edge lists are rejected and empty graphs work."""
+    with pytest.raises(ValueError):
+        GraphAdjacency.from_edges(["a"], [])
+    with pytest.raises(ValueError):
+        GraphAdjacency.from_edges(["a"], ["b"], costs=[1, 2])
+
+    empty = GraphAdjacency.from_edges([], [])
+    assert len(empty) == 0 and empty.edge_count == 0
+    assert empty.out_offsets.tolist() == [0]
@@ -0,0 +1,186 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from litegraph.enums.vector_search_domain_enum import VectorSearchDomainEnum
+from litegraph.local.ann_index import LocalVectorIndex
+from litegraph.local.similarity import score, top_k
+from litegraph.models.hnsw_lite_vector_index import HnswLiteVectorIndexModel
+from litegraph.models.vector_search_response import VectorSearchResultModel
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Create a mock client and configure it."""
+    client = Mock()
+    client.tenant_guid = "tenant1"
+    client.graph_guid = "graph1"
+    client.model_backend = "pydantic"
+    monkeypatch.setattr("litegraph.configuration._client", client)
+    return client
+
+
+@pytest.fixture
+def data():
+    """Fixture providing random embeddings."""
+    rng = np.random.default_rng(0)
+    return rng.standard_normal((400, 16)).astype(np.float32)
+
+
+@pytest.mark.parametrize(
+    "metric, search_type",
+    [
+        ("Cosine", "CosineSimilarity"),
+        ("Euclidean", "EuclidianDistance"),
+        ("DotProduct", "DotProduct"),
+    ],
+)
+def test_recall(data, metric, search_type):
+    """Test that the index finds most of the exact nearest neighbours."""
+    index = LocalVectorIndex(
+        m=8, ef_construction=64, default_ef=64, distance_metric=metric, seed=1
+    )
+    index.add([str(i) for i in range(len(data))], data)
+    queries = data[:20] + 0.01
+    truth, _ = top_k(score(queries, data, search_type), 5, search_type)
+
+    found = 0
+    for query, expected in zip(queries, truth):
+        guids, distances = index.query(query, k=5)
+        assert distances == sorted(distances)
+        found += len({int(guid) for guid in guids} & set(expected.tolist()))
+    assert found / truth.size >= 0.9
+
+
+def test_from_config_and_validation():
+    """Test creating an index from the server's configuration."""
+    config = HnswLiteVectorIndexModel(
+        GraphGUID="graph1",
+        VectorDimensionality=16,
+        M=12,
+        EfConstruction=100,
+        DefaultEf=40,
+        DistanceMetric="Euclidean",
+    )
+    index = LocalVectorIndex.from_config(config)
+    assert (index.m, index.ef_construction, index.default_ef) == (12, 100, 40)
+    assert index.distance_metric == "Euclidean"
+    assert index.graph_guid == "graph1"
+    assert index.query([0.0] * 16) == ([], [])
+
+    with pytest.raises(ValueError):
+        LocalVectorIndex(distance_metric="Manhattan")
+    with pytest.raises(ValueError):
+        index.add(["v1"], np.zeros((1, 8)))
+
+
+def test_incremental_add_and_remove(data):
+    """Test adding, replacing and removing vectors."""
+    index = LocalVectorIndex(m=8, ef_construction=32, seed=1)
+    index.add([f"v{i}" for i in range(100)], data[:100])
+    index.add(["new"], data[200:201])
+    assert len(index) == 101
+    assert index.query(data[200], k=1)[0] == ["new"]
+
+    # Replacing a vector moves it
+    index.add(["new"], data[300:301])
+    assert len(index) == 101
+    assert index.query(data[300], k=1)[0] == ["new"]
+
+    assert index.remove(["new", "unknown"]) == 1
+    assert "new" not in index
+    assert "new" not in index.query(data[300], k=5)[0]
+
+
+def test_compaction(data):
+    """Test that deleted vectors are dropped once they pass the compaction fraction."""
+    index = LocalVectorIndex(m=8, ef_construction=32, seed=1)
+    guids = [f"v{i}" for i in range(100)]
+    index.add(guids, data[:100], node_guids=[f"n{i}" for i in range(100)])
+
+    index.remove(guids[:25])
+    assert len(index._deleted) == 25
+    assert len(index.guids) == 100
+
+    index.remove(guids[25:26])
+    assert index._deleted == set()
+    assert index.guids == guids[26:]
+    assert index.node_guids == [f"n{i}" for i in range(26, 100)]
+    assert len(index) == 74
+    for i in (26, 50, 99):
+        assert index.query(data[i], k=1)[0] == [f"v{i}"]
+
+    # Replaced vectors count as deleted too
+    index.add(guids[26:60], data[200:234])
+    assert len(index.guids) == 74
+    assert index.query(data[210], k=1)[0] == ["v36"]
+
+    index.remove(guids[26:])
+    assert index.query(data[0]) == ([], [])
+
+
+def test_build_sync_and_search(mock_client, data):
+    """Test building from the server and answering searches locally."""
+    records = [
+        {"GUID": f"v{i}", "NodeGUID": f"n{i}", "Vectors": data[i].tolist()}
+        for i in range(50)
+    ]
+    mock_client.request.return_value = json.dumps(records).encode()
+    config = HnswLiteVectorIndexModel(M=8, EfConstruction=32, DefaultEf=32)
+    index = LocalVectorIndex.build("graph1", config=config, seed=1)
+    assert len(index) == 50
+    assert mock_client.request.call_args[0][1].endswith("graphs/graph1/vectors/all")
+
+    results = index.search_vectors(VectorSearchDomainEnum.Node, data[3].tolist(), k=3)
+    assert len(results) == 3
+    assert isinstance(results[0], VectorSearchResultModel)
+    assert results[0].node.guid == "n3"
+    assert results[0].score == pytest.approx(1.0, abs=1e-5)
+    assert index.search_vectors(VectorSearchDomainEnum.Edge, data[3].tolist()) == []
+
+    # Sync picks up changed, new and deleted vectors
+    records[3]["Vectors"] = data[100].tolist()
+    records = records[1:] + [
+        {"GUID": "v99", "NodeGUID": "n99", "Vectors": data[99].tolist()}
+    ]
+    mock_client.request.return_value = json.dumps(records).encode()
+    assert index.sync() == 2
+    assert "v0" not in index and "v99" in index
+    assert index.query(data[100], k=1)[0] == ["v3"]
+
+
+def test_stale_index_falls_back_to_server(mock_client, data):
+    """Test that stale indexes and filtered searches go to the server."""
+    mock_client.tenant_guid = "550e8400-e29b-41d4-a716-446655440001"
+    index = LocalVectorIndex(graph_guid="550e8400-e29b-41d4-a716-446655440002", seed=1)
+    index.add(["v1"], data[:1], node_guids=["n1"])
+    mock_client.request.side_effect = None
+    mock_client.request.return_value = [
+        {"Score": 0.5, "Node": {"GUID": f"server{i}"}} for i in range(5)
+    ]
+
+    assert (
+        index.search_vectors(VectorSearchDomainEnum.Node, data[0].tolist())[0].node.guid
+        == "n1"
+    )
+    mock_client.request.assert_not_called()
+
+    results = index.search_vectors(
+        VectorSearchDomainEnum.Node, data[0].tolist(), k=2, labels=["x"]
+    )
+    assert [result.node.guid for result in results] == ["server0", "server1"]
+
+    index.mark_stale()
+    assert index.is_stale()
+    assert (
+        index.search_vectors(VectorSearchDomainEnum.Node, data[0].tolist())[0].node.guid
+        == "server0"
+    )
+    assert mock_client.request.call_count == 2
+
+    index = LocalVectorIndex(stale_after=0)
+    index._synced_at = 0
+    assert index.is_stale()
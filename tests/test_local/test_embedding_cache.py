@@ -0,0 +1,41 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from litegraph.local.embedding_cache import EmbeddingCache
+from litegraph.models.vector_matrix import VectorMatrix
+
+
+def test_add_and_lookup():
+    """Test adding, replacing and looking up embeddings."""
+    cache = EmbeddingCache()
+    cache.add(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+    cache.add(["b", "c", "c"], [[2.0, 2.0], [3.0, 3.0], [4.0, 4.0]])
+
+    assert len(cache) == 3
+    assert "c" in cache and "z" not in cache
+    embeddings, found = cache.lookup(["c", "z", "a", "b"])
+    assert found.tolist() == [True, False, True, True]
+    assert embeddings.tolist() == [[4.0, 4.0], [1.0, 0.0], [2.0, 2.0]]
+    assert embeddings.dtype == np.float32
+
+    with pytest.raises(ValueError):
+        cache.add(["d"], [[1.0, 2.0, 3.0]])
+    with pytest.raises(ValueError):
+        cache.add(["d", "e"], [[1.0, 2.0]])
+
+
+def test_from_matrix():
+    """Test building a cache from a downloaded vector matrix."""
+    matrix = VectorMatrix(
+        embeddings=np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32),
+        guids=np.array(["v1", "v2"], dtype=object),
+        node_guids=np.array(["n1", None], dtype=object),
+        edge_guids=np.array([None, "e1"], dtype=object),
+    )
+    cache = EmbeddingCache.from_matrix(matrix)
+    assert len(cache) == 1
+    assert cache.lookup(["n1"])[0].tolist() == [[1.0, 0.0]]
+
+    cache = EmbeddingCache.from_matrix(matrix, key="guids")
+    assert len(cache) == 2
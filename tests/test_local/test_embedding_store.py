@@ -0,0 +1,185 @@
+import multiprocessing
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from litegraph.local.embedding_store import EmbeddingStore
+from litegraph.models.vector_metadata import VectorMetadataModel
+
+
+def _vector(guid, node, values, updated="2024-01-01T00:00:00Z", edge=None):
+    return VectorMetadataModel(
+        GUID=guid,
+        NodeGUID=node,
+        EdgeGUID=edge,
+        Vectors=values,
+        Dimensionality=len(values),
+        LastUpdateUtc=updated,
+    )
+
+
+def _read_row(path, queue):
+    store = EmbeddingStore.open(path)
+    embeddings, _ = store.lookup(["n2"], key="node")
+    queue.put(embeddings.tolist())
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Create a mock client and configure it."""
+    from unittest.mock import Mock
+
+    client = Mock()
+    client.tenant_guid = "tenant1"
+    client.graph_guid = "graph1"
+    client.model_backend = "pydantic"
+    monkeypatch.setattr("litegraph.configuration._client", client)
+    return client
+
+
+def test_upsert_and_lookup(tmp_path):
+    """Test adding vectors and looking them up by each kind of GUID."""
+    store = EmbeddingStore(tmp_path / "store")
+    written = store.upsert(
+        [
+            _vector("v1", "n1", [1.0, 0.0]),
+            _vector("v2", "n2", [0.0, 1.0]),
+            _vector("v3", None, [1.0, 1.0], edge="e1"),
+        ]
+    )
+    assert written == 3
+    assert len(store) == 3 and "v2" in store
+    assert store.dimensionality == 2
+
+    embeddings, found = store.lookup(["n2", "missing", "n1"], key="node")
+    assert found.tolist() == [True, False, True]
+    assert embeddings.tolist() == [[0.0, 1.0], [1.0, 0.0]]
+    assert store.keyed("edge").lookup(["e1"])[0].tolist() == [[1.0, 1.0]]
+    assert store.lookup(["v3"])[0].dtype == np.float32
+
+    with pytest.raises(ValueError):
+        store.upsert([_vector("v4", "n4", [1.0, 2.0, 3.0])])
+    with pytest.raises(ValueError):
+        store.lookup(["v1"], key="graph")
+
+
+def test_upsert_uses_last_update(tmp_path):
+    """Test that only newer vectors are rewritten."""
+    store = EmbeddingStore(tmp_path / "store")
+    store.upsert([_vector("v1", "n1", [1.0, 0.0], "2024-01-02T00:00:00Z")])
+
+    assert store.upsert([_vector("v1", "n1", [5.0, 5.0], "2024-01-01T00:00:00Z")]) == 0
+    assert store.lookup(["v1"])[0].tolist() == [[1.0, 0.0]]
+
+    assert store.upsert([_vector("v1", "n9", [2.0, 2.0], "2024-01-03T00:00:00Z")]) == 1
+    assert store.lookup(["v1"])[0].tolist() == [[2.0, 2.0]]
+    assert store.lookup(["n1"], key="node")[1].tolist() == [False]
+    assert store.lookup(["n9"], key="node")[1].tolist() == [True]
+    assert len(store) == 1
+
+
+def test_growth_persistence_and_remove(tmp_path):
+    """Test growing past the initial capacity, reopening and removing."""
+    path = tmp_path / "store"
+    with EmbeddingStore(path, dimensionality=4) as store:
+        store.upsert(_vector(f"v{i}", f"n{i}", [float(i)] * 4) for i in range(3000))
+
+    store = EmbeddingStore(path)
+    assert len(store) == 3000
+    assert store.lookup(["n2999"], key="node")[0].tolist() == [[2999.0] * 4]
+    assert store.remove(["v0", "unknown"]) == 1
+    assert "v0" not in store
+    assert store.lookup(["n0"], key="node")[1].tolist() == [False]
+    store.upsert([_vector("v3000", "n3000", [1.0] * 4)])
+    store.flush()
+
+    readonly = EmbeddingStore.open(path)
+    assert isinstance(readonly.embeddings, np.memmap)
+    assert readonly.embeddings.shape == (3001, 4)
+    assert "v0" not in readonly
+    with pytest.raises(ValueError):
+        readonly.upsert([_vector("v1", "n1", [1.0] * 4)])
+    with pytest.raises(FileNotFoundError):
+        EmbeddingStore.open(tmp_path / "missing")
+    with pytest.raises(ValueError):
+        EmbeddingStore(path, dimensionality=8)
+
+
+def test_shared_across_processes(tmp_path):
+    """Test that another process can read the store."""
+    path = tmp_path / "store"
+    with EmbeddingStore(path) as store:
+        store.upsert([_vector("v1", "n1", [1.0, 0.0]), _vector("v2", "n2", [0.5, 0.5])])
+
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_read_row, args=(str(path), queue))
+    process.start()
+    process.join(timeout=60)
+    assert queue.get(timeout=5) == [[0.5, 0.5]]
+
+
+def test_sync(tmp_path, mock_client):
+    """Test refreshing a store from the vectors of a graph."""
+    mock_client.request.return_value = [
+        {
+            "GUID": "v1",
+            "NodeGUID": "n1",
+            "Vectors": [1.0, 0.0],
+            "LastUpdateUtc": "2024-01-01T00:00:00Z",
+        },
+        {
+            "GUID": "v2",
+            "NodeGUID": "n2",
+            "Vectors": [0.0, 1.0],
+            "LastUpdateUtc": "2024-01-01T00:00:00Z",
+        },
+    ]
+    store = EmbeddingStore(tmp_path / "store")
+    assert store.sync() == 2
+    assert store.sync() == 0
+    assert mock_client.request.call_args[0] == (
+        "GET",
+        "v1.0/tenants/tenant1/graphs/graph1/vectors/all",
+    )
+
+    mock_client.request.return_value = mock_client.request.return_value[:1]
+    store.sync(prune=True)
+    assert "v2" not in store and "v1" in store
+    assert len(EmbeddingStore.open(tmp_path / "store")) == 1
+
+
+def test_copy_on_write_and_compact(tmp_path):
+    """Test that rewrites leave published rows untouched until compaction."""
+    path = tmp_path / "store"
+    store = EmbeddingStore(path)
+    store.upsert([_vector("v1", "n1", [1.0, 0.0]), _vector("v2", "n2", [0.0, 1.0])])
+    store.flush()
+    reader = EmbeddingStore.open(path)
+
+    store.upsert([_vector("v1", "n1", [2.0, 2.0], "2024-01-02T00:00:00Z")])
+    store.remove(["v2"])
+    store.flush()
+    assert store.stale_rows == 2 and len(store) == 1
+    assert reader.lookup(["v1", "v2"])[0].tolist() == [[1.0, 0.0], [0.0, 1.0]]
+    assert store.lookup(["n1"], key="node")[0].tolist() == [[2.0, 2.0]]
+
+    assert store.compact() == 2
+    assert store.compact() == 0
+    assert store.stale_rows == 0 and store.embeddings.shape == (1, 2)
+    assert store.lookup(["n1"], key="node")[0].tolist() == [[2.0, 2.0]]
+    assert reader.lookup(["v1"])[0].tolist() == [[1.0, 0.0]]
+
+    reopened = EmbeddingStore.open(path)
+    assert len(reopened) == 1 and reopened.embeddings.shape == (1, 2)
+    assert reopened.lookup(["v1"])[0].tolist() == [[2.0, 2.0]]
+    store.upsert([_vector("v3", "n3", [3.0, 3.0])])
+    store.flush()
+    assert sorted(os.listdir(path)) == [
+        "embeddings.3.f32",
+        "index.4.npy",
+        "index.5.npy",
+        "meta.json",
+    ]
@@ -0,0 +1,189 @@
+import itertools
+from unittest.mock import Mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from litegraph.local.adjacency import GraphAdjacency
+from litegraph.local.routing import LocalRouter
+from litegraph.models.route_response import RouteResultModel
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Create a mock client and configure it."""
+    client = Mock()
+    client.tenant_guid = "tenant1"
+    client.graph_guid = None
+    monkeypatch.setattr("litegraph.configuration._client", client)
+    return client
+
+
+@pytest.fixture
+def router():
+    """Fixture providing a router over a small weighted graph.
+
+    a->b (1), b->d (5), a->c (2), c->d (1), b->c (1), a->d (9), c->d (3, parallel)
+    """
+    adjacency = GraphAdjacency.from_edges(
+        ["a", "b", "a", "c", "b", "a", "c"],
+        ["b", "d", "c", "d", "c", "d", "d"],
+        costs=[1, 5, 2, 1, 1, 9, 3],
+        edge_guids=["ab", "bd", "ac", "cd", "bc", "ad", "cd2"],
+        node_guids=["e"],
+    )
+    return LocalRouter(adjacency, graph_guid="graph1", tenant_guid="tenant1")
+
+
+def _edge_guids(router, path):
+    return [router.adjacency.edge_guids[edge] for edge in path[2]]
+
+
+def _all_paths(router, source, target):
+    """Enumerate the costs of all loopless paths by brute force."""
+    offsets, targets, costs, _ = router._out
+    found = []
+
+    def visit(node, visited, cost):
+        if node == target:
+            found.append(cost)
+            return
+        for position in range(offsets[node], offsets[node + 1]):
+            if targets[position] not in visited:
+                visit(
+                    targets[position],
+                    visited | {targets[position]},
+                    cost + costs[position],
+                )
+
+    visit(source, {source}, 0.0)
+    return sorted(found)
+
+
+def test_shortest_path(router):
+    """Test the three algorithms on a small graph."""
+    for algorithm in ("dijkstra", "bidirectional"):
+        path = router.shortest_path("a", "d", algorithm=algorithm)
+        assert path[0] == 3
+        assert _edge_guids(router, path) == ["ac", "cd"]
+        assert [router.adjacency.guids[node] for node in path[1]] == ["a", "c", "d"]
+
+    heuristic = Mock(return_value=0)
+    path = router.shortest_path("a", "d", algorithm="astar", heuristic=heuristic)
+    assert _edge_guids(router, path) == ["ac", "cd"]
+    heuristic.assert_any_call("a", "d")
+
+    assert router.shortest_path("d", "a") is None
+    assert router.shortest_path("a", "e", algorithm="bidirectional") is None
+    assert router.shortest_path("a", "a", algorithm="bidirectional")[0] == 0
+
+    with pytest.raises(KeyError):
+        router.shortest_path("a", "x")
+    with pytest.raises(ValueError):
+        router.shortest_path("a", "d", algorithm="astar")
+    with pytest.raises(ValueError):
+        router.shortest_path("a", "d", algorithm="bfs")
+
+
+def test_algorithms_agree_on_random_graph():
+    """Test that Dijkstra, bidirectional Dijkstra and A* find equal costs."""
+    rng = np.random.default_rng(3)
+    nodes = [f"n{i}" for i in range(60)]
+    sources = rng.choice(nodes, 300).tolist()
+    targets = rng.choice(nodes, 300).tolist()
+    costs = rng.integers(0, 20, 300).tolist()
+    router = LocalRouter(GraphAdjacency.from_edges(sources, targets, costs=costs))
+
+    for source, target in itertools.islice(itertools.permutations(nodes, 2), 400):
+        if source not in router.adjacency or target not in router.adjacency:
+            continue
+        expected = router.shortest_path(source, target)
+        for algorithm in ("bidirectional", "astar"):
+            path = router.shortest_path(
+                source, target, algorithm=algorithm, heuristic=lambda *_: 0
+            )
+            if expected is None:
+                assert path is None
+            else:
+                assert path[0] == expected[0]
+                assert sum(router._edge_costs[edge] for edge in path[2]) == path[0]
+
+
+def test_k_shortest_paths(router):
+    """Test Yen's algorithm against all loopless paths."""
+    paths = router.k_shortest_paths("a", "d", k=10)
+    source, target = router.adjacency.index_of("a"), router.adjacency.index_of("d")
+    assert [path[0] for path in paths] == _all_paths(router, source, target)
+    assert _edge_guids(router, paths[0]) == ["ac", "cd"]
+    assert len({tuple(path[2]) for path in paths}) == len(paths)
+
+    assert len(router.k_shortest_paths("a", "d", k=2)) == 2
+    assert router.k_shortest_paths("d", "a", k=3) == []
+    with pytest.raises(ValueError):
+        router.k_shortest_paths("a", "d", k=0)
+
+
+def test_routes_result_model(router, mock_client):
+    """Test that local routes come back in the server's result shape."""
+    result = router.routes("a", "d", k=2)
+    assert isinstance(result, RouteResultModel)
+    assert [route.TotalCost for route in result.Routes] == [3, 3]
+    edges = result.Routes[0].Edges
+    assert [edge.guid for edge in edges] == ["ac", "cd"]
+    assert (edges[0].from_node_guid, edges[0].to_node_guid, edges[0].cost) == (
+        "a",
+        "c",
+        2,
+    )
+    assert edges[0].graph_guid == "graph1"
+    assert router.routes("d", "a").Routes == []
+    mock_client.request.assert_not_called()
+
+
+def test_routes_fall_back_to_server(router, mock_client):
+    """Test that stale snapshots, filters and unknown nodes go to the server."""
+    mock_client.request.return_value = {
+        "Timestamp": {"TotalMs": 1.0},
+        "Routes": [{"TotalCost": 7, "Edges": []}, {"TotalCost": 8, "Edges": []}],
+    }
+
+    result = router.routes("a", "x")
+    assert [route.TotalCost for route in result.Routes] == [7]
+    method, url = mock_client.request.call_args[0]
+    assert method == "POST"
+    assert url.endswith("tenants/tenant1/graphs/graph1/routes")
+    assert mock_client.request.call_args[1]["json"]["From"] == "a"
+
+    router.routes("a", "d", edge_filter={"GraphGUID": "graph1"})
+    assert mock_client.request.call_args[1]["json"]["EdgeFilter"] is not None
+
+    router.mark_stale()
+    assert router.is_stale()
+    assert len(router.routes("a", "d", k=2).Routes) == 2
+    assert mock_client.request.call_count == 3
+
+    router.stale_after = 0
+    router._stale = False
+    router._synced_at -= 1
+    assert router.is_stale()
+
+
+def test_build_and_refresh(mock_client):
+    """Test loading the snapshot from the server."""
+    mock_client.request.return_value = (
+        b'[{"GUID": "e1", "From": "a", "To": "b", "Cost": 2}]'
+    )
+    router = LocalRouter.build("graph1", stale_after=3600)
+    assert router.tenant_guid == "tenant1"
+    assert not router.is_stale()
+    assert mock_client.request.call_args[0][1].endswith("graphs/graph1/edges/all")
+    assert router.shortest_path("a", "b")[0] == 2
+
+    mock_client.request.return_value = (
+        b'[{"GUID": "e2", "From": "a", "To": "b", "Cost": 1}]'
+    )
+    router.mark_stale()
+    router.refresh()
+    assert not router.is_stale()
+    assert router.routes("a", "b").Routes[0].Edges[0].guid == "e2"
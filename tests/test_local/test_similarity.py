@@ -0,0 +1,61 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from litegraph.enums.vector_search_type_enum import VectorSearchTypeEnum
+from litegraph.local.similarity import HIGHER_IS_BETTER, score, top_k
+
+
+@pytest.fixture
+def vectors():
+    """Fixture providing a query and candidate embeddings."""
+    query = np.array([1.0, 0.0], dtype=np.float32)
+    candidates = np.array([[2.0, 0.0], [0.0, 1.0], [1.0, 1.0]], dtype=np.float32)
+    return query, candidates
+
+
+@pytest.mark.parametrize(
+    "search_type, expected",
+    [
+        (VectorSearchTypeEnum.DotProduct, [2.0, 0.0, 1.0]),
+        (VectorSearchTypeEnum.CosineSimilarity, [1.0, 0.0, 2**-0.5]),
+        (VectorSearchTypeEnum.CosineDistance, [0.0, 1.0, 1 - 2**-0.5]),
+        (VectorSearchTypeEnum.EuclidianDistance, [1.0, 2**0.5, 1.0]),
+        (VectorSearchTypeEnum.EuclidianSimilarity, [0.5, 1 / (1 + 2**0.5), 0.5]),
+    ],
+)
+def test_score(vectors, search_type, expected):
+    """Test the exact metrics against hand-computed values."""
+    query, candidates = vectors
+    np.testing.assert_allclose(
+        score(query, candidates, search_type), expected, atol=1e-6
+    )
+
+    batch = score(np.stack([query, query]), candidates, search_type)
+    assert batch.shape == (2, 3)
+    np.testing.assert_allclose(batch[1], expected, atol=1e-6)
+
+
+def test_top_k_direction(vectors):
+    """Test that similarities are ranked descending and distances ascending."""
+    query, candidates = vectors
+    for search_type in VectorSearchTypeEnum:
+        scores = score(query, candidates, search_type)
+        indices, selected = top_k(scores, 2, search_type)
+        assert indices.tolist()[0] == 0
+        if search_type in HIGHER_IS_BETTER:
+            assert selected[0] >= selected[1]
+        else:
+            assert selected[0] <= selected[1]
+
+
+def test_top_k_matches_full_sort():
+    """Test that top_k agrees with a full sort on random data."""
+    rng = np.random.default_rng(0)
+    scores = rng.random((4, 50))
+    indices, selected = top_k(scores, 5, VectorSearchTypeEnum.DotProduct)
+    np.testing.assert_array_equal(indices, np.argsort(-scores, axis=1)[:, :5])
+    np.testing.assert_array_equal(selected, -np.sort(-scores, axis=1)[:, :5])
+
+    indices, _ = top_k(scores[0], 100, VectorSearchTypeEnum.EuclidianDistance)
+    assert indices.tolist() == np.argsort(scores[0]).tolist()
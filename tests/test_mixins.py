@@ -1,3 +1,4 @@
+import json
 import uuid
 from typing import Optional
 from unittest.mock import Mock, patch
@@ -329,6 +330,10 @@ def test_create_multiple_resources(mock_client):
     assert called_args[0][0] == "PUT"
     assert "bulk" in called_args[0][1]
 
+    # Test with an explicit graph GUID
+    ResourceModel.create_multiple(test_data, graph_guid="other-graph")
+    assert "graphs/other-graph/" in mock_client.request.call_args[0][1]
+
 
 def test_delete_all_resources(mock_client):
     """Test DeleteAllAPIResource mixin."""
@@ -1889,3 +1894,68 @@ def test_deletable_all_endpoint_mixin_delete_for_graph_exception_handling(mock_c
     mock_client.request.side_effect = ValueError("Invalid graph GUID")
     with pytest.raises(ValueError, match="Invalid graph GUID"):
         TestGraphResource.delete_for_graph()
+
+
+def test_search_and_retrieve_all_with_fields(mock_client):
+    """Test field projection on search and retrieve_all."""
+    record = {"id": "test-id", "name": "Test Resource", "data": {"key": "value"}}
+
+    mock_client.request.return_value = {"results": [record]}
+    result = ResourceModel.search(graph_id="test-graph-guid", fields=["id", "name"])
+    assert result.results[0].name == "Test Resource"
+    assert result.results[0].data is None
+    sent = mock_client.request.call_args[1]["data"]
+    assert b'"IncludeData": false' in sent
+
+    mock_client.request.return_value = [record]
+    result = ResourceModel.retrieve_all(fields=["id", "data"])
+    assert result[0].data == {"key": "value"}
+    assert result[0].name is None
+    mock_client.request.assert_called_with(
+        "GET",
+        "v1.0/tenants/test-tenant-guid/graphs/test-graph-guid/test-resources?incldata",
+    )
+
+
+def test_create_multiple_with_model_instances(mock_client):
+    """Test that model instances are serialized once without re-validation."""
+    models = [
+        MockModel(id="test-id-1", name="One"),
+        MockModel(id="test-id-2", name="Two"),
+    ]
+    mock_client.request.return_value = [m.model_dump() for m in models]
+    mock_client.request.side_effect = None
+
+    result = ResourceModel.create_multiple(models)
+    assert [item.id for item in result] == ["test-id-1", "test-id-2"]
+    kwargs = mock_client.request.call_args[1]
+    assert "json" not in kwargs
+    assert json.loads(kwargs["content"]) == [m.model_dump(mode="json") for m in models]
+
+
+def test_create_multiple_without_validation(mock_client):
+    """Test sending trusted dicts and pre-encoded bytes as-is."""
+    records = [{"id": "test-id-1", "unexpected": True}]
+    mock_client.request.return_value = [{"id": "test-id-1"}]
+    mock_client.request.side_effect = None
+
+    ResourceModel.create_multiple(records, validate=False)
+    assert mock_client.request.call_args[1]["json"] is not None
+    assert mock_client.request.call_args[1]["json"][0] is records[0]
+
+    body = b'[{"id": "test-id-1"}]'
+    ResourceModel.create_multiple(body)
+    assert mock_client.request.call_args[1]["content"] == body
+
+
+def test_create_resource_with_model_instance(mock_client):
+    """Test creating a resource from a model instance."""
+    model = MockModel(id="test-id", name="Test")
+    mock_client.request.return_value = model.model_dump()
+    mock_client.request.side_effect = None
+
+    result = ResourceModel.create(model)
+    assert result.id == "test-id"
+    assert mock_client.request.call_args[1]["json"] == model.model_dump(
+        mode="json", by_alias=True, exclude_unset=True
+    )
@@ -0,0 +1,86 @@
+import threading
+import time
+
+import pytest
+from litegraph.utils.concurrency import _iter_concurrent, _map_concurrent
+
+
+def test_map_concurrent_preserves_order():
+    """Test that results come back in input order."""
+
+    def slow_square(value):
+        time.sleep(0.01 * (5 - value))
+        return value * value
+
+    assert _map_concurrent(slow_square, range(5), max_concurrency=5) == [0, 1, 4, 9, 16]
+    assert _map_concurrent(slow_square, [], max_concurrency=5) == []
+
+
+def test_map_concurrent_bounds_concurrency():
+    """Test that no more than max_concurrency calls run at once."""
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def task(value):
+        with lock:
+            running.append(value)
+            peak.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(value)
+        return value
+
+    _map_concurrent(task, range(12), max_concurrency=3)
+    assert max(peak) <= 3
+
+
+def test_map_concurrent_propagates_errors():
+    """Test that exceptions are re-raised and invalid limits are rejected."""
+
+    def fail(value):
+        if value == 2:
+            raise RuntimeError("boom")
+        return value
+
+    with pytest.raises(RuntimeError):
+        _map_concurrent(fail, range(4), max_concurrency=2)
+    with pytest.raises(ValueError):
+        _map_concurrent(fail, range(4), max_concurrency=0)
+
+
+def test_iter_concurrent_yields_results_and_errors():
+    """Test that results and errors are yielded as calls complete."""
+
+    def task(value):
+        if value == 2:
+            raise ValueError("two")
+        time.sleep(0.01 * value)
+        return value * 10
+
+    outcomes = {
+        item: (result, error)
+        for item, result, error in _iter_concurrent(task, range(4), 4)
+    }
+    assert outcomes[0] == (0, None)
+    assert outcomes[3] == (30, None)
+    assert outcomes[2][0] is None and isinstance(outcomes[2][1], ValueError)
+    assert list(_iter_concurrent(task, [], 4)) == []
+    with pytest.raises(ValueError):
+        list(_iter_concurrent(task, [1], 0))
+
+
+def test_iter_concurrent_close_cancels_pending():
+    """Test that closing the generator early cancels calls not yet started."""
+    started = []
+
+    def task(value):
+        started.append(value)
+        time.sleep(0.01)
+        return value
+
+    results = _iter_concurrent(task, range(20), max_concurrency=1)
+    next(results)
+    results.close()
+    time.sleep(0.05)
+    assert len(started) < 20
@@ -315,4 +315,244 @@ def test_graph_retrieve_subgraph_statistics(mock_client):
         "Vectors": 2
     }
     mock_client.request.return_value = mock_response
-    result = Graph.retrieve_subgraph_statistics(graph_guid="test-graph-guid", node_guid="test-node-guid")
\ No newline at end of file
+    result = Graph.retrieve_subgraph_statistics(graph_guid="test-graph-guid", node_guid="test-node-guid")
+
+@pytest.mark.parametrize("use_msgspec", [True, False])
+def test_load_adjacency(mock_client, monkeypatch, use_msgspec):
+    """Test that edges are downloaded into a CSR snapshot."""
+    pytest.importorskip("numpy")
+    import json
+
+    if not use_msgspec:
+        monkeypatch.setattr("litegraph.resources.graphs.find_spec", lambda name: None)
+    mock_client.tenant_guid = "tenant"
+    edges = [
+        {"GUID": "e1", "From": "a", "To": "b", "Cost": 3, "Name": "x", "Data": {}},
+        {"GUID": "e2", "From": "b", "To": "c"},
+    ]
+    nodes = [{"GUID": "a"}, {"GUID": "b"}, {"GUID": "c"}, {"GUID": "lonely"}]
+    mock_client.request.side_effect = lambda method, url, raw=False: json.dumps(
+        nodes if url.endswith("nodes/all") else edges
+    ).encode()
+
+    adjacency = Graph.load_adjacency("graph", include_isolated=True)
+    assert mock_client.request.call_args_list[0].args == (
+        "GET",
+        "v1.0/tenants/tenant/graphs/graph/edges/all",
+    )
+    assert adjacency.children("a") == ["b"]
+    assert adjacency.parents("c") == ["b"]
+    assert adjacency.edges_from("a") == ["e1"]
+    assert adjacency.out_costs.tolist() == [3, 0]
+    assert "lonely" in adjacency
+
+    mock_client.request.reset_mock()
+    assert len(Graph.load_adjacency()) == 3
+    assert mock_client.request.call_count == 1
+
+    mock_client.tenant_guid = None
+    with pytest.raises(ValueError):
+        Graph.load_adjacency("graph")
+
+
+@pytest.mark.parametrize("backend", ["pydantic", "msgspec"])
+def test_to_matrices(mock_client, backend):
+    """Test that paged nodes and edges are exported as matrices."""
+    pytest.importorskip("numpy")
+    import json
+
+    if backend == "msgspec":
+        pytest.importorskip("msgspec")
+    mock_client.tenant_guid = "tenant"
+    mock_client.model_backend = backend
+    nodes = [
+        {
+            "GUID": "a",
+            "Labels": ["person"],
+            "Tags": {"team": "red", "level": "1"},
+            "Vectors": [
+                {"Model": "other", "Vectors": [9.0, 9.0]},
+                {"Model": "mini", "Vectors": [1.0, 2.0]},
+            ],
+        },
+        {"GUID": "b", "Labels": ["person", "admin"], "Tags": {"team": "blue"}},
+        {"GUID": "c", "Vectors": [{"Model": "mini", "Vectors": [3.0, 4.0]}]},
+    ]
+    edges = [
+        {"GUID": "e1", "From": "a", "To": "b", "Cost": 2},
+        {"GUID": "e2", "From": "b", "To": "c", "Cost": 5},
+        {"GUID": "e3", "From": "c", "To": "late", "Cost": 1},
+    ]
+    requests = []
+
+    def request(method, url, raw=False, json=None):
+        requests.append((url, json))
+        records = nodes if url.endswith("/nodes") else edges
+        start = int(json.get("ContinuationToken") or 0)
+        stop = start + json["MaxResults"]
+        page = {
+            "Objects": records[start:stop],
+            "ContinuationToken": str(stop) if stop < len(records) else None,
+            "EndOfResults": stop >= len(records),
+        }
+        return _json.dumps(page).encode() if raw else page
+
+    _json = json
+    mock_client.request.side_effect = request
+
+    matrices = Graph.to_matrices("graph", page_size=2, vector_model="mini")
+    assert [url for url, _ in requests] == [
+        "v2.0/tenants/tenant/graphs/graph/nodes",
+        "v2.0/tenants/tenant/graphs/graph/nodes",
+        "v2.0/tenants/tenant/graphs/graph/edges",
+        "v2.0/tenants/tenant/graphs/graph/edges",
+    ]
+    assert requests[0][1]["MaxResults"] == 2
+    assert requests[0][1]["IncludeSubordinates"] is True
+    assert requests[1][1]["ContinuationToken"] == "2"
+    assert "IncludeSubordinates" not in requests[2][1]
+
+    assert matrices.node_guids.tolist() == ["a", "b", "c", "late"]
+    assert matrices.edge_guids.tolist() == ["e1", "e2", "e3"]
+    assert matrices.sources.tolist() == [0, 1, 2]
+    assert matrices.targets.tolist() == [1, 2, 3]
+    assert matrices.costs.tolist() == [2, 5, 1]
+    assert matrices.features.tolist() == [[1, 2], [0, 0], [3, 4], [0, 0]]
+    assert matrices.has_features.tolist() == [True, False, True, False]
+    assert matrices.label_names == ["person", "admin"]
+    assert matrices.labels.tolist() == [[1, 0], [1, 1], [0, 0], [0, 0]]
+    assert matrices.tag_names == ["team=red", "level=1", "team=blue"]
+    assert matrices.tags[:, 2].tolist() == [0, 1, 0, 0]
+
+    indptr, indices, data = matrices.csr(weighted=False)
+    assert indptr.tolist() == [0, 1, 2, 3, 3]
+    assert indices.tolist() == [1, 2, 3]
+    assert data.tolist() == [1, 1, 1]
+
+    requests.clear()
+    matrices = Graph.to_matrices(
+        "graph", include_features=False, tag_keys=["level"], page_size=1000
+    )
+    assert len(requests) == 2
+    assert matrices.features is None
+    assert matrices.tag_names == ["level=1"]
+
+    mismatched = [{"GUID": "x", "Vectors": [{"Vectors": [1.0]}]}]
+    nodes[:] = nodes[:1] + mismatched
+    with pytest.raises(ValueError):
+        Graph.to_matrices("graph", page_size=1)
+
+
+def test_graph_matrices_to_scipy():
+    """Test conversion of the adjacency to a SciPy CSR matrix."""
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    from litegraph.models.graph_matrices import GraphMatrices
+
+    matrices = GraphMatrices(
+        node_guids=np.array(["a", "b", "c"], dtype=object),
+        edge_guids=np.array(["e1", "e2", "e3"], dtype=object),
+        sources=np.array([2, 0, 0], dtype=np.int32),
+        targets=np.array([0, 2, 1], dtype=np.int32),
+        costs=np.array([3, 1, 2], dtype=np.float32),
+        features=None,
+        has_features=np.zeros(3, dtype=bool),
+        label_names=[],
+        labels=np.zeros((3, 0), dtype=np.uint8),
+        tag_names=[],
+        tags=np.zeros((3, 0), dtype=np.uint8),
+    )
+    matrix = matrices.to_scipy()
+    assert matrix.shape == (3, 3)
+    assert matrix.toarray().tolist() == [[0, 2, 1], [0, 0, 0], [3, 0, 0]]
+
+
+@pytest.mark.parametrize("backend", ["pydantic", "msgspec"])
+def test_retrieve_subgraphs(mock_client, backend):
+    """Test that overlapping subgraphs share one copy of each node and edge."""
+    if backend == "msgspec":
+        pytest.importorskip("msgspec")
+    mock_client.tenant_guid = "tenant"
+    mock_client.model_backend = backend
+    subgraphs = {
+        "a": {
+            "Nodes": [{"GUID": "a"}, {"GUID": "b"}],
+            "Edges": [{"GUID": "ab", "From": "a", "To": "b"}],
+        },
+        "b": {
+            "Nodes": [{"GUID": "b"}, {"GUID": "a"}, {"GUID": "c"}],
+            "Edges": [
+                {"GUID": "ab", "From": "a", "To": "b"},
+                {"GUID": "bc", "From": "b", "To": "c"},
+            ],
+        },
+    }
+    urls = []
+
+    def request(method, url):
+        urls.append(url)
+        return subgraphs[url.split("/nodes/")[1].split("/")[0]]
+
+    mock_client.request.side_effect = request
+
+    batch = Graph.retrieve_subgraphs(
+        "graph", ["b", "a", "b"], max_depth=2, include_data=True, max_concurrency=2
+    )
+    assert len(urls) == 2
+    assert sorted(url.split("&")[0] for url in urls) == [
+        "v1.0/tenants/tenant/graphs/graph/nodes/a/subgraph?maxDepth=2",
+        "v1.0/tenants/tenant/graphs/graph/nodes/b/subgraph?maxDepth=2",
+    ]
+    assert all("incldata" in url and "inclsub" not in url for url in urls)
+    assert batch.seeds == ["b", "a"]
+    assert sorted(batch.node_guids) == ["a", "b", "c"]
+    assert sorted(batch.edge_guids) == ["ab", "bc"]
+    assert len(batch.nodes) == 3 and len(batch.edges) == 2
+    nodes, edges = batch.subgraph("b")
+    assert [node.guid for node in nodes] == ["b", "a", "c"]
+    assert [edge.guid for edge in edges] == ["ab", "bc"]
+    expected = "NodeStruct" if backend == "msgspec" else "NodeModel"
+    assert all(type(node).__name__ == expected for node in nodes)
+    # Shared records are the same model instance in both subgraphs
+    assert batch.subgraph("a")[1][0] is edges[0]
+    assert "c" not in batch
+
+    mock_client.request.side_effect = RuntimeError("boom")
+    with pytest.raises(RuntimeError):
+        Graph.retrieve_subgraphs("graph", ["a"])
+
+
+def test_retrieve_subgraphs_local(mock_client):
+    """Test ego networks expanded over a local snapshot."""
+    pytest.importorskip("numpy")
+    from litegraph.local.adjacency import GraphAdjacency
+
+    adjacency = GraphAdjacency.from_edges(
+        ["a", "b", "c", "d", "x"],
+        ["b", "c", "d", "e", "a"],
+        edge_guids=["ab", "bc", "cd", "de", "xa"],
+    )
+    batch = Graph.retrieve_subgraphs(None, ["b", "d"], adjacency=adjacency)
+    mock_client.request.assert_not_called()
+    assert batch.nodes is None
+    nodes, edges = batch.subgraph("b")
+    assert sorted(nodes) == ["a", "b", "c", "d", "x"]
+    assert sorted(edges) == ["ab", "bc", "cd", "xa"]
+    nodes, edges = batch.subgraph("d")
+    assert sorted(nodes) == ["b", "c", "d", "e"]
+    assert sorted(edges) == ["bc", "cd", "de"]
+    assert sorted(batch.node_guids) == ["a", "b", "c", "d", "e", "x"]
+
+    nodes, edges = Graph.retrieve_subgraphs(
+        None, ["b"], max_depth=None, adjacency=adjacency
+    ).subgraph("b")
+    assert len(nodes) == 6 and len(edges) == 5
+
+    nodes, edges = Graph.retrieve_subgraphs(
+        None, ["b"], max_nodes=2, max_edges=1, adjacency=adjacency
+    ).subgraph("b")
+    assert nodes == ["b", "c"]
+    assert edges == ["bc"]
+
+    with pytest.raises(KeyError):
+        Graph.retrieve_subgraphs(None, ["missing"], adjacency=adjacency)
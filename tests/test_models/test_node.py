@@ -296,3 +296,139 @@ def test_node_enumerate_with_query_empty_result(mock_client):
     assert len(result.objects) == 0
     assert result.end_of_results is True
     mock_client.request.assert_called_once()
+
+
+def test_node_enumerate_with_query_fields(mock_client):
+    """Test that a field projection drops unwanted keys and pushes down flags."""
+    mock_client.request.return_value = {
+        "Success": True,
+        "MaxResults": 5,
+        "EndOfResults": True,
+        "TotalRecords": 1,
+        "Objects": [
+            {
+                "GUID": "node1",
+                "TenantGUID": "tenant1",
+                "GraphGUID": "graph1",
+                "Name": "Node 1",
+                "Data": {"key": "value"},
+                "Labels": ["TestLabel"],
+                "Tags": {"type": "test", "owner": "me"},
+            }
+        ],
+    }
+
+    from litegraph.models.expression import ExprModel
+    from litegraph.enums.operator_enum import Opertator_Enum
+
+    result = Node.enumerate_with_query(
+        include_data=True,
+        expr=ExprModel(Left="field", Operator=Opertator_Enum.Equals, Right="value"),
+        fields=["guid", "labels", "tags.type"],
+    )
+
+    node = result.objects[0]
+    assert node.guid == "node1"
+    assert node.tenant_guid == "tenant1"
+    assert node.graph_guid == "graph1"
+    assert node.labels == ["TestLabel"]
+    assert node.tags == {"type": "test"}
+    # The explicit include_data=True keeps Data despite the projection
+    assert node.data == {"key": "value"}
+    assert node.name is None
+    assert node.is_projected()
+    body = mock_client.request.call_args[1]["json"]
+    assert body["IncludeData"] is True
+    assert body["IncludeSubordinates"] is True
+
+    # Fields left out of the projection are never sent back as real values
+    node.labels = ["Changed"]
+    with pytest.raises(ValueError):
+        Node.update_changed(node)
+    mock_client.request.return_value = {"GUID": "node1", "Labels": ["Changed"]}
+    Node.update_changed(node, partial=True)
+    assert mock_client.request.call_args[1]["json"] == {
+        "GUID": "node1",
+        "Labels": ["Changed"],
+    }
+
+
+def test_node_retrieve_many_fields(mock_client):
+    """Test retrieving many nodes with a field projection."""
+    mock_client.request.return_value = [
+        {"GUID": "node1", "Name": "Node 1", "Data": {"key": "value"}},
+        {"GUID": "node2", "Name": "Node 2", "Data": {"key": "value"}},
+    ]
+
+    result = Node.retrieve_many(["node1", "node2"], graph_guid="graph1", fields=["name"])
+
+    assert [node.name for node in result] == ["Node 1", "Node 2"]
+    assert all(node.data is None for node in result)
+
+
+def test_node_retrieve_with_msgspec_backend(mock_client):
+    """Test that the msgspec backend decodes raw bytes into structs."""
+    pytest.importorskip("msgspec")
+    from litegraph.models.structs import NodeStruct
+
+    mock_client.tenant_guid = "tenant1"
+    mock_client.graph_guid = "graph1"
+    mock_client.model_backend = "msgspec"
+    mock_client.request.return_value = b'{"GUID": "node1", "Name": "Node 1"}'
+
+    node = Node.retrieve("node1")
+
+    assert isinstance(node, NodeStruct)
+    assert node.name == "Node 1"
+    assert mock_client.request.call_args[1]["raw"] is True
+
+    mock_client.request.return_value = b'[{"GUID": "node1"}, {"GUID": "node2"}]'
+    nodes = Node.retrieve_all_graph_nodes("tenant1", "graph1")
+    assert [node.guid for node in nodes] == ["node1", "node2"]
+
+    # Writes return structs too
+    mock_client.request.return_value = b'{"GUID": "node1", "Name": "Created"}'
+    node = Node.create(name="Created")
+    assert isinstance(node, NodeStruct)
+    assert mock_client.request.call_args[1]["raw"] is True
+
+    mock_client.request.return_value = b'{"GUID": "node1", "Name": "Updated"}'
+    node = Node.update("node1", name="Updated")
+    assert isinstance(node, NodeStruct)
+    assert node.name == "Updated"
+
+
+def test_node_update_changed(mock_client):
+    """Test updating a node with only its changed fields."""
+    mock_client.tenant_guid = "tenant1"
+    mock_client.graph_guid = "graph1"
+    response = {
+        "GUID": "node1",
+        "TenantGUID": "tenant1",
+        "GraphGUID": "graph1",
+        "Name": "Node 1",
+        "Data": {"big": list(range(100))},
+        "Tags": {"type": "test"},
+    }
+    mock_client.request.return_value = response
+    node = Node.retrieve("node1")
+    mock_client.request.reset_mock()
+
+    # Nothing changed: no request is made
+    assert Node.update_changed(node) is node
+    mock_client.request.assert_not_called()
+
+    node.tags["type"] = "updated"
+    mock_client.request.return_value = {**response, "Tags": {"type": "updated"}}
+
+    result = Node.update_changed(node, partial=True)
+    assert result.tags == {"type": "updated"}
+    args, kwargs = mock_client.request.call_args
+    assert args == ("PUT", "v1.0/tenants/tenant1/graphs/graph1/nodes/node1")
+    assert kwargs["json"] == {"GUID": "node1", "Tags": {"type": "updated"}}
+
+    Node.update_changed(node)
+    assert mock_client.request.call_args[1]["json"]["Data"] is response["Data"]
+
+    with pytest.raises(TypeError):
+        Node.update_changed({"GUID": "node1"})
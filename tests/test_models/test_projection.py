@@ -0,0 +1,104 @@
+import pytest
+from litegraph.models.node import NodeModel
+from litegraph.utils.projection import (
+    _project_record,
+    _project_records,
+    _resolve_projection,
+)
+
+
+@pytest.fixture
+def node_record():
+    return {
+        "GUID": "node1",
+        "GraphGUID": "graph1",
+        "Name": "Node 1",
+        "Data": {"payload": "x" * 100},
+        "Labels": ["a", "b"],
+        "Tags": {"color": "red", "size": "large"},
+        "Vectors": [{"Vectors": [0.1, 0.2]}],
+    }
+
+
+def test_no_projection_returns_record_unchanged(node_record):
+    """Test that a missing projection leaves records untouched."""
+    assert _resolve_projection(NodeModel, None) is None
+    assert _project_record(node_record, None) is node_record
+    assert _project_records([node_record], None) == [node_record]
+
+
+def test_projection_accepts_names_and_aliases(node_record):
+    """Test that attribute names and API aliases resolve to the same keys."""
+    by_name = _resolve_projection(NodeModel, ["labels", "name"])
+    by_alias = _resolve_projection(NodeModel, ["Labels", "Name"])
+    assert (
+        by_name.keys
+        == by_alias.keys
+        == {
+            "GUID",
+            "TenantGUID",
+            "GraphGUID",
+            "Labels",
+            "Name",
+        }
+    )
+    assert _project_record(node_record, by_name) == {
+        "GUID": "node1",
+        "GraphGUID": "graph1",
+        "Name": "Node 1",
+        "Labels": ["a", "b"],
+    }
+
+
+def test_projection_push_down_flags():
+    """Test that include flags follow the requested fields."""
+    projection = _resolve_projection(NodeModel, ["guid", "name"])
+    assert projection.include_data is False
+    assert projection.include_subordinates is False
+
+    projection = _resolve_projection(NodeModel, ["data", "tags"])
+    assert projection.include_data is True
+    assert projection.include_subordinates is True
+
+
+def test_projection_single_tag(node_record):
+    """Test selecting a single tag key."""
+    projection = _resolve_projection(NodeModel, ["labels", "tags.color"])
+    projected = _project_record(node_record, projection)
+    assert projected["Tags"] == {"color": "red"}
+    assert "Data" not in projected
+    assert "Vectors" not in projected
+
+    # A bare tags request keeps all tags
+    projection = _resolve_projection(NodeModel, ["tags.color", "tags"])
+    assert _project_record(node_record, projection)["Tags"] == node_record["Tags"]
+
+
+def test_projection_unknown_field():
+    """Test that unknown fields are rejected."""
+    with pytest.raises(ValueError):
+        _resolve_projection(NodeModel, ["not_a_field"])
+
+
+def test_projection_string_and_non_dict_records():
+    """Test that a single string is accepted and non-dict records pass through."""
+    projection = _resolve_projection(NodeModel, "name")
+    assert projection.keys == {"GUID", "TenantGUID", "GraphGUID", "Name"}
+    assert _project_record("raw", projection) == "raw"
+    assert _project_records(None, projection) is None
+
+
+def test_projection_explicit_include_flags(node_record):
+    """Test that explicit include flags are honoured rather than overridden."""
+    projection = _resolve_projection(NodeModel, ["name"], include_data=True)
+    assert projection.include_data is True
+    assert _project_record(node_record, projection)["Data"] == node_record["Data"]
+
+    projection = _resolve_projection(NodeModel, ["name"], include_subordinates=True)
+    assert projection.include_subordinates is True
+    assert {"Labels", "Tags", "Vectors"} <= projection.keys
+
+    with pytest.raises(ValueError):
+        _resolve_projection(NodeModel, ["data"], include_data=False)
+    with pytest.raises(ValueError):
+        _resolve_projection(NodeModel, ["tags"], include_subordinates=False)
@@ -0,0 +1,237 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import httpx
+import pytest
+from litegraph.exceptions import SdkException
+from litegraph.models.vector_index_statistics import VectorIndexStatisticsModel
+from litegraph.resources.vector_index import VectorIndex
+from litegraph.utils.rebuild import (
+    ChangedSinceRebuildPolicy,
+    ChangeThresholdPolicy,
+    RebuildOperation,
+    RebuildPolicy,
+)
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def stats(**fields):
+    return {"VectorCount": 100, "IsLoaded": True, **fields}
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Create a mock client and configure it."""
+    client = Mock()
+    client.tenant_guid = "test-tenant-guid"
+    client.graph_guid = "test-graph-guid"
+    monkeypatch.setattr("litegraph.configuration._client", client)
+    return client
+
+
+def route(client, rebuild=None, stats_sequence=None):
+    """Answer rebuild POSTs with ``rebuild`` and stats GETs from a sequence."""
+    responses = iter(stats_sequence or [])
+    last = [stats()]
+
+    def request(method, url, **kwargs):
+        if method == "POST":
+            return rebuild() if rebuild else None
+        last[0] = next(responses, last[0])
+        return last[0]
+
+    client.request.side_effect = request
+
+
+def test_rebuild_timeout(mock_client):
+    """Test that rebuild passes an explicit request timeout only when given."""
+    mock_client.request.return_value = None
+    VectorIndex.rebuild("test-graph-guid")
+    assert mock_client.request.call_args.kwargs == {"retry": False}
+
+    VectorIndex.rebuild("test-graph-guid", timeout=None)
+    assert mock_client.request.call_args.kwargs == {"retry": False, "timeout": None}
+
+
+def test_rebuild_async_completes(mock_client):
+    """Test that the operation resolves once the request returned and the index loaded."""
+    # LastRebuildUtc never moves, so only the returned request signals completion.
+    release = threading.Event()
+    route(
+        mock_client,
+        rebuild=release.wait,
+        stats_sequence=[
+            stats(),
+            stats(IsLoaded=False, VectorCount=10),
+            stats(IsLoaded=False, VectorCount=50),
+            stats(VectorCount=120),
+        ],
+    )
+    progress = []
+    done = []
+    operation = VectorIndex.rebuild_async(
+        "test-graph-guid", poll_interval=0.01, max_poll_interval=0.02
+    )
+    operation.add_progress_callback(lambda current: progress.append(current))
+    operation.add_done_callback(done.append)
+
+    assert not operation.done()
+    release.set()
+    result = operation.result(timeout=5)
+
+    assert result.vector_count == 120
+    assert operation.stats is result
+    assert not operation.skipped
+    assert done == [operation]
+    assert progress[-1] is result
+    methods = [call.args[0] for call in mock_client.request.call_args_list]
+    assert methods.count("POST") == 1
+    assert mock_client.request.call_args_list[methods.index("POST")].kwargs == {
+        "retry": False,
+        "timeout": 60.0,
+    }
+
+
+def test_rebuild_async_completes_by_polling(mock_client):
+    """Test that a hanging or timed out request does not block completion."""
+    release = threading.Event()
+    before = (NOW - timedelta(hours=1)).isoformat()
+    route(
+        mock_client,
+        rebuild=release.wait,
+        stats_sequence=[
+            stats(LastRebuildUtc=before),
+            stats(IsLoaded=False, LastRebuildUtc=before),
+            stats(VectorCount=120, LastRebuildUtc=NOW.isoformat()),
+        ],
+    )
+    operation = VectorIndex.rebuild_async("test-graph-guid", poll_interval=0.01)
+    assert operation.result(timeout=5).vector_count == 120
+    release.set()
+
+    def timed_out():
+        try:
+            raise httpx.ReadTimeout("timed out")
+        except httpx.ReadTimeout:
+            raise SdkException("Request failed after 3 attempts: timed out")
+
+    route(
+        mock_client,
+        rebuild=timed_out,
+        stats_sequence=[
+            stats(LastRebuildUtc=before),
+            stats(VectorCount=130, LastRebuildUtc=NOW.isoformat()),
+        ],
+    )
+    operation = VectorIndex.rebuild_async(
+        "test-graph-guid", poll_interval=0.01, request_timeout=0.5
+    )
+    assert operation.result(timeout=5).vector_count == 130
+    posts = [c for c in mock_client.request.call_args_list if c.args[0] == "POST"]
+    assert posts[-1].kwargs == {"retry": False, "timeout": 0.5}
+
+
+def test_rebuild_async_is_awaitable(mock_client):
+    """Test that the operation can be awaited."""
+    route(mock_client)
+
+    async def wait():
+        return await VectorIndex.rebuild_async("test-graph-guid", poll_interval=0.01)
+
+    assert asyncio.run(wait()).vector_count == 100
+
+
+def test_rebuild_async_skipped_by_policy(mock_client):
+    """Test that no rebuild is sent when the policy declines."""
+    route(
+        mock_client,
+        stats_sequence=[
+            stats(LastRebuildUtc=NOW.isoformat(), LastAddUtc=NOW.isoformat())
+        ],
+    )
+    operation = VectorIndex.rebuild_async(
+        "test-graph-guid", policy=ChangedSinceRebuildPolicy()
+    )
+
+    assert operation.result(timeout=5).vector_count == 100
+    assert operation.skipped
+    assert [call.args[0] for call in mock_client.request.call_args_list] == ["GET"]
+
+
+def test_rebuild_async_errors(mock_client):
+    """Test that request errors and timeouts fail the operation."""
+
+    def fail():
+        raise RuntimeError("rebuild failed")
+
+    route(mock_client, rebuild=fail)
+    operation = VectorIndex.rebuild_async("test-graph-guid", poll_interval=0.01)
+    with pytest.raises(RuntimeError, match="rebuild failed"):
+        operation.result(timeout=5)
+    assert isinstance(operation.exception(), RuntimeError)
+
+    release = threading.Event()
+    route(mock_client, rebuild=release.wait)
+    operation = VectorIndex.rebuild_async(
+        "test-graph-guid", poll_interval=0.01, timeout=0.05
+    )
+    with pytest.raises(TimeoutError):
+        operation.result(timeout=5)
+    release.set()
+
+
+def test_rebuild_async_validation(mock_client):
+    """Test argument validation."""
+    with pytest.raises(ValueError, match="Graph GUID is required"):
+        VectorIndex.rebuild_async("")
+    mock_client.tenant_guid = None
+    with pytest.raises(ValueError, match="Tenant GUID is required"):
+        VectorIndex.rebuild_async("test-graph-guid")
+    with pytest.raises(ValueError):
+        RebuildOperation("test-graph-guid", poll_interval=0)
+    operation = RebuildOperation("test-graph-guid")
+    operation.started_at = 0.0
+    with pytest.raises(RuntimeError):
+        operation.start()
+
+
+def test_changed_since_rebuild_policy():
+    """Test rebuilding only after adds or removes newer than the last rebuild."""
+    policy = ChangedSinceRebuildPolicy()
+    model = VectorIndexStatisticsModel.model_validate
+
+    assert policy.should_rebuild("g", model(stats()))
+    assert not policy.should_rebuild(
+        "g",
+        model(stats(LastRebuildUtc=NOW, LastAddUtc=NOW - timedelta(seconds=1))),
+    )
+    assert policy.should_rebuild(
+        "g",
+        model(
+            stats(
+                LastRebuildUtc="2026-01-01T00:00:00", LastRemoveUtc=NOW + timedelta(1)
+            )
+        ),
+    )
+    assert RebuildPolicy().should_rebuild("g", model(stats()))
+
+
+def test_change_threshold_policy():
+    """Test rebuilding only once the vector count moved by the threshold."""
+    policy = ChangeThresholdPolicy(threshold=10)
+    model = VectorIndexStatisticsModel.model_validate
+
+    # No recorded count yet: falls back to the timestamps
+    assert not policy.should_rebuild(
+        "g", model(stats(LastRebuildUtc=NOW, LastAddUtc=NOW))
+    )
+    policy.rebuilt("g", model(stats(VectorCount=100)))
+    assert not policy.should_rebuild("g", model(stats(VectorCount=109)))
+    assert policy.should_rebuild("g", model(stats(VectorCount=90)))
+    assert policy.should_rebuild("other", model(stats()))
+
+    with pytest.raises(ValueError):
+        ChangeThresholdPolicy(threshold=0)
@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from unittest.mock import Mock
 
 import pytest
 from litegraph.models.edge import EdgeModel
@@ -186,3 +187,122 @@ def sample_node_data():
         "CreatedUtc": datetime.now(timezone.utc).isoformat(),
         "Data": {"key": "value"},
     }
+
+
+GRAPH_EDGES = [
+    # (guid, from, to, labels, data)
+    ("e1", "a", "b", ["follows"], {"weight": 5}),
+    ("e2", "a", "c", ["follows"], {"weight": 1}),
+    ("e3", "b", "d", ["likes"], {"weight": 7}),
+    ("e4", "c", "d", ["follows"], {"weight": 3}),
+    ("e5", "d", "e", ["follows"], {"weight": 9, "meta": {"kind": "x"}}),
+]
+
+
+@pytest.fixture
+def graph_client(monkeypatch):
+    """Create a mock client serving the edges of a small graph."""
+
+    def edge(guid, source, target, labels, data):
+        return {
+            "GUID": guid,
+            "TenantGUID": "tenant",
+            "GraphGUID": "graph",
+            "From": source,
+            "To": target,
+            "Labels": labels,
+            "Data": data,
+        }
+
+    def request(method, url):
+        node, endpoint = url.split("/nodes/")[1].split("/", 1)
+        index = 1 if endpoint == "edges/from" else 2
+        return [edge(*row) for row in GRAPH_EDGES if row[index] == node]
+
+    client = Mock()
+    client.tenant_guid = "tenant"
+    client.graph_guid = "graph"
+    client.request.side_effect = request
+    monkeypatch.setattr("litegraph.configuration._client", client)
+    return client
+
+
+def test_traverse_bfs(graph_client):
+    """Test a breadth-first traversal with depth levels and de-duplication."""
+    steps = list(RouteNodes.traverse("a", max_concurrency=4))
+
+    depths = {step.node_guid: step.depth for step in steps if step.new}
+    assert depths == {"a": 0, "b": 1, "c": 1, "d": 2, "e": 3}
+    assert sorted(step.edge.guid for step in steps if step.edge) == [
+        "e1",
+        "e2",
+        "e3",
+        "e4",
+        "e5",
+    ]
+    revisits = [step for step in steps if not step.new]
+    assert len(revisits) == 1 and revisits[0].node_guid == "d"
+    # Every node is expanded once
+    assert graph_client.request.call_count == 5
+    assert all(
+        "tenants/tenant/graphs/graph/nodes/" in call.args[1]
+        for call in graph_client.request.call_args_list
+    )
+
+
+def test_traverse_budgets(graph_client):
+    """Test the depth, node and edge budgets."""
+    assert {step.node_guid for step in RouteNodes.traverse("a", max_depth=1)} == {
+        "a",
+        "b",
+        "c",
+    }
+    nodes = {step.node_guid for step in RouteNodes.traverse("a", max_nodes=3)}
+    assert nodes == {"a", "b", "c"}
+    steps = list(RouteNodes.traverse("a", max_edges=2))
+    assert len([step for step in steps if step.edge]) == 2
+
+
+def test_traverse_filters_and_directions(graph_client):
+    """Test edge filters and the in/both directions."""
+    follows = {step.node_guid for step in RouteNodes.traverse("a", labels=["follows"])}
+    assert follows == {"a", "b", "c", "d", "e"}
+    assert "b" in follows  # reached through e1; e3 (likes) is not followed
+    heavy = RouteNodes.traverse(
+        "a", expr={"Left": "weight", "Operator": "GreaterThan", "Right": "4"}
+    )
+    assert {step.node_guid for step in heavy} == {"a", "b", "d", "e"}
+    nested = RouteNodes.traverse(
+        "d", expr={"Left": "meta.kind", "Operator": "Equals", "Right": "x"}
+    )
+    assert [step.node_guid for step in nested] == ["d", "e"]
+
+    parents = RouteNodes.traverse("d", direction="in", max_depth=1)
+    assert {step.node_guid for step in parents} == {"d", "b", "c"}
+    around = list(RouteNodes.traverse("d", direction="both", max_depth=1))
+    assert {step.node_guid for step in around} == {"d", "b", "c", "e"}
+    assert len([step for step in around if step.edge]) == 3
+
+
+def test_traverse_dfs(graph_client):
+    """Test a depth-first traversal."""
+    steps = list(RouteNodes.traverse(["a", "a"], strategy="dfs"))
+    assert [step.node_guid for step in steps if step.new] == ["a", "b", "c", "d", "e"]
+    assert [step.edge.guid for step in steps if step.edge][:2] == ["e1", "e2"]
+    assert steps[3].parent_guid == "b"
+
+
+def test_traverse_validation(graph_client):
+    """Test argument validation and early stopping."""
+    with pytest.raises(ValueError):
+        RouteNodes.traverse("a", direction="sideways")
+    with pytest.raises(ValueError):
+        list(RouteNodes.traverse("a", strategy="random"))
+    graph_client.graph_guid = None
+    with pytest.raises(ValueError):
+        RouteNodes.traverse("a")
+
+    graph_client.graph_guid = "graph"
+    steps = RouteNodes.traverse("a")
+    assert next(steps).node_guid == "a"
+    steps.close()
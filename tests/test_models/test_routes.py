@@ -110,3 +110,56 @@ class TestRoutesClass:
         assert len(result.Routes) > 0
         assert result.Routes[0].TotalCost == 10.5
         assert isinstance(result.Routes[0].Edges, list)
+
+
+@pytest.fixture
+def routes_client(monkeypatch, mock_configuration):
+    """Bind the mock client to the routes module, which may hold a stale patch."""
+    monkeypatch.setattr(
+        "litegraph.resources.routes.get_client", lambda: mock_configuration
+    )
+    return mock_configuration
+
+
+def test_routes_many(routes_class, mock_response_data, routes_client):
+    """Test routing many pairs concurrently with a shared filter body."""
+    import json
+
+    routes_client._request.return_value = mock_response_data
+    pairs = [("a", "b"), ("a", "c"), ("a", "b"), ["b", "c"]]
+
+    results = dict(
+        routes_class.routes_many(
+            "graph-1",
+            pairs,
+            edge_filter={"GraphGUID": "graph-1", "Labels": ["road"]},
+            max_concurrency=2,
+        )
+    )
+
+    assert set(results) == {("a", "b"), ("a", "c"), ("b", "c")}
+    assert all(isinstance(result, RouteResultModel) for result in results.values())
+    assert routes_client._request.call_count == 3
+    bodies = []
+    for call in routes_client._request.call_args_list:
+        method, url = call[0]
+        assert method == "POST"
+        assert url.endswith("tenants/test-tenant-guid/graphs/graph-1/routes")
+        bodies.append(json.loads(call[1]["content"]))
+    assert sorted((body["From"], body["To"]) for body in bodies) == sorted(results)
+    assert all(body["Graph"] == "graph-1" for body in bodies)
+    assert all(body["EdgeFilter"]["Labels"] == ["road"] for body in bodies)
+    assert all(body["NodeFilter"] is None for body in bodies)
+
+
+def test_routes_many_errors(routes_class, mock_response_data, routes_client):
+    """Test that a failed pair raises and that validation happens on iteration."""
+    routes_client._request.side_effect = [mock_response_data, RuntimeError("boom")]
+    with pytest.raises(RuntimeError):
+        list(routes_class.routes_many("graph-1", [("a", "b"), ("b", "c")], max_concurrency=1))
+
+    routes_client.tenant_guid = None
+    with pytest.raises(ValueError):
+        next(routes_class.routes_many("graph-1", [("a", "b")]))
+    assert list(routes_class.routes_many("graph-1", [], tenant_guid="t")) == []
+
@@ -0,0 +1,99 @@
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+
+from litegraph.models.edge import EdgeModel
+from litegraph.models.enumeration_result import EnumerationResultModel
+from litegraph.models.node import NodeModel
+from litegraph.models.structs import (
+    EdgeStruct,
+    EnumerationResultStruct,
+    NodeStruct,
+    VectorMetadataStruct,
+    decode,
+    from_model,
+    to_model,
+)
+from litegraph.utils.projection import _resolve_projection
+
+NODE_JSON = (
+    b'{"GUID": "node1", "TenantGUID": "tenant1", "GraphGUID": "graph1",'
+    b' "Name": "Node 1", "Data": {"key": "value"}, "Labels": ["a"],'
+    b' "Tags": {"color": "red"}, "CreatedUtc": "2024-01-01T00:00:00.0000000Z",'
+    b' "Vectors": [{"GUID": "vec1", "Model": "m", "Dimensionality": 2,'
+    b' "Vectors": [0.1, 0.2]}]}'
+)
+
+
+def test_decode_single_struct():
+    """Test decoding a single record from bytes."""
+    node = decode(NODE_JSON, NodeStruct)
+    assert isinstance(node, NodeStruct)
+    assert node.guid == "node1"
+    assert node.data == {"key": "value"}
+    assert node.created_utc.year == 2024
+    assert isinstance(node.vectors[0], VectorMetadataStruct)
+    assert node.vectors[0].vectors == [0.1, 0.2]
+
+
+def test_decode_list_and_enumeration():
+    """Test decoding lists and enumeration results."""
+    nodes = decode(b"[" + NODE_JSON + b"," + NODE_JSON + b"]", NodeStruct, many=True)
+    assert [node.guid for node in nodes] == ["node1", "node1"]
+
+    page = decode(
+        b'{"TotalRecords": 1, "EndOfResults": false, "Objects": [' + NODE_JSON + b"]}",
+        NodeStruct,
+        enumeration=True,
+    )
+    assert isinstance(page, EnumerationResultStruct)
+    assert page.total_records == 1
+    assert page.end_of_results is False
+    assert page.objects[0].name == "Node 1"
+
+    empty = decode(b'{"Objects": null}', NodeStruct, enumeration=True)
+    assert empty.objects == []
+
+
+def test_decode_with_projection_and_builtins():
+    """Test decoding already parsed payloads and applying a projection."""
+    payload = [msgspec.json.decode(NODE_JSON)]
+    projection = _resolve_projection(NodeModel, ["labels"])
+    nodes = decode(payload, NodeStruct, many=True, projection=projection)
+    assert nodes[0].labels == ["a"]
+    assert nodes[0].data is None
+    assert nodes[0].vectors == []
+    assert decode(b"", NodeStruct) is None
+
+
+def test_struct_model_round_trip():
+    """Test conversion helpers between structs and pydantic models."""
+    node = decode(NODE_JSON, NodeStruct)
+    model = to_model(node)
+    assert isinstance(model, NodeModel)
+    assert model.guid == "node1"
+    assert model.vectors[0].vectors == [0.1, 0.2]
+
+    struct = from_model(model)
+    assert isinstance(struct, NodeStruct)
+    assert struct.guid == "node1"
+    assert struct.tags == {"color": "red"}
+    assert isinstance(struct.vectors[0], VectorMetadataStruct)
+
+    edge = from_model(EdgeModel(GUID="edge1", From="a", To="b", Cost=3))
+    assert isinstance(edge, EdgeStruct)
+    assert edge.cost == 3
+    assert to_model([edge])[0].from_node_guid == "a"
+
+    page = decode(b'{"Objects": [' + NODE_JSON + b"]}", NodeStruct, enumeration=True)
+    result = to_model(page)
+    assert isinstance(result, EnumerationResultModel)
+    assert result.objects[0].name == "Node 1"
+
+
+def test_conversion_errors():
+    """Test conversion of unregistered types."""
+    with pytest.raises(TypeError):
+        to_model(object())
+    with pytest.raises(TypeError):
+        from_model(object())
@@ -0,0 +1,100 @@
+import pytest
+from litegraph.models.node import NodeModel
+from litegraph.models.tracked import ChangeTrackedModel
+from litegraph.models.vector_metadata import VectorMetadataModel
+
+
+@pytest.fixture
+def node_response():
+    """Fixture providing a node as returned by the API."""
+    return {
+        "GUID": "node1",
+        "TenantGUID": "tenant1",
+        "GraphGUID": "graph1",
+        "Name": "Node 1",
+        "Data": {"payload": list(range(10))},
+        "Labels": ["a"],
+        "Tags": {"color": "red"},
+        "CreatedUtc": "2024-01-01T00:00:00Z",
+        "LastUpdateUtc": "2024-01-01T00:00:00Z",
+        "Vectors": [
+            {
+                "GUID": "vec1",
+                "Model": "m",
+                "Dimensionality": 2,
+                "Content": "hello",
+                "Vectors": [0.1, 0.2],
+            }
+        ],
+    }
+
+
+def test_validated_model_is_clean(node_response):
+    """Test that freshly validated models report no changes."""
+    node = NodeModel.from_response(node_response)
+    assert isinstance(node, ChangeTrackedModel)
+    assert node.changed_fields() == set()
+    assert node.is_changed() is False
+
+
+def test_assignment_is_tracked(node_response):
+    """Test that assigning a field marks it as changed."""
+    node = NodeModel.from_response(node_response)
+    node.name = "Renamed"
+    assert node.changed_fields() == {"name"}
+
+
+def test_in_place_mutation_is_tracked(node_response):
+    """Test that in-place changes to containers and nested models are detected."""
+    node = NodeModel.from_response(node_response)
+    node.tags["owner"] = "me"
+    node.labels.append("b")
+    assert node.changed_fields() == {"tags", "labels"}
+
+    node = NodeModel.from_response(node_response)
+    node.vectors[0].content = "changed"
+    assert node.changed_fields() == {"vectors"}
+
+    node = NodeModel.from_response(node_response)
+    node.vectors.append(VectorMetadataModel(Vectors=[0.3, 0.4]))
+    assert node.changed_fields() == {"vectors"}
+
+
+def test_mark_changed(node_response):
+    """Test explicitly marking fields as changed."""
+    node = NodeModel.from_response(node_response)
+    node.mark_changed("data")
+    assert node.changed_fields() == {"data"}
+    with pytest.raises(ValueError):
+        node.mark_changed("unknown")
+
+
+def test_partial_payload(node_response):
+    """Test that a partial payload only contains changed fields and the GUID."""
+    node = NodeModel.from_response(node_response)
+    node.tags["owner"] = "me"
+    assert node.changed_payload(partial=True) == {
+        "GUID": "node1",
+        "Tags": {"color": "red", "owner": "me"},
+    }
+
+
+def test_full_payload_reuses_raw_values(node_response):
+    """Test that unchanged fields reuse the raw response values."""
+    node = NodeModel.from_response(node_response)
+    node.name = "Renamed"
+    payload = node.changed_payload()
+    assert payload["Name"] == "Renamed"
+    assert payload["Data"] is node_response["Data"]
+    assert payload["Vectors"] is node_response["Vectors"]
+    assert payload["CreatedUtc"] == node_response["CreatedUtc"]
+    # Fields missing from the response are serialized from the model
+    assert payload["EdgesIn"] is None
+
+
+def test_constructed_models_track_changes():
+    """Test that models built by callers also track assignments."""
+    node = NodeModel(name="Node")
+    assert node.is_changed() is False
+    node.data = {"key": "value"}
+    assert node.changed_fields() == {"data"}
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+from litegraph.utils.vector_manifest import VectorManifest
+
+
+def test_content_hash_and_keys():
+    """Test that hashes cover model and content, and keys the owner."""
+    assert VectorManifest.content_hash("m", "text") == VectorManifest.content_hash(
+        "m", "text"
+    )
+    assert VectorManifest.content_hash("m", "text") != VectorManifest.content_hash(
+        "other", "text"
+    )
+    assert VectorManifest.content_hash("m", "ab") != VectorManifest.content_hash(
+        "ma", "b"
+    )
+    assert VectorManifest.key("g", "m", node_guid="n") == "g/node/n/m"
+    assert VectorManifest.key("g", "m", edge_guid="e") == "g/edge/e/m"
+    assert VectorManifest.key("g", None) == "g/graph/"
+
+
+def test_record_discard_and_keys():
+    """Test the in-memory manifest operations."""
+    manifest = VectorManifest()
+    key = VectorManifest.key("g1", "m", node_guid="n")
+    manifest.record(key, VectorManifest.content_hash("m", "a"), "v1")
+    manifest.record(VectorManifest.key("g2", "m", node_guid="n"), "h", "v2")
+
+    assert key in manifest
+    assert manifest.is_current("g1", "m", "a", node_guid="n")
+    assert not manifest.is_current("g1", "m", "b", node_guid="n")
+    assert list(manifest.keys("g1")) == [key]
+    assert len(list(manifest.keys())) == 2
+    manifest.record(key, VectorManifest.content_hash("m", "b"), "v3")
+    assert len(manifest) == 3
+    assert manifest.is_current("g1", "m", "b", node_guid="n")
+    assert manifest.discard(key, VectorManifest.content_hash("m", "a")) == ["v1"]
+    assert manifest.get(key) == {VectorManifest.content_hash("m", "b"): "v3"}
+    assert manifest.discard(key) == ["v3"]
+    assert manifest.discard(key) == []
+    manifest.save()  # No path: nothing written
+
+
+def test_save_and_load(tmp_path):
+    """Test that the manifest round-trips through its JSON file."""
+    path = tmp_path / "manifest.json"
+    manifest = VectorManifest(path)
+    manifest.record("g/node/n/m", "hash", "v1")
+    manifest.pending_deletes.append("v0")
+    manifest.save()
+
+    loaded = VectorManifest(path)
+    assert loaded.get("g/node/n/m") == {"hash": "v1"}
+    assert loaded.pending_deletes == ["v0"]
+
+    path.write_text(json.dumps({"version": 99, "entries": {}}))
+    with pytest.raises(ValueError):
+        VectorManifest(path)
@@ -1,9 +1,11 @@
+import json
 from datetime import datetime
 import pytest
 from unittest.mock import Mock
 from uuid import UUID
 
 from litegraph.enums.vector_search_domain_enum import VectorSearchDomainEnum
+from litegraph.enums.vector_search_type_enum import VectorSearchTypeEnum
 from litegraph.models.graphs import GraphModel
 from litegraph.models.node import NodeModel
 from litegraph.models.edge import EdgeModel
@@ -109,6 +111,27 @@ def test_search_vectors_node_domain(mock_client, valid_search_result):
     mock_client.request.assert_called_once()
 
 
+def test_search_vectors_payload_unchanged(mock_client, valid_search_result):
+    """Test that a search without TopK sends the same body as before TopK existed."""
+    mock_client.request.return_value = valid_search_result
+    Vector.search_vectors(
+        domain=VectorSearchDomainEnum.Node,
+        embeddings=[0.1, 0.2, 0.3],
+        tenant_guid=UUID("550e8400-e29b-41d4-a716-446655440001"),
+        graph_guid=UUID("550e8400-e29b-41d4-a716-446655440002"),
+    )
+    assert mock_client.request.call_args.kwargs["json"] == {
+        "TenantGUID": "550e8400-e29b-41d4-a716-446655440001",
+        "GraphGUID": "550e8400-e29b-41d4-a716-446655440002",
+        "Domain": "Node",
+        "SearchType": "CosineSimilarity",
+        "Labels": [],
+        "Tags": {},
+        "Expr": None,
+        "Embeddings": [0.1, 0.2, 0.3],
+    }
+
+
 def test_search_vectors_edge_domain(mock_client, valid_search_result):
     """Test searching vectors in edge domain."""
     mock_client.request.return_value = valid_search_result
@@ -546,3 +569,453 @@ def test_delete_edge_vectors(mock_client):
     mock_client.request.assert_called_once()
     called_args = mock_client.request.call_args
     assert "edges/edge-guid-123/vectors" in called_args[0][1]
+
+
+def test_bulk_upload(mock_client):
+    """Test uploading an embedding matrix in batches."""
+    np = pytest.importorskip("numpy")
+    import json
+
+    mock_client.tenant_guid = "test-tenant-guid"
+    mock_client.graph_guid = "test-graph-guid"
+    mock_client.request.side_effect = [
+        b'[{"GUID": "v1"}, {"GUID": "v2"}]',
+        b'[{"GUID": "v3"}]',
+    ]
+    embeddings = np.arange(6, dtype=np.float32).reshape(3, 2)
+
+    guids = Vector.bulk_upload(
+        embeddings, node_guids=["n1", "n2", "n3"], model="test-model", batch_size=2
+    )
+
+    assert list(guids) == ["v1", "v2", "v3"]
+    assert mock_client.request.call_count == 2
+    args, kwargs = mock_client.request.call_args_list[0]
+    assert args == ("PUT", "v1.0/tenants/test-tenant-guid/vectors/bulk")
+    records = json.loads(kwargs["content"])
+    assert records[1] == {
+        "GraphGUID": "test-graph-guid",
+        "Dimensionality": 2,
+        "Model": "test-model",
+        "NodeGUID": "n2",
+        "Vectors": [2.0, 3.0],
+    }
+
+    with pytest.raises(ValueError):
+        Vector.bulk_upload(embeddings, node_guids=["n1"])
+    with pytest.raises(ValueError):
+        Vector.bulk_upload(np.zeros(3))
+
+    mock_client.graph_guid = None
+    mock_client.request.reset_mock()
+    with pytest.raises(ValueError):
+        Vector.bulk_upload(embeddings)
+    mock_client.request.assert_not_called()
+
+
+def test_download_matrix(mock_client):
+    """Test downloading the vectors of a graph as a matrix."""
+    np = pytest.importorskip("numpy")
+
+    mock_client.tenant_guid = "test-tenant-guid"
+    mock_client.graph_guid = None
+    mock_client.request.side_effect = None
+    mock_client.request.return_value = (
+        b'[{"GUID": "v1", "NodeGUID": "n1", "Vectors": [0.5, 1.0]},'
+        b' {"GUID": "v2", "EdgeGUID": "e1", "Vectors": [1.5, 2.0]}]'
+    )
+
+    matrix = Vector.download_matrix("graph1")
+
+    assert mock_client.request.call_args[0] == (
+        "GET",
+        "v1.0/tenants/test-tenant-guid/graphs/graph1/vectors/all",
+    )
+    assert matrix.embeddings.dtype == np.float32
+    assert matrix.embeddings.flags["C_CONTIGUOUS"]
+    assert matrix.embeddings.tolist() == [[0.5, 1.0], [1.5, 2.0]]
+    assert list(matrix.guids) == ["v1", "v2"]
+    assert list(matrix.node_guids) == ["n1", None]
+    assert list(matrix.edge_guids) == [None, "e1"]
+    assert len(matrix) == 2 and matrix.dimensionality == 2
+
+    mock_client.request.return_value = b"[]"
+    assert Vector.download_matrix("graph1").embeddings.shape == (0, 0)
+
+    mock_client.request.return_value = (
+        b'[{"GUID": "v1", "Vectors": [0.5]}, {"GUID": "v2", "Vectors": [1.5, 2.0]}]'
+    )
+    with pytest.raises(ValueError):
+        Vector.download_matrix("graph1")
+
+
+def test_search_vectors_batch_distance(mock_client):
+    """Test that distance searches fill the score matrix with distances."""
+    np = pytest.importorskip("numpy")
+
+    mock_client.request.return_value = [
+        {"Distance": 0.25, "Node": {"GUID": "node-a"}},
+        {"Distance": 1.5, "Node": {"GUID": "node-b"}},
+    ]
+    for search_type in (
+        VectorSearchTypeEnum.EuclidianDistance,
+        VectorSearchTypeEnum.CosineDistance,
+    ):
+        result = Vector.search_vectors_batch(
+            domain=VectorSearchDomainEnum.Node,
+            queries=np.ones((2, 3)),
+            tenant_guid=UUID("550e8400-e29b-41d4-a716-446655440001"),
+            graph_guid=UUID("550e8400-e29b-41d4-a716-446655440002"),
+            search_type=search_type,
+        )
+        assert result.scores.tolist() == [[0.25, 1.5], [0.25, 1.5]]
+
+
+def test_search_vectors_batch(mock_client):
+    """Test running a batch of vector searches concurrently."""
+    np = pytest.importorskip("numpy")
+    import time
+
+    def search(method, url, json, headers):
+        time.sleep(0.1)
+        first = json["Embeddings"][0]
+        hits = [
+            {"Score": 0.9, "InnerProduct": 4.0, "Node": {"GUID": f"node-{first}-a"}},
+            {"Score": 0.5, "InnerProduct": 2.0, "Node": {"GUID": f"node-{first}-b"}},
+        ]
+        return hits[: int(first)]
+
+    mock_client.request.side_effect = search
+    queries = np.array([[2.0, 0.0], [1.0, 0.0], [0.0, 0.0], [2.0, 1.0]])
+
+    start = time.perf_counter()
+    result = Vector.search_vectors_batch(
+        domain=VectorSearchDomainEnum.Node,
+        queries=queries,
+        tenant_guid=UUID("550e8400-e29b-41d4-a716-446655440001"),
+        graph_guid=UUID("550e8400-e29b-41d4-a716-446655440002"),
+        search_type=VectorSearchTypeEnum.DotProduct,
+        max_concurrency=4,
+    )
+    # All four queries run concurrently
+    assert time.perf_counter() - start < 0.35
+    assert mock_client.request.call_count == 4
+    payload = mock_client.request.call_args[1]["json"]
+    assert payload["SearchType"] == "DotProduct"
+
+    assert result.scores.shape == (4, 2)
+    assert result.scores.dtype == np.float32
+    assert result.counts.tolist() == [2, 1, 0, 2]
+    assert result.guids[0].tolist() == ["node-2.0-a", "node-2.0-b"]
+    assert result.guids[1].tolist() == ["node-1.0-a", None]
+    # DotProduct searches report the inner product
+    assert result.scores[0].tolist() == [4.0, 2.0]
+    assert np.isnan(result.scores[2]).all()
+    assert result.results is None
+
+    result = Vector.search_vectors_batch(
+        domain=VectorSearchDomainEnum.Node,
+        queries=queries,
+        tenant_guid=UUID("550e8400-e29b-41d4-a716-446655440001"),
+        graph_guid=UUID("550e8400-e29b-41d4-a716-446655440002"),
+        k=1,
+        hydrate=True,
+    )
+    assert result.scores.shape == (4, 1)
+    assert isinstance(result.results[0][0], VectorSearchResultModel)
+    assert [len(hits) for hits in result.results] == [1, 1, 0, 1]
+
+    with pytest.raises(ValueError):
+        Vector.search_vectors_batch(
+            domain=VectorSearchDomainEnum.Node,
+            queries=queries,
+            tenant_guid=UUID("550e8400-e29b-41d4-a716-446655440001"),
+        )
+
+
+def test_search_vectors_reranked(mock_client):
+    """Test re-ranking approximate candidates exactly from a local cache."""
+    pytest.importorskip("numpy")
+    from litegraph.local.embedding_cache import EmbeddingCache
+
+    cache = EmbeddingCache()
+    cache.add(["n1", "n2", "n3"], [[0.0, 1.0], [1.0, 0.1], [1.0, 0.0]])
+    # The approximate index returns the candidates in the wrong order
+    mock_client.request.side_effect = None
+    mock_client.request.return_value = [
+        {"Score": 0.9, "Node": {"GUID": "n1"}},
+        {"Score": 0.8, "Node": {"GUID": "n2"}},
+        {"Score": 0.7, "Node": {"GUID": "n3"}},
+        {"Score": 0.6, "Node": {"GUID": "uncached"}},
+    ]
+
+    results = Vector.search_vectors_reranked(
+        domain=VectorSearchDomainEnum.Node,
+        embeddings=[1.0, 0.0],
+        tenant_guid=UUID("550e8400-e29b-41d4-a716-446655440001"),
+        graph_guid=UUID("550e8400-e29b-41d4-a716-446655440002"),
+        cache=cache,
+        k=2,
+        oversample=3,
+    )
+
+    payload = mock_client.request.call_args[1]["json"]
+    assert payload["TopK"] == 6
+    assert payload["SearchType"] == "CosineSimilarity"
+    assert [result.node.guid for result in results] == ["n3", "n2"]
+    assert results[0].score == pytest.approx(1.0)
+
+    results = Vector.search_vectors_reranked(
+        domain=VectorSearchDomainEnum.Node,
+        embeddings=[1.0, 0.0],
+        tenant_guid=UUID("550e8400-e29b-41d4-a716-446655440001"),
+        graph_guid=UUID("550e8400-e29b-41d4-a716-446655440002"),
+        cache=cache,
+        k=1,
+        search_type=VectorSearchTypeEnum.EuclidianDistance,
+    )
+    assert results[0].node.guid == "n3"
+    assert results[0].distance == pytest.approx(0.0)
+
+
+def test_sync_vectors_uploads_only_changes(mock_client, tmp_path):
+    """Test that unchanged content is skipped and stale vectors are deleted."""
+    from litegraph.utils.vector_manifest import VectorManifest
+
+    mock_client.tenant_guid = "tenant"
+    mock_client.graph_guid = "graph"
+    created = []
+
+    def request(method, url, **kwargs):
+        if method == "PUT":
+            records = json.loads(kwargs["content"])
+            guids = [f"v{len(created) + i}" for i in range(len(records))]
+            created.extend(guids)
+            return [{**record, "GUID": guid} for record, guid in zip(records, guids)]
+        return None
+
+    mock_client.request.side_effect = request
+
+    def vectors(contents):
+        return [
+            VectorMetadataModel(
+                node_guid=node,
+                model="mini",
+                content=content,
+                vectors=[0.1, 0.2],
+                dimensionality=2,
+            )
+            for node, content in contents.items()
+        ]
+
+    path = tmp_path / "manifest.json"
+    manifest = VectorManifest(path)
+    result = Vector.sync_vectors(
+        vectors({"n1": "a", "n2": "b", "n3": "c"}), manifest, batch_size=2
+    )
+    assert (result.created, result.replaced, result.deleted, result.unchanged) == (
+        3,
+        0,
+        0,
+        0,
+    )
+    puts = [
+        call for call in mock_client.request.call_args_list if call.args[0] == "PUT"
+    ]
+    assert len(puts) == 2
+    assert "tenants/tenant/vectors/bulk" in puts[0].args[1]
+    assert json.loads(puts[0].kwargs["content"])[0]["GraphGUID"] == "graph"
+
+    # Reload from disk: n1 unchanged, n2 changed, n3 gone, n4 new
+    manifest = VectorManifest(path)
+    assert manifest.is_current("graph", "mini", "a", node_guid="n1")
+    mock_client.request.reset_mock()
+    result = Vector.sync_vectors(vectors({"n1": "a", "n2": "B", "n4": "d"}), manifest)
+    assert (result.created, result.replaced, result.deleted, result.unchanged) == (
+        1,
+        1,
+        2,
+        1,
+    )
+    methods = [call.args[0] for call in mock_client.request.call_args_list]
+    assert methods == ["PUT", "DELETE"]
+    deleted = mock_client.request.call_args_list[1].kwargs["json"]
+    assert sorted(deleted) == ["v1", "v2"]
+    assert list(VectorManifest(path).get("graph/node/n2/mini").values()) == ["v3"]
+    assert not VectorManifest(path).pending_deletes
+
+    # Nothing changed: no requests at all
+    mock_client.request.reset_mock()
+    result = Vector.sync_vectors(vectors({"n1": "a", "n2": "B", "n4": "d"}), manifest)
+    assert result.uploaded == 0 and result.unchanged == 3
+    mock_client.request.assert_not_called()
+
+
+def test_sync_vectors_multiple_chunks_per_node(mock_client):
+    """Test that several vectors of one node and model are all kept."""
+    from litegraph.utils.vector_manifest import VectorManifest
+
+    mock_client.tenant_guid = "tenant"
+    mock_client.graph_guid = "graph"
+    created = []
+
+    def request(method, url, **kwargs):
+        if method == "PUT":
+            records = json.loads(kwargs["content"])
+            guids = [f"v{len(created) + i}" for i in range(len(records))]
+            created.extend(guids)
+            return [{**record, "GUID": guid} for record, guid in zip(records, guids)]
+        return None
+
+    mock_client.request.side_effect = request
+
+    def chunks(*contents):
+        return [
+            VectorMetadataModel(
+                node_guid="n1",
+                model="mini",
+                content=content,
+                vectors=[0.1, 0.2],
+                dimensionality=2,
+            )
+            for content in contents
+        ]
+
+    manifest = VectorManifest()
+    result = Vector.sync_vectors(chunks("first", "second"), manifest)
+    assert (result.created, result.unchanged) == (2, 0)
+    assert len(manifest) == 2
+    assert manifest.is_current("graph", "mini", "first", node_guid="n1")
+    assert manifest.is_current("graph", "mini", "second", node_guid="n1")
+
+    # Both chunks unchanged: nothing is uploaded or pruned
+    mock_client.request.reset_mock()
+    result = Vector.sync_vectors(chunks("first", "second"), manifest)
+    assert (result.uploaded, result.deleted, result.unchanged) == (0, 0, 2)
+    mock_client.request.assert_not_called()
+
+    # One chunk edited, one dropped: the edit replaces a stale chunk
+    result = Vector.sync_vectors(chunks("first", "third"), manifest)
+    assert (result.created, result.replaced, result.deleted, result.unchanged) == (
+        0,
+        1,
+        1,
+        1,
+    )
+    assert mock_client.request.call_args.kwargs["json"] == ["v1"]
+    assert sorted(manifest.get("graph/node/n1/mini").values()) == ["v0", "v2"]
+
+
+def test_sync_vectors_retries_failed_deletes(mock_client):
+    """Test that deletes that fail are retried on the next sync."""
+    from litegraph.utils.vector_manifest import VectorManifest
+
+    mock_client.tenant_guid = "tenant"
+    manifest = VectorManifest()
+    manifest.record(VectorManifest.key("graph", "mini", "n1"), "old", "v-old")
+    mock_client.request.side_effect = RuntimeError("unavailable")
+
+    with pytest.raises(RuntimeError):
+        Vector.sync_vectors([], manifest, graph_guid="graph")
+    assert manifest.pending_deletes == ["v-old"]
+    assert len(manifest) == 0
+
+    mock_client.request.side_effect = None
+    mock_client.request.return_value = None
+    result = Vector.sync_vectors([], manifest, graph_guid="graph")
+    assert result.deleted == 1
+    assert manifest.pending_deletes == []
+
+
+def test_sync_vectors_validation(mock_client):
+    """Test sync_vectors argument validation."""
+    from litegraph.utils.vector_manifest import VectorManifest
+
+    mock_client.tenant_guid = "tenant"
+    mock_client.graph_guid = None
+    with pytest.raises(ValueError, match="Graph GUID"):
+        Vector.sync_vectors([], VectorManifest())
+    with pytest.raises(ValueError, match="another graph|cannot be synced"):
+        Vector.sync_vectors(
+            [{"GraphGUID": "other", "NodeGUID": "n1", "Content": "a"}],
+            VectorManifest(),
+            graph_guid="graph",
+        )
+
+
+def test_search_across_graphs_merges_top_k(mock_client):
+    """Test that per-graph results are merged into a global top-k."""
+    mock_client.tenant_guid = "00000000-0000-0000-0000-000000000000"
+    scores = {"g1": [0.9, 0.5], "g2": [0.95, 0.2], "g3": [0.7, 0.6]}
+
+    def request(method, url, json=None, **kwargs):
+        graph = json["GraphGUID"]
+        assert json["TopK"] == 3
+        return [
+            {"Score": score, "Node": {"GUID": f"{graph}-{i}", "Name": "n"}}
+            for i, score in enumerate(scores[graph])
+        ]
+
+    mock_client.request.side_effect = request
+    result = Vector.search_across_graphs(
+        ["g1", "g2", "g3", "g1"], [0.1, 0.2], k=3, max_concurrency=2
+    )
+
+    assert [hit.score for hit in result.results] == [0.95, 0.9, 0.7]
+    assert [hit.node.guid for hit in result.results] == ["g2-0", "g1-0", "g3-0"]
+    assert result.graph_guids == ["g2", "g1", "g3"]
+    assert set(result.timings) == {"g1", "g2", "g3"}
+    assert mock_client.request.call_count == 3
+    assert result.slowest(1)[0][0] in scores
+    assert not result.skipped and not result.errors
+
+
+def test_search_across_graphs_distances_and_errors(mock_client):
+    """Test that distances are merged lowest first and failures can be collected."""
+    mock_client.tenant_guid = "00000000-0000-0000-0000-000000000000"
+
+    def request(method, url, json=None, **kwargs):
+        if json["GraphGUID"] == "bad":
+            raise RuntimeError("shard down")
+        offset = 0.0 if json["GraphGUID"] == "g1" else 0.05
+        return [{"Distance": offset + d, "Score": 1} for d in (0.1, 0.3)]
+
+    mock_client.request.side_effect = request
+    result = Vector.search_across_graphs(
+        ["g1", "g2", "bad"],
+        [0.1, 0.2],
+        k=3,
+        search_type=VectorSearchTypeEnum.EuclidianDistance,
+        raise_errors=False,
+    )
+    assert [round(hit.distance, 2) for hit in result.results] == [0.1, 0.15, 0.3]
+    assert isinstance(result.errors["bad"], RuntimeError)
+
+    with pytest.raises(RuntimeError, match="shard down"):
+        Vector.search_across_graphs(["bad"], [0.1, 0.2])
+
+
+def test_search_across_graphs_early_cutoff(mock_client):
+    """Test that remaining graphs are skipped once enough good results arrived."""
+    mock_client.tenant_guid = "00000000-0000-0000-0000-000000000000"
+    mock_client.request.return_value = [{"Score": 0.99}, {"Score": 0.98}]
+
+    graphs = [f"g{i}" for i in range(10)]
+    result = Vector.search_across_graphs(
+        graphs, [0.1, 0.2], k=2, max_concurrency=1, stop_at=0.95
+    )
+    assert len(result) == 2
+    assert mock_client.request.call_count < len(graphs)
+    assert set(result.skipped) | set(result.timings) == set(graphs)
+
+
+def test_search_across_graphs_validation(mock_client):
+    """Test search_across_graphs argument validation."""
+    mock_client.tenant_guid = "00000000-0000-0000-0000-000000000000"
+    with pytest.raises(ValueError):
+        Vector.search_across_graphs(["g1"], [])
+    with pytest.raises(ValueError):
+        Vector.search_across_graphs(["g1"], [0.1], k=0)
+    with pytest.raises(ValueError):
+        Vector.search_across_graphs(["g1"], [0.1], domain=VectorSearchDomainEnum.Graph)
+    assert len(Vector.search_across_graphs([], [0.1])) == 0